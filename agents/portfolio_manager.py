@@ -6,10 +6,12 @@ Ensures the portfolio remains diversified by rejecting trades that are highly co
 with existing positions.
 """
 import pandas as pd
-import yfinance as yf
 import logging
 import numpy as np
-from typing import List
+from typing import List, Optional
+
+from services.market_data_gateway import get_market_data_gateway
+from services.correlation_service import CorrelationService, get_correlation_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +20,14 @@ class PortfolioManager:
     Manages portfolio-level risk constraints.
     """
     
-    def __init__(self):
-        """Initialize Portfolio Manager."""
+    def __init__(self, correlation_service: Optional[CorrelationService] = None):
+        """
+        Initialize Portfolio Manager.
+        
+        Args:
+            correlation_service: Rolling correlation service (default: shared instance)
+        """
+        self.correlation_service = correlation_service or get_correlation_service()
         logger.info("PortfolioManager initialized")
 
     def fetch_data_batch(self, symbols: List[str]) -> pd.DataFrame:
@@ -33,21 +41,9 @@ class PortfolioManager:
             DataFrame with Close prices (columns=symbols)
         """
         try:
-            # Join symbols for batch download
-            tickers = " ".join(symbols)
-            
-            # Download data (last 60 days, daily to reduce noise/latency for correlation)
-            # Using daily data is standard for correlation checks
-            df = yf.download(tickers, period="60d", interval="1d", progress=False)['Close']
-            
-            # If single symbol, yfinance returns Series or DataFrame with single col
-            if isinstance(df, pd.Series):
-                df = df.to_frame(name=symbols[0])
-            
-            if len(symbols) == 1 and df.shape[1] == 1:
-                df.columns = symbols
-                
-            return df
+            # Last 60 days, daily to reduce noise/latency for correlation
+            # (served from the local cache/Data Lake; only missing bars hit the network)
+            return get_market_data_gateway().get_close_matrix(symbols, period="60d", interval="1d")
         except Exception as e:
             logger.error(f"Failed to fetch batch data: {e}")
             return pd.DataFrame()
@@ -58,10 +54,13 @@ class PortfolioManager:
         
         Logic:
         1. If portfolio is empty, return True (Safe).
-        2. Fetch history for symbol + current_positions.
-        3. Calculate correlation matrix.
-        4. Calculate average correlation of the new symbol with existing positions.
+        2. Look up the candidate's return correlation with each position in the
+           rolling correlation service (held symbols are already tracked; a new
+           candidate costs one column fetch).
+        3. Calculate average correlation of the new symbol with existing positions.
         5. If avg_corr > 0.8, return False (Reject).
+        6. Stop tracking the candidate and any closed positions, so the
+           service only keeps columns for what is actually held.
         
         Args:
             symbol: Candidate symbol to add
@@ -95,25 +94,20 @@ class PortfolioManager:
         logger.info(f"📊 Checking correlation for {symbol} against {len(current_positions)} positions...")
         
         try:
-            df = self.fetch_data_batch(all_symbols)
+            try:
+                metrics = self.correlation_service.portfolio_correlation(symbol, current_positions)
+            finally:
+                held = set(current_positions)
+                self.correlation_service.remove_symbols(
+                    [s for s in self.correlation_service.symbols if s not in held]
+                )
             
-            if df.empty or len(df) < 10:
+            if metrics["observed"] == 0:
                 logger.warning("Insufficient data for correlation check. Allowing trade (fail open).")
                 return True
-                
-            # Calculate Correlation Matrix
-            corr_matrix = df.corr()
-            
-            # Get correlations of the new symbol with others
-            if symbol not in corr_matrix.columns:
-                 logger.warning(f"Symbol {symbol} data missing in batch fetch. Allowing trade.")
-                 return True
-
-            correlations = corr_matrix[symbol].drop(symbol)
             
-            # Calculate average correlation
-            avg_corr = correlations.mean()
-            max_corr = correlations.max()
+            avg_corr = metrics["avg"]
+            max_corr = metrics["max"]
             
             logger.info(f"Correlation metrics for {symbol}: Avg={avg_corr:.2f}, Max={max_corr:.2f}")
             
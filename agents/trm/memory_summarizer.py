@@ -6,8 +6,9 @@ Prevents the bot from repeating the same mistake multiple times.
 
 Enhanced v2.0: Now integrates with Global Data Lake (DuckDB) for market context.
 """
+import importlib.util
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 import json
@@ -15,16 +16,19 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from core.metrics import metrics
+
 # Initialize logger first (needed for import error handling)
 logger = logging.getLogger(__name__)
 
-try:
-    import duckdb
-    DUCKDB_AVAILABLE = True
-except ImportError:
-    DUCKDB_AVAILABLE = False
+# duckdb is imported on first connection (keeps agent imports cheap)
+DUCKDB_AVAILABLE = importlib.util.find_spec("duckdb") is not None
+if not DUCKDB_AVAILABLE:
     logger.warning("DuckDB not available - market context features disabled")
 
+if TYPE_CHECKING:
+    import duckdb
+
 
 class MemoryNarrative(BaseModel):
     """
@@ -254,7 +258,8 @@ class MemorySummarizer:
             return None
         
         try:
-            return duckdb.connect(str(self.db_path), read_only=True)  # type: ignore
+            import duckdb
+            return duckdb.connect(str(self.db_path), read_only=True)
         except Exception as e:
             logger.error(f"Failed to connect to DuckDB: {e}")
             return None
@@ -342,34 +347,37 @@ class MemorySummarizer:
             cutoff_date = (datetime.now() - timedelta(days=days)).date()
             
             # Query symbol data
-            symbol_df = conn.execute("""
-                SELECT date, close
-                FROM ohlcv_history
-                WHERE symbol = ?
-                AND date >= ?
-                ORDER BY date
-            """, [symbol, cutoff_date]).df()
+            with metrics.timer("duckdb.query", query="market_context"):
+                symbol_df = conn.execute("""
+                    SELECT date, close
+                    FROM ohlcv_history
+                    WHERE symbol = ?
+                    AND date >= ?
+                    ORDER BY date
+                """, [symbol, cutoff_date]).df()
             
             if symbol_df.empty:
                 return f"No recent market data found for {symbol}"
             
             # Query S&P 500 for market correlation
-            sp500_df = conn.execute("""
-                SELECT date, close
-                FROM ohlcv_history
-                WHERE symbol = '^GSPC'
-                AND date >= ?
-                ORDER BY date
-            """, [cutoff_date]).df()
+            with metrics.timer("duckdb.query", query="market_context"):
+                sp500_df = conn.execute("""
+                    SELECT date, close
+                    FROM ohlcv_history
+                    WHERE symbol = '^GSPC'
+                    AND date >= ?
+                    ORDER BY date
+                """, [cutoff_date]).df()
             
             # Query Gold for safe-haven correlation
-            gold_df = conn.execute("""
-                SELECT date, close
-                FROM ohlcv_history
-                WHERE symbol = 'GC=F'
-                AND date >= ?
-                ORDER BY date
-            """, [cutoff_date]).df()
+            with metrics.timer("duckdb.query", query="market_context"):
+                gold_df = conn.execute("""
+                    SELECT date, close
+                    FROM ohlcv_history
+                    WHERE symbol = 'GC=F'
+                    AND date >= ?
+                    ORDER BY date
+                """, [cutoff_date]).df()
             
             conn.close()
             
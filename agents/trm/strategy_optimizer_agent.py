@@ -12,9 +12,10 @@ Version: Phase 4 - Automated Parameter Optimization
 """
 import json
 import os
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, TextIO
 from pydantic import BaseModel
 from pathlib import Path
 
@@ -23,6 +24,143 @@ logger = logging.getLogger("StrategyOptimizer")
 INPUT_FILE = "data/war_games_results.json"
 OUTPUT_FILE = "data/optimized_params.json"
 
+# Only these fields are kept per campaign; the (potentially huge) `trades` list is dropped.
+SUMMARY_FIELDS = (
+    "campaign_name",
+    "symbol",
+    "scenario_description",
+    "params",
+    "sharpe_ratio",
+    "win_rate",
+    "max_drawdown_pct",
+    "total_return_pct",
+    "total_trades",
+)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonStream:
+    """
+    Minimal incremental JSON reader.
+
+    Decodes one value at a time from a file handle so that large arrays can be
+    consumed element by element without holding the whole document in memory.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = 1 << 20):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, discarding consumed text."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}")
+        self.pos += 1
+
+    def decode(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+                # A number ending exactly at the buffer edge may be truncated
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def iter_array(self) -> Iterator:
+        """Yield the elements of the JSON array at the current position."""
+        self.expect("[")
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.pos += 1
+                return
+            if char == ",":
+                self.pos += 1
+                continue
+            if char == "":
+                raise ValueError("Unterminated JSON array")
+            yield self.decode()
+
+
+def iter_campaign_summaries(path: str, fields: tuple = SUMMARY_FIELDS) -> Iterator[dict]:
+    """
+    Stream campaign summaries from a War Games results file.
+
+    Supports both the WarGamesRunner layout (dict with a 'results' key) and a
+    flat list of campaigns. Only `fields` are retained for each campaign.
+
+    Args:
+        path: Path to war_games_results.json
+        fields: Campaign keys to keep
+
+    Yields:
+        Summary dict for each campaign
+    """
+    with open(path, 'r') as f:
+        stream = _JsonStream(f)
+        first = stream.peek()
+
+        if first == "[":
+            campaigns = stream.iter_array()
+        elif first == "{":
+            campaigns = _iter_results_section(stream)
+        else:
+            return
+
+        for campaign in campaigns:
+            if isinstance(campaign, dict):
+                yield {k: campaign[k] for k in fields if k in campaign}
+
+
+def _iter_results_section(stream: _JsonStream) -> Iterator:
+    """Walk a top-level object, streaming only the 'results' array."""
+    stream.expect("{")
+    while True:
+        char = stream.peek()
+        if char in ("}", ""):
+            return
+        if char == ",":
+            stream.pos += 1
+            continue
+        key = stream.decode()
+        stream.expect(":")
+        if key == "results" and stream.peek() == "[":
+            yield from stream.iter_array()
+        else:
+            stream.decode()  # Small metadata sections (scenarios, param_sets, ...)
+
 
 class OptimizationResult(BaseModel):
     """Result of strategy optimization for a specific Symbol+Regime combination."""
@@ -61,18 +199,17 @@ class StrategyOptimizerAgent:
         self.results = []
 
     def load_results(self):
-        """Load War Games simulation results."""
+        """
+        Load War Games simulation results.
+
+        Campaigns are streamed and reduced to SUMMARY_FIELDS, so per-trade
+        lists are never held in memory.
+        """
         if not os.path.exists(self.input_file):
             logger.warning(f"No simulation results found at {self.input_file}")
             return
         
-        with open(self.input_file, 'r') as f:
-            data = json.load(f)
-            # Handle the structure returned by WarGamesRunner (dict with 'results' key)
-            if isinstance(data, dict) and 'results' in data:
-                self.results = data['results']
-            else:
-                self.results = data  # Fallback for flat list
+        self.results = list(iter_campaign_summaries(self.input_file))
         
         logger.info(f"📊 Loaded {len(self.results)} campaign results")
 
@@ -120,15 +257,54 @@ class StrategyOptimizerAgent:
         
         return score
 
-    def optimize(self) -> List[OptimizationResult]:
+    def score_campaigns(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized equivalent of `score_campaign` over a DataFrame of campaigns.
+
+        Applies the same formula and disqualification rules (in the same
+        precedence order) to every row at once.
+
+        Args:
+            df: DataFrame with one campaign per row
+
+        Returns:
+            Array of optimization scores aligned with df rows
+        """
+        def column(name: str) -> np.ndarray:
+            if name not in df:
+                return np.zeros(len(df))
+            return pd.to_numeric(df[name], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+        sharpe = column('sharpe_ratio')
+        win_rate = column('win_rate')
+        drawdown = np.abs(column('max_drawdown_pct'))
+        return_pct = column('total_return_pct')
+        total_trades = column('total_trades')
+
+        score = sharpe * 10.0 + win_rate * 50.0 - drawdown * 2.0 + return_pct * 0.5
+
+        return np.select(
+            [total_trades == 0, drawdown > 25.0, return_pct < 0],
+            [-500.0, -999.0, -100.0],
+            default=score,
+        )
+
+    def optimize(self, results: Optional[List[dict]] = None) -> List[OptimizationResult]:
         """
         Analyze all campaigns and select best parameters for each Symbol+Regime.
         
+        Args:
+            results: Campaign results already in memory (e.g. from an in-process
+                War Games run). If None, results are loaded from input_file.
+        
         Returns:
             List of OptimizationResult objects
         """
         logger.info("🧠 Running Strategy Optimization...")
-        self.load_results()
+        if results is None:
+            self.load_results()
+        else:
+            self.results = [{k: r[k] for k in SUMMARY_FIELDS if k in r} for r in results]
         
         if not self.results:
             logger.error("No results to optimize!")
@@ -137,16 +313,19 @@ class StrategyOptimizerAgent:
         df = pd.DataFrame(self.results)
         
         # Add optimization score
-        df['opt_score'] = df.apply(self.score_campaign, axis=1)
+        df['opt_score'] = self.score_campaigns(df)
         
         # Group by Symbol + Scenario (Market Regime)
         group_cols = ['symbol', 'scenario_description']
         
+        # Best campaign per group in a single pass
+        best_runs = df.loc[df.groupby(group_cols)['opt_score'].idxmax()]
+        
         optimized = []
         
-        for (symbol, regime), group in df.groupby(group_cols):
-            # Find best campaign in this group
-            best_run = group.loc[group['opt_score'].idxmax()]
+        for _, best_run in best_runs.iterrows():
+            symbol = best_run['symbol']
+            regime = best_run['scenario_description']
             
             # Extract parameters
             params = best_run.get('params', {})
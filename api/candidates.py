@@ -15,7 +15,7 @@ from datetime import datetime, timedelta
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from persistence.db import SessionLocal
+from persistence.db import SessionLocal, session_scope
 from persistence.repositories_triggers import TradeCandidateRepository
 from persistence.repositories_trades import TradeRequestRepository
 from core.logger import logger
@@ -81,7 +81,7 @@ async def promote_candidate(candidate_id: int, request: Request):
     Uses HTMX to return a partial HTML update.
     """
     try:
-        with SessionLocal() as session:
+        with session_scope() as session:
             candidate_repo = TradeCandidateRepository(session)
             trade_repo = TradeRequestRepository(session)
             
@@ -105,24 +105,24 @@ async def promote_candidate(candidate_id: int, request: Request):
             quantity = 1  # Default quantity
             
             # Create trade request
-            trade_request = trade_repo.add_trade_request(
-                trade_id=trade_id,
-                approval_code=approval_code,
-                symbol=candidate.symbol,
-                action=candidate.action,
-                quantity=quantity,
-                order_type="MARKET",  # Default to market order
-                price=None,  # Market order, no limit price
-                expires_at=expires_at,
-                forecast_id=None,  # Could link to forecast if available
-                trade_details={
+            trade_repo.add_trade_requests([{
+                "trade_id": trade_id,
+                "approval_code": approval_code,
+                "symbol": candidate.symbol,
+                "action": candidate.action,
+                "quantity": quantity,
+                "order_type": "MARKET",  # Default to market order
+                "price": None,  # Market order, no limit price
+                "expires_at": expires_at,
+                "forecast_id": None,  # Could link to forecast if available
+                "trade_details": {
                     "candidate_id": candidate.id,
                     "trigger_id": candidate.trigger_id,
                     "confidence": candidate.confidence,
                     "promoted_at": datetime.utcnow().isoformat(),
                 },
-                paper_trading=False  # Default to live trading, could be configurable
-            )
+                "paper_trading": False  # Default to live trading, could be configurable
+            }])
             
             logger.info(f"Promoted candidate {candidate_id} to trade request {trade_id}")
             
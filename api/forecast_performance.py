@@ -44,7 +44,7 @@ def render_template(template_name: str, context: dict) -> str:
 
 def list_forecast_snapshots(limit: int = 100) -> List[Dict[str, Any]]:
     """
-    List forecast snapshots from filesystem.
+    List the most recent forecast snapshots.
     
     Args:
         limit: Maximum number of forecasts to return
@@ -52,22 +52,7 @@ def list_forecast_snapshots(limit: int = 100) -> List[Dict[str, Any]]:
     Returns:
         List of forecast snapshot dicts
     """
-    metadata_manager = ForecastMetadata()
-    forecasts = []
-    
-    # Get all forecast snapshot files
-    snapshot_files = sorted(metadata_manager.storage_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    
-    for filepath in snapshot_files[:limit]:
-        try:
-            with open(filepath, "r") as f:
-                snapshot = json.load(f)
-                forecasts.append(snapshot)
-        except Exception as e:
-            logger.warning(f"Error loading forecast snapshot {filepath}: {e}")
-            continue
-    
-    return forecasts
+    return ForecastMetadata().list_forecast_snapshots(limit=limit)
 
 
 def calculate_rolling_metrics(backtests: List[Dict[str, Any]], window: int = 10) -> Dict[str, List[float]]:
@@ -5,7 +5,6 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-import yfinance as yf
 from pathlib import Path
 import sys
 
@@ -15,6 +14,7 @@ sys.path.insert(0, str(project_root))
 
 from dash.utils.price_feed import get_price
 from dash.utils.forecast_helper import get_historical_prices
+from services.market_data_gateway import get_market_data_gateway
 from core.logger import logger
 
 router = APIRouter(prefix="/api/market", tags=["market"])
@@ -94,8 +94,7 @@ async def get_price_chart(
         Dict with timestamps and prices for charting
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
-        hist = ticker.history(period=period, interval=interval)
+        hist = get_market_data_gateway().get_bars(symbol.upper(), period=period, interval=interval)
         
         if hist.empty:
             raise HTTPException(status_code=404, detail=f"No data available for {symbol}")
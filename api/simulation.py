@@ -3,16 +3,19 @@ Simulation and Strategy Optimization API.
 
 Exposes the 'War Games' simulator and 'Strategy Optimizer' agent to the frontend.
 """
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from typing import Dict, Any, List
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
+import asyncio
 import logging
 import json
 import os
 
-from daemon.simulator.war_games_runner import WarGamesRunner
-from agents.trm.strategy_optimizer_agent import StrategyOptimizerAgent
-from daemon.job_queue import create_job, update_job, get_job, JobStatus, Job, clear_jobs
+from daemon.job_queue import (
+    create_job, get_job, list_jobs, cancel_job, get_job_events,
+    JobStatus, Job, JobEvent, TERMINAL_STATUSES, clear_jobs
+)
 
 logger = logging.getLogger("api.simulation")
 
@@ -23,61 +26,13 @@ class RunResponse(BaseModel):
     message: str
     job_id: str
 
-async def run_simulation_job(job_id: str):
-    """Background task wrapper for simulation."""
-    try:
-        update_job(job_id, status=JobStatus.RUNNING, progress=10, message="Initializing War Games...")
-        
-        runner = WarGamesRunner()
-        
-        def progress_cb(pct, msg):
-            update_job(job_id, progress=pct, message=msg)
-            
-        # Run with callback
-        runner.run_all_scenarios(progress_callback=progress_cb)
-        
-        # Load results to return in job
-        results = []
-        try:
-            with open("data/war_games_results.json", 'r') as f:
-                results = json.load(f)
-        except:
-            pass
-            
-        update_job(
-            job_id, 
-            status=JobStatus.COMPLETED, 
-            progress=100, 
-            message="Simulations Complete",
-            result={"scenarios_run": len(results)}
-        )
-        
-    except Exception as e:
-        logger.error(f"Simulation job failed: {e}")
-        update_job(job_id, status=JobStatus.FAILED, message=str(e))
-
-async def run_optimizer_job(job_id: str):
-    """Background task wrapper for optimizer."""
-    try:
-        update_job(job_id, status=JobStatus.RUNNING, progress=10, message="Initializing Optimizer...")
-        
-        optimizer = StrategyOptimizerAgent()
-        update_job(job_id, progress=50, message="Optimizing Parameters...")
-        
-        optimizer.optimize()
-        
-        update_job(job_id, status=JobStatus.COMPLETED, progress=100, message="Optimization Complete")
-        
-    except Exception as e:
-        logger.error(f"Optimizer job failed: {e}")
-        update_job(job_id, status=JobStatus.FAILED, message=str(e))
+# Jobs are executed by the worker pool (python -m workers.job_worker), not the API process.
 
 @router.post("/run", response_model=RunResponse)
-async def run_simulation(background_tasks: BackgroundTasks):
-    """Run War Games simulation (Async Job)."""
+async def run_simulation():
+    """Queue a War Games simulation (Async Job)."""
     job_id = create_job("simulation")
-    background_tasks.add_task(run_simulation_job, job_id)
-    return {"message": "Simulation started", "job_id": job_id}
+    return {"message": "Simulation queued", "job_id": job_id}
 
 @router.get("/results")
 async def get_simulation_results():
@@ -98,6 +53,45 @@ async def get_simulation_job_status(job_id: str):
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
+@router.get("/status/{job_id}/events", response_model=List[JobEvent])
+async def get_job_progress_events(job_id: str, after_id: int = 0):
+    """Get progress events for a job recorded after `after_id`."""
+    if not get_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return get_job_events(job_id, after_id=after_id)
+
+@router.get("/status/{job_id}/stream")
+async def stream_job_progress(job_id: str, poll_interval: float = 1.0):
+    """Stream job progress as Server-Sent Events until the job finishes."""
+    if not get_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        last_id = 0
+        while True:
+            for event in get_job_events(job_id, after_id=last_id):
+                last_id = event.id
+                yield f"id: {event.id}\ndata: {event.model_dump_json()}\n\n"
+            job = get_job(job_id)
+            if job is None or job.status in TERMINAL_STATUSES:
+                return
+            await asyncio.sleep(poll_interval)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@router.post("/cancel/{job_id}", response_model=Job)
+async def cancel_simulation_job(job_id: str):
+    """Cancel a pending or running job."""
+    job = cancel_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("/jobs", response_model=List[Job])
+async def get_recent_jobs(limit: int = 10, job_type: Optional[str] = None, status: Optional[JobStatus] = None):
+    """List most recently updated jobs."""
+    return list_jobs(limit=limit, job_type=job_type, status=status)
+
 @router.post("/reset")
 async def reset_simulation():
     """Reset simulation state and clear jobs."""
@@ -106,11 +100,10 @@ async def reset_simulation():
     return {"message": "Simulation reset successfully"}
 
 @optimizer_router.post("/run", response_model=RunResponse)
-async def run_optimizer(background_tasks: BackgroundTasks):
-    """Run Strategy Optimizer (Async Job)."""
+async def run_optimizer():
+    """Queue a Strategy Optimizer run (Async Job)."""
     job_id = create_job("optimizer")
-    background_tasks.add_task(run_optimizer_job, job_id)
-    return {"message": "Optimizer started", "job_id": job_id}
+    return {"message": "Optimizer queued", "job_id": job_id}
 
 @optimizer_router.get("/results")
 async def get_optimizer_results():
@@ -17,7 +17,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from services.trade_service import get_trade_service
-from persistence.db import SessionLocal
+from persistence.db import session_scope
 from persistence.repositories_trades import TradeRequestRepository
 from core.logger import logger
 from core.auth import require_auth
@@ -218,21 +218,20 @@ async def place_trade(
         }
         
         # Create trade request via repository
-        with SessionLocal() as session:
-            repo = TradeRequestRepository(session)
-            trade_request = repo.add_trade_request(
-                trade_id=trade_id,
-                approval_code=approval_code,
-                symbol=request.symbol.upper(),
-                action=action_upper,
-                quantity=request.qty,
-                order_type=order_type_upper,
-                price=request.limit_price,
-                expires_at=expires_at,
-                forecast_id=request.forecast_id,
-                trade_details=trade_details,
-                paper_trading=request.paper_trading
-            )
+        with session_scope() as session:
+            TradeRequestRepository(session).add_trade_requests([{
+                "trade_id": trade_id,
+                "approval_code": approval_code,
+                "symbol": request.symbol.upper(),
+                "action": action_upper,
+                "quantity": request.qty,
+                "order_type": order_type_upper,
+                "price": request.limit_price,
+                "expires_at": expires_at,
+                "forecast_id": request.forecast_id,
+                "trade_details": trade_details,
+                "paper_trading": request.paper_trading,
+            }])
             
             logger.info(
                 f"Trade request created via API: {trade_id} - {request.symbol} {action_upper} {request.qty} "
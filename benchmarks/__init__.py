@@ -0,0 +1 @@
+"""Reproducible end-to-end benchmarks with local stand-ins (see benchmarks/run.py)."""
@@ -0,0 +1,304 @@
+"""
+Deterministic local stand-ins for the benchmark suite.
+
+Replaces every network dependency of the decision pipeline:
+
+- market data: SyntheticBarProvider (seeded bars for any symbol/interval)
+  and build_synthetic_lake() (DuckDB ohlcv_history with the real schema)
+- news: FakeNewsFetcher (recorded headlines)
+- LLM: FakeChatClient (OpenAI-compatible, canned JSON per reasoning step)
+- broker: FakeBroker (IBKRBridge surface used by the orchestrator)
+- alerts: FakeAlertRouter
+"""
+import json
+import time
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from services.market_data_gateway import normalize_bars
+
+# Symbols in the synthetic Data Lake (symbol -> asset_class)
+LAKE_SYMBOLS: Dict[str, str] = {
+    "BTC-USD": "CRYPTO",
+    "ETH-USD": "CRYPTO",
+    "SOL-USD": "CRYPTO",
+    "NVDA": "STOCKS",
+    "MSFT": "STOCKS",
+    "AAPL": "STOCKS",
+    "AMZN": "STOCKS",
+    "GOOGL": "STOCKS",
+    "^GSPC": "INDEX",
+    "GC=F": "COMMODITY",
+}
+
+LAKE_START = "2020-01-01"
+
+_INTERVAL_SPACING = {
+    "1m": timedelta(minutes=1),
+    "5m": timedelta(minutes=5),
+    "15m": timedelta(minutes=15),
+    "30m": timedelta(minutes=30),
+    "60m": timedelta(hours=1),
+    "90m": timedelta(minutes=90),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+
+def _seed(symbol: str, salt: str = "") -> int:
+    return zlib.crc32(f"{symbol}|{salt}".encode())
+
+
+def synthetic_ohlcv(symbol: str, index: pd.DatetimeIndex, salt: str = "") -> pd.DataFrame:
+    """
+    Seeded OHLCV bars: a cycle plus drift and noise, ending on an upswing.
+
+    The series finishes shortly after a cycle trough so the latest bar passes
+    the orchestrator's quality filters (RSI < 70, MACD histogram > 0) and the
+    full pipeline is exercised.
+
+    Args:
+        symbol: Symbol (selects the seed and price level)
+        index: Bar timestamps
+        salt: Extra seed material (e.g. the interval)
+
+    Returns:
+        DataFrame with Open/High/Low/Close/Volume columns on index
+    """
+    rng = np.random.default_rng(_seed(symbol, salt))
+    n = len(index)
+    level = 50 + (_seed(symbol) % 5000)
+    period = 40.0
+    t = np.arange(n, dtype="float64")
+    # Phase chosen so the last bar sits just past a trough of the cycle
+    phase = 1.5 * np.pi + 1.0 - 2 * np.pi * (n - 1) / period
+    cycle = 0.08 * np.sin(2 * np.pi * t / period + phase)
+    drift = 0.0004 * t
+    noise = np.cumsum(rng.normal(0, 0.002, n))
+    noise -= np.linspace(0, noise[-1], n)  # pin the random walk's endpoint
+    close = level * np.exp(cycle + drift + noise)
+    spread = np.abs(rng.normal(0, 0.004, n)) * close
+    open_ = close * (1 + rng.normal(0, 0.002, n))
+    volume = rng.integers(5_000, 50_000, n).astype("float64")
+    volume[-5:] *= 1.6  # volume confirmation on the latest bars
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) + spread,
+            "Low": np.minimum(open_, close) - spread,
+            "Close": close,
+            "Volume": volume,
+        },
+        index=index,
+    )
+
+
+class SyntheticBarProvider:
+    """Upstream provider returning seeded bars for any symbol and interval."""
+
+    name = "synthetic"
+
+    def __init__(self, bars: int = 600, latency_ms: float = 0.0, end: Optional[datetime] = None):
+        """
+        Args:
+            bars: Bars per (symbol, interval) history
+            latency_ms: Simulated upstream latency per call
+            end: Timestamp of the last bar (default: now, rounded down to the hour)
+        """
+        self.bars = bars
+        self.latency_ms = latency_ms
+        self.end = end or datetime.now().replace(minute=0, second=0, microsecond=0)
+        self.calls = 0
+
+    def fetch_bars(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        self.calls += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        spacing = _INTERVAL_SPACING.get(interval, timedelta(days=1))
+        index = pd.date_range(end=self.end, periods=self.bars, freq=spacing)
+        df = normalize_bars(synthetic_ohlcv(symbol, index, salt=interval))
+        if start is not None:
+            df = df[df.index >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df.index <= pd.Timestamp(end)]
+        return df
+
+    def fetch_quote(self, symbol: str) -> Optional[float]:
+        df = self.fetch_bars(symbol, "1d")
+        return float(df["Close"].iloc[-1]) if not df.empty else None
+
+
+def build_synthetic_lake(path: Path, symbols: Optional[Dict[str, str]] = None, start: str = LAKE_START) -> int:
+    """
+    Write a DuckDB Data Lake with daily bars from start through today.
+
+    Args:
+        path: DuckDB file to (re)create
+        symbols: symbol -> asset_class (default: LAKE_SYMBOLS)
+        start: First bar date
+
+    Returns:
+        Rows written
+    """
+    import duckdb
+
+    symbols = symbols or LAKE_SYMBOLS
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    index = pd.date_range(start=start, end=datetime.now().date(), freq="D")
+    frames = []
+    for symbol, asset_class in symbols.items():
+        df = synthetic_ohlcv(symbol, index, salt="lake").reset_index(names="date")
+        df.columns = [c.lower() for c in df.columns]
+        df["date"] = df["date"].dt.date
+        df["volume"] = df["volume"].astype("int64")
+        df["symbol"] = symbol
+        df["asset_class"] = asset_class
+        frames.append(df[["date", "symbol", "open", "high", "low", "close", "volume", "asset_class"]])
+    lake = pd.concat(frames, ignore_index=True)
+
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute("""
+            CREATE TABLE ohlcv_history (
+                date DATE NOT NULL,
+                symbol VARCHAR NOT NULL,
+                open DOUBLE,
+                high DOUBLE,
+                low DOUBLE,
+                close DOUBLE,
+                volume BIGINT,
+                asset_class VARCHAR NOT NULL,
+                PRIMARY KEY (symbol, date)
+            )
+        """)
+        conn.register("lake_df", lake)
+        conn.execute("INSERT INTO ohlcv_history SELECT * FROM lake_df")
+        conn.execute("CREATE INDEX idx_symbol_date ON ohlcv_history (symbol, date)")
+    finally:
+        conn.close()
+    return len(lake)
+
+
+class FakeNewsFetcher:
+    """NewsFetcher stand-in serving recorded headlines."""
+
+    HEADLINES = [
+        "{symbol} rallies as institutional demand surges",
+        "Analysts upgrade {symbol} on strong growth outlook",
+        "{symbol} volatility rises ahead of macro data",
+        "Markets steady as investors weigh Fed commentary",
+        "{symbol} partnership announcement boosts sentiment",
+    ]
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+
+    def get_context(self, symbol: str, max_specific: int = 3, max_fallback: int = 5) -> str:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        lines = [f"RECENT NEWS FOR {symbol}:"]
+        for i, headline in enumerate(self.HEADLINES[:max_specific], 1):
+            lines.append(f"{i}. {headline.format(symbol=symbol)}")
+        return "\n".join(lines)
+
+
+class FakeChatClient:
+    """
+    OpenAI-compatible client returning canned reasoning-step JSON.
+
+    Exposes client.chat.completions.create(model=..., messages=..., ...) like
+    the OpenAI SDK, so the real MetaCriticAgent parsing path runs.
+    """
+
+    RESPONSES = {
+        "proposer": {
+            "decision": "APPROVE",
+            "confidence": 0.82,
+            "thesis": "Momentum is turning up from a cycle low with volume confirmation.",
+            "risk_analysis": "Macro event risk; trend still young.",
+            "rationale": "Forecast and trust both supportive.",
+        },
+        "critic": {
+            "flaws": ["Short history in current regime"],
+            "revised_confidence": 0.8,
+            "critique_summary": "Thesis holds but sizing should stay modest.",
+        },
+        "verdict": {
+            "decision": "APPROVE",
+            "confidence": 0.8,
+            "risk_analysis": "Manageable with stop loss.",
+            "rationale": "Upswing with confirmed volume.",
+        },
+    }
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model: str, messages: List[Dict], **kwargs):
+        self.calls += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        system = messages[0]["content"] if messages else ""
+        user = messages[-1]["content"] if messages else ""
+        if "CRITIC AGENT" in system:
+            step = "critic"
+        elif user.startswith("Initial Analysis"):
+            step = "verdict"
+        else:
+            step = "proposer"
+        content = json.dumps(self.RESPONSES[step])
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=len(user) // 4, completion_tokens=len(content) // 4),
+        )
+
+
+class FakeBroker:
+    """IBKRBridge stand-in: always connected, fills every order instantly."""
+
+    def __init__(self, positions: Optional[List[str]] = None):
+        self.positions = positions or []
+        self.orders: List[SimpleNamespace] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    def get_positions(self) -> List[str]:
+        return list(self.positions)
+
+    def execute_trade(self, action: str, symbol: str, quantity: float, *args, **kwargs):
+        order = SimpleNamespace(orderId=len(self.orders) + 1, action=action, symbol=symbol, totalQuantity=quantity)
+        self.orders.append(order)
+        return order
+
+    def disconnect(self) -> None:
+        pass
+
+
+class FakeAlertRouter:
+    """AlertRouter stand-in that only counts alerts."""
+
+    def __init__(self):
+        self.sent = 0
+
+    def send_alert(self, message: str, level: str = "info", channel: Optional[str] = None, **kwargs) -> bool:
+        self.sent += 1
+        return True
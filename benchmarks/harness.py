@@ -0,0 +1,217 @@
+"""
+Benchmark measurement and baseline comparison.
+
+Each benchmark is timed over several runs (median wall time), then run once
+more under tracemalloc for peak Python heap usage. Per-stage latencies come
+from core.metrics, which is reset before every benchmark.
+"""
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from core.metrics import metrics
+
+# Benchmarks within this fraction of their baseline are not regressions
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one benchmark."""
+    name: str
+    ops: int
+    unit: str
+    runs_seconds: List[float]
+    wall_seconds: float
+    throughput: float
+    peak_memory_mb: Optional[float] = None
+    stages: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    counters: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _stage_breakdown(snapshot: Dict[str, Any], runs: int) -> Dict[str, Dict[str, float]]:
+    """Histograms from a metrics snapshot as {"name[label=value]": {...}} per run."""
+    stages = {}
+    for entry in snapshot["histograms"]:
+        labels = ",".join(f"{k}={v}" for k, v in entry["labels"].items())
+        key = f"{entry['name']}[{labels}]" if labels else entry["name"]
+        stages[key] = {
+            "calls": entry["count"] / runs,
+            "total_ms": round(entry["sum_ms"] / runs, 3),
+            "avg_ms": entry["avg_ms"],
+            "p95_ms": entry["p95_ms"],
+        }
+    return dict(sorted(stages.items(), key=lambda item: -item[1]["total_ms"]))
+
+
+def _counter_totals(snapshot: Dict[str, Any], runs: int) -> Dict[str, float]:
+    counters = {}
+    for entry in snapshot["counters"]:
+        labels = ",".join(f"{k}={v}" for k, v in entry["labels"].items())
+        key = f"{entry['name']}[{labels}]" if labels else entry["name"]
+        counters[key] = entry["value"] / runs
+    return counters
+
+
+def measure(
+    name: str,
+    func: Callable[[], int],
+    unit: str = "ops",
+    repeat: int = 3,
+    warmup: int = 1,
+    track_memory: bool = True
+) -> BenchmarkResult:
+    """
+    Benchmark a callable.
+
+    Args:
+        name: Benchmark name
+        func: Workload; returns the number of operations it performed
+        unit: Operation unit for throughput (e.g. "tickers", "campaigns")
+        repeat: Timed runs (median is reported)
+        warmup: Untimed runs first (caches, imports, lazy init)
+        track_memory: Extra run under tracemalloc for peak memory
+
+    Returns:
+        BenchmarkResult
+    """
+    for _ in range(warmup):
+        func()
+
+    metrics.reset()
+    runs, ops = [], 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        ops = func()
+        runs.append(time.perf_counter() - start)
+    snapshot = metrics.snapshot()
+
+    peak_mb = None
+    if track_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+
+    wall = statistics.median(runs)
+    return BenchmarkResult(
+        name=name,
+        ops=ops,
+        unit=unit,
+        runs_seconds=[round(r, 4) for r in runs],
+        wall_seconds=round(wall, 4),
+        throughput=round(ops / wall, 3) if wall > 0 else 0.0,
+        peak_memory_mb=round(peak_mb, 2) if peak_mb is not None else None,
+        stages=_stage_breakdown(snapshot, repeat),
+        counters=_counter_totals(snapshot, repeat),
+    )
+
+
+# ----------------------------------------------------------------------
+# Baselines
+# ----------------------------------------------------------------------
+
+def environment_info() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or "unknown",
+    }
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path) -> None:
+    """Write results as the baseline (merged into any existing baseline file)."""
+    baseline = load_baseline(path) or {"benchmarks": {}}
+    baseline["updated_at"] = datetime.now().isoformat()
+    baseline["environment"] = environment_info()
+    for result in results:
+        baseline["benchmarks"][result.name] = result.to_dict()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Current results
+        baseline: Loaded baseline file
+        tolerance: Allowed relative slowdown / memory growth
+
+    Returns:
+        One row per benchmark with wall/memory ratios and a regression flag
+    """
+    rows = []
+    for result in results:
+        base = baseline.get("benchmarks", {}).get(result.name)
+        if base is None:
+            rows.append({"name": result.name, "status": "new"})
+            continue
+        wall_ratio = result.wall_seconds / base["wall_seconds"] if base["wall_seconds"] else 1.0
+        mem_ratio = None
+        if result.peak_memory_mb is not None and base.get("peak_memory_mb"):
+            mem_ratio = result.peak_memory_mb / base["peak_memory_mb"]
+        regressed = wall_ratio > 1 + tolerance or (mem_ratio is not None and mem_ratio > 1 + tolerance)
+        rows.append({
+            "name": result.name,
+            "status": "REGRESSION" if regressed else "ok",
+            "wall_ratio": round(wall_ratio, 3),
+            "memory_ratio": round(mem_ratio, 3) if mem_ratio is not None else None,
+            "baseline_wall_seconds": base["wall_seconds"],
+            "baseline_peak_memory_mb": base.get("peak_memory_mb"),
+        })
+    return rows
+
+
+def format_report(results: List[BenchmarkResult], comparison: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Human-readable report."""
+    by_name = {row["name"]: row for row in comparison or []}
+    lines = []
+    for result in results:
+        memory = f"{result.peak_memory_mb:.1f} MB" if result.peak_memory_mb is not None else "n/a"
+        lines.append("=" * 72)
+        lines.append(
+            f"{result.name}: {result.wall_seconds:.3f}s median of {len(result.runs_seconds)} "
+            f"| {result.throughput:.2f} {result.unit}/s ({result.ops} {result.unit}) | peak {memory}"
+        )
+        row = by_name.get(result.name)
+        if row and row["status"] != "new":
+            mem_ratio = f", memory x{row['memory_ratio']:.2f}" if row["memory_ratio"] is not None else ""
+            marker = "❌" if row["status"] == "REGRESSION" else "✅"
+            lines.append(f"  {marker} vs baseline: wall x{row['wall_ratio']:.2f}{mem_ratio}")
+        elif row:
+            lines.append("  (no baseline)")
+        for stage, values in list(result.stages.items())[:15]:
+            lines.append(
+                f"  {stage:<48} {values['total_ms']:>10.1f} ms/run "
+                f"({values['calls']:.0f} calls, avg {values['avg_ms']:.2f} ms)"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+FuggerBot benchmark suite.
+
+Runs the hot paths end to end against a synthetic DuckDB Data Lake and local
+stand-ins for yfinance, RSS, OpenRouter, TWS and the alert channels:
+
+- orchestrator: TradeOrchestrator.process_ticker over a ticker list
+- war_games:    WarGamesRunner.run_all_scenarios (full campaign grid)
+- war_games_snapshot: the same grid reading the memory-mapped lake snapshot
+- miner:        LearningBookMiner.mine_patterns over the lake
+- triggers:     TriggerEvaluator.evaluate_triggers over a synthetic trigger book
+- startup:      TradeOrchestrator construction plus warm_up() of its components
+
+Everything runs in a scratch workspace (temporary SQLite DB, Data Lake and
+data/ files), so the real data directory is never touched.
+
+Usage:
+    python -m benchmarks.run                      # all suites, compare to baseline
+    python -m benchmarks.run --suite orchestrator --repeat 5
+    python -m benchmarks.run --save-baseline      # record current numbers
+    python -m benchmarks.run --llm-latency-ms 800 # model network latency
+
+Exit code 1 when a benchmark regresses past --tolerance vs the baseline.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    BenchmarkResult,
+    compare,
+    format_report,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = PROJECT_ROOT / "data" / "benchmarks" / "baseline.json"
+
+ORCHESTRATOR_TICKERS = ["BTC-USD", "ETH-USD", "SOL-USD", "NVDA", "MSFT", "AAPL"]
+TRIGGER_SYMBOLS = 50
+TRIGGERS_PER_SYMBOL = 20
+
+# Per-symbol params written to data/optimized_params.json. Without the file the
+# loader falls back to trust_threshold 0.75, which rejects every synthetic
+# ticker at the trust stage and leaves the LLM/policy/execution stages unmeasured.
+BENCHMARK_PARAMS = {
+    "trust_threshold": 0.6,
+    "min_confidence": 0.7,
+    "max_position_size": 0.1,
+    "stop_loss": 0.05,
+    "take_profit": 0.15,
+    "cooldown_days": 0.0,
+}
+
+
+class Workspace:
+    """Scratch directory holding the synthetic lake, DB and data/ files."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.data_dir = root / "data"
+        self.lake_path = self.data_dir / "market_history.duckdb"
+        self.db_path = self.data_dir / "fuggerbot.db"
+        self.trade_memory = self.data_dir / "trade_memory.json"
+        self.learning_book = self.data_dir / "learning_book.json"
+        self.triggers_file = self.data_dir / "triggers.json"
+        self.optimized_params = self.data_dir / "optimized_params.json"
+
+
+def prepare_workspace(root: Path) -> Workspace:
+    """
+    Build the scratch workspace and point the app at it.
+
+    Must run before persistence.db is imported (it binds the DB path at import).
+
+    Args:
+        root: Empty directory to populate
+
+    Returns:
+        Workspace
+    """
+    ws = Workspace(root)
+    ws.data_dir.mkdir(parents=True, exist_ok=True)
+    os.environ["FUGGERBOT_DB_PATH"] = str(ws.db_path)
+    # Relative data/ paths (regime log, TRM memory, learning book) resolve here
+    os.chdir(root)
+
+    from benchmarks.fakes import SyntheticBarProvider, build_synthetic_lake
+    from services.market_data_gateway import MarketDataGateway, set_market_data_gateway
+    rows = build_synthetic_lake(ws.lake_path)
+    set_market_data_gateway(MarketDataGateway(provider=SyntheticBarProvider(), lake_path=ws.lake_path))
+
+    from research.miner import LearningBookMiner, MINING_SYMBOLS, MINING_LOOKBACK_DAYS
+    miner = LearningBookMiner(db_path=ws.lake_path, output_path=ws.learning_book)
+    miner.save_learning_book(miner.mine_patterns(symbols=MINING_SYMBOLS, lookback_days=MINING_LOOKBACK_DAYS))
+    miner.conn.close()
+
+    with open(ws.optimized_params, "w") as f:
+        json.dump([
+            {
+                "symbol": symbol,
+                "regime": "benchmark",
+                "best_strategy_name": "benchmark",
+                "best_params": BENCHMARK_PARAMS,
+                "score": 1.0,
+            }
+            for symbol in ORCHESTRATOR_TICKERS
+        ], f, indent=2)
+
+    print(f"📦 Workspace {root} (lake: {rows:,} rows)")
+    return ws
+
+
+# ----------------------------------------------------------------------
+# Suites (each returns the workload callable and its unit)
+# ----------------------------------------------------------------------
+
+def build_orchestrator(ws: Workspace, llm_latency_ms: float = 0.0, news_latency_ms: float = 0.0):
+    """
+    TradeOrchestrator wired to local stand-ins (no TWS, RSS or OpenRouter).
+
+    Args:
+        ws: Workspace
+        llm_latency_ms: Simulated latency per LLM call
+        news_latency_ms: Simulated latency per news fetch
+
+    Returns:
+        TradeOrchestrator
+    """
+    from config.settings import Settings
+    from config import AdaptiveParamLoader
+    from engine.orchestrator import TradeOrchestrator
+    from reasoning.engine import DeepSeekEngine
+    from reasoning.memory import TradeMemory
+    from agents.trm.memory_summarizer import MemorySummarizer
+    from benchmarks.fakes import FakeBroker, FakeChatClient, FakeNewsFetcher
+
+    reasoning_engine = DeepSeekEngine(api_key="offline-benchmark", base_url="http://127.0.0.1:9/v1")
+    reasoning_engine.client = FakeChatClient(latency_ms=llm_latency_ms)
+
+    # Stand-ins are injected before first use; the remaining components are
+    # built lazily from the workspace (cwd) during the warm-up run
+    orchestrator = TradeOrchestrator(
+        env="benchmark",
+        settings=Settings(openrouter_api_key="offline-benchmark", live_trading_enabled=True)
+    )
+    orchestrator.reasoning_engine = reasoning_engine
+    orchestrator.memory = TradeMemory(memory_file=ws.trade_memory)
+    orchestrator.param_loader = AdaptiveParamLoader(params_file=ws.data_dir / "adaptive_params.json")
+    orchestrator.news_fetcher = FakeNewsFetcher(latency_ms=news_latency_ms)
+    orchestrator.memory_summarizer = MemorySummarizer(memory_file=ws.trade_memory, db_path=ws.lake_path)
+    orchestrator.broker = FakeBroker(positions=["MSFT"])
+    return orchestrator
+
+
+def orchestrator_suite(ws: Workspace, args) -> Tuple[Callable[[], int], str]:
+    from reasoning.memory import TradeMemory
+
+    orchestrator = build_orchestrator(ws, args.llm_latency_ms, args.news_latency_ms)
+    tickers = ORCHESTRATOR_TICKERS[:2] if args.quick else ORCHESTRATOR_TICKERS
+
+    def run() -> int:
+        # Fresh trade memory per run so every run does the same work
+        ws.trade_memory.unlink(missing_ok=True)
+        orchestrator.memory = TradeMemory(memory_file=ws.trade_memory)
+        for ticker in tickers:
+            orchestrator.process_ticker(ticker)
+        return len(tickers)
+
+    return run, "tickers"
+
+
+def startup_suite(ws: Workspace, args) -> Tuple[Callable[[], int], str]:
+    from config.settings import Settings
+    from engine.orchestrator import TradeOrchestrator
+
+    settings = Settings(openrouter_api_key="offline-benchmark")
+
+    def run() -> int:
+        # Construction plus a blocking warm-up of every component but the broker
+        orchestrator = TradeOrchestrator(env="benchmark", settings=settings)
+        orchestrator.warm_up(background=False)
+        return 1
+
+    return run, "orchestrators"
+
+
+def war_games_suite(ws: Workspace, args) -> Tuple[Callable[[], int], str]:
+    from daemon.simulator.war_games_runner import WarGamesRunner
+
+    runner = WarGamesRunner(db_path=ws.lake_path)
+    output = ws.data_dir / "war_games_results.json"
+    trm_memory = ws.data_dir / "trm_memory.jsonl"
+
+    def run() -> int:
+        trm_memory.unlink(missing_ok=True)
+        return runner.run_all_scenarios(output_path=output)["total_campaigns"]
+
+    return run, "campaigns"
+
+
+def war_games_snapshot_suite(ws: Workspace, args) -> Tuple[Callable[[], int], str]:
+    from daemon.simulator.war_games_runner import WarGamesRunner
+    from services.lake_snapshot import ensure_lake_snapshot
+
+    # Same campaign grid as war_games, reading bars from the mapped snapshot
+    snapshot = ensure_lake_snapshot(ws.lake_path, ws.data_dir / "lake_snapshot")
+    runner = WarGamesRunner(db_path=ws.lake_path, preloaded_data=snapshot)
+    output = ws.data_dir / "war_games_results.json"
+    trm_memory = ws.data_dir / "trm_memory.jsonl"
+
+    def run() -> int:
+        trm_memory.unlink(missing_ok=True)
+        return runner.run_all_scenarios(output_path=output)["total_campaigns"]
+
+    return run, "campaigns"
+
+
+def miner_suite(ws: Workspace, args) -> Tuple[Callable[[], int], str]:
+    from research.miner import LearningBookMiner
+
+    miner = LearningBookMiner(db_path=ws.lake_path, output_path=ws.learning_book)
+    lookback_days = 365 if args.quick else 730
+
+    def run() -> int:
+        miner.mine_patterns(lookback_days=lookback_days)
+        return miner.conn.execute(
+            "SELECT COUNT(DISTINCT symbol) FROM ohlcv_history WHERE asset_class IN ('CRYPTO', 'STOCKS')"
+        ).fetchone()[0]
+
+    return run, "symbols"
+
+
+def triggers_suite(ws: Workspace, args) -> Tuple[Callable[[], int], str]:
+    from services.trigger_service import TriggerService
+    from services.market_data_bus import get_market_data_bus
+    from core.trigger_engine import TriggerEngine
+    from workers.trigger_evaluator import TriggerEvaluator
+    from benchmarks.fakes import FakeAlertRouter
+
+    # Trigger book: thresholds spread around each symbol's price so ~5% fire
+    symbols = [f"SYM{i:03d}" for i in range(TRIGGER_SYMBOLS)]
+    price = {symbol: 100.0 + i for i, symbol in enumerate(symbols)}
+    conditions = [">", "<", "rise_pct", "drop_pct"]
+    triggers = []
+    for symbol in symbols:
+        for j in range(TRIGGERS_PER_SYMBOL):
+            condition = conditions[j % len(conditions)]
+            if condition in (">", "<"):
+                offset = 1 + 0.01 * (j + 1)  # 1% .. 20% away
+                value = price[symbol] * (offset if condition == ">" else 2 - offset)
+                if j == 0:
+                    value = price[symbol] * 0.99  # fires
+            else:
+                value = 0.5 + 0.5 * j  # % move; fires below the 1% quote move
+            triggers.append({
+                "id": f"{symbol}-{j}",
+                "symbol": symbol,
+                "condition": condition,
+                "value": round(value, 4),
+                "action": ["notify", "buy", "sell", "layer_in"][j % 4],
+                "enabled": True,
+            })
+    with open(ws.triggers_file, "w") as f:
+        json.dump(triggers, f)
+
+    evaluator = TriggerEvaluator()
+    evaluator.trigger_service = TriggerService(trigger_file=ws.triggers_file)
+    evaluator.engine = TriggerEngine(evaluator.trigger_service)
+    evaluator.alert_router = FakeAlertRouter()
+    bus = get_market_data_bus()
+
+    def run() -> int:
+        for symbol in symbols:
+            bus.publish_quote(symbol, price[symbol] * 0.99, source="benchmark")
+            bus.publish_quote(symbol, price[symbol], source="benchmark")
+        evaluator.evaluate_triggers()
+        return len(triggers)
+
+    return run, "triggers"
+
+
+SUITES: Dict[str, Callable] = {
+    "miner": miner_suite,
+    "war_games": war_games_suite,
+    "war_games_snapshot": war_games_snapshot_suite,
+    "orchestrator": orchestrator_suite,
+    "startup": startup_suite,
+    "triggers": triggers_suite,
+}
+
+
+def run_suites(ws: Workspace, names: List[str], args) -> List[BenchmarkResult]:
+    results = []
+    for name in names:
+        print(f"⏱️  {name}...")
+        workload, unit = SUITES[name](ws, args)
+        results.append(measure(
+            name,
+            workload,
+            unit=unit,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            track_memory=not args.no_memory
+        ))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FuggerBot benchmark suite")
+    parser.add_argument("--suite", default=",".join(SUITES), help=f"Comma-separated suites ({', '.join(SUITES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (median reported)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup runs")
+    parser.add_argument("--quick", action="store_true", help="Smaller workloads")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency per LLM call")
+    parser.add_argument("--news-latency-ms", type=float, default=0.0, help="Simulated latency per news fetch")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown/memory growth")
+    parser.add_argument("--json", type=Path, help="Also write results as JSON")
+    parser.add_argument("--workspace", type=Path, help="Keep the scratch workspace here (default: temp dir)")
+    parser.add_argument("--verbose", action="store_true", help="Keep INFO logging from the pipeline")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.suite.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        parser.error(f"Unknown suite(s): {', '.join(unknown)}")
+
+    baseline_path = args.baseline.resolve()
+    json_path = args.json.resolve() if args.json else None
+    cwd = Path.cwd()
+    root = args.workspace.resolve() if args.workspace else Path(tempfile.mkdtemp(prefix="fuggerbot-bench-"))
+    root.mkdir(parents=True, exist_ok=True)
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+        os.environ.setdefault("TQDM_DISABLE", "1")  # war games progress bars
+
+    try:
+        ws = prepare_workspace(root)
+        results = run_suites(ws, names, args)
+    finally:
+        os.chdir(cwd)
+        if not args.workspace:
+            shutil.rmtree(root, ignore_errors=True)
+
+    baseline = load_baseline(baseline_path)
+    comparison = compare(results, baseline, args.tolerance) if baseline else None
+    print(format_report(results, comparison))
+
+    if json_path:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(json_path, "w") as f:
+            json.dump({"results": [r.to_dict() for r in results], "comparison": comparison}, f, indent=2)
+
+    if args.save_baseline:
+        save_baseline(results, baseline_path)
+        print(f"💾 Baseline saved to {baseline_path}")
+        return 0
+
+    if baseline is None:
+        print(f"ℹ️  No baseline at {baseline_path} (run with --save-baseline)")
+        return 0
+    regressions = [row["name"] for row in comparison if row["status"] == "REGRESSION"]
+    if regressions:
+        print(f"❌ Regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
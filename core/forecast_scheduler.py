@@ -3,10 +3,11 @@ Daily forecast scheduler.
 
 Automatically generates and stores forecasts on a schedule.
 """
-import schedule
+import threading
 import time
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import sys
@@ -30,7 +31,9 @@ class ForecastScheduler:
         symbols: List[str],
         forecast_horizon: int = 30,
         historical_period: str = "1y",
-        context_length: Optional[int] = None
+        context_length: Optional[int] = None,
+        batch_size: int = 16,
+        fetch_workers: int = 8
     ):
         """
         Initialize forecast scheduler.
@@ -40,24 +43,44 @@ class ForecastScheduler:
             forecast_horizon: Forecast horizon in days
             historical_period: Historical data period
             context_length: Context window size
+            batch_size: Symbols per batched forecast/trust evaluation
+            fetch_workers: Concurrent history fetches
         """
         self.symbols = symbols
         self.forecast_horizon = forecast_horizon
         self.historical_period = historical_period
         self.context_length = context_length
+        self.batch_size = max(1, batch_size)
+        self.fetch_workers = fetch_workers
+        self._stop_event = threading.Event()
         
         self.forecast_trader = ForecastTrader()
         self.metadata = ForecastMetadata()
         
         logger.info(f"ForecastScheduler initialized for {len(symbols)} symbols")
     
+    def _parameters(self) -> Dict[str, Any]:
+        return {
+            "context_length": self.context_length,
+            "historical_period": self.historical_period,
+            "strict_mode": False,
+            "min_trust_score": 0.6,
+            "forecast_horizon": self.forecast_horizon
+        }
+    
     def run_daily_forecasts(self) -> Dict[str, Any]:
         """
         Run forecasts for all symbols.
         
+        Pipelined: histories are fetched concurrently, and every `batch_size`
+        fetched series go through one batched forecast + trust evaluation
+        while the remaining fetches continue. Snapshots for the whole run are
+        written in one bulk insert.
+        
         Returns:
             Dict with results
         """
+        started = time.perf_counter()
         results = {
             "timestamp": datetime.now().isoformat(),
             "symbols_processed": 0,
@@ -66,44 +89,68 @@ class ForecastScheduler:
             "forecasts": []
         }
         
-        for symbol in self.symbols:
-            try:
-                logger.info(f"Generating daily forecast for {symbol}")
-                
-                # Get historical data
-                prices = get_historical_prices(symbol, period=self.historical_period)
+        with ThreadPoolExecutor(max_workers=max(1, self.fetch_workers)) as pool, self.metadata.batch():
+            futures = {
+                pool.submit(get_historical_prices, symbol, period=self.historical_period): symbol
+                for symbol in self.symbols
+            }
+            ready: Dict[str, List[float]] = {}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                prices = future.result()
                 if not prices or len(prices) < 20:
                     logger.warning(f"Insufficient data for {symbol}")
                     results["symbols_failed"] += 1
                     continue
-                
-                # Generate forecast
-                result = self.forecast_trader.analyze_symbol(
-                    symbol=symbol,
-                    historical_prices=prices,
-                    forecast_horizon=self.forecast_horizon,
-                    context_length=self.context_length
-                )
-                
+                ready[symbol] = prices
+                if len(ready) >= self.batch_size:
+                    self._forecast_batch(ready, results)
+                    ready = {}
+            if ready:
+                self._forecast_batch(ready, results)
+        
+        # Report in watchlist order regardless of fetch completion order
+        order = {symbol: i for i, symbol in enumerate(self.symbols)}
+        results["forecasts"].sort(key=lambda f: order.get(f["symbol"], len(order)))
+        results["duration_seconds"] = round(time.perf_counter() - started, 2)
+        
+        # Save daily summary
+        self._save_daily_summary(results)
+        
+        logger.info(
+            f"Daily forecasts complete: {results['symbols_successful']}/{results['symbols_processed']} successful "
+            f"in {results['duration_seconds']:.1f}s"
+        )
+        
+        return results
+    
+    def _forecast_batch(self, symbol_data: Dict[str, List[float]], results: Dict[str, Any]) -> None:
+        """Forecast, evaluate and snapshot one batch of symbols, updating results in place."""
+        logger.info(f"Generating daily forecasts for {len(symbol_data)} symbols: {', '.join(symbol_data)}")
+        try:
+            analyses = self.forecast_trader.analyze_multiple_symbols(
+                symbol_data,
+                forecast_horizon=self.forecast_horizon,
+                context_length=self.context_length
+            )
+        except Exception as e:
+            logger.error(f"Error generating forecasts for {', '.join(symbol_data)}: {e}", exc_info=True)
+            results["symbols_failed"] += len(symbol_data)
+            return
+        
+        parameters = self._parameters()
+        for symbol, result in analyses.items():
+            try:
                 results["symbols_processed"] += 1
                 
                 if result.get("success") and result["trust_evaluation"].is_trusted:
-                    # Save snapshot
-                    parameters = {
-                        "context_length": self.context_length,
-                        "historical_period": self.historical_period,
-                        "strict_mode": False,
-                        "min_trust_score": 0.6,
-                        "forecast_horizon": self.forecast_horizon
-                    }
-                    
+                    # Save snapshot (buffered until the run's batch() exits)
                     forecast_id = self.metadata.generate_forecast_id(symbol, parameters)
-                    snapshot_path = self.metadata.save_forecast_snapshot(
+                    self.metadata.save_forecast_snapshot(
                         forecast_id, symbol, parameters, result
                     )
                     
                     # Extract key metrics for time series
-                    forecast = result["forecast"]
                     recommendation = result["recommendation"]
                     trust_eval = result["trust_evaluation"]
                     
@@ -115,8 +162,7 @@ class ForecastScheduler:
                         "risk_pct": recommendation.get("risk_pct", 0),
                         "trust_score": trust_eval.metrics.overall_trust_score,
                         "confidence": trust_eval.metrics.confidence_level,
-                        "action": recommendation.get("action", "HOLD"),
-                        "snapshot_path": str(snapshot_path)
+                        "action": recommendation.get("action", "HOLD")
                     }
                     
                     results["forecasts"].append(forecast_summary)
@@ -130,15 +176,6 @@ class ForecastScheduler:
             except Exception as e:
                 logger.error(f"Error generating forecast for {symbol}: {e}", exc_info=True)
                 results["symbols_failed"] += 1
-        
-        # Save daily summary
-        self._save_daily_summary(results)
-        
-        logger.info(
-            f"Daily forecasts complete: {results['symbols_successful']}/{results['symbols_processed']} successful"
-        )
-        
-        return results
     
     def _save_daily_summary(self, results: Dict[str, Any]) -> None:
         """Save daily forecast summary."""
@@ -154,24 +191,61 @@ class ForecastScheduler:
         
         logger.info(f"Daily summary saved: {summary_file}")
     
+    @staticmethod
+    def next_run_at(run_time: str, now: Optional[datetime] = None) -> datetime:
+        """
+        Next occurrence of a daily HH:MM run time.
+        
+        Args:
+            run_time: Time of day (HH:MM, local time)
+            now: Reference time (default: now)
+        
+        Returns:
+            Today's run time if still ahead, otherwise tomorrow's
+        """
+        now = now or datetime.now()
+        hour, minute = (int(part) for part in run_time.split(":"))
+        candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        return candidate
+    
     def start_scheduler(self, run_time: str = "09:00") -> None:
         """
         Start the daily forecast scheduler.
         
+        Sleeps until the next run time (no polling); stop() wakes it.
+        
         Args:
             run_time: Time to run forecasts daily (HH:MM format)
         """
-        schedule.every().day.at(run_time).do(self.run_daily_forecasts)
-        
+        self._stop_event.clear()
         logger.info(f"Forecast scheduler started - will run daily at {run_time}")
         logger.info("Press Ctrl+C to stop")
         
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            while not self._stop_event.is_set():
+                next_run = self.next_run_at(run_time)
+                logger.info(f"Next forecast run at {next_run.isoformat(timespec='minutes')}")
+                # Re-check the wall clock after waking (sleep can drift across suspend/DST)
+                while not self._stop_event.is_set():
+                    remaining = (next_run - datetime.now()).total_seconds()
+                    if remaining <= 0:
+                        break
+                    self._stop_event.wait(min(remaining, 3600))
+                if self._stop_event.is_set():
+                    break
+                try:
+                    self.run_daily_forecasts()
+                except Exception as e:
+                    logger.error(f"Daily forecast run failed: {e}", exc_info=True)
         except KeyboardInterrupt:
-            logger.info("Forecast scheduler stopped")
+            pass
+        logger.info("Forecast scheduler stopped")
+    
+    def stop(self) -> None:
+        """Stop a running scheduler."""
+        self._stop_event.set()
 
 
 def run_scheduler_cli():
@@ -183,16 +257,24 @@ def run_scheduler_cli():
     parser.add_argument("--time", default="09:00", help="Daily run time (HH:MM)")
     parser.add_argument("--horizon", type=int, default=30, help="Forecast horizon")
     parser.add_argument("--period", default="1y", help="Historical period")
+    parser.add_argument("--batch-size", type=int, default=16, help="Symbols per batched forecast")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent history fetches")
+    parser.add_argument("--once", action="store_true", help="Run once now and exit")
     
     args = parser.parse_args()
     
     scheduler = ForecastScheduler(
         symbols=args.symbols,
         forecast_horizon=args.horizon,
-        historical_period=args.period
+        historical_period=args.period,
+        batch_size=args.batch_size,
+        fetch_workers=args.workers
     )
     
-    scheduler.start_scheduler(run_time=args.time)
+    if args.once:
+        scheduler.run_daily_forecasts()
+    else:
+        scheduler.start_scheduler(run_time=args.time)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+Lazily constructed components.
+
+LazyComponent works like functools.cached_property, but is safe to trigger
+from several threads (the factory runs once per instance) and records how
+long each component took to build:
+
+    class TradeOrchestrator:
+        @LazyComponent
+        def reasoning_engine(self) -> DeepSeekEngine:
+            from reasoning.engine import DeepSeekEngine
+            return DeepSeekEngine(...)
+
+The built value is stored in the instance __dict__ under the same name, so
+later reads are plain attribute lookups and assigning the attribute (e.g. to
+inject a stand-in) skips the factory entirely.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.metrics import metrics
+
+_LOCKS_ATTR = "_lazy_locks"
+_TIMINGS_ATTR = "_lazy_timings"
+
+
+class LazyComponent:
+    """Descriptor building an attribute on first access via a factory method."""
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        """
+        Args:
+            factory: Method returning the component (called once per instance)
+        """
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        state = instance.__dict__
+        if self.name in state:
+            return state[self.name]
+
+        # setdefault is atomic for dicts, so racing threads share one lock
+        lock = state.setdefault(_LOCKS_ATTR, {}).setdefault(self.name, threading.Lock())
+        with lock:
+            if self.name in state:
+                return state[self.name]
+            start = time.perf_counter()
+            value = self.factory(instance)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            state[self.name] = value
+
+        state.setdefault(_TIMINGS_ATTR, {})[self.name] = elapsed_ms
+        metrics.observe("startup.component", elapsed_ms, component=self.name, owner=type(instance).__name__)
+        return value
+
+
+def lazy_components(cls: type) -> List[str]:
+    """Names of the LazyComponent attributes of a class (in definition order)."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, LazyComponent) and name not in names:
+                names.append(name)
+    return names
+
+
+def is_built(instance: Any, name: str) -> bool:
+    """Whether a lazy component has been built (or assigned) on instance."""
+    return name in instance.__dict__
+
+
+def build_timings(instance: Any) -> Dict[str, float]:
+    """Build time (ms) of each lazy component built so far on instance."""
+    return dict(instance.__dict__.get(_TIMINGS_ATTR, {}))
@@ -8,10 +8,14 @@ Provides structured logging for:
 - Backtest results
 - IBKR callbacks
 """
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 import json
 
@@ -19,9 +23,157 @@ import json
 log_dir = Path(__file__).parent.parent / "data" / "logs"
 log_dir.mkdir(parents=True, exist_ok=True)
 
+# Pipeline configuration (environment)
+# FUGGERBOT_LOG_QUEUE=0       -> handlers run synchronously on the calling thread
+# FUGGERBOT_LOG_JSON=0        -> no JSON-lines file (fuggerbot.jsonl)
+# FUGGERBOT_LOG_LEVEL         -> minimum level recorded at all (default DEBUG)
+# FUGGERBOT_LOG_ROTATE_WHEN   -> time rotation ("midnight", "H", ...); unset = size rotation
+# FUGGERBOT_LOG_MAX_BYTES / FUGGERBOT_LOG_BACKUPS -> rotation size / files kept
+LOG_QUEUE = os.getenv("FUGGERBOT_LOG_QUEUE", "1") != "0"
+LOG_JSON = os.getenv("FUGGERBOT_LOG_JSON", "1") != "0"
+LOG_LEVEL = os.getenv("FUGGERBOT_LOG_LEVEL", "DEBUG").upper()
+LOG_ROTATE_WHEN = os.getenv("FUGGERBOT_LOG_ROTATE_WHEN", "")
+LOG_MAX_BYTES = int(os.getenv("FUGGERBOT_LOG_MAX_BYTES", 50 * 1024 * 1024))
+LOG_BACKUPS = int(os.getenv("FUGGERBOT_LOG_BACKUPS", 5))
+
+# Standard LogRecord attributes (anything else was passed via extra=)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+# Argument types safe to format later on the listener thread
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), bytes, datetime)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line, including extra={"data": ...} payloads."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "func": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats every record on the calling thread. Here
+    the message is only rendered eagerly when an argument is mutable (its
+    value could change before the listener gets to it).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(a, _IMMUTABLE_ARGS) for a in values):
+                record.msg = record.getMessage()
+                record.args = None
+        if record.exc_info and not record.exc_text:
+            # Tracebacks reference live frames; render them now
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _rotating_handler(path: Path) -> logging.Handler:
+    """Size- or time-rotating file handler per FUGGERBOT_LOG_ROTATE_WHEN."""
+    if LOG_ROTATE_WHEN:
+        return logging.handlers.TimedRotatingFileHandler(
+            path, when=LOG_ROTATE_WHEN, backupCount=LOG_BACKUPS, encoding="utf-8"
+        )
+    return logging.handlers.RotatingFileHandler(
+        path, mode="a", maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+    )
+
+
+_listeners: List[logging.handlers.QueueListener] = []
+
+
+def enable_queue_logging(target: Optional[logging.Logger] = None) -> Optional[logging.handlers.QueueListener]:
+    """
+    Move a logger's handlers behind a queue.
+
+    Callers only enqueue records; a background listener thread does the
+    formatting and I/O. Idempotent per logger; a no-op with FUGGERBOT_LOG_QUEUE=0.
+
+    Args:
+        target: Logger whose handlers to move (default: the root logger,
+            e.g. after logging.basicConfig in scripts and the simulator)
+
+    Returns:
+        The QueueListener, or None if the logger had no handlers or already queues
+    """
+    if not LOG_QUEUE:
+        return None
+    target = target if target is not None else logging.getLogger()
+    handlers = [h for h in target.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers or len(handlers) != len(target.handlers):
+        return None
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(DeferredQueueHandler(log_queue))
+    listener.start()
+    _listeners.append(listener)
+    return listener
+
+
+@atexit.register
+def flush_logging() -> None:
+    """Stop listeners, draining queued records (runs at exit)."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+class Lazy:
+    """
+    Defers an expensive computation to when a log record is formatted.
+
+    Use with %-style arguments: logger.debug("state: %s", lazy(describe, obj)).
+    Nothing is computed when the level is disabled.
+    """
+
+    __slots__ = ("fn", "args", "kwargs")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self.fn(*self.args, **self.kwargs))
+
+
+def lazy(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Lazy:
+    """Lazy-formatted log argument (see Lazy)."""
+    return Lazy(fn, *args, **kwargs)
+
+
+def is_enabled(level: int, log: Optional[logging.Logger] = None) -> bool:
+    """Guard for hot paths: skip building log payloads nobody will record."""
+    return (log or root_logger).isEnabledFor(level)
+
+
 # Configure root logger
 root_logger = logging.getLogger("fuggerbot")
-root_logger.setLevel(logging.DEBUG)
+root_logger.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
 
 # Remove existing handlers to avoid duplicates
 if root_logger.handlers:
@@ -37,9 +189,9 @@ console_formatter = logging.Formatter(
 console_handler.setFormatter(console_formatter)
 root_logger.addHandler(console_handler)
 
-# File handler (DEBUG and above)
+# File handler (DEBUG and above, rotating)
 log_file = log_dir / "fuggerbot.log"
-file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+file_handler = _rotating_handler(log_file)
 file_handler.setLevel(logging.DEBUG)
 file_formatter = logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
@@ -48,9 +200,18 @@ file_formatter = logging.Formatter(
 file_handler.setFormatter(file_formatter)
 root_logger.addHandler(file_handler)
 
+# JSON-lines handler (structured events with their extra data)
+if LOG_JSON:
+    json_handler = _rotating_handler(log_dir / "fuggerbot.jsonl")
+    json_handler.setLevel(logging.DEBUG)
+    json_handler.setFormatter(JsonLinesFormatter())
+    root_logger.addHandler(json_handler)
+
 # Prevent propagation to root logger
 root_logger.propagate = False
 
+enable_queue_logging(root_logger)
+
 
 def get_logger(name: str = "fuggerbot") -> logging.Logger:
     """
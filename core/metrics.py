@@ -0,0 +1,345 @@
+"""
+Lightweight in-process metrics for FuggerBot.
+
+Counters and latency histograms keyed by name + labels, e.g.:
+
+    from core.metrics import metrics
+
+    with metrics.timer("pipeline.stage", stage="forecast"):
+        forecast = engine.forecast(...)
+    metrics.incr("pipeline.decisions", decision="APPROVE")
+
+Exported as Prometheus text (GET /metrics on the API) and as periodic JSON
+snapshots (data/metrics/<process>.json) for the daemons.
+
+FUGGERBOT_METRICS=0 disables collection: timer() then returns a shared no-op
+context manager and incr()/observe() return immediately.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("FUGGERBOT_METRICS", "1") != "0"
+SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "metrics"
+SNAPSHOT_INTERVAL_SECONDS = int(os.getenv("FUGGERBOT_METRICS_INTERVAL", 60))
+
+# Histogram bucket upper bounds (milliseconds)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000
+)
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> _Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Bucketed latency distribution (count, sum, min, max, cumulative buckets)."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot = +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile (upper bound of the bucket holding it)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total, 3),
+            "avg_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+        }
+
+
+class _Timer:
+    """Context manager recording its elapsed time (ms) into a histogram."""
+
+    __slots__ = ("_registry", "_name", "_labels", "_start", "elapsed_ms")
+
+    def __init__(self, registry: "MetricsRegistry", name: str, labels: Dict[str, Any]):
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+        self.elapsed_ms = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.elapsed_ms = (time.perf_counter() - self._start) * 1000
+        self._registry.observe(self._name, self.elapsed_ms, **self._labels)
+        if exc_type is not None:
+            self._registry.incr(f"{self._name}.errors", **self._labels)
+        return False
+
+
+class _NullTimer:
+    """No-op timer used when metrics are disabled."""
+
+    __slots__ = ()
+    elapsed_ms = 0.0
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters and latency histograms."""
+
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        """
+        Initialize registry.
+
+        Args:
+            enabled: Collect metrics (False makes every call a no-op)
+        """
+        self.enabled = enabled
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._counters: Dict[_Key, float] = {}
+        self._histograms: Dict[_Key, Histogram] = {}
+        self._writer: Optional[threading.Thread] = None
+        self._writer_stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def incr(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add value to a counter."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value_ms: float, **labels: Any) -> None:
+        """Record a latency (milliseconds) in a histogram."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value_ms)
+
+    def timer(self, name: str, **labels: Any):
+        """
+        Time a block into the `name` histogram.
+
+        Exceptions propagate and are also counted as `<name>.errors`.
+
+        Args:
+            name: Metric name (dotted, e.g. "pipeline.stage")
+            **labels: Label values (e.g. stage="forecast")
+
+        Returns:
+            Context manager (exposes elapsed_ms after exit)
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def timed(self, name: str, **labels: Any) -> Callable:
+        """Decorator form of timer()."""
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+        self.started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current values as a JSON-serializable dict.
+
+        Returns:
+            Dict with counters and histograms, each a list of
+            {"name", "labels", ...values} entries
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+        return {
+            "timestamp": time.time(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "pid": os.getpid(),
+            "enabled": self.enabled,
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def render_prometheus(self, prefix: str = "fuggerbot") -> str:
+        """
+        Current values in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        def metric_name(name: str) -> str:
+            return f"{prefix}_{name}".replace(".", "_").replace("-", "_")
+
+        def label_str(labels, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+            pairs = tuple(labels) + extra
+            if not pairs:
+                return ""
+            escaped = (
+                k + '="' + v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+                for k, v in pairs
+            )
+            return "{" + ",".join(escaped) + "}"
+
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                metric = metric_name(name) + "_total"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} counter")
+                    typed.add(metric)
+                lines.append(f"{metric}{label_str(labels)} {value}")
+
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = metric_name(name) + "_ms"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} histogram")
+                    typed.add(metric)
+                cumulative = 0
+                for bound, n in zip(histogram.bounds, histogram.counts):
+                    cumulative += n
+                    lines.append(f"{metric}_bucket{label_str(labels, (('le', f'{bound:g}'),))} {cumulative}")
+                lines.append(f"{metric}_bucket{label_str(labels, (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{metric}_sum{label_str(labels)} {histogram.total:.3f}")
+                lines.append(f"{metric}_count{label_str(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, path: Path) -> None:
+        """Write snapshot() as JSON (atomically via a temp file)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self.snapshot(), f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write metrics snapshot {path}: {e}")
+
+    def start_snapshot_writer(
+        self,
+        process_name: str,
+        interval_seconds: int = SNAPSHOT_INTERVAL_SECONDS,
+        directory: Path = SNAPSHOT_DIR
+    ) -> Optional[Path]:
+        """
+        Periodically write snapshots to <directory>/<process_name>.json.
+
+        Runs on a daemon thread and writes a final snapshot at exit. Calling
+        it again while a writer is running is a no-op.
+
+        Args:
+            process_name: Snapshot file name (e.g. "api", "run_bot")
+            interval_seconds: Seconds between snapshots
+            directory: Snapshot directory
+
+        Returns:
+            Snapshot path, or None when metrics are disabled
+        """
+        if not self.enabled:
+            return None
+        path = directory / f"{process_name}.json"
+        with self._lock:
+            if self._writer is not None and self._writer.is_alive():
+                return path
+
+            def run():
+                while not self._writer_stop.wait(interval_seconds):
+                    self.write_snapshot(path)
+
+            self._writer_stop.clear()
+            self._writer = threading.Thread(target=run, name=f"metrics-{process_name}", daemon=True)
+            self._writer.start()
+        atexit.register(self.write_snapshot, path)
+        logger.info(f"📈 Metrics snapshots every {interval_seconds}s -> {path}")
+        return path
+
+    def stop_snapshot_writer(self) -> None:
+        """Stop the periodic snapshot writer."""
+        self._writer_stop.set()
+
+
+# Global registry
+metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return metrics
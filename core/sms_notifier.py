@@ -1,11 +1,13 @@
 """Twilio SMS notification module for FuggerBot core functionality."""
 import os
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from dotenv import load_dotenv
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioException
 from .logger import logger
 
+# twilio is imported on first send; core is imported by nearly every process
+if TYPE_CHECKING:
+    from twilio.rest import Client
+
 # Load environment variables
 load_dotenv()
 
@@ -23,7 +25,7 @@ class SMSNotifier:
         self.from_number = os.getenv("TWILIO_FROM_NUMBER") or os.getenv("TWILIO_FROM")
         self.to_number = os.getenv("TWILIO_TO_NUMBER") or os.getenv("TWILIO_TO")
         
-        self._client: Optional[Client] = None
+        self._client: Optional["Client"] = None
         self._is_configured = self._validate_config()
     
     def _validate_config(self) -> bool:
@@ -45,13 +47,14 @@ class SMSNotifier:
         return True
     
     @property
-    def client(self) -> Optional[Client]:
+    def client(self) -> Optional["Client"]:
         """Get or create Twilio client."""
         if not self._is_configured:
             return None
         
         if self._client is None:
             try:
+                from twilio.rest import Client
                 self._client = Client(self.account_sid, self.auth_token)
                 logger.debug("Twilio client initialized")
             except Exception as e:
@@ -82,6 +85,7 @@ class SMSNotifier:
         if not client:
             return False
         
+        from twilio.base.exceptions import TwilioException
         try:
             result = client.messages.create(
                 body=message,
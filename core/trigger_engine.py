@@ -1,2 +1,233 @@
-# Monitors asset prices and triggers alerts
+"""
+Event-driven trigger engine.
 
+Enabled triggers are indexed by symbol, with thresholds kept sorted per
+condition type, so a price update finds every fired trigger with a couple of
+binary searches instead of scanning the whole trigger list:
+
+- ">"  / "<":            price above / below threshold
+- "rise_pct" / "drop_pct": % move vs the previous price at least threshold
+
+Level mode fires every trigger whose condition currently holds (one-shot
+polling). Crossing mode fires only thresholds crossed since the last price
+seen for the symbol, which is what tick-level streams need; the first price
+seen for a symbol is evaluated in level mode, and so are ">"/"<" triggers
+added or changed by an index rebuild (on the next price for their symbol),
+so a new trigger whose threshold is already behind the price still fires.
+
+The index is rebuilt only when the trigger file changes (see
+TriggerService.version()).
+"""
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional
+
+from core.logger import logger
+
+LEVEL_CONDITIONS = (">", "<")
+PCT_CONDITIONS = ("rise_pct", "drop_pct")
+
+
+def _level_key(symbol: str, condition: str, threshold: float, trigger: Dict[str, Any]) -> tuple:
+    """Identity of a ">"/"<" trigger across index rebuilds."""
+    return (symbol, condition, threshold, trigger.get("id"))
+
+
+class _SortedTriggers:
+    """Thresholds sorted ascending with the trigger for each threshold."""
+
+    __slots__ = ("thresholds", "triggers")
+
+    def __init__(self, entries: List[tuple]):
+        entries.sort(key=lambda e: e[0])
+        self.thresholds = [e[0] for e in entries]
+        self.triggers = [e[1] for e in entries]
+
+    def slice(self, lo: int, hi: int) -> List[Dict[str, Any]]:
+        return self.triggers[lo:hi] if hi > lo else []
+
+
+class TriggerIndex:
+    """Per-symbol, per-condition sorted threshold index."""
+
+    def __init__(self, triggers: List[Dict[str, Any]]):
+        """
+        Build the index from trigger dicts (disabled triggers are skipped).
+
+        Args:
+            triggers: Trigger dicts with symbol, condition and value/price
+        """
+        grouped: Dict[str, Dict[str, List[tuple]]] = {}
+        self.level_triggers: Dict[tuple, Dict[str, Any]] = {}
+        self.size = 0
+        for trigger in triggers:
+            if not trigger.get("enabled", True):
+                continue
+            condition = trigger.get("condition")
+            if condition not in LEVEL_CONDITIONS + PCT_CONDITIONS:
+                logger.warning(f"Unknown condition type: {condition}")
+                continue
+            symbol = str(trigger.get("symbol", "")).upper()
+            if not symbol:
+                continue
+            threshold = float(trigger.get("value", trigger.get("price", 0)))
+            grouped.setdefault(symbol, {}).setdefault(condition, []).append((threshold, trigger))
+            if condition in LEVEL_CONDITIONS:
+                self.level_triggers[_level_key(symbol, condition, threshold, trigger)] = trigger
+            self.size += 1
+
+        self._by_symbol: Dict[str, Dict[str, _SortedTriggers]] = {
+            symbol: {condition: _SortedTriggers(entries) for condition, entries in conditions.items()}
+            for symbol, conditions in grouped.items()
+        }
+
+    def symbols(self) -> List[str]:
+        return list(self._by_symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._by_symbol
+
+    def fired(
+        self,
+        symbol: str,
+        price: float,
+        previous_price: Optional[float] = None,
+        crossed_from: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Triggers fired by a price update.
+
+        Args:
+            symbol: Trading symbol
+            price: Current price
+            previous_price: Reference price for percentage conditions
+            crossed_from: If set, only ">"/"<" thresholds crossed moving from
+                this price to `price` fire (crossing mode); otherwise every
+                threshold the price is beyond fires (level mode)
+
+        Returns:
+            Fired trigger dicts
+        """
+        conditions = self._by_symbol.get(symbol.upper())
+        if not conditions:
+            return []
+
+        fired: List[Dict[str, Any]] = []
+
+        above = conditions.get(">")
+        if above is not None:
+            # price > threshold  <=>  threshold in [.., price)
+            hi = bisect_left(above.thresholds, price)
+            lo = 0 if crossed_from is None else bisect_left(above.thresholds, crossed_from)
+            fired.extend(above.slice(lo, hi))
+
+        below = conditions.get("<")
+        if below is not None:
+            # price < threshold  <=>  threshold in (price, ..]
+            lo = bisect_right(below.thresholds, price)
+            hi = len(below.thresholds) if crossed_from is None else bisect_right(below.thresholds, crossed_from)
+            fired.extend(below.slice(lo, hi))
+
+        if previous_price:
+            change_pct = (price - previous_price) / previous_price * 100
+            rise = conditions.get("rise_pct")
+            if rise is not None:
+                fired.extend(rise.slice(0, bisect_right(rise.thresholds, change_pct)))
+            drop = conditions.get("drop_pct")
+            if drop is not None:
+                fired.extend(drop.slice(0, bisect_right(drop.thresholds, -change_pct)))
+
+        return fired
+
+
+class TriggerEngine:
+    """Keeps the trigger index current and evaluates price updates against it."""
+
+    def __init__(self, trigger_service=None):
+        """
+        Initialize trigger engine.
+
+        Args:
+            trigger_service: TriggerService to load triggers from (default: shared service)
+        """
+        if trigger_service is None:
+            from services.trigger_service import get_trigger_service
+            trigger_service = get_trigger_service()
+        self.trigger_service = trigger_service
+        self.index = TriggerIndex([])
+        self._version: Optional[tuple] = None
+        self._loaded = False
+        self._last_price: Dict[str, float] = {}
+        # ">"/"<" triggers added or changed by a rebuild, not yet level-checked
+        self._pending: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, triggers: List[Dict[str, Any]]) -> None:
+        """Replace the index with the given triggers."""
+        index = TriggerIndex(triggers)
+        with self._lock:
+            if self._loaded:
+                pending = {
+                    key: trigger for key, trigger in index.level_triggers.items()
+                    if key in self._pending or key not in self.index.level_triggers
+                }
+                # Symbols never priced are level-checked on their first price anyway
+                self._pending = {key: t for key, t in pending.items() if key[0] in self._last_price}
+            self.index = index
+            self._loaded = True
+        logger.info(f"Trigger index built: {index.size} enabled triggers on {len(index.symbols())} symbols")
+
+    def refresh(self) -> bool:
+        """
+        Rebuild the index if the trigger definitions changed.
+
+        Returns:
+            True if the index was rebuilt
+        """
+        version = self.trigger_service.version()
+        if self._loaded and version == self._version:
+            return False
+        self.load(self.trigger_service.load_triggers())
+        self._version = version
+        return True
+
+    def symbols(self) -> List[str]:
+        return self.index.symbols()
+
+    def on_price(
+        self,
+        symbol: str,
+        price: float,
+        previous_price: Optional[float] = None,
+        crossing: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate a price update.
+
+        Args:
+            symbol: Trading symbol
+            price: New price
+            previous_price: Reference price for percentage conditions
+            crossing: Fire ">"/"<" triggers only when their threshold is crossed
+                since the last price seen for the symbol (level check on first price)
+
+        Returns:
+            Fired trigger dicts
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            last = self._last_price.get(symbol)
+            self._last_price[symbol] = price
+            index = self.index
+            pending = [self._pending.pop(key) for key in [k for k in self._pending if k[0] == symbol]]
+        fired = index.fired(
+            symbol,
+            price,
+            previous_price=previous_price,
+            crossed_from=last if crossing else None
+        )
+        if pending and crossing and last is not None:
+            # New/changed thresholds: level check once, skipping ones already crossed
+            seen = {id(t) for t in fired}
+            fired.extend(t for t in TriggerIndex(pending).fired(symbol, price) if id(t) not in seen)
+        return fired
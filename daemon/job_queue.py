@@ -1,17 +1,44 @@
 """
-Async Job Queue for managing long-running background tasks.
+Persistent Job Queue for managing long-running background tasks.
+
+Jobs live in a SQLite database (data/job_queue.db) so they survive API
+restarts and can be executed by a separate worker pool process
+(see workers/job_worker.py) instead of inside the API process.
+
+Features:
+- Deduplication: enqueuing a job identical to one still PENDING returns
+  the existing job ID.
+- Per-type concurrency limits, enforced atomically when workers claim jobs.
+- Cancellation: PENDING jobs are cancelled immediately; RUNNING jobs are
+  flagged and stop at their next progress report.
+- Progress streaming: every update is appended to an event log that can
+  be tailed incrementally.
 """
-import uuid
+import json
+import os
+import sqlite3
 import time
-from typing import Dict, Any, Optional
+import uuid
+import hashlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterable
 from enum import Enum
 from pydantic import BaseModel
 
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "job_queue.db"
+
+
 class JobStatus(str, Enum):
     PENDING = "PENDING"
     RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+TERMINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
 
 class Job(BaseModel):
     id: str
@@ -20,52 +47,395 @@ class Job(BaseModel):
     progress: int = 0 # 0-100
     message: str = "Initialized"
     result: Optional[Dict[str, Any]] = None
+    payload: Optional[Dict[str, Any]] = None
+    cancel_requested: bool = False
     created_at: float
     updated_at: float
 
-# In-memory store
-_jobs: Dict[str, Job] = {}
 
-def create_job(job_type: str) -> str:
-    """Create a new job and return ID."""
-    job_id = str(uuid.uuid4())
-    now = time.time()
-    _jobs[job_id] = Job(
-        id=job_id, 
-        type=job_type, 
-        status=JobStatus.PENDING, 
-        created_at=now, 
-        updated_at=now
+class JobEvent(BaseModel):
+    id: int
+    job_id: str
+    timestamp: float
+    status: JobStatus
+    progress: int
+    message: str
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT 'Initialized',
+    result TEXT,
+    payload TEXT,
+    dedup_key TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker_pid INTEGER,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON jobs (updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_type ON jobs (status, type, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_dedup ON jobs (dedup_key, status);
+
+CREATE TABLE IF NOT EXISTS job_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id, id);
+"""
+
+_JOB_COLUMNS = (
+    "id, type, status, progress, message, result, payload, "
+    "cancel_requested, created_at, updated_at"
+)
+
+
+def _dedup_key(job_type: str, payload: Optional[Dict[str, Any]]) -> str:
+    canonical = json.dumps({"type": job_type, "payload": payload or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _row_to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        type=row["type"],
+        status=JobStatus(row["status"]),
+        progress=row["progress"],
+        message=row["message"],
+        result=json.loads(row["result"]) if row["result"] else None,
+        payload=json.loads(row["payload"]) if row["payload"] else None,
+        cancel_requested=bool(row["cancel_requested"]),
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
     )
-    return job_id
+
+
+class JobQueue:
+    """SQLite-backed job store shared by the API and worker processes."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or os.getenv("FUGGERBOT_JOB_DB", DEFAULT_DB_PATH))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection; one transaction per block."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction that takes the database lock up front."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _append_event(conn: sqlite3.Connection, job_id: str) -> None:
+        conn.execute(
+            """
+            INSERT INTO job_events (job_id, timestamp, status, progress, message)
+            SELECT id, updated_at, status, progress, message FROM jobs WHERE id = ?
+            """,
+            (job_id,),
+        )
+
+    def create_job(
+        self,
+        job_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        dedupe: bool = True
+    ) -> str:
+        """
+        Enqueue a job and return its ID.
+
+        Args:
+            job_type: Handler name (e.g. "simulation", "optimizer")
+            payload: JSON-serializable job arguments
+            dedupe: Return the ID of an identical PENDING job instead of adding another
+
+        Returns:
+            Job ID
+        """
+        key = _dedup_key(job_type, payload)
+        with self._transaction() as conn:
+            if dedupe:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE dedup_key = ? AND status = ? LIMIT 1",
+                    (key, JobStatus.PENDING.value),
+                ).fetchone()
+                if row:
+                    return row["id"]
+
+            job_id = str(uuid.uuid4())
+            now = time.time()
+            conn.execute(
+                """
+                INSERT INTO jobs (id, type, status, progress, message, payload, dedup_key, created_at, updated_at)
+                VALUES (?, ?, ?, 0, 'Initialized', ?, ?, ?, ?)
+                """,
+                (job_id, job_type, JobStatus.PENDING.value,
+                 json.dumps(payload, default=str) if payload is not None else None,
+                 key, now, now),
+            )
+            self._append_event(conn, job_id)
+        return job_id
+
+    def update_job(
+        self,
+        job_id: str,
+        status: JobStatus = None,
+        progress: int = None,
+        message: str = None,
+        result: Dict = None
+    ):
+        """Update job state and record a progress event."""
+        assignments = ["updated_at = ?"]
+        params: List[Any] = [time.time()]
+        if status:
+            assignments.append("status = ?")
+            params.append(JobStatus(status).value)
+        if progress is not None:
+            assignments.append("progress = ?")
+            params.append(int(progress))
+        if message:
+            assignments.append("message = ?")
+            params.append(message)
+        if result:
+            assignments.append("result = ?")
+            params.append(json.dumps(result, default=str))
+        params.append(job_id)
+
+        with self._transaction() as conn:
+            cursor = conn.execute(f"UPDATE jobs SET {', '.join(assignments)} WHERE id = ?", params)
+            if cursor.rowcount:
+                self._append_event(conn, job_id)
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Retrieve job details."""
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        limit: int = 10,
+        job_type: Optional[str] = None,
+        status: Optional[JobStatus] = None
+    ) -> List[Job]:
+        """List most recently updated jobs (served from the updated_at index)."""
+        clauses, params = [], []
+        if job_type:
+            clauses.append("type = ?")
+            params.append(job_type)
+        if status:
+            clauses.append("status = ?")
+            params.append(JobStatus(status).value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs {where} ORDER BY updated_at DESC LIMIT ?", params
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def cancel_job(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job.
+
+        PENDING jobs move straight to CANCELLED. RUNNING jobs are flagged and
+        the worker stops them at their next progress report.
+
+        Returns:
+            Updated job, or None if not found
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if not row:
+                return None
+            if row["status"] == JobStatus.PENDING.value:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, message = 'Cancelled', updated_at = ? WHERE id = ?",
+                    (JobStatus.CANCELLED.value, now, job_id),
+                )
+                self._append_event(conn, job_id)
+            elif row["status"] == JobStatus.RUNNING.value:
+                conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1, message = 'Cancellation requested', updated_at = ? WHERE id = ?",
+                    (now, job_id),
+                )
+                self._append_event(conn, job_id)
+        return self.get_job(job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """Whether cancellation has been requested for a running job."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def claim_next_job(
+        self,
+        job_types: Iterable[str],
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        worker_pid: Optional[int] = None
+    ) -> Optional[Job]:
+        """
+        Atomically claim the oldest PENDING job whose type is below its limit.
+
+        Args:
+            job_types: Job types this worker can run
+            concurrency_limits: Max RUNNING jobs per type (missing = unlimited)
+            worker_pid: PID recorded on the claimed job
+
+        Returns:
+            Claimed job (now RUNNING), or None if nothing is runnable
+        """
+        concurrency_limits = concurrency_limits or {}
+        with self._transaction() as conn:
+            running = dict(conn.execute(
+                "SELECT type, COUNT(*) FROM jobs WHERE status = ? GROUP BY type",
+                (JobStatus.RUNNING.value,),
+            ).fetchall())
+            eligible = [
+                t for t in job_types
+                if concurrency_limits.get(t) is None or running.get(t, 0) < concurrency_limits[t]
+            ]
+            if not eligible:
+                return None
+
+            placeholders = ", ".join("?" for _ in eligible)
+            row = conn.execute(
+                f"""
+                SELECT id FROM jobs
+                WHERE status = ? AND type IN ({placeholders})
+                ORDER BY created_at LIMIT 1
+                """,
+                [JobStatus.PENDING.value, *eligible],
+            ).fetchone()
+            if not row:
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_pid = ?, updated_at = ? WHERE id = ?",
+                (JobStatus.RUNNING.value, worker_pid, time.time(), row["id"]),
+            )
+            self._append_event(conn, row["id"])
+        return self.get_job(row["id"])
+
+    def requeue_orphaned_jobs(self) -> int:
+        """
+        Return RUNNING jobs whose worker process is gone to PENDING.
+
+        Returns:
+            Number of jobs requeued
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, worker_pid FROM jobs WHERE status = ?", (JobStatus.RUNNING.value,)
+            ).fetchall()
+            orphaned = [row["id"] for row in rows if not _pid_alive(row["worker_pid"])]
+            now = time.time()
+            for job_id in orphaned:
+                conn.execute(
+                    """
+                    UPDATE jobs SET status = ?, worker_pid = NULL, progress = 0,
+                        message = 'Requeued after worker exit', updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (JobStatus.PENDING.value, now, job_id),
+                )
+                self._append_event(conn, job_id)
+        return len(orphaned)
+
+    def get_job_events(self, job_id: str, after_id: int = 0, limit: int = 100) -> List[JobEvent]:
+        """Progress events for a job with id > after_id, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, job_id, timestamp, status, progress, message FROM job_events
+                WHERE job_id = ? AND id > ? ORDER BY id LIMIT ?
+                """,
+                (job_id, after_id, limit),
+            ).fetchall()
+        return [JobEvent(**dict(row)) for row in rows]
+
+    def clear_jobs(self):
+        """Clear all jobs and their events."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM job_events")
+            conn.execute("DELETE FROM jobs")
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Singleton instance
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the job queue instance."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
+
+
+def create_job(job_type: str, payload: Optional[Dict[str, Any]] = None, dedupe: bool = True) -> str:
+    """Create a new job and return ID."""
+    return get_job_queue().create_job(job_type, payload, dedupe)
 
 def update_job(job_id: str, status: JobStatus = None, progress: int = None, message: str = None, result: Dict = None):
     """Update job state."""
-    if job_id not in _jobs:
-        return
-        
-    job = _jobs[job_id]
-    if status:
-        job.status = status
-    if progress is not None:
-        job.progress = progress
-    if message:
-        job.message = message
-    if result:
-        job.result = result
-        
-    job.updated_at = time.time()
+    get_job_queue().update_job(job_id, status, progress, message, result)
 
 def get_job(job_id: str) -> Optional[Job]:
     """Retrieve job details."""
-    return _jobs.get(job_id)
+    return get_job_queue().get_job(job_id)
 
-def list_jobs(limit: int = 10) -> list[Job]:
+def list_jobs(limit: int = 10, job_type: Optional[str] = None, status: Optional[JobStatus] = None) -> list[Job]:
     """List recent jobs."""
-    # Sort by updated_at desc
-    sorted_jobs = sorted(_jobs.values(), key=lambda x: x.updated_at, reverse=True)
-    return sorted_jobs[:limit]
+    return get_job_queue().list_jobs(limit, job_type, status)
+
+def cancel_job(job_id: str) -> Optional[Job]:
+    """Cancel a pending or running job."""
+    return get_job_queue().cancel_job(job_id)
+
+def get_job_events(job_id: str, after_id: int = 0, limit: int = 100) -> List[JobEvent]:
+    """Progress events for a job after a given event ID."""
+    return get_job_queue().get_job_events(job_id, after_id, limit)
 
 def clear_jobs():
     """Clear all jobs."""
-    _jobs.clear()
+    get_job_queue().clear_jobs()
@@ -9,6 +9,11 @@ Automates the meta-optimization feedback loop:
 
 Runs weekly (default: Sunday 00:00) or on-demand.
 
+With --pipeline inprocess, all stages run in the daemon process, share one
+load of the Data Lake, and stages whose inputs are unchanged since their last
+successful run are skipped. Per-stage timings are written to
+optimization_status.json in both modes.
+
 Author: FuggerBot AI Team
 Version: v2.5 - Operation Autopilot
 """
@@ -16,12 +21,13 @@ import os
 import sys
 import time
 import json
+import hashlib
 import logging
 import subprocess
 import schedule
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 # Setup logging
 logging.basicConfig(
@@ -34,6 +40,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger("OptimizationDaemon")
 
+PIPELINE_MODES = ("subprocess", "inprocess")
+
 
 class OptimizationDaemon:
     """
@@ -50,7 +58,8 @@ class OptimizationDaemon:
         self,
         interval_days: int = 7,
         run_day: str = "sunday",
-        run_time: str = "00:00"
+        run_time: str = "00:00",
+        pipeline_mode: str = "subprocess"
     ):
         """
         Initialize the optimization daemon.
@@ -59,10 +68,17 @@ class OptimizationDaemon:
             interval_days: Days between optimization cycles (default: 7)
             run_day: Day of week to run (default: "sunday")
             run_time: Time to run in HH:MM format (default: "00:00")
+            pipeline_mode: "subprocess" runs each stage as a separate script;
+                "inprocess" runs all stages in this process, sharing market data
+                and intermediate results and skipping stages whose inputs are unchanged
         """
+        if pipeline_mode not in PIPELINE_MODES:
+            raise ValueError(f"pipeline_mode must be one of {PIPELINE_MODES}, got {pipeline_mode!r}")
+        
         self.interval_days = interval_days
         self.run_day = run_day.lower()
         self.run_time = run_time
+        self.pipeline_mode = pipeline_mode
         
         # Paths
         self.project_root = Path(__file__).parent.parent
@@ -73,6 +89,8 @@ class OptimizationDaemon:
         self.war_games_results = self.project_root / "data" / "war_games_results.json"
         self.optimized_params = self.project_root / "data" / "optimized_params.json"
         self.status_file = self.project_root / "data" / "optimization_status.json"
+        self.data_lake = self.project_root / "data" / "market_history.duckdb"
+        self.lake_snapshot_dir = self.project_root / "data" / "lake_snapshot"
         
         # Ensure log directory exists
         log_dir = self.project_root / "data" / "logs"
@@ -174,6 +192,14 @@ class OptimizationDaemon:
             logger.warning(f"⚠️ [{step_name}] Validation: {file_path.name} not modified (before={before_mtime}, after={after_mtime})")
             return False
     
+    def _load_status(self) -> Dict[str, Any]:
+        """Load the last saved optimization status (empty dict if unavailable)."""
+        try:
+            with open(self.status_file, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+    
     def _save_status(self, status: Dict[str, Any]):
         """Save optimization status to JSON file."""
         try:
@@ -207,11 +233,19 @@ class OptimizationDaemon:
         status = {
             "last_run": timestamp,
             "status": "IN_PROGRESS",
+            "pipeline_mode": self.pipeline_mode,
             "steps": {},
             "duration_seconds": 0
         }
         
+        # Export the lake once per cycle; every stage maps the same pages
+        snapshot = self._refresh_lake_snapshot(status)
+        
+        if self.pipeline_mode == "inprocess":
+            return self._run_inprocess_cycle(status, cycle_start, snapshot)
+        
         # STEP 1: Run Miner
+        step_start = time.time()
         learning_book_before = self._get_file_mtime(self.learning_book)
         step1_success = self._run_subprocess(self.miner_script, "STEP 1: Miner", timeout=1800)
         step1_validated = self._validate_file_updated(self.learning_book, learning_book_before, "STEP 1")
@@ -219,7 +253,8 @@ class OptimizationDaemon:
         status["steps"]["miner"] = {
             "success": step1_success and step1_validated,
             "output_file": str(self.learning_book),
-            "file_updated": step1_validated
+            "file_updated": step1_validated,
+            "duration_seconds": time.time() - step_start
         }
         
         if not (step1_success and step1_validated):
@@ -231,6 +266,7 @@ class OptimizationDaemon:
             return False
         
         # STEP 2: Run War Games Simulator
+        step_start = time.time()
         war_games_before = self._get_file_mtime(self.war_games_results)
         step2_success = self._run_subprocess(self.simulator_script, "STEP 2: War Games", timeout=3600)
         step2_validated = self._validate_file_updated(self.war_games_results, war_games_before, "STEP 2")
@@ -238,7 +274,8 @@ class OptimizationDaemon:
         status["steps"]["simulator"] = {
             "success": step2_success and step2_validated,
             "output_file": str(self.war_games_results),
-            "file_updated": step2_validated
+            "file_updated": step2_validated,
+            "duration_seconds": time.time() - step_start
         }
         
         if not (step2_success and step2_validated):
@@ -250,6 +287,7 @@ class OptimizationDaemon:
             return False
         
         # STEP 3: Run Strategy Optimizer
+        step_start = time.time()
         optimized_params_before = self._get_file_mtime(self.optimized_params)
         step3_success = self._run_subprocess(self.optimizer_script, "STEP 3: Optimizer", timeout=300)
         step3_validated = self._validate_file_updated(self.optimized_params, optimized_params_before, "STEP 3")
@@ -257,7 +295,8 @@ class OptimizationDaemon:
         status["steps"]["optimizer"] = {
             "success": step3_success and step3_validated,
             "output_file": str(self.optimized_params),
-            "file_updated": step3_validated
+            "file_updated": step3_validated,
+            "duration_seconds": time.time() - step_start
         }
         
         if not (step3_success and step3_validated):
@@ -280,6 +319,255 @@ class OptimizationDaemon:
         
         return True
     
+    # ------------------------------------------------------------------
+    # In-process pipeline
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _hash_file(file_path: Path) -> Optional[str]:
+        """SHA-256 of a file's contents (None if missing)."""
+        if not file_path.exists():
+            return None
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _hash_obj(obj: Any) -> str:
+        """Stable SHA-256 of a JSON-serializable object."""
+        return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def _data_lake_max_date(self, conn) -> Optional[str]:
+        """Latest bar date in the Data Lake (None if unavailable)."""
+        try:
+            row = conn.execute("SELECT MAX(date) FROM ohlcv_history").fetchone()
+            return str(row[0]) if row and row[0] is not None else None
+        except Exception as e:
+            logger.warning(f"Could not read Data Lake max date: {e}")
+            return None
+    
+    def _load_market_data(self, conn, symbols: List[str]) -> Dict[str, Any]:
+        """
+        Load full OHLCV history for symbols in one query.
+        
+        Returns:
+            Dict mapping symbol to a DataFrame with a datetime 'date' column
+        """
+        import pandas as pd
+        
+        placeholders = ", ".join("?" for _ in symbols)
+        df = conn.execute(
+            f"""
+            SELECT symbol, date, open, high, low, close, volume
+            FROM ohlcv_history
+            WHERE symbol IN ({placeholders})
+            ORDER BY symbol, date
+            """,
+            list(symbols)
+        ).fetchdf()
+        df['date'] = pd.to_datetime(df['date'])
+        
+        frames = {
+            symbol: group.drop(columns='symbol').reset_index(drop=True)
+            for symbol, group in df.groupby('symbol', sort=False)
+        }
+        logger.info(f"📦 Loaded {len(df)} bars for {len(frames)} symbols into memory")
+        return frames
+    
+    def _refresh_lake_snapshot(self, status: Dict[str, Any]):
+        """
+        Export the Data Lake snapshot if missing or stale, and open it.
+        
+        Args:
+            status: Status dict (gets a "lake_snapshot" entry)
+            
+        Returns:
+            LakeSnapshot, or None if the export failed (stages query DuckDB)
+        """
+        from services.lake_snapshot import ensure_lake_snapshot
+        
+        start = time.time()
+        snapshot = ensure_lake_snapshot(self.data_lake, self.lake_snapshot_dir)
+        status["lake_snapshot"] = {
+            "path": str(self.lake_snapshot_dir),
+            "available": snapshot is not None,
+            "created_at": snapshot.index["created_at"] if snapshot else None,
+            "duration_seconds": time.time() - start
+        }
+        if snapshot is None:
+            logger.warning("⚠️ No lake snapshot - stages will query DuckDB directly")
+        return snapshot
+    
+    def _run_inprocess_cycle(
+        self,
+        status: Dict[str, Any],
+        cycle_start: float,
+        snapshot=None
+    ) -> bool:
+        """
+        Run the pipeline inside this process.
+        
+        Market data comes from the lake snapshot (or is loaded from DuckDB
+        once) and is shared by the miner and War Games; War Games results are
+        handed to the optimizer in memory. A stage is skipped when its input
+        fingerprint matches the one stored after its last successful run and
+        its output file still exists.
+        
+        Args:
+            status: Status dict initialised by run_cycle
+            cycle_start: Cycle start time (time.time())
+            snapshot: Mapped LakeSnapshot to read bars from (None loads them)
+            
+        Returns:
+            True if all stages succeeded or were skipped, False otherwise
+        """
+        import duckdb
+        from research.miner import LearningBookMiner, MINING_SYMBOLS, MINING_LOOKBACK_DAYS
+        from daemon.simulator.war_games_runner import (
+            WarGamesRunner, DEFAULT_SCENARIOS, DEFAULT_PARAM_SETS, DEFAULT_SYMBOLS
+        )
+        from agents.trm.strategy_optimizer_agent import StrategyOptimizerAgent
+        
+        previous_inputs = self._load_status().get("last_success_inputs", {})
+        status["last_success_inputs"] = dict(previous_inputs)
+        
+        try:
+            conn = duckdb.connect(str(self.data_lake), read_only=True)
+        except Exception as e:
+            logger.error(f"🛑 ABORTING: Cannot open Data Lake {self.data_lake}: {e}")
+            status["status"] = "FAILED"
+            status["failed_step"] = "data_lake"
+            status["duration_seconds"] = time.time() - cycle_start
+            self._save_status(status)
+            return False
+        
+        market_data: Optional[Dict[str, Any]] = snapshot
+        
+        def shared_market_data() -> Dict[str, Any]:
+            nonlocal market_data
+            if market_data is None:
+                symbols = sorted(set(MINING_SYMBOLS) | set(DEFAULT_SYMBOLS))
+                market_data = self._load_market_data(conn, symbols)
+            return market_data
+        
+        def run_stage(name: str, inputs: Dict[str, Any], output_file: Path, fn) -> Tuple[bool, Any]:
+            """Run or skip a stage; returns (success, in-memory result)."""
+            stage_start = time.time()
+            entry = {
+                "output_file": str(output_file),
+                "inputs": inputs,
+                "skipped": False
+            }
+            status["steps"][name] = entry
+            
+            if previous_inputs.get(name) == inputs and output_file.exists():
+                logger.info(f"⏭️  [{name}] Inputs unchanged since last success - skipping")
+                entry.update(success=True, skipped=True, file_updated=False, duration_seconds=0.0)
+                return True, None
+            
+            before = self._get_file_mtime(output_file)
+            logger.info(f"🚀 [{name}] Starting (in-process)")
+            try:
+                result = fn()
+                ok = True
+            except Exception as e:
+                logger.error(f"💥 [{name}] Exception: {e}", exc_info=True)
+                result, ok = None, False
+            
+            validated = ok and self._validate_file_updated(output_file, before, name)
+            entry.update(
+                success=ok and validated,
+                file_updated=validated,
+                duration_seconds=time.time() - stage_start
+            )
+            logger.info(f"⏱️  [{name}] {entry['duration_seconds']:.1f}s")
+            
+            if entry["success"]:
+                status["last_success_inputs"][name] = inputs
+            return entry["success"], result
+        
+        def abort(stage: str) -> bool:
+            logger.error(f"🛑 ABORTING: {stage} step failed")
+            status["status"] = "FAILED"
+            status["failed_step"] = stage
+            status["duration_seconds"] = time.time() - cycle_start
+            self._save_status(status)
+            return False
+        
+        try:
+            lake_max_date = self._data_lake_max_date(conn)
+            
+            # STEP 1: Miner
+            def mine():
+                miner = LearningBookMiner(
+                    db_path=self.data_lake,
+                    output_path=self.learning_book,
+                    preloaded_data=shared_market_data()
+                )
+                patterns = miner.mine_patterns(symbols=MINING_SYMBOLS, lookback_days=MINING_LOOKBACK_DAYS)
+                miner.save_learning_book(patterns)
+                return patterns
+            
+            miner_inputs = {
+                "data_lake_max_date": lake_max_date,
+                "symbols": MINING_SYMBOLS,
+                "lookback_days": MINING_LOOKBACK_DAYS
+            }
+            ok, _ = run_stage("miner", miner_inputs, self.learning_book, mine)
+            if not ok:
+                return abort("miner")
+            
+            # STEP 2: War Games
+            def simulate():
+                runner = WarGamesRunner(db_path=self.data_lake, preloaded_data=shared_market_data())
+                return runner.run_all_scenarios(output_path=self.war_games_results)
+            
+            simulator_inputs = {
+                "data_lake_max_date": lake_max_date,
+                "learning_book_hash": self._hash_file(self.learning_book),
+                "param_grid_hash": self._hash_obj({
+                    "scenarios": DEFAULT_SCENARIOS,
+                    "param_sets": {name: p.to_dict() for name, p in DEFAULT_PARAM_SETS.items()},
+                    "symbols": DEFAULT_SYMBOLS
+                })
+            }
+            ok, war_games_output = run_stage("simulator", simulator_inputs, self.war_games_results, simulate)
+            if not ok:
+                return abort("simulator")
+            
+            # STEP 3: Optimizer
+            def optimize():
+                optimizer = StrategyOptimizerAgent(
+                    input_file=str(self.war_games_results),
+                    output_file=str(self.optimized_params)
+                )
+                results = war_games_output["results"] if war_games_output else None
+                optimized = optimizer.optimize(results=results)
+                if not optimized:
+                    raise RuntimeError("Optimizer produced no configurations")
+                return optimized
+            
+            optimizer_inputs = {"war_games_hash": self._hash_file(self.war_games_results)}
+            ok, _ = run_stage("optimizer", optimizer_inputs, self.optimized_params, optimize)
+            if not ok:
+                return abort("optimizer")
+        finally:
+            conn.close()
+        
+        cycle_duration = time.time() - cycle_start
+        skipped = [name for name, step in status["steps"].items() if step.get("skipped")]
+        logger.info("=" * 80)
+        logger.info(f"✅ OPTIMIZATION CYCLE COMPLETE (Duration: {cycle_duration:.1f}s, skipped: {skipped or 'none'})")
+        logger.info("=" * 80)
+        
+        status["status"] = "SUCCESS"
+        status["duration_seconds"] = cycle_duration
+        self._save_status(status)
+        
+        return True
+    
     def start_daemon(self):
         """
         Start the scheduler daemon.
@@ -338,13 +626,24 @@ def main():
         default="00:00",
         help="Time to run in HH:MM format (default: 00:00)"
     )
+    parser.add_argument(
+        "--pipeline",
+        choices=list(PIPELINE_MODES),
+        default="subprocess",
+        help="Stage execution: 'subprocess' (one script per stage) or 'inprocess' (shared memory, skips unchanged stages)"
+    )
     
     args = parser.parse_args()
     
+    if args.pipeline == "inprocess":
+        from core.logger import enable_queue_logging
+        enable_queue_logging()  # Format/write simulator log records off the pipeline thread
+    
     daemon = OptimizationDaemon(
         interval_days=7,
         run_day=args.day,
-        run_time=args.time
+        run_time=args.time,
+        pipeline_mode=args.pipeline
     )
     
     if args.mode == "once":
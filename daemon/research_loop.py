@@ -22,6 +22,7 @@ from agents.research.proposal_agent import ProposalAgent, get_proposal_agent
 from agents.research.historonics_agent import HistoronicsAgent, get_historonics_agent
 from agents.research.regime_ontology import get_regime_ontology
 from daemon.simulator.war_games_runner import WarGamesRunner
+from daemon.scenario_store import ScenarioResultStore
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,7 @@ class ResearchLoop:
             results_store_path = project_root / "data" / "research_results"
         self.results_store_path = Path(results_store_path)
         self.results_store_path.mkdir(parents=True, exist_ok=True)
+        self.result_store = ScenarioResultStore(self.results_store_path)
         
         logger.info(f"ResearchLoop initialized (results: {self.results_store_path})")
     
@@ -243,10 +245,10 @@ class ResearchLoop:
         comparisons = []
         
         # Get previous scenario results
-        previous_results = self._load_previous_scenario_results(current_results["scenario_id"])
+        previous_results = self._load_previous_scenario_results(current_results["scenario_id"], limit=5)
         
         # Compare with each previous scenario
-        for prev_result in previous_results[:5]:  # Compare with top 5 most recent
+        for prev_result in previous_results:  # Compare with top 5 most recent
             comparison = self.meta_evaluator.compare_scenarios(
                 scenario_a_results=prev_result,
                 scenario_b_results=current_results
@@ -256,75 +258,38 @@ class ResearchLoop:
         return comparisons
     
     def _save_scenario_results(self, scenario_id: str, results: Dict[str, Any]) -> None:
-        """Save scenario results to disk."""
-        output_file = self.results_store_path / f"scenario_{scenario_id}.json"
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        """Save scenario results to disk and update the result index."""
+        output_file = self.result_store.save(scenario_id, results)
         logger.debug(f"Saved scenario results to {output_file}")
     
     def _load_all_scenario_results(self) -> List[Dict[str, Any]]:
         """Load all scenario results."""
-        all_results = []
-        for result_file in sorted(self.results_store_path.glob("scenario_*.json"), reverse=True):
-            try:
-                with open(result_file, 'r') as f:
-                    result_data = json.load(f)
-                    all_results.append(result_data)
-            except Exception as e:
-                logger.warning(f"Failed to load scenario result {result_file}: {e}")
-        return all_results
+        return self.result_store.load_recent()
     
-    def _load_previous_scenario_results(self, exclude_id: str) -> List[Dict[str, Any]]:
-        """Load previous scenario results (excluding current)."""
-        previous = []
-        
-        for result_file in sorted(self.results_store_path.glob("scenario_*.json"), reverse=True):
-            try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
-                    if data.get("scenario_id") != exclude_id:
-                        previous.append(data)
-            except Exception as e:
-                logger.warning(f"Error loading {result_file}: {e}")
-        
-        return previous
+    def _load_previous_scenario_results(
+        self,
+        exclude_id: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Load previous scenario results (excluding current), most recent first."""
+        return self.result_store.load_recent(limit=limit, exclude_id=exclude_id)
     
     def _get_existing_scenario_ids(self) -> List[str]:
         """Get list of existing scenario IDs."""
-        scenario_ids = []
-        
-        for result_file in self.results_store_path.glob("scenario_*.json"):
-            try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
-                    if "scenario_id" in data:
-                        scenario_ids.append(data["scenario_id"])
-            except Exception:
-                pass
-        
-        return scenario_ids
+        return self.result_store.get_scenario_ids()
     
     def _calculate_regime_coverage(self) -> Dict[str, int]:
         """
         Calculate regime coverage from existing scenario results.
         
+        Uses the indexed regime classifications rather than full result files.
+        
         Returns:
             Dict mapping regime_id to count of scenarios
         """
         regime_ontology = get_regime_ontology()
         
-        # Load all scenario results
-        all_results = []
-        for result_file in self.results_store_path.glob("scenario_*.json"):
-            try:
-                with open(result_file, 'r') as f:
-                    result_data = json.load(f)
-                    all_results.append(result_data)
-            except Exception as e:
-                logger.warning(f"Failed to load scenario result {result_file}: {e}")
-        
-        # Calculate coverage
-        coverage = regime_ontology.get_regime_coverage(all_results)
+        coverage = regime_ontology.get_regime_coverage(self.result_store.get_regime_classifications())
         
         logger.debug(f"Regime coverage: {coverage}")
         return coverage
@@ -372,20 +337,14 @@ class ResearchLoop:
     def _get_scenario_metadata(self) -> List[Dict[str, str]]:
         """Get scenario metadata (NO METRICS - just IDs and regime info)."""
         metadata = []
-        for result_file in sorted(self.results_store_path.glob("scenario_*.json")):
-            try:
-                with open(result_file, 'r') as f:
-                    result_data = json.load(f)
-                    scenario_id = result_data.get("scenario_id", "unknown")
-                    regime_classification = result_data.get("regime_classification", {})
-                    regime_id = regime_classification.get("regime_id") if isinstance(regime_classification, dict) else None
-                    
-                    metadata.append({
-                        "scenario_id": scenario_id,
-                        "regime_id": regime_id or "unknown"
-                    })
-            except Exception as e:
-                logger.warning(f"Failed to load scenario metadata {result_file}: {e}")
+        for stub in self.result_store.get_regime_classifications():
+            regime_classification = stub.get("regime_classification", {})
+            regime_id = regime_classification.get("regime_id") if isinstance(regime_classification, dict) else None
+            
+            metadata.append({
+                "scenario_id": stub["scenario_id"],
+                "regime_id": regime_id or "unknown"
+            })
         
         return metadata
     
@@ -398,7 +357,7 @@ class ResearchLoop:
             len(insights.get("regime_heuristics", []))
         )
         
-        scenario_count = len(self._get_existing_scenario_ids())
+        scenario_count = self.result_store.count()
         regime_coverage = self._calculate_regime_coverage()
         covered_regimes = len([r for r in regime_coverage.values() if r > 0])
         
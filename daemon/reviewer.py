@@ -3,12 +3,25 @@ Reviewer daemon.
 
 Automatically runs post-mortem reviews on completed trades and saves results
 back to trade_memory.json.
+
+Change tracking:
+- Newly closed trades are read from the closed-trades log written by
+  TradeMemory.update_outcome, starting at a saved byte offset (high-water
+  mark), so a poll never rescans the full trade history.
+- Trades awaiting review (including ones whose review failed) are kept in a
+  persisted pending set.
+- Each finished post-mortem is appended to a results log immediately, then
+  all new results are folded into trade_memory.json once per pass.
+
+The full memory file is scanned only on the very first run (no state yet)
+to pick up trades closed before change tracking existed.
 """
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 import sys
 
@@ -17,12 +30,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from reasoning.memory import TradeMemory
+from reasoning.memory import TradeMemory, closed_trades_log_path
 from engine.postmortem import TradeCoroner
 
 logger = logging.getLogger(__name__)
 
 POLL_INTERVAL_SECONDS = 300  # 5 minutes
+MAX_CONCURRENT_REVIEWS = 4
 
 
 def _load_memory(path: Path) -> Dict[str, Any]:
@@ -39,16 +53,140 @@ def _save_memory(path: Path, data: Dict[str, Any]) -> None:
     tmp.replace(path)
 
 
+def _read_jsonl_from(path: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read complete JSON lines appended after `offset`.
+
+    Returns:
+        (records, new_offset). A trailing partial line is left for the next read.
+    """
+    if not path.exists():
+        return [], 0
+    if path.stat().st_size < offset:
+        offset = 0  # Log was truncated/rotated
+
+    records = []
+    with path.open("rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed line in {path}")
+    return records, offset
+
+
+def _needs_review(trade: Dict[str, Any]) -> bool:
+    # Only review closed trades (pnl present) without a post-mortem
+    return trade.get("pnl") is not None and trade.get("post_mortem") is None
+
+
 class ReviewerDaemon:
     """
     Background reviewer that auto-runs post-mortems on completed trades.
     """
 
-    def __init__(self, memory_path: Optional[Path] = None, poll_interval: int = POLL_INTERVAL_SECONDS):
+    def __init__(
+        self,
+        memory_path: Optional[Path] = None,
+        poll_interval: int = POLL_INTERVAL_SECONDS,
+        max_workers: int = MAX_CONCURRENT_REVIEWS
+    ):
         self.memory_path = memory_path or Path("data/trade_memory.json")
         self.poll_interval = poll_interval
+        self.max_workers = max_workers
+        self.closed_log_path = closed_trades_log_path(self.memory_path)
+        self.results_log_path = self.memory_path.with_name(f"{self.memory_path.stem}_postmortems.jsonl")
+        self.state_path = self.memory_path.with_name(f"{self.memory_path.stem}_reviewer_state.json")
         self.coroner = TradeCoroner()
 
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        if not self.state_path.exists():
+            return None
+        try:
+            with self.state_path.open("r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read reviewer state ({e}); rebuilding")
+            return None
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        _save_memory(self.state_path, state)
+
+    def _bootstrap_state(self) -> Dict[str, Any]:
+        """First run: queue every closed, unreviewed trade from the full memory file."""
+        trades = _load_memory(self.memory_path).get("trades", [])
+        pending = {
+            t["trade_id"]: t for t in trades
+            if t.get("trade_id") and _needs_review(t)
+        }
+        offset = self.closed_log_path.stat().st_size if self.closed_log_path.exists() else 0
+        results_offset = self.results_log_path.stat().st_size if self.results_log_path.exists() else 0
+        logger.info(f"Reviewer state initialised with {len(pending)} pending trade(s)")
+        return {"closed_log_offset": offset, "results_log_offset": results_offset, "pending": pending}
+
+    def _collect_new_closures(self, state: Dict[str, Any]) -> int:
+        """Move trades closed since the high-water mark into the pending set."""
+        records, state["closed_log_offset"] = _read_jsonl_from(
+            self.closed_log_path, state.get("closed_log_offset", 0)
+        )
+        added = 0
+        for record in records:
+            trade = record.get("trade", {})
+            trade_id = trade.get("trade_id")
+            if trade_id and _needs_review(trade):
+                state["pending"][trade_id] = trade
+                added += 1
+        return added
+
+    def _review(self, trade: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        report = self.coroner.conduct_review(trade)
+        if not report:
+            return None
+
+        reason = report.outcome_category.value if hasattr(report.outcome_category, "value") else str(report.outcome_category)
+        logger.info(
+            f"📝 Reviewed {trade.get('symbol', 'UNKNOWN')}: "
+            f"{trade.get('outcome', 'UNKNOWN')} attributed to {reason} "
+            f"({report.root_cause[:80]}...)"
+        )
+        return report.model_dump()
+
+    def _record_result(self, trade_id: str, post_mortem: Dict[str, Any]) -> None:
+        """Append a single post-mortem to the results log."""
+        with self.results_log_path.open("a") as f:
+            f.write(json.dumps({"trade_id": trade_id, "post_mortem": post_mortem}, default=str) + "\n")
+
+    def _fold_results(self, state: Dict[str, Any]) -> int:
+        """Apply post-mortems logged since the last fold to trade_memory.json."""
+        records, new_offset = _read_jsonl_from(self.results_log_path, state.get("results_log_offset", 0))
+        if not records:
+            state["results_log_offset"] = new_offset
+            return 0
+
+        updates = {r["trade_id"]: r["post_mortem"] for r in records if r.get("trade_id")}
+
+        # Reload file right before saving to merge with any concurrent updates
+        # This prevents overwriting new trades added by the bot
+        current_data = _load_memory(self.memory_path)
+        applied = 0
+        for trade in current_data.get("trades", []):
+            post_mortem = updates.get(trade.get("trade_id"))
+            if post_mortem is not None:
+                # Preserve all existing fields, just add/update post_mortem
+                trade["post_mortem"] = post_mortem
+                applied += 1
+
+        _save_memory(self.memory_path, current_data)
+        state["results_log_offset"] = new_offset
+        return applied
+
     def run_once(self, max_reviews: int = 10) -> int:
         """
         Run a single review pass.
@@ -59,69 +197,43 @@ class ReviewerDaemon:
         Returns:
             count of trades reviewed.
         """
-        data = _load_memory(self.memory_path)
-        trades: List[Dict[str, Any]] = data.get("trades", [])
-        if not trades:
-            logger.info("No trades in memory.")
+        state = self._load_state() or self._bootstrap_state()
+        new_closures = self._collect_new_closures(state)
+        if new_closures:
+            logger.info(f"{new_closures} newly closed trade(s) queued for review")
+
+        pending: Dict[str, Dict[str, Any]] = state["pending"]
+        batch = list(pending.items())[:max_reviews]
+        if not batch:
+            logger.info("No trades awaiting review.")
+            self._save_state(state)
             return 0
 
         reviewed = 0
-        updated = False
-
-        for trade in trades:
-            # Limit reviews per pass to avoid long-running processes
-            if reviewed >= max_reviews:
-                break
-
-            pnl = trade.get("pnl")
-            post_mortem = trade.get("post_mortem")
-
-            # Only review closed trades (pnl present) without a post-mortem
-            if pnl is None or post_mortem is not None:
-                continue
-
-            try:
-                report = self.coroner.conduct_review(trade)
-                if report:
-                    trade["post_mortem"] = report.model_dump()
-                    reviewed += 1
-                    updated = True
-
-                    reason = report.outcome_category.value if hasattr(report.outcome_category, "value") else str(report.outcome_category)
-                    logger.info(
-                        f"📝 Reviewed {trade.get('symbol', 'UNKNOWN')}: "
-                        f"{trade.get('outcome', 'UNKNOWN')} attributed to {reason} "
-                        f"({report.root_cause[:80]}...)"
-                    )
-            except Exception as e:
-                logger.error(f"Error reviewing trade {trade.get('trade_id', 'UNKNOWN')}: {e}", exc_info=True)
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._review, trade): trade_id for trade_id, trade in batch}
+            for future in as_completed(futures):
+                trade_id = futures[future]
+                try:
+                    post_mortem = future.result()
+                except Exception as e:
+                    logger.error(f"Error reviewing trade {trade_id}: {e}", exc_info=True)
+                    continue  # Stays pending for the next pass
+                if post_mortem is None:
+                    continue
+                self._record_result(trade_id, post_mortem)
+                pending.pop(trade_id, None)
+                reviewed += 1
 
-        if updated:
-            try:
-                # Reload file right before saving to merge with any concurrent updates
-                # This prevents overwriting new trades added by the bot
-                current_data = _load_memory(self.memory_path)
-                current_trades = {t.get("trade_id"): t for t in current_data.get("trades", [])}
-                
-                # Update current trades with our post-mortem additions
-                for trade in trades:
-                    trade_id = trade.get("trade_id")
-                    if trade_id and trade.get("post_mortem"):
-                        if trade_id in current_trades:
-                            # Preserve all existing fields, just add/update post_mortem
-                            current_trades[trade_id]["post_mortem"] = trade["post_mortem"]
-                        else:
-                            # New trade not in current data, add it
-                            current_data["trades"].append(trade)
-                
-                # Convert back to list and save
-                current_data["trades"] = list(current_trades.values())
-                _save_memory(self.memory_path, current_data)
-                logger.info(f"💾 Saved {reviewed} post-mortems to {self.memory_path}")
-            except Exception as e:
-                logger.error(f"Failed to save memory: {e}", exc_info=True)
+        try:
+            applied = self._fold_results(state)
+            if applied:
+                logger.info(f"💾 Saved {applied} post-mortems to {self.memory_path}")
+        except Exception as e:
+            # Results stay in the log and are folded on the next pass
+            logger.error(f"Failed to save memory: {e}", exc_info=True)
 
+        self._save_state(state)
         return reviewed
 
     def start(self):
@@ -153,6 +265,12 @@ if __name__ == "__main__":
         default=10,
         help="Maximum reviews per pass (default: 10)"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=MAX_CONCURRENT_REVIEWS,
+        help=f"Concurrent post-mortem reviews (default: {MAX_CONCURRENT_REVIEWS})"
+    )
     
     args = parser.parse_args()
     
@@ -161,7 +279,7 @@ if __name__ == "__main__":
         format="%(asctime)s - %(levelname)s - %(message)s"
     )
     
-    daemon = ReviewerDaemon()
+    daemon = ReviewerDaemon(max_workers=args.max_workers)
     
     if args.once:
         count = daemon.run_once(max_reviews=args.max_reviews)
@@ -0,0 +1,205 @@
+"""
+Scenario Result Store - Indexed access to research loop results.
+
+Full scenario results stay on disk as `scenario_<id>.json` files (one per
+scenario, unchanged format). A small SQLite index alongside them keeps the
+summary columns the research loop queries every iteration (scenario ID,
+regime classification, save time), so ID lookups, regime coverage and
+recent-N queries no longer re-parse every result file.
+
+Files written before the index existed are picked up on first use.
+"""
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "scenario_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenario_index (
+    filename TEXT PRIMARY KEY,
+    scenario_id TEXT,
+    regime_classification TEXT,
+    saved_at TEXT,
+    file_mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scenario_index_scenario_id ON scenario_index (scenario_id);
+"""
+
+
+class ScenarioResultStore:
+    """
+    JSON result files plus a SQLite summary index.
+
+    Ordering follows the file names, matching the previous glob-based
+    behaviour of the research loop.
+    """
+
+    def __init__(self, results_store_path: Path):
+        """
+        Initialize the store and reconcile the index with files on disk.
+
+        Args:
+            results_store_path: Directory holding scenario_*.json files
+        """
+        self.results_store_path = Path(results_store_path)
+        self.results_store_path.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.results_store_path / INDEX_FILENAME
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self.reconcile()
+
+    @staticmethod
+    def _filename_for(scenario_id: str) -> str:
+        return f"scenario_{scenario_id}.json"
+
+    def _index_row(self, filename: str, data: Dict[str, Any], mtime: float) -> tuple:
+        regime = data.get("regime_classification")
+        return (
+            filename,
+            data.get("scenario_id"),
+            json.dumps(regime, default=str) if regime is not None else None,
+            datetime.now().isoformat(),
+            mtime,
+        )
+
+    def reconcile(self) -> int:
+        """
+        Bring the index in line with the result files on disk.
+
+        Only files that are new or modified since they were indexed are parsed;
+        rows for deleted files are dropped.
+
+        Returns:
+            Number of files (re)indexed
+        """
+        on_disk = {p.name: p for p in self.results_store_path.glob("scenario_*.json")}
+
+        with self._lock:
+            indexed = dict(self._conn.execute("SELECT filename, file_mtime FROM scenario_index"))
+
+            stale = [name for name in indexed if name not in on_disk]
+            rows = []
+            for name, path in on_disk.items():
+                mtime = path.stat().st_mtime
+                if indexed.get(name) == mtime:
+                    continue
+                try:
+                    with open(path, 'r') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Failed to index scenario result {path}: {e}")
+                    continue
+                rows.append(self._index_row(name, data, mtime))
+
+            if stale:
+                self._conn.executemany(
+                    "DELETE FROM scenario_index WHERE filename = ?", [(name,) for name in stale]
+                )
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO scenario_index VALUES (?, ?, ?, ?, ?)", rows
+                )
+            self._conn.commit()
+
+        if rows or stale:
+            logger.info(f"Scenario index reconciled: {len(rows)} indexed, {len(stale)} removed")
+        return len(rows)
+
+    def save(self, scenario_id: str, results: Dict[str, Any]) -> Path:
+        """
+        Write a scenario result file and update its index row.
+
+        Args:
+            scenario_id: Scenario identifier
+            results: Full simulation results
+
+        Returns:
+            Path of the written result file
+        """
+        filename = self._filename_for(scenario_id)
+        output_file = self.results_store_path / filename
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+
+        row = self._index_row(filename, results, output_file.stat().st_mtime)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO scenario_index VALUES (?, ?, ?, ?, ?)", row)
+            self._conn.commit()
+        return output_file
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def get_scenario_ids(self) -> List[str]:
+        """Scenario IDs of all stored results."""
+        rows = self._query(
+            "SELECT scenario_id FROM scenario_index WHERE scenario_id IS NOT NULL ORDER BY filename"
+        )
+        return [row[0] for row in rows]
+
+    def get_regime_classifications(self) -> List[Dict[str, Any]]:
+        """
+        Lightweight scenario stubs carrying only `scenario_id` and
+        `regime_classification`, suitable for regime coverage analysis.
+        """
+        rows = self._query(
+            "SELECT scenario_id, regime_classification FROM scenario_index ORDER BY filename"
+        )
+        stubs = []
+        for scenario_id, regime_json in rows:
+            stub: Dict[str, Any] = {"scenario_id": scenario_id or "unknown"}
+            if regime_json is not None:
+                stub["regime_classification"] = json.loads(regime_json)
+            stubs.append(stub)
+        return stubs
+
+    def load_recent(
+        self,
+        limit: Optional[int] = None,
+        exclude_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load full results, most recent file name first.
+
+        Args:
+            limit: Maximum number of results to load (None for all)
+            exclude_id: Scenario ID to skip
+
+        Returns:
+            List of result dicts
+        """
+        sql = "SELECT filename FROM scenario_index"
+        params: tuple = ()
+        if exclude_id is not None:
+            sql += " WHERE scenario_id IS NULL OR scenario_id != ?"
+            params = (exclude_id,)
+        sql += " ORDER BY filename DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+
+        results = []
+        for (filename,) in self._query(sql, params):
+            result_file = self.results_store_path / filename
+            try:
+                with open(result_file, 'r') as f:
+                    results.append(json.load(f))
+            except Exception as e:
+                logger.warning(f"Failed to load scenario result {result_file}: {e}")
+        return results
+
+    def count(self) -> int:
+        """Number of indexed scenario results."""
+        return self._query("SELECT COUNT(*) FROM scenario_index")[0][0]
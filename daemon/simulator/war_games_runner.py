@@ -27,6 +27,9 @@ from dataclasses import dataclass, asdict
 from models.technical_analysis import add_indicators, is_quality_setup
 from context.tracker import RegimeTracker
 from core.memory.trm_learner import TRMLearnerAgent
+from core.logger import enable_queue_logging
+from core.metrics import get_metrics
+from services.lake_snapshot import LakeSnapshot, open_lake_snapshot
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -96,6 +99,56 @@ class CampaignResult:
         return asdict(self)
 
 
+# Default campaign grid used by run_all_scenarios (also fingerprinted by the
+# optimization scheduler to detect parameter grid changes).
+DEFAULT_SCENARIOS = [
+    {
+        "name": "Bull Run (2021)",
+        "start_date": "2021-01-01",
+        "end_date": "2021-12-31",
+        "description": "Strong upward trend, low volatility"
+    },
+    {
+        "name": "Inflation Shock (2022)",
+        "start_date": "2022-01-01",
+        "end_date": "2022-12-31",
+        "description": "High volatility, regime shifts"
+    },
+    {
+        "name": "Recovery Rally (2023)",
+        "start_date": "2023-01-01",
+        "end_date": "2023-12-31",
+        "description": "Tech bounce back, choppy markets"
+    }
+]
+
+DEFAULT_PARAM_SETS = {
+    "Aggressive": TradingParams(
+        trust_threshold=0.55,
+        min_confidence=0.70,
+        max_position_size=0.15,
+        stop_loss=0.08,
+        take_profit=0.20
+    ),
+    "Balanced": TradingParams(
+        trust_threshold=0.65,
+        min_confidence=0.75,
+        max_position_size=0.10,
+        stop_loss=0.05,
+        take_profit=0.15
+    ),
+    "Conservative": TradingParams(
+        trust_threshold=0.75,
+        min_confidence=0.80,
+        max_position_size=0.05,
+        stop_loss=0.03,
+        take_profit=0.10
+    )
+}
+
+DEFAULT_SYMBOLS = ["BTC-USD", "ETH-USD", "NVDA", "MSFT"]
+
+
 class WarGamesRunner:
     """
     High-speed simulation engine for backtesting trading strategies.
@@ -103,14 +156,23 @@ class WarGamesRunner:
     Uses the Global Data Lake to simulate trades without calling external APIs.
     """
     
-    def __init__(self, db_path: Path = Path("data/market_history.duckdb")):
+    def __init__(
+        self,
+        db_path: Path = Path("data/market_history.duckdb"),
+        preloaded_data: Optional[Dict[str, pd.DataFrame]] = None
+    ):
         """
         Initialize the War Games Runner.
         
         Args:
             db_path: Path to the DuckDB database
+            preloaded_data: Optional full OHLCV history per symbol (with a
+                datetime 'date' column) already held in memory, or a
+                LakeSnapshot; symbols found here are sliced instead of
+                queried from DuckDB
         """
         self.db_path = db_path
+        self.preloaded_data = preloaded_data or {}
         self.conn = self._get_db_connection()
         
     def _get_db_connection(self) -> Optional[duckdb.DuckDBPyConnection]:
@@ -130,6 +192,17 @@ class WarGamesRunner:
         """
         Load OHLCV data from DuckDB for a specific time window.
         """
+        if symbol in self.preloaded_data:
+            if isinstance(self.preloaded_data, LakeSnapshot):
+                # Copies only the window out of the mapped columns
+                df = self.preloaded_data.window(symbol, start_date, end_date)
+            else:
+                full = self.preloaded_data[symbol]
+                mask = (full['date'] >= pd.Timestamp(start_date)) & (full['date'] <= pd.Timestamp(end_date))
+                df = full.loc[mask].reset_index(drop=True)
+            logger.info(f"Loaded {len(df)} rows for {symbol} ({start_date} to {end_date}) from memory")
+            return df
+        
         if not self.conn:
             logger.error("No database connection")
             return pd.DataFrame()
@@ -144,7 +217,8 @@ class WarGamesRunner:
         """
         
         try:
-            df = self.conn.execute(query).fetchdf()
+            with get_metrics().timer("duckdb.query", query="war_games_window"):
+                df = self.conn.execute(query).fetchdf()
             df['date'] = pd.to_datetime(df['date'])
             logger.info(f"Loaded {len(df)} rows for {symbol} ({start_date} to {end_date})")
             return df
@@ -477,52 +551,9 @@ class WarGamesRunner:
     ) -> Dict[str, Any]:
         logger.info("🎯 Starting War Games - Full Campaign Suite")
         
-        scenarios = [
-            {
-                "name": "Bull Run (2021)",
-                "start_date": "2021-01-01",
-                "end_date": "2021-12-31",
-                "description": "Strong upward trend, low volatility"
-            },
-            {
-                "name": "Inflation Shock (2022)",
-                "start_date": "2022-01-01",
-                "end_date": "2022-12-31",
-                "description": "High volatility, regime shifts"
-            },
-            {
-                "name": "Recovery Rally (2023)",
-                "start_date": "2023-01-01",
-                "end_date": "2023-12-31",
-                "description": "Tech bounce back, choppy markets"
-            }
-        ]
-        
-        param_sets = {
-            "Aggressive": TradingParams(
-                trust_threshold=0.55,
-                min_confidence=0.70,
-                max_position_size=0.15,
-                stop_loss=0.08,
-                take_profit=0.20
-            ),
-            "Balanced": TradingParams(
-                trust_threshold=0.65,
-                min_confidence=0.75,
-                max_position_size=0.10,
-                stop_loss=0.05,
-                take_profit=0.15
-            ),
-            "Conservative": TradingParams(
-                trust_threshold=0.75,
-                min_confidence=0.80,
-                max_position_size=0.05,
-                stop_loss=0.03,
-                take_profit=0.10
-            )
-        }
-        
-        symbols = ["BTC-USD", "ETH-USD", "NVDA", "MSFT"]
+        scenarios = list(DEFAULT_SCENARIOS)
+        param_sets = dict(DEFAULT_PARAM_SETS)
+        symbols = list(DEFAULT_SYMBOLS)
         all_results = []
         
         total_steps = len(scenarios) * len(symbols) * len(param_sets)
@@ -603,9 +634,15 @@ if __name__ == "__main__":
     parser.add_argument("--quick", action="store_true", help="Run quick test")
     parser.add_argument("--simulate-delusion", action="store_true", help="Inject hallucinations")
     parser.add_argument("--output", type=str, default="data/war_games_results.json")
+    parser.add_argument("--no-snapshot", action="store_true", help="Query DuckDB even if a current lake snapshot exists")
     args = parser.parse_args()
     
-    runner = WarGamesRunner()
+    enable_queue_logging()  # Format/write log records off the simulation thread
+    
+    # Map the shared lake snapshot when current (see services/lake_snapshot.py)
+    snapshot = None if args.no_snapshot else open_lake_snapshot()
+    runner = WarGamesRunner(preloaded_data=snapshot)
+    get_metrics().start_snapshot_writer("war_games")
     
     if args.quick:
         # Pass the new simulate_delusion flag
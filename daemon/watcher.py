@@ -12,22 +12,43 @@ from daemon.signal_extractor import SignalExtractor
 from daemon.classifier import RegimeClassifier
 from context.tracker import RegimeTracker
 from context.schemas import MacroRegime
+from core.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# Market proxies that can wake the daemon before the next scheduled cycle
+MACRO_PROXIES = ["SPY", "TLT", "GLD", "BTC-USD"]
+
 
 class MacroDaemon:
     """
     Main daemon that continuously monitors macroeconomic signals
     and updates the regime tracker when shifts are detected.
     
-    Runs in a loop, checking for regime changes every 10 minutes.
+    Runs in a loop, checking for regime changes every 10 minutes, or sooner
+    when a macro proxy moves sharply on the market data bus.
     """
     
-    def __init__(self):
-        """Initialize the macro daemon with extractor, classifier, and tracker."""
+    def __init__(
+        self,
+        interval_seconds: int = 600,
+        wake_move_pct: float = 2.0,
+        min_cycle_gap_seconds: int = 120
+    ):
+        """
+        Initialize the macro daemon with extractor, classifier, and tracker.
+        
+        Args:
+            interval_seconds: Seconds between scheduled cycles
+            wake_move_pct: Proxy move (%) that triggers an early cycle
+            min_cycle_gap_seconds: Minimum seconds between cycles, even on sharp moves
+        """
         logger.info("Initializing MacroDaemon...")
         
+        self.interval_seconds = interval_seconds
+        self.wake_move_pct = wake_move_pct
+        self.min_cycle_gap_seconds = min_cycle_gap_seconds
+        
         self.extractor = SignalExtractor()
         self.classifier = RegimeClassifier()
         self.tracker = RegimeTracker()
@@ -35,6 +56,7 @@ class MacroDaemon:
         logger.info("✅ MacroDaemon initialized")
         logger.info(f"   Current regime: {self.tracker.get_current_regime().id}")
     
+    @metrics.timed("daemon.cycle", daemon="macro")
     def run_cycle(self) -> None:
         """
         Run a single cycle of regime detection.
@@ -144,13 +166,19 @@ class MacroDaemon:
         """
         Start the daemon loop.
         
-        Runs continuously, checking for regime changes every 10 minutes (600 seconds).
+        Runs continuously, checking for regime changes every interval_seconds
+        (10 minutes by default) and early when a macro proxy moves sharply.
         """
+        from services.market_data_bus import start_market_data_feed
+        bus = start_market_data_feed()
+        bus.watch(MACRO_PROXIES)
+        metrics.start_snapshot_writer("macro_daemon")
+        
         logger.info("=" * 60)
         logger.info("🚀 Starting MacroDaemon")
         logger.info("=" * 60)
         logger.info(f"Current regime: {self.tracker.get_current_regime().id}")
-        logger.info("Polling interval: 600 seconds (10 minutes)")
+        logger.info(f"Polling interval: {self.interval_seconds} seconds (early on ≥{self.wake_move_pct}% moves in {', '.join(MACRO_PROXIES)})")
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
         
@@ -162,9 +190,19 @@ class MacroDaemon:
                 logger.info(f"\n📅 Cycle #{cycle_count} - {time.strftime('%Y-%m-%d %H:%M:%S')}")
                 
                 self.run_cycle()
+                # Measure moves from the prices this cycle saw, not from after the gap
+                reference = bus.last_prices(MACRO_PROXIES)
                 
-                logger.info(f"⏸️  Waiting 600 seconds before next cycle...")
-                time.sleep(600)  # 10 minutes
+                logger.info(f"⏸️  Waiting {self.interval_seconds} seconds before next cycle...")
+                time.sleep(self.min_cycle_gap_seconds)
+                moved = bus.wait_for_move(
+                    MACRO_PROXIES,
+                    self.wake_move_pct,
+                    timeout=max(0, self.interval_seconds - self.min_cycle_gap_seconds),
+                    reference=reference
+                )
+                if moved:
+                    logger.info(f"⚡ Sharp move in {', '.join(moved)} - running regime check early")
                 
         except KeyboardInterrupt:
             logger.info("\n" + "=" * 60)
@@ -516,19 +516,32 @@ def render_forecast_panel():
                     # Signal Decay Analysis
                     
                     decay_model = SignalDecayModel()
+                    half_life = decay_model.calculate_half_life(symbol)
+                    persistence = decay_model.calculate_signal_persistence(symbol)
                     
-                    # Calculate half-life (would use actual forecast history in production)
-                    st.info("💡 Signal decay analysis requires forecast history. Run daily forecasts to build history.")
+                    if half_life.get("half_life_hours") is None:
+                        st.info("💡 Signal decay analysis requires forecast history. Run daily forecasts to build history.")
                     
                     with st.expander("📊 Signal Persistence Metrics"):
                         st.write("**Forecast Half-Life:** Estimated time until forecast validity degrades by 50%")
                         st.write("**Signal Persistence:** How stable the expected return is over repeated runs")
+                        if half_life.get("half_life_hours") is not None:
+                            col1, col2, col3 = st.columns(3)
+                            col1.metric("Half-Life", f"{half_life['half_life_hours']:.1f}h")
+                            col2.metric("Persistence", f"{persistence['persistence_score']:.2f}")
+                            col3.metric("Forecasts", half_life["forecast_count"])
                         st.caption("💡 Use daily scheduler to build forecast history for decay analysis")
                     
-                    # Signal Decay Heatmap (placeholder - would show actual data)
                     if st.checkbox("Show Signal Decay Heatmap", key="show_decay_heatmap"):
-                        st.info("📊 Heatmap visualization coming soon. Requires forecast history from daily scheduler.")
-                        # Would generate heatmap here with actual data
+                        heatmap = decay_model.generate_decay_heatmap_data([symbol]).get(symbol, {})
+                        trend = heatmap.get("expected_return_trend", [])
+                        if any(v is not None for v in trend):
+                            st.line_chart(pd.DataFrame(
+                                {"Expected Return %": trend},
+                                index=pd.to_datetime(heatmap["bucket_starts"])
+                            ))
+                        else:
+                            st.info("📊 No forecast history in the last 7 days. Requires forecast history from daily scheduler.")
                     
                     # Add disclaimer
                     st.markdown("---")
@@ -923,6 +936,10 @@ def render_forecast_panel():
                 
                 st.success(f"✅ Analyzed {analysis['successful']}/{analysis['total_analyzed']} symbols")
                 
+                if analysis.get('failures'):
+                    with st.expander(f"⚠️ {len(analysis['failures'])} symbols failed"):
+                        st.json(analysis['failures'])
+                
                 ranked = analysis['ranked_opportunities']
                 
                 # Top BUY Opportunities
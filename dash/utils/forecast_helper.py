@@ -1,8 +1,9 @@
 """Helper functions for fetching historical data and generating forecasts."""
-import yfinance as yf
 from typing import List, Optional, Dict, Any
 import logging
 
+from services.market_data_gateway import get_market_data_gateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,8 +24,7 @@ def get_historical_prices(
         List of closing prices (most recent last) or None if error
     """
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period, interval=interval)
+        hist = get_market_data_gateway().get_bars(symbol, period=period, interval=interval)
         
         if hist.empty:
             logger.warning(f"No historical data for {symbol}")
@@ -25,7 +25,6 @@ def get_crypto_price(symbol: str):
     return None
 
 def get_price(symbol: str):
-    """Auto-detect whether asset is stock or crypto."""
-    if symbol.upper() in ["BTC", "ETH"]:
-        return get_crypto_price(symbol)
-    return get_stock_price(symbol)
\ No newline at end of file
+    """Current price via the shared market data gateway (auto-detects stock vs crypto, short-TTL cached)."""
+    from services.market_data_gateway import get_market_data_gateway
+    return get_market_data_gateway().get_quote(symbol)
\ No newline at end of file
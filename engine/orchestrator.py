@@ -1,11 +1,14 @@
 import logging
 import time
+
+_import_started = time.perf_counter()
+
+import threading
 import pandas as pd
 import numpy as np
-import yfinance as yf
 import json
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, TYPE_CHECKING
 from datetime import datetime
 
 from config.settings import get_settings
@@ -14,17 +17,15 @@ from models.tsfm.inference import ChronosInferenceEngine
 from models.tsfm.schemas import ForecastInput
 from models.trust.filter import TrustFilter
 from models.technical_analysis import add_indicators  # Phase 3: Quality filters
-from reasoning.engine import DeepSeekEngine
 from reasoning.memory import TradeMemory
 from reasoning.schemas import TradeContext, ReasoningDecision, DeepSeekResponse
-from execution.ibkr import IBKRBridge
 from context.tracker import RegimeTracker
 
 # Level 2 Perception Agents
 from agents.trm.news_digest_agent import NewsDigestAgent, NewsDigest
 from agents.trm.symbol_sentiment_agent import SymbolSentimentAgent
 from agents.trm.memory_summarizer import MemorySummarizer, MemoryNarrative
-from services.news_fetcher import NewsFetcher
+from services.market_data_gateway import get_market_data_gateway
 
 # Level 4 Policy Agent
 from agents.trm.risk_policy_agent import RiskPolicyAgent, TRMInput, FinalVerdict
@@ -33,9 +34,18 @@ from agents.trm.risk_policy_agent import RiskPolicyAgent, TRMInput, FinalVerdict
 from agents.portfolio_manager import PortfolioManager
 
 # Setup logging
+from core.lazy import LazyComponent, build_timings, is_built, lazy_components
+from core.metrics import metrics
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("engine.orchestrator")
 
+# openai, ib_insync and feedparser are imported by the component factories
+if TYPE_CHECKING:
+    from config.settings import Settings
+    from execution.ibkr import IBKRBridge
+    from reasoning.engine import DeepSeekEngine
+    from services.news_fetcher import NewsFetcher
+
 
 class TradeDecision:
     """Result of trade decision process (for backward compatibility)."""
@@ -75,49 +85,210 @@ class ExecutionOrder:
 
 
 class TradeOrchestrator:
-    def __init__(self, env: str = "prod"):
-        self.settings = get_settings()
+    """
+    End-to-end decision pipeline for one ticker at a time.
+
+    Components are built on first use (see core.lazy), so constructing the
+    orchestrator is cheap and a run only pays for the stages it reaches.
+    warm_up() builds them ahead of time, optionally on a background thread.
+    The broker is never warmed in the background: ib_insync binds to the
+    event loop of the thread that connects, so it connects on first use.
+    """
+
+    def __init__(
+        self,
+        env: str = "prod",
+        background_warm_up: bool = False,
+        settings: Optional["Settings"] = None
+    ):
+        """
+        Initialize orchestrator.
+
+        Components can be replaced by assigning the attribute before first use
+        (e.g. orchestrator.broker = PaperBroker()); the factory then never runs.
+
+        Args:
+            env: Environment name (for logging)
+            background_warm_up: Start building components on a background thread
+            settings: Settings to use (default: get_settings())
+        """
+        init_started = time.perf_counter()
+        self.settings = settings or get_settings()
         self.env = env
-        
-        # Initialize Components
-        self.tsfm = ChronosInferenceEngine(model_name="amazon/chronos-t5-tiny") 
-        self.trust_filter = TrustFilter()
-        self.reasoning_engine = DeepSeekEngine(
+        self._warm_up_thread: Optional[threading.Thread] = None
+        self._warm_up_ms: Optional[float] = None
+
+        if background_warm_up:
+            self.warm_up(background=True)
+
+        self._init_ms = (time.perf_counter() - init_started) * 1000
+        metrics.observe("startup.init", self._init_ms, owner="TradeOrchestrator")
+        logger.info(f"TradeOrchestrator initialized (env: {self.env}) in {self._init_ms:.0f}ms")
+
+    # ------------------------------------------------------------------
+    # Components (built on first use)
+    # ------------------------------------------------------------------
+
+    @LazyComponent
+    def tsfm(self) -> ChronosInferenceEngine:
+        # Load weights here so warm-up (and the startup report) covers the
+        # torch/chronos import instead of the first forecast
+        engine = ChronosInferenceEngine(model_name="amazon/chronos-t5-tiny")
+        engine.load()
+        return engine
+
+    @LazyComponent
+    def trust_filter(self) -> TrustFilter:
+        return TrustFilter()
+
+    @LazyComponent
+    def reasoning_engine(self) -> "DeepSeekEngine":
+        from reasoning.engine import DeepSeekEngine
+        return DeepSeekEngine(
             api_key=self.settings.openrouter_api_key,
             base_url="https://openrouter.ai/api/v1",
             model=self.settings.deepseek_model
         )
-        self.memory = TradeMemory()
-        self.param_loader = AdaptiveParamLoader()
-        
-        # Initialize Regime Tracker for Macro Context
-        self.regime_tracker = RegimeTracker()
-        
-        # Initialize Level 2 Perception Agents
-        self.news_fetcher = NewsFetcher()
-        self.news_digest = NewsDigestAgent()
-        self.symbol_sentiment_agent = SymbolSentimentAgent()
-        self.memory_summarizer = MemorySummarizer()
-        
-        # Initialize Level 4 Policy Agent
-        self.risk_policy = RiskPolicyAgent()
-        
-        # Initialize Portfolio Manager (Task C)
-        self.portfolio_manager = PortfolioManager()
-        
-        # Initialize Execution Bridge
+
+    @LazyComponent
+    def memory(self) -> TradeMemory:
+        return TradeMemory()
+
+    @LazyComponent
+    def param_loader(self) -> AdaptiveParamLoader:
+        return AdaptiveParamLoader()
+
+    @LazyComponent
+    def regime_tracker(self) -> RegimeTracker:
+        """Regime Tracker for Macro Context."""
+        return RegimeTracker()
+
+    # Level 2 Perception Agents
+    @LazyComponent
+    def news_fetcher(self) -> "NewsFetcher":
+        from services.news_fetcher import NewsFetcher
+        return NewsFetcher()
+
+    @LazyComponent
+    def news_digest(self) -> NewsDigestAgent:
+        return NewsDigestAgent()
+
+    @LazyComponent
+    def symbol_sentiment_agent(self) -> SymbolSentimentAgent:
+        return SymbolSentimentAgent()
+
+    @LazyComponent
+    def memory_summarizer(self) -> MemorySummarizer:
+        return MemorySummarizer()
+
+    # Level 4 Policy Agent
+    @LazyComponent
+    def risk_policy(self) -> RiskPolicyAgent:
+        return RiskPolicyAgent()
+
+    # Portfolio Manager (Task C)
+    @LazyComponent
+    def portfolio_manager(self) -> PortfolioManager:
+        return PortfolioManager()
+
+    @LazyComponent
+    def broker(self) -> Optional["IBKRBridge"]:
+        """Execution bridge, connected on first use (None if unavailable)."""
         # We default to Paper Trading port (7497). Change to 7496 for Live.
+        # A single attempt: the default retry loop never gives up while TWS
+        # is down, and this runs mid-pipeline on the first approved trade.
         try:
-            self.broker = IBKRBridge(port=7497)
-            self.broker.connect()
+            from execution.ibkr import IBKRBridge
+            broker = IBKRBridge(port=7497)
+            if not broker.connect(use_retry=False):
+                logger.error("Failed to connect to IBKR. Execution will be disabled.")
+                return None
+            return broker
         except Exception as e:
             logger.error(f"Failed to connect to IBKR: {e}. Execution will be disabled.")
-            self.broker = None
-        
-        # Load Learning Book (History Miner)
-        self.learning_book = self._load_learning_book()
-        
-        logger.info(f"TradeOrchestrator initialized (env: {self.env})")
+            return None
+
+    @LazyComponent
+    def learning_book(self) -> List[dict]:
+        """Learning Book (History Miner) records."""
+        return self._load_learning_book()
+
+    # ------------------------------------------------------------------
+    # Warm-up and startup report
+    # ------------------------------------------------------------------
+
+    def warm_up(
+        self,
+        components: Optional[Iterable[str]] = None,
+        background: bool = True
+    ) -> Optional[threading.Thread]:
+        """
+        Build components ahead of their first use.
+
+        Args:
+            components: Component names (default: all except the broker)
+            background: Build on a daemon thread instead of blocking
+
+        Returns:
+            The warm-up thread when background=True, else None
+        """
+        names = list(components) if components is not None else [
+            name for name in lazy_components(type(self)) if name != "broker"
+        ]
+
+        def run():
+            started = time.perf_counter()
+            for name in names:
+                try:
+                    getattr(self, name)
+                except Exception as e:
+                    # Left unbuilt; first use retries and surfaces the error
+                    logger.warning(f"⚠️ Warm-up of {name} failed: {e}")
+            self._warm_up_ms = (time.perf_counter() - started) * 1000
+            metrics.observe("startup.warm_up", self._warm_up_ms, owner="TradeOrchestrator")
+            logger.info(f"🔥 Warmed up {len(names)} components in {self._warm_up_ms:.0f}ms")
+
+        if not background:
+            run()
+            return None
+        self._warm_up_thread = threading.Thread(target=run, name="orchestrator-warm-up", daemon=True)
+        self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def startup_report(self) -> Dict[str, Any]:
+        """
+        Startup timings.
+
+        Returns:
+            Dict with module import, constructor and warm-up times (ms) and the
+            build time of each component (None if not built yet)
+        """
+        timings = build_timings(self)
+        return {
+            "import_ms": round(IMPORT_MS, 1),
+            "init_ms": round(self._init_ms, 1),
+            "warm_up_ms": round(self._warm_up_ms, 1) if self._warm_up_ms is not None else None,
+            "components": {
+                name: round(timings[name], 1) if name in timings else None
+                for name in lazy_components(type(self))
+            },
+        }
+
+    def log_startup_report(self) -> Dict[str, Any]:
+        """Log startup_report() (slowest components first) and return it."""
+        report = self.startup_report()
+        built = sorted(
+            ((name, ms) for name, ms in report["components"].items() if ms is not None),
+            key=lambda item: -item[1]
+        )
+        pending = [name for name, ms in report["components"].items() if ms is None]
+        warm_up = f", warm-up {report['warm_up_ms']:.0f}ms" if report["warm_up_ms"] is not None else ""
+        logger.info(
+            f"⏱️ Startup: import {report['import_ms']:.0f}ms, init {report['init_ms']:.0f}ms{warm_up} | "
+            + ", ".join(f"{name}={ms:.0f}ms" for name, ms in built)
+            + (f" | not built: {', '.join(pending)}" if pending else "")
+        )
+        return report
 
     def _load_learning_book(self) -> List[dict]:
         path = "data/learning_book.json"
@@ -173,36 +344,48 @@ class TradeOrchestrator:
         )
 
     def fetch_data(self, symbol: str) -> pd.DataFrame:
-        logger.info(f"📊 Fetching data for {symbol} via yfinance...")
+        logger.info("📊 Fetching data for %s via market data gateway...", symbol)
         try:
-            # Use Ticker().history() instead of download() to avoid progress argument issues
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(period="60d", interval="90m")
+            df = get_market_data_gateway().get_bars(symbol, period="60d", interval="90m")
             
             if df.empty:
-                logger.warning(f"No data found for {symbol}")
+                logger.warning("No data found for %s", symbol)
                 return pd.DataFrame()
             
             df = df.dropna()
             
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            
-            if 'Close' not in df.columns:
-                if 'Adj Close' in df.columns:
-                    df['Close'] = df['Adj Close']
-                else:
-                    return pd.DataFrame()
-            
-            logger.info(f"✅ Fetched {len(df)} data points for {symbol}")
+            logger.info("✅ Fetched %s data points for %s", len(df), symbol)
             return df
         except Exception as e:
             logger.error(f"Data fetch error for {symbol}: {e}")
             return pd.DataFrame()
 
     def process_ticker(self, symbol: str, red_team_mode: bool = False) -> Optional[dict]:
+        """
+        Run the full decision pipeline for one symbol.
+        
+        Records per-stage latencies ("pipeline.stage") and the outcome
+        ("pipeline.decisions") in core.metrics.
+        
+        Args:
+            symbol: Ticker to process
+            red_team_mode: Run the LLM in adversarial mode
+        
+        Returns:
+            TradeDecision, or None if the pipeline aborted
+        """
+        with metrics.timer("pipeline.process_ticker"):
+            decision = self._process_ticker(symbol, red_team_mode)
+        metrics.incr(
+            "pipeline.decisions",
+            stage=getattr(decision, "stage", "aborted"),
+            decision=getattr(decision, "decision", "NONE")
+        )
+        return decision
+
+    def _process_ticker(self, symbol: str, red_team_mode: bool) -> Optional[dict]:
         logger.info("="*60)
-        logger.info(f"🚀 PROCESSING TICKER: {symbol}")
+        logger.info("🚀 PROCESSING TICKER: %s", symbol)
         logger.info("="*60)
         
         start_time = time.time()
@@ -219,13 +402,15 @@ class TradeOrchestrator:
         take_profit = float(params.get("take_profit", 0.15))
         
         logger.info(
-            f"📐 Using optimized params for {symbol} in '{current_regime.name}': "
-            f"Trust>{trust_threshold:.2f}, Conf>{min_confidence:.2f}, "
-            f"PosSize<{max_position_size:.0%}, SL={stop_loss:.0%}, TP={take_profit:.0%}"
+            "📐 Using optimized params for %s in '%s': "
+            "Trust>%.2f, Conf>%.2f, PosSize<%.0f%%, SL=%.0f%%, TP=%.0f%%",
+            symbol, current_regime.name, trust_threshold, min_confidence,
+            max_position_size * 100, stop_loss * 100, take_profit * 100
         )
         
         # --- STAGE 0: DATA ---
-        df = self.fetch_data(symbol)
+        with metrics.timer("pipeline.stage", stage="data"):
+            df = self.fetch_data(symbol)
         if df.empty or len(df) < 50:
             return None
         
@@ -241,7 +426,7 @@ class TradeOrchestrator:
         
         # Filter 1: RSI Overbought Check
         if pd.notna(latest['rsi_14']) and latest['rsi_14'] > 70:
-            logger.info(f"🔴 [STAGE 0] REJECTED: Overbought (RSI={latest['rsi_14']:.1f} > 70)")
+            logger.info("🔴 [STAGE 0] REJECTED: Overbought (RSI=%.1f > 70)", latest['rsi_14'])
             return TradeDecision(
                 symbol=symbol,
                 decision="REJECT",
@@ -251,7 +436,7 @@ class TradeOrchestrator:
         
         # Filter 2: MACD Momentum Check
         if pd.notna(latest['macd_hist']) and latest['macd_hist'] < 0:
-            logger.info(f"🔴 [STAGE 0] REJECTED: Negative Momentum (MACD={latest['macd_hist']:.2f} < 0)")
+            logger.info("🔴 [STAGE 0] REJECTED: Negative Momentum (MACD=%.2f < 0)", latest['macd_hist'])
             return TradeDecision(
                 symbol=symbol,
                 decision="REJECT",
@@ -270,7 +455,7 @@ class TradeOrchestrator:
         current_vol = float(returns.std() * np.sqrt(24))
 
         # --- STAGE 1: FORECAST ---
-        logger.info(f"[STAGE 1] 🔮 Generating forecast for {symbol}...")
+        logger.info("[STAGE 1] 🔮 Generating forecast for %s...", symbol)
         try:
             series = [x for x in df['close'].tolist() if not (isinstance(x, float) and (np.isnan(x) or np.isinf(x)))]
             
@@ -283,11 +468,12 @@ class TradeOrchestrator:
             )
             
             # Generate forecast
-            forecast_output = self.tsfm.forecast(forecast_input, num_samples=10)
+            with metrics.timer("pipeline.stage", stage="forecast"):
+                forecast_output = self.tsfm.forecast(forecast_input, num_samples=10)
             
             # Get target price (mean of point forecast)
             target_price = float(np.mean(forecast_output.point_forecast))
-            logger.info(f"✅ [STAGE 1] Target=${target_price:.2f}")
+            logger.info("✅ [STAGE 1] Target=$%.2f", target_price)
         except Exception as e:
             logger.error(f"❌ [STAGE 1] Forecast failed: {e}")
             return None
@@ -297,13 +483,14 @@ class TradeOrchestrator:
         try:
             historical_vol = float(returns.std() * np.sqrt(24)) if len(returns) > 0 else current_vol
             
-            trust_result = self.trust_filter.evaluate(
-                forecast=forecast_output,
-                input_data=forecast_input,
-                symbol=symbol,
-                current_volatility=current_vol,
-                historical_volatility=historical_vol
-            )
+            with metrics.timer("pipeline.stage", stage="trust"):
+                trust_result = self.trust_filter.evaluate(
+                    forecast=forecast_output,
+                    input_data=forecast_input,
+                    symbol=symbol,
+                    current_volatility=current_vol,
+                    historical_volatility=historical_vol
+                )
             
             trust_score = trust_result.metrics.overall_trust_score
             if not trust_result.is_trusted or trust_score < trust_threshold:
@@ -320,7 +507,7 @@ class TradeOrchestrator:
                     trust_evaluation=trust_result,
                 )
             
-            logger.info(f"✅ [STAGE 2] Trust Score: {trust_score:.3f} (threshold {trust_threshold:.2f})")
+            logger.info("✅ [STAGE 2] Trust Score: %.3f (threshold %.2f)", trust_score, trust_threshold)
         except Exception as e:
             logger.error(f"❌ [STAGE 2] Trust evaluation failed: {e}")
             return None
@@ -330,8 +517,9 @@ class TradeOrchestrator:
         
         # 1. News Perception
         try:
-            raw_news = self.news_fetcher.get_context(symbol)  # Returns formatted string
-            news_digest = self.news_digest.digest(raw_news, symbol)  # Returns NewsDigest object
+            with metrics.timer("pipeline.stage", stage="news"):
+                raw_news = self.news_fetcher.get_context(symbol)  # Returns formatted string
+                news_digest = self.news_digest.digest(raw_news, symbol)  # Returns NewsDigest object
             logger.info(
                 f"✅ [PERCEPTION] News: {news_digest.sentiment.value} "
                 f"(Impact: {news_digest.impact_level.value}, Headlines: {news_digest.headline_count})"
@@ -352,8 +540,9 @@ class TradeOrchestrator:
             # We reuse the raw news string, but ideally we'd pass a list of headlines
             # Extract headlines from raw news for the agent
             headlines = [line.strip() for line in raw_news.split('\n') if line.strip() and not line.startswith("RECENT")]
-            symbol_sentiment = self.symbol_sentiment_agent.analyze(symbol, headlines)
-            logger.info(f"✅ [PERCEPTION] Symbol Sentiment: {symbol_sentiment.score:.2f} ({symbol_sentiment.zone.value})")
+            with metrics.timer("pipeline.stage", stage="sentiment"):
+                symbol_sentiment = self.symbol_sentiment_agent.analyze(symbol, headlines)
+            logger.info("✅ [PERCEPTION] Symbol Sentiment: %.2f (%s)", symbol_sentiment.score, symbol_sentiment.zone.value)
         except Exception as e:
             logger.error(f"❌ [PERCEPTION] Symbol sentiment failed: {e}")
             symbol_sentiment = None
@@ -361,14 +550,15 @@ class TradeOrchestrator:
         # 2. Memory Perception (Enhanced with Global Data Lake)
         try:
             # Get MemoryNarrative object for metrics
-            memory_narrative = self.memory_summarizer.summarize(symbol, current_regime.id)
-            
-            # Get unified context (Trade History + Global Market Context)
-            unified_memory_context = self.memory_summarizer.get_unified_context(
-                symbol, 
-                current_regime.id, 
-                include_market=True
-            )
+            with metrics.timer("pipeline.stage", stage="memory"):
+                memory_narrative = self.memory_summarizer.summarize(symbol, current_regime.id)
+                
+                # Get unified context (Trade History + Global Market Context)
+                unified_memory_context = self.memory_summarizer.get_unified_context(
+                    symbol, 
+                    current_regime.id, 
+                    include_market=True
+                )
             
             logger.info(
                 f"✅ [PERCEPTION] Memory: Win Rate={memory_narrative.regime_win_rate:.1%}, "
@@ -376,8 +566,9 @@ class TradeOrchestrator:
             )
             
             # Log market context from Global Data Lake
-            market_context_only = self.memory_summarizer.get_market_context(symbol, days=30)
-            logger.info(f"📊 [PERCEPTION] Global Market Context:\n{market_context_only}")
+            with metrics.timer("pipeline.stage", stage="market_context"):
+                market_context_only = self.memory_summarizer.get_market_context(symbol, days=30)
+            logger.info("📊 [PERCEPTION] Global Market Context:\n%s", market_context_only)
             
         except Exception as e:
             logger.error(f"❌ [PERCEPTION] Memory summarizer failed: {e}")
@@ -397,7 +588,7 @@ class TradeOrchestrator:
         
         # 1. Get Current Macro Regime
         regime = current_regime
-        logger.info(f"🌍 Market Regime: {regime.id} ({regime.name})")
+        logger.info("🌍 Market Regime: %s (%s)", regime.id, regime.name)
         
         # 2. Fetch Precedents (Learning Book)
         precedent_summary = self.find_precedents(symbol, current_vol, trust_result.metrics.overall_trust_score)
@@ -444,7 +635,8 @@ class TradeOrchestrator:
         
         # 3. Call LLM
         try:
-            llm_decision = self.reasoning_engine.analyze_trade(context, red_team_mode=red_team_mode)
+            with metrics.timer("pipeline.stage", stage="llm"):
+                llm_decision = self.reasoning_engine.analyze_trade(context, red_team_mode=red_team_mode)
         except Exception as e:
             logger.error(f"❌ [STAGE 3] LLM reasoning failed: {e}")
             return None
@@ -494,14 +686,15 @@ class TradeOrchestrator:
             )
             
             # Call Risk Policy Agent
-            final_verdict = self.risk_policy.decide(trm_input)
+            with metrics.timer("pipeline.stage", stage="policy"):
+                final_verdict = self.risk_policy.decide(trm_input)
             
             logger.info(
                 f"✅ [LEVEL 4] Final Verdict: {final_verdict.decision.value} "
                 f"(Conf: {final_verdict.original_confidence:.2f} → {final_verdict.confidence:.2f}, "
                 f"Veto: {final_verdict.veto_applied})"
             )
-            logger.info(f"[LEVEL 4] {final_verdict.override_reason}")
+            logger.info("[LEVEL 4] %s", final_verdict.override_reason)
             
         except Exception as e:
             logger.error(f"❌ [LEVEL 4] Risk policy failed: {e}")
@@ -526,35 +719,36 @@ class TradeOrchestrator:
         )
         
         # Save trade with all metrics including TRM details
-        trade_id = self.memory.add_trade(
-            context=context,
-            response=llm_decision,
-            proposer_confidence=proposer_conf,
-            critique_flaws_count=critique_flaws,
-            regime_id=current_regime.id,
-            regime_name=current_regime.name,
-            trm_details={
-                "news_impact": news_digest.impact_level.value,
-                "news_sentiment": news_digest.sentiment.value,
-                "news_summary": news_digest.summary,
-                "memory_win_rate": memory_narrative.regime_win_rate,
-                "memory_hallucination_rate": memory_narrative.hallucination_rate,
-                "critic_confidence": llm_decision.confidence,
-                "critic_flaws": critique_flaws or 0,
-                "policy_veto": final_verdict.veto_applied,
-                "policy_veto_reason": final_verdict.veto_reason.value,
-                "override_reason": final_verdict.override_reason,
-                "waterfall_steps": {
-                    "forecast_confidence": forecast_confidence,
-                    "trust_score": trust_result.metrics.overall_trust_score,
-                    "llm_confidence": llm_decision.confidence,
-                    "final_confidence": final_verdict.confidence,
-                    "confidence_adjustment": final_verdict.confidence_adjustment
+        with metrics.timer("pipeline.stage", stage="persist"):
+            trade_id = self.memory.add_trade(
+                context=context,
+                response=llm_decision,
+                proposer_confidence=proposer_conf,
+                critique_flaws_count=critique_flaws,
+                regime_id=current_regime.id,
+                regime_name=current_regime.name,
+                trm_details={
+                    "news_impact": news_digest.impact_level.value,
+                    "news_sentiment": news_digest.sentiment.value,
+                    "news_summary": news_digest.summary,
+                    "memory_win_rate": memory_narrative.regime_win_rate,
+                    "memory_hallucination_rate": memory_narrative.hallucination_rate,
+                    "critic_confidence": llm_decision.confidence,
+                    "critic_flaws": critique_flaws or 0,
+                    "policy_veto": final_verdict.veto_applied,
+                    "policy_veto_reason": final_verdict.veto_reason.value,
+                    "override_reason": final_verdict.override_reason,
+                    "waterfall_steps": {
+                        "forecast_confidence": forecast_confidence,
+                        "trust_score": trust_result.metrics.overall_trust_score,
+                        "llm_confidence": llm_decision.confidence,
+                        "final_confidence": final_verdict.confidence,
+                        "confidence_adjustment": final_verdict.confidence_adjustment
+                    }
                 }
-            }
-        )
+            )
         
-        logger.info(f"[EXECUTION] Trade {trade_id} saved with proposer_conf={proposer_conf}, critique_flaws={critique_flaws}")
+        logger.info("[EXECUTION] Trade %s saved with proposer_conf=%s, critique_flaws=%s", trade_id, proposer_conf, critique_flaws)
 
         # Use Final Verdict for execution decision
         if final_verdict.decision == ReasoningDecision.APPROVE and not final_verdict.veto_applied:
@@ -562,12 +756,12 @@ class TradeOrchestrator:
             # --- TASK C: PORTFOLIO LEVEL CHECK ---
             correlation_risk_ok = True
             if self.broker and self.broker.is_connected():
-                current_positions = self.broker.get_positions()
-                if not self.portfolio_manager.check_correlation_risk(symbol, current_positions):
-                    correlation_risk_ok = False
+                with metrics.timer("pipeline.stage", stage="portfolio_risk"):
+                    current_positions = self.broker.get_positions()
+                    correlation_risk_ok = self.portfolio_manager.check_correlation_risk(symbol, current_positions)
             
             if not correlation_risk_ok:
-                logger.warning(f"⚠️ [EXECUTION] REJECTED: High Correlation Risk for {symbol}")
+                logger.warning("⚠️ [EXECUTION] REJECTED: High Correlation Risk for %s", symbol)
                 return TradeDecision(
                     symbol=symbol,
                     decision="REJECT",
@@ -586,17 +780,19 @@ class TradeOrchestrator:
             # Determine Size
             quantity = 0.0001 if "-USD" in symbol else 1
             
-            logger.info(f"🟢 [EXECUTION] APPROVED! Sending BUY for {quantity} {symbol}...")
+            logger.info("🟢 [EXECUTION] APPROVED! Sending BUY for %s %s...", quantity, symbol)
             
             if self.broker and self.broker.is_connected():
                 if self.settings.live_trading_enabled:
-                    order = self.broker.execute_trade("BUY", symbol, quantity)
+                    with metrics.timer("pipeline.stage", stage="execution"):
+                        order = self.broker.execute_trade("BUY", symbol, quantity)
+                    metrics.incr("pipeline.orders", status="placed" if order else "failed")
                     if order:
-                        logger.info(f"🚀 Order Placed: Order ID {order.orderId}")
+                        logger.info("🚀 Order Placed: Order ID %s", order.orderId)
                     else:
                         logger.error("❌ Order Placement Failed")
                 else:
-                    logger.warning(f"🛑 Live Trading DISABLED. Skipping execution for {quantity} {symbol}.")
+                    logger.warning("🛑 Live Trading DISABLED. Skipping execution for %s %s.", quantity, symbol)
             else:
                 logger.warning("⚠️ Broker not connected. Trade skipped.")
             
@@ -617,7 +813,7 @@ class TradeOrchestrator:
         else:
             # Rejected by policy or LLM
             reject_reason = "VETOED by Risk Policy" if final_verdict.veto_applied else f"LLM {llm_decision.decision.value}"
-            logger.info(f"⚠️ [EXECUTION] REJECTED: {reject_reason}. Logged to memory.")
+            logger.info("⚠️ [EXECUTION] REJECTED: %s. Logged to memory.", reject_reason)
             
             # Return TradeDecision even when rejected (for backward compatibility)
             return TradeDecision(
@@ -634,6 +830,11 @@ class TradeOrchestrator:
             )
 
     def shutdown(self):
-        if self.broker:
+        # Don't connect just to disconnect
+        if is_built(self, "broker") and self.broker:
             self.broker.disconnect()
             logger.info("Broker disconnected.")
+
+
+# Time spent importing this module and its dependencies (startup report)
+IMPORT_MS = (time.perf_counter() - _import_started) * 1000
@@ -0,0 +1,126 @@
+"""
+Qualified contract cache for IBKR.
+
+Qualified contracts (conId, localSymbol, primary exchange, ...) are stable,
+so they are cached in memory and persisted to data/ibkr_contracts.json,
+keyed by symbol/secType/exchange. Orders can then be placed without a
+`qualifyContracts` round-trip per trade, and a fresh process starts warm.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core.logger import logger
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "data" / "ibkr_contracts.json"
+
+# Contract fields needed to rebuild a qualified contract
+CONTRACT_FIELDS = (
+    "conId", "symbol", "secType", "exchange", "primaryExchange", "currency",
+    "localSymbol", "tradingClass", "multiplier", "lastTradeDateOrContractMonth",
+)
+
+ContractKey = Tuple[str, str, str]
+
+
+def contract_key(symbol: str, sec_type: str, exchange: str) -> ContractKey:
+    return (symbol.upper(), sec_type.upper(), exchange.upper())
+
+
+class ContractCache:
+    """In-memory + on-disk cache of qualified contract fields."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH, max_age_days: float = 30.0):
+        """
+        Initialize contract cache.
+
+        Args:
+            path: JSON file to persist to (None = memory only)
+            max_age_days: Entries older than this are re-qualified
+        """
+        self.path = Path(path) if path else None
+        self.max_age_seconds = max_age_days * 86400
+        self._entries: Dict[ContractKey, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            for entry in data.get("contracts", []):
+                key = contract_key(entry["key"][0], entry["key"][1], entry["key"][2])
+                self._entries[key] = {"fields": entry["fields"], "cached_at": entry.get("cached_at", 0)}
+            logger.debug(f"Loaded {len(self._entries)} cached IBKR contracts from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load IBKR contract cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "contracts": [
+                {"key": list(key), "fields": entry["fields"], "cached_at": entry["cached_at"]}
+                for key, entry in self._entries.items()
+            ]
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.warning(f"Could not save IBKR contract cache {self.path}: {e}")
+
+    def get(self, key: ContractKey) -> Optional[Dict[str, Any]]:
+        """Cached contract fields for key (None if missing or expired)."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.time() - entry["cached_at"] > self.max_age_seconds:
+            return None
+        return entry["fields"]
+
+    def put_many(self, items: Dict[ContractKey, Any]) -> None:
+        """Store qualified contracts (objects with CONTRACT_FIELDS attributes) and persist once."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            for key, contract in items.items():
+                fields = {
+                    name: getattr(contract, name) for name in CONTRACT_FIELDS
+                    if getattr(contract, name, None) not in (None, "", 0)
+                }
+                self._entries[key] = {"fields": fields, "cached_at": now}
+            self._save()
+
+    def put(self, key: ContractKey, contract: Any) -> None:
+        self.put_many({key: contract})
+
+    def invalidate(self, key: Optional[ContractKey] = None) -> None:
+        """Drop one entry (or all) and persist."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_contract_cache: Optional[ContractCache] = None
+
+
+def get_contract_cache() -> ContractCache:
+    """Get or create the shared contract cache."""
+    global _contract_cache
+    if _contract_cache is None:
+        _contract_cache = ContractCache()
+    return _contract_cache
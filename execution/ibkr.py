@@ -7,10 +7,12 @@ Features auto-reconnection logic to survive TWS restarts.
 import logging
 import time
 import threading
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
 from services.risk_control_service import RiskControlService
+from services.approval_registry import get_approval_registry
+from execution.contract_cache import ContractKey, contract_key, get_contract_cache
 from core.logger import logger
 
 # Lazy import ib_insync to handle import errors gracefully
@@ -23,6 +25,36 @@ except ImportError:
 
 import asyncio
 
+# Order statuses that settle an order future from execute_trades_async
+ACKED_STATUSES = {"PreSubmitted", "Submitted", "Filled"}
+REJECTED_STATUSES = {"Cancelled", "ApiCancelled", "Inactive"}
+
+# Seconds an order waits for SMS/API approval before it is cancelled
+APPROVAL_TIMEOUT_SECONDS = 300
+# Seconds execute_trade_async waits for IBKR to acknowledge a placed order
+ORDER_ACK_TIMEOUT_SECONDS = 30
+
+_nest_asyncio_applied = False
+
+
+def _ensure_nest_asyncio() -> None:
+    """Enable nested event loops once per process (sync ib_insync calls inside a running loop)."""
+    global _nest_asyncio_applied
+    if _nest_asyncio_applied:
+        return
+    _nest_asyncio_applied = True
+    try:
+        import nest_asyncio
+        nest_asyncio.apply()
+    except Exception:
+        pass  # nest_asyncio not available
+
+
+def _default_contract_universe() -> List[str]:
+    """Universe symbols tradeable through the bridge (FX/index tickers excluded)."""
+    from config.universe import get_all_assets
+    return [s for s in get_all_assets() if "=" not in s and not s.startswith("^")]
+
 
 class OrderAction(str, Enum):
     """Order action types."""
@@ -190,6 +222,11 @@ class IBKRBridge:
         
         # Initialize Risk Control Service
         self.risk_control = RiskControlService()
+
+        # Qualified contracts (shared, persisted); pre-warmed for the universe on connect
+        self.contract_cache = get_contract_cache()
+        self.prewarm_symbols: Optional[List[str]] = None  # None = config.universe
+        self._contracts_warmed = False
         
         logger.info(
             f"IBKRBridge initialized: host={host}, port={port} "
@@ -219,6 +256,8 @@ class IBKRBridge:
             if success:
                 logger.info(f"✅ Bridge Connected via Manager ({'Paper' if self.is_paper_trading else 'Live'})")
                 # Watchdog disabled (using Singleton ConnectionManager)
+                if not self._contracts_warmed:
+                    await self.warm_contract_cache_async(self.prewarm_symbols)
             
             return success
             
@@ -250,6 +289,8 @@ class IBKRBridge:
             logger.info(f"✅ Connected to IBKR ({'Paper' if self.is_paper_trading else 'Live'} trading)")
             
             # Watchdog disabled (using Singleton ConnectionManager)
+            if not self._contracts_warmed:
+                self.warm_contract_cache(self.prewarm_symbols)
                 
             return True
             
@@ -344,15 +385,91 @@ class IBKRBridge:
             # Wait before next attempt
             time.sleep(self.reconnect_interval)
     
+    def _contract_spec(self, symbol: str) -> Tuple[ContractKey, "Contract"]:
+        """
+        Unqualified contract and cache key for a symbol.
+
+        - "-USD" symbols (e.g., "BTC-USD") are Crypto contracts on PAXOS
+        - Everything else (e.g., "NVDA") is a Stock contract on SMART
+        """
+        if "-USD" in symbol:
+            base_symbol = symbol.replace("-USD", "")
+            return (
+                contract_key(base_symbol, "CRYPTO", "PAXOS"),
+                Crypto(symbol=base_symbol, exchange="PAXOS", currency="USD")
+            )
+        return (
+            contract_key(symbol, "STK", "SMART"),
+            Stock(symbol=symbol, exchange="SMART", currency="USD")
+        )
+
+    def _cached_contract(self, symbol: str) -> Optional["Contract"]:
+        """Qualified contract from the cache, or None if not cached."""
+        key, _ = self._contract_spec(symbol)
+        fields = self.contract_cache.get(key)
+        return Contract(**fields) if fields else None
+
+    def _store_qualified(self, specs: Dict[str, Tuple[ContractKey, "Contract"]]) -> int:
+        """Cache contracts qualified in place (conId set); returns how many were stored."""
+        qualified = {key: contract for key, contract in specs.values() if getattr(contract, "conId", 0)}
+        self.contract_cache.put_many(qualified)
+        failed = [symbol for symbol, (key, _) in specs.items() if key not in qualified]
+        if failed:
+            logger.warning(f"⚠️ Could not qualify contracts for: {', '.join(failed)}")
+        return len(qualified)
+
+    def _missing_specs(self, symbols: List[str]) -> Dict[str, Tuple[ContractKey, "Contract"]]:
+        specs = {}
+        for symbol in symbols:
+            if symbol not in specs and self._cached_contract(symbol) is None:
+                specs[symbol] = self._contract_spec(symbol)
+        return specs
+
+    def warm_contract_cache(self, symbols: Optional[List[str]] = None) -> int:
+        """
+        Qualify every uncached symbol in one batched request.
+
+        Args:
+            symbols: Symbols to warm (default: tradeable config.universe symbols)
+
+        Returns:
+            Number of contracts newly qualified
+        """
+        try:
+            specs = self._missing_specs(symbols if symbols is not None else _default_contract_universe())
+            self._contracts_warmed = True
+            if not specs:
+                return 0
+            _ensure_nest_asyncio()
+            self.ib.qualifyContracts(*[contract for _, contract in specs.values()])
+            stored = self._store_qualified(specs)
+            logger.info(f"📇 Contract cache warmed: {stored}/{len(specs)} contracts qualified")
+            return stored
+        except Exception as e:
+            logger.warning(f"⚠️ Contract cache warm-up failed: {e}")
+            return 0
+
+    async def warm_contract_cache_async(self, symbols: Optional[List[str]] = None) -> int:
+        """Async variant of warm_contract_cache (single qualifyContractsAsync call)."""
+        try:
+            specs = self._missing_specs(symbols if symbols is not None else _default_contract_universe())
+            self._contracts_warmed = True
+            if not specs:
+                return 0
+            await self.ib.qualifyContractsAsync(*[contract for _, contract in specs.values()])
+            stored = self._store_qualified(specs)
+            logger.info(f"📇 Contract cache warmed: {stored}/{len(specs)} contracts qualified")
+            return stored
+        except Exception as e:
+            logger.warning(f"⚠️ Contract cache warm-up failed: {e}")
+            return 0
+
     def get_contract(self, symbol: str) -> Optional[Contract]:
         """
         Get qualified contract for a symbol.
         
-        Handles both crypto and stock contracts:
-        - If symbol has "-USD" (e.g., "BTC-USD"), creates Crypto contract
-          (exchange="PAXOS", currency="USD")
-        - Otherwise (e.g., "NVDA"), creates Stock contract
-          (exchange="SMART", currency="USD")
+        Served from the contract cache when possible; otherwise the contract is
+        qualified with IBKR (see _contract_spec) and cached.
         
         Args:
             symbol: Trading symbol (e.g., "BTC-USD", "NVDA")
@@ -365,46 +482,21 @@ class IBKRBridge:
             return None
         
         try:
-            # Determine contract type based on symbol
-            if "-USD" in symbol:
-                # Crypto contract
-                base_symbol = symbol.replace("-USD", "")
-                contract = Crypto(
-                    symbol=base_symbol,
-                    exchange="PAXOS",
-                    currency="USD"
-                )
-                logger.debug(f"Created Crypto contract: {base_symbol} on PAXOS")
-            else:
-                # Stock contract
-                contract = Stock(
-                    symbol=symbol,
-                    exchange="SMART",
-                    currency="USD"
-                )
-                logger.debug(f"Created Stock contract: {symbol} on SMART")
-            
-            # Qualify the contract
-            # Enable nested event loops if needed (for async contexts)
-            import asyncio
-            try:
-                import nest_asyncio
-                nest_asyncio.apply()
-            except:
-                pass  # nest_asyncio not available or already applied
-                
+            cached = self._cached_contract(symbol)
+            if cached is not None:
+                return cached
+
+            key, contract = self._contract_spec(symbol)
+            _ensure_nest_asyncio()
             qualified = self.ib.qualifyContracts(contract)
             
             if not qualified:
                 logger.error(f"❌ Failed to qualify contract for {symbol}")
                 return None
             
-            if len(qualified) == 0:
-                logger.error(f"❌ No qualified contracts found for {symbol}")
-                return None
-            
             # Return the first qualified contract
             qualified_contract = qualified[0]
+            self.contract_cache.put(key, qualified_contract)
             logger.debug(
                 f"✅ Qualified contract for {symbol}: "
                 f"{qualified_contract.localSymbol} on {qualified_contract.exchange}"
@@ -433,7 +525,8 @@ class IBKRBridge:
             quantity: Number of shares/units to trade
             order_type: "MARKET" or "LIMIT"
             limit_price: Price for limit orders (required if LIMIT)
-            require_confirmation: If True, blocks until SMS approval (timeout 5 mins)
+            require_confirmation: If True, blocks until SMS/API approval (timeout 5 mins);
+                use execute_trade_async to wait without holding a thread
         
         Returns:
             Order object if placed successfully, None otherwise
@@ -459,32 +552,13 @@ class IBKRBridge:
             # 1. Risk Control: SMS Confirmation
             trade_id = None
             if require_confirmation:
-                logger.info(f"🛑 RISK CONTROL: SMS Confirmation required for {action} {quantity} {symbol}")
-                
-                trade_details = {
-                    "symbol": symbol, "action": action_upper, 
-                    "quantity": quantity, "order_type": order_type,
-                    "price": limit_price
-                }
-                
-                trade_id = self.risk_control.request_confirmation(trade_details)
+                trade_id = self._request_approval(action_upper, symbol, quantity, order_type, limit_price)
                 if not trade_id:
-                    logger.error("Failed to send confirmation SMS. Aborting trade.")
                     return None
                 
-                # Poll for Approval (Blocking, max 5 mins)
-                logger.info(f"⏳ Waiting for approval (Trade ID: {trade_id})...")
-                approved = False
-                start_wait = time.time()
-                while time.time() - start_wait < 300:
-                    if self.risk_control.check_approval(trade_id):
-                        approved = True
-                        break
-                    time.sleep(5)
-                    
-                if not approved:
-                    logger.warning(f"❌ Trade {trade_id} timed out waiting for approval. Cancelled.")
-                    self.risk_control.send_execution_failure(trade_id, "Approval Timeout")
+                # Woken by the approval registry as soon as the trade is decided
+                if not get_approval_registry().wait_blocking(trade_id, timeout=APPROVAL_TIMEOUT_SECONDS):
+                    self._approval_denied(trade_id)
                     return None
                     
                 logger.info(f"✅ Trade {trade_id} APPROVED. Proceeding to execution.")
@@ -527,10 +601,199 @@ class IBKRBridge:
                  self.risk_control.send_execution_failure(trade_id, str(e))
             return None
 
+    def _request_approval(
+        self,
+        action: str,
+        symbol: str,
+        quantity: float,
+        order_type: str,
+        limit_price: float
+    ) -> Optional[str]:
+        """Send the SMS confirmation request; returns its trade ID (None if it could not be sent)."""
+        logger.info(f"🛑 RISK CONTROL: SMS Confirmation required for {action} {quantity} {symbol}")
+        
+        trade_details = {
+            "symbol": symbol, "action": action,
+            "quantity": quantity, "order_type": order_type,
+            "price": limit_price
+        }
+        
+        trade_id = self.risk_control.request_confirmation(trade_details)
+        if not trade_id:
+            logger.error("Failed to send confirmation SMS. Aborting trade.")
+            return None
+        
+        logger.info(f"⏳ Waiting for approval (Trade ID: {trade_id})...")
+        return trade_id
+
+    def _approval_denied(self, trade_id: str) -> None:
+        """Log and report a trade that was rejected or timed out waiting for approval."""
+        decision = get_approval_registry().decision(trade_id)
+        reason = (decision[1] if decision else None) or "Approval Timeout"
+        logger.warning(f"❌ Trade {trade_id} not approved ({reason}). Cancelled.")
+        self.risk_control.send_execution_failure(trade_id, reason)
+
+    async def execute_trade_async(
+        self,
+        action: str,
+        symbol: str,
+        quantity: float,
+        order_type: str = "MARKET",
+        limit_price: float = 0.0,
+        require_confirmation: bool = False,
+        approval_timeout: float = APPROVAL_TIMEOUT_SECONDS
+    ) -> Optional[Order]:
+        """
+        Async execute_trade.
+        
+        The pending approval is parked in the approval registry rather than
+        holding a thread, so many orders can await approval concurrently
+        (e.g. via asyncio.gather) and each is placed the moment it is approved.
+        
+        Args:
+            action: Order action ("BUY" or "SELL")
+            symbol: Trading symbol (e.g., "BTC-USD", "NVDA")
+            quantity: Number of shares/units to trade
+            order_type: "MARKET" or "LIMIT"
+            limit_price: Price for limit orders (required if LIMIT)
+            require_confirmation: If True, wait for SMS/API approval first
+            approval_timeout: Seconds to wait for approval
+        
+        Returns:
+            Order object once acknowledged by IBKR, None otherwise
+        """
+        action_upper = action.upper()
+        if action_upper not in ["BUY", "SELL"]:
+            logger.error(f"❌ Invalid action: {action}")
+            return None
+
+        trade_id = None
+        if require_confirmation:
+            trade_id = await asyncio.to_thread(
+                self._request_approval, action_upper, symbol, quantity, order_type, limit_price
+            )
+            if not trade_id:
+                return None
+            if not await get_approval_registry().wait(trade_id, timeout=approval_timeout):
+                await asyncio.to_thread(self._approval_denied, trade_id)
+                return None
+            logger.info(f"✅ Trade {trade_id} APPROVED. Proceeding to execution.")
+
+        order = None
+        try:
+            [future] = await self.execute_trades_async([{
+                "action": action_upper, "symbol": symbol, "quantity": quantity,
+                "order_type": order_type, "limit_price": limit_price
+            }])
+            order = await asyncio.wait_for(future, ORDER_ACK_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(f"❌ No acknowledgement from IBKR for {action_upper} {quantity} {symbol}")
+        except Exception as e:
+            logger.error(f"❌ Error executing trade {action} {quantity} {symbol}: {e}", exc_info=True)
+
+        if trade_id:
+            if order is not None:
+                await asyncio.to_thread(
+                    self.risk_control.send_confirmation_success,
+                    trade_id=trade_id, order_id=str(order.orderId), symbol=symbol
+                )
+            else:
+                await asyncio.to_thread(self.risk_control.send_execution_failure, trade_id, "Order not placed")
+        return order
+
+    async def execute_trades_async(self, orders: List[Dict[str, Any]]) -> List[asyncio.Future]:
+        """
+        Place a basket of (already approved) orders concurrently.
+        
+        Contracts missing from the cache are qualified in a single batched
+        request, then every order is sent without waiting for the others.
+        
+        Args:
+            orders: Dicts with action, symbol, quantity and optional
+                order_type ("MARKET"/"LIMIT") and limit_price
+        
+        Returns:
+            One future per input order (same order). Each resolves to the placed
+            Order once IBKR acknowledges it, or to None if the order was invalid,
+            could not be placed or was rejected/cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in orders]
+
+        if not self.ib.isConnected():
+            logger.error("❌ Cannot execute orders: not connected to IBKR")
+            for future in futures:
+                future.set_result(None)
+            return futures
+        self.connected = True
+
+        # 1. Build orders
+        pending = []
+        for future, spec in zip(futures, orders):
+            action = str(spec.get("action", "")).upper()
+            order_type = str(spec.get("order_type", "MARKET")).upper()
+            if action not in ("BUY", "SELL"):
+                logger.error(f"❌ Invalid action: {spec.get('action')}")
+                future.set_result(None)
+                continue
+            if order_type == "MARKET":
+                order = MarketOrder(action, spec["quantity"])
+            elif order_type == "LIMIT":
+                order = LimitOrder(action, spec["quantity"], spec.get("limit_price", 0.0))
+            else:
+                logger.error(f"Invalid order type: {order_type}")
+                future.set_result(None)
+                continue
+            pending.append((future, spec["symbol"], order))
+
+        # 2. Qualify uncached contracts in one round-trip
+        specs = self._missing_specs([symbol for _, symbol, _ in pending])
+        if specs:
+            try:
+                await self.ib.qualifyContractsAsync(*[contract for _, contract in specs.values()])
+                self._store_qualified(specs)
+            except Exception as e:
+                logger.error(f"❌ Error qualifying contracts: {e}", exc_info=True)
+
+        # 3. Place all orders
+        for future, symbol, order in pending:
+            contract = self._cached_contract(symbol)
+            if contract is None:
+                logger.error(f"❌ Cannot execute trade: failed to get contract for {symbol}")
+                future.set_result(None)
+                continue
+            try:
+                logger.info(f"📤 Placing {order.orderType} {order.action} order: {order.totalQuantity} {symbol}")
+                trade = self.ib.placeOrder(contract, order)
+            except Exception as e:
+                logger.error(f"❌ Error placing order for {symbol}: {e}", exc_info=True)
+                future.set_result(None)
+                continue
+            self._settle_on_status(trade, future, symbol)
+
+        return futures
+
+    @staticmethod
+    def _settle_on_status(trade, future: asyncio.Future, symbol: str) -> None:
+        """Resolve future from the trade's status events (acknowledged -> Order, rejected -> None)."""
+        def on_status(trade) -> None:
+            if future.done():
+                return
+            status = trade.orderStatus.status
+            if status in ACKED_STATUSES:
+                logger.info(f"✅ Order placed: {trade.order.action} {trade.order.totalQuantity} {symbol} (Order ID: {trade.order.orderId})")
+                future.set_result(trade.order)
+            elif status in REJECTED_STATUSES:
+                logger.warning(f"❌ Order for {symbol} {status}")
+                future.set_result(None)
+
+        trade.statusEvent += on_status
+        on_status(trade)  # Status may already be final
+
     def approve_and_execute(self, trade_id: str) -> Dict:
         """
         Legacy compatibility method for TradeService.
-        Marks the trade as approved so the blocking execute_trade loop can proceed.
+        Marks the trade as approved, waking any execute_trade waiting on it.
         """
         success = self.risk_control.approve_trade(trade_id)
         if success:
@@ -9,7 +9,7 @@ import { Loader2, CheckCircle, XCircle } from "lucide-react";
 interface Job {
     id: string;
     type: string;
-    status: "PENDING" | "RUNNING" | "COMPLETED" | "FAILED";
+    status: "PENDING" | "RUNNING" | "COMPLETED" | "FAILED" | "CANCELLED";
     progress: number;
     message: string;
     result?: any;
@@ -36,7 +36,7 @@ export function JobMonitor({ jobId, onComplete }: JobMonitorProps) {
                     const data = await res.json();
                     setJob(data);
 
-                    if (data.status === "COMPLETED" || data.status === "FAILED") {
+                    if (data.status === "COMPLETED" || data.status === "FAILED" || data.status === "CANCELLED") {
                         clearInterval(interval);
                         setPolling(false);
                         if (data.status === "COMPLETED" && onComplete) {
@@ -56,7 +56,7 @@ export function JobMonitor({ jobId, onComplete }: JobMonitorProps) {
     if (!job) return <div className="text-sm text-muted-foreground animate-pulse">Initializing monitor...</div>;
 
     const isRunning = job.status === "RUNNING" || job.status === "PENDING";
-    const isFailed = job.status === "FAILED";
+    const isFailed = job.status === "FAILED" || job.status === "CANCELLED";
     const isSuccess = job.status === "COMPLETED";
 
     return (
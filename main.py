@@ -5,6 +5,7 @@ Provides REST API endpoints for forecast creation and retrieval.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 import sys
 from pathlib import Path
 
@@ -29,6 +30,7 @@ from api.auth import router as auth_router, dashboard_router as auth_dashboard_r
 from api.market_data import router as market_data_router
 from api.ibkr import router as ibkr_router
 from core.logger import logger
+from core.metrics import get_metrics
 
 # Create FastAPI app
 app = FastAPI(
@@ -108,6 +110,25 @@ async def health():
     return {"status": "healthy"}
 
 
+# Metrics endpoint
+@app.get("/metrics")
+async def metrics(format: str = "prometheus"):
+    """
+    Pipeline / inference / LLM / DuckDB latency metrics.
+    
+    Prometheus text exposition by default; ?format=json returns the snapshot dict.
+    """
+    if format == "json":
+        return get_metrics().snapshot()
+    return PlainTextResponse(get_metrics().render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.on_event("startup")
+async def start_metrics_snapshots():
+    """Write periodic JSON metrics snapshots (data/metrics/api.json)."""
+    get_metrics().start_snapshot_writer("api")
+
+
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting FuggerBot API server")
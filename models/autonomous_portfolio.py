@@ -22,7 +22,10 @@ class AutonomousPortfolioManager:
         constructor: Optional[PortfolioConstructor] = None
     ):
         self.rebalance_engine = rebalance_engine or RebalancingEngine()
-        self.constructor = constructor or PortfolioConstructor()
+        if constructor is None:
+            from services.correlation_service import get_correlation_service
+            constructor = PortfolioConstructor(correlation_service=get_correlation_service())
+        self.constructor = constructor
         self.current_positions: Dict[str, float] = {}
         self.last_rebalance_date: Optional[datetime] = None
 
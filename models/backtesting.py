@@ -8,9 +8,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import logging
 
 from models.forecast_metadata import ForecastMetadata
 
+logger = logging.getLogger(__name__)
+
 
 class ForecastBacktester:
     """Backtests forecasts against actual outcomes."""
@@ -198,7 +201,7 @@ class ForecastBacktester:
         directional = self.calculate_directional_accuracy(point_forecast, actual_prices)
         calibration = self.calculate_calibration(lower_bound, upper_bound, actual_prices)
         
-        return {
+        evaluation = {
             "forecast_id": forecast_id,
             "symbol": snapshot.get("symbol"),
             "evaluation_date": datetime.now().isoformat(),
@@ -216,4 +219,12 @@ class ForecastBacktester:
                 "well_calibrated": calibration['well_calibrated']
             }
         }
+        
+        # Persist for drift detection
+        try:
+            self.metadata.save_evaluation(forecast_id, evaluation)
+        except Exception as e:
+            logger.warning(f"Failed to store evaluation for {forecast_id}: {e}")
+        
+        return evaluation
 
@@ -5,9 +5,8 @@ Detects systematic bias, regime shifts, and calibration issues.
 """
 import numpy as np
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-import json
 
 from models.forecast_metadata import ForecastMetadata
 
@@ -41,37 +40,16 @@ class DriftDetector:
         Returns:
             List of evaluation dicts
         """
-        evaluations = []
-        cutoff_date = datetime.now().timestamp() - (days * 24 * 3600)
-        
-        # Load all forecast snapshots
-        storage_dir = self.metadata.storage_dir
-        for filepath in storage_dir.glob("*.json"):
-            try:
-                with open(filepath, "r") as f:
-                    snapshot = json.load(f)
-                
-                # Filter by symbol if provided
-                if symbol and snapshot.get("symbol") != symbol:
-                    continue
-                
-                # Check date
-                timestamp_str = snapshot.get("timestamp", "")
-                if timestamp_str:
-                    snapshot_time = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    if snapshot_time.timestamp() < cutoff_date:
-                        continue
-                
-                # Try to load evaluation if available
-                eval_file = filepath.parent / f"eval_{filepath.stem}"
-                if eval_file.exists():
-                    with open(eval_file, "r") as ef:
-                        eval_data = json.load(ef)
-                        evaluations.append(eval_data)
-            except Exception:
-                continue
-        
-        return evaluations[:min_samples] if len(evaluations) >= min_samples else []
+        cutoff = datetime.now() - timedelta(days=days)
+        
+        # Indexed query: evaluations joined to snapshots by symbol and time
+        evaluations = self.metadata.store.recent_evaluations(
+            symbol=symbol,
+            since=cutoff,
+            limit=min_samples
+        )
+        
+        return evaluations if len(evaluations) >= min_samples else []
     
     def detect_systematic_bias(
         self,
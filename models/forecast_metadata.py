@@ -2,13 +2,16 @@
 Forecast metadata and reproducibility tracking.
 
 Provides Forecast ID generation and parameter snapshot storage.
+Snapshots are kept in an indexed SQLite store (see forecast_snapshot_store).
 """
 import hashlib
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
 
+from models.forecast_snapshot_store import ForecastSnapshotStore, get_snapshot_store
+
 
 class ForecastMetadata:
     """Manages forecast metadata and reproducibility."""
@@ -24,6 +27,7 @@ class ForecastMetadata:
             storage_dir = Path(__file__).parent.parent.parent / "data" / "forecasts"
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.store: ForecastSnapshotStore = get_snapshot_store(self.storage_dir)
     
     def generate_forecast_id(
         self,
@@ -73,7 +77,7 @@ class ForecastMetadata:
         parameters: Dict[str, Any],
         forecast_result: Dict[str, Any],
         timestamp: Optional[datetime] = None
-    ) -> Path:
+    ) -> str:
         """
         Save a forecast snapshot for reproducibility.
         
@@ -85,7 +89,7 @@ class ForecastMetadata:
             timestamp: Optional timestamp
             
         Returns:
-            Path to saved snapshot file
+            Snapshot ID (the forecast_id; load with load_forecast_snapshot)
         """
         if timestamp is None:
             timestamp = datetime.now()
@@ -109,14 +113,13 @@ class ForecastMetadata:
             "recommendation": forecast_result.get("recommendation", {})
         }
         
-        # Save to file
-        filename = f"{symbol}_{forecast_id}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-        filepath = self.storage_dir / filename
+        self.store.save_snapshot(snapshot)
         
-        with open(filepath, "w") as f:
-            json.dump(snapshot, f, indent=2, default=str)
-        
-        return filepath
+        return forecast_id
+    
+    def batch(self):
+        """Context manager grouping snapshot writes into one transaction."""
+        return self.store.batch()
     
     def load_forecast_snapshot(self, forecast_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -128,19 +131,33 @@ class ForecastMetadata:
         Returns:
             Snapshot dict or None if not found
         """
-        # Find file with this forecast_id
-        for filepath in self.storage_dir.glob(f"*_{forecast_id}_*.json"):
-            with open(filepath, "r") as f:
-                return json.load(f)
-        return None
-
-
-
-
-
-
-
-
-
-
-
+        return self.store.get_snapshot(forecast_id)
+    
+    def list_forecast_snapshots(
+        self,
+        limit: int = 100,
+        symbol: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List snapshots, most recent first.
+        
+        Args:
+            limit: Maximum number of snapshots
+            symbol: Optional symbol filter
+            since: Optional earliest forecast timestamp
+            
+        Returns:
+            List of snapshot dicts
+        """
+        return self.store.list_snapshots(limit=limit, symbol=symbol, since=since)
+    
+    def save_evaluation(self, forecast_id: str, evaluation: Dict[str, Any]) -> None:
+        """
+        Store the evaluation of a forecast against actual outcomes.
+        
+        Args:
+            forecast_id: Forecast ID
+            evaluation: Evaluation dict (e.g. from BacktestEvaluator.evaluate_forecast)
+        """
+        self.store.save_evaluation(forecast_id, evaluation)
@@ -249,6 +249,117 @@ class ForecastQualityScorer:
             "interpretation": ForecastQualityScorer._interpret_fqs(fqs)
         }
     
+    @staticmethod
+    def _recent_std(historical_series: Optional[List[float]], window: int) -> float:
+        """Std of the last `window` points (NaN if no usable history)."""
+        if historical_series and len(historical_series) > 1:
+            return float(np.std(np.asarray(historical_series[-min(window, len(historical_series)):], dtype=float)))
+        return np.nan
+    
+    @staticmethod
+    def calculate_fqs_batch(
+        forecasts: List[ForecastOutput],
+        historical_series_list: Optional[List[Optional[List[float]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate FQS for many forecasts in one vectorized pass.
+        
+        Equivalent to calling `calculate_fqs` per forecast without forecast
+        history (stability = 0.7). All forecasts must share one horizon.
+        
+        Args:
+            forecasts: ForecastOutputs with equal horizons
+            historical_series_list: Optional historical data per forecast
+            
+        Returns:
+            List of FQS dicts, in input order
+        """
+        if not forecasts:
+            return []
+        
+        n = len(forecasts)
+        histories = historical_series_list or [None] * n
+        point = np.array([f.point_forecast for f in forecasts], dtype=float)
+        lower = np.array([f.lower_bound for f in forecasts], dtype=float)
+        upper = np.array([f.upper_bound for f in forecasts], dtype=float)
+        horizon = point.shape[1]
+        
+        hist_vol_20 = np.array([ForecastQualityScorer._recent_std(h, 20) for h in histories])
+        hist_vol_30 = np.array([ForecastQualityScorer._recent_std(h, 30) for h in histories])
+        has_history = ~np.isnan(hist_vol_20)
+        forecast_std = np.std(point, axis=1)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Directional strength
+            if horizon < 2:
+                directional_strength = np.full(n, 0.5)
+            else:
+                changes = np.diff(point, axis=1)
+                mean_change = np.mean(np.abs(changes), axis=1)
+                if changes.shape[1] > 1:
+                    direction_consistency = np.mean(np.sign(changes[:, :1]) == np.sign(changes), axis=1)
+                else:
+                    direction_consistency = np.ones(n)
+                relative_strength = np.where(
+                    has_history,
+                    np.where(hist_vol_20 > 0, np.minimum(1.0, mean_change / hist_vol_20), 0.5),
+                    np.minimum(1.0, mean_change / (np.mean(np.abs(point), axis=1) + 1e-10))
+                )
+                directional_strength = np.clip(
+                    0.4 * direction_consistency +
+                    0.3 * np.minimum(1.0, relative_strength * 2) +
+                    0.3 * np.minimum(1.0, mean_change / (forecast_std + 1e-10)),
+                    0.0, 1.0
+                )
+            
+            # Uncertainty width (optimal 10-20% of point forecast)
+            point_abs = np.abs(point)
+            ratios = (upper - lower) / np.where(point_abs < 1e-10, 1.0, point_abs)
+            ratio_scores = np.select(
+                [ratios < 0.10, ratios > 0.20],
+                [ratios / 0.10, np.maximum(0.0, 1.0 - (ratios - 0.20) / 0.20)],
+                default=1.0
+            )
+            uncertainty_width = np.clip(np.mean(ratio_scores, axis=1), 0.0, 1.0)
+            
+            # Volatility alignment (ideal forecast/historical vol ratio 0.8-1.2)
+            vol_ratio = forecast_std / hist_vol_30
+            alignment = np.select(
+                [~has_history, hist_vol_30 <= 0, vol_ratio < 0.8, vol_ratio > 1.2],
+                [0.7, 0.5, vol_ratio / 0.8, np.maximum(0.0, 1.0 - (vol_ratio - 1.2) / 1.2)],
+                default=1.0
+            )
+            volatility_alignment = np.clip(alignment, 0.0, 1.0)
+        
+        stability = 0.7  # No forecast history in batch mode
+        weights = {
+            "directional_strength": 0.30,
+            "uncertainty_width": 0.25,
+            "volatility_alignment": 0.25,
+            "stability": 0.20
+        }
+        fqs = (
+            weights["directional_strength"] * directional_strength +
+            weights["uncertainty_width"] * uncertainty_width +
+            weights["volatility_alignment"] * volatility_alignment +
+            weights["stability"] * stability
+        )
+        
+        return [
+            {
+                "fqs_score": float(np.clip(fqs[i], 0.0, 1.0)),
+                "components": {
+                    "directional_strength": float(directional_strength[i]),
+                    "uncertainty_width": float(uncertainty_width[i]),
+                    "volatility_alignment": float(volatility_alignment[i]),
+                    "stability": stability
+                },
+                "weights": weights,
+                "interpretation": ForecastQualityScorer._interpret_fqs(fqs[i])
+            }
+            for i in range(n)
+        ]
+    
     @staticmethod
     def _interpret_fqs(score: float) -> str:
         """Interpret FQS score."""
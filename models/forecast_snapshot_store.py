@@ -0,0 +1,326 @@
+"""
+Forecast Snapshot Store - SQLite-backed forecast snapshots and evaluations.
+
+Replaces the one-JSON-file-per-forecast layout in data/forecasts/. Snapshots
+and their evaluations live in `snapshots.db` next to the legacy files, with
+indexes on forecast_id, symbol and timestamp, so ID lookups and "recent
+evaluations for symbol X" no longer scan the directory.
+
+Legacy `<SYMBOL>_<forecast_id>_<stamp>.json` files (and `eval_<stem>`
+siblings) are imported on first use; the files themselves are left in place.
+Writes can be buffered and committed in one transaction with `batch()`.
+"""
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "snapshots.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    forecast_id TEXT NOT NULL,
+    symbol TEXT,
+    timestamp TEXT,
+    ts REAL,
+    source_file TEXT UNIQUE,
+    snapshot TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_forecast_id ON snapshots (forecast_id);
+CREATE INDEX IF NOT EXISTS idx_snapshots_symbol_ts ON snapshots (symbol, ts);
+CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON snapshots (ts);
+
+CREATE TABLE IF NOT EXISTS evaluations (
+    forecast_id TEXT PRIMARY KEY,
+    evaluated_at TEXT,
+    evaluation TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS legacy_imports (
+    filename TEXT PRIMARY KEY
+);
+"""
+
+
+def _epoch(timestamp: Optional[str]) -> Optional[float]:
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class ForecastSnapshotStore:
+    """Indexed forecast snapshot and evaluation storage."""
+
+    def __init__(self, storage_dir: Path, migrate: bool = True):
+        """
+        Initialize the store.
+
+        Args:
+            storage_dir: Forecast directory (holds snapshots.db and any legacy JSON files)
+            migrate: Import legacy JSON snapshots not yet in the database
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.storage_dir / DB_FILENAME
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        if migrate:
+            self.migrate_legacy()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add_listener(self, callback: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """
+        Call `callback(snapshots)` with newly stored snapshots after they are committed
+        (once per `batch()`; duplicates ignored by the store are left out).
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, snapshots: List[Dict[str, Any]]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(snapshots)
+            except Exception as e:
+                logger.warning(f"Snapshot listener {callback!r} failed: {e}")
+
+    @contextmanager
+    def batch(self):
+        """
+        Buffer snapshot writes made by this thread and insert them in one
+        transaction on exit. Buffered snapshots are not readable until then.
+        """
+        outer = getattr(self._local, "buffer", None) is None
+        if outer:
+            self._local.buffer = []
+        try:
+            yield self
+        finally:
+            if outer:
+                entries, self._local.buffer = self._local.buffer, None
+                if entries:
+                    self._insert(entries)
+
+    @staticmethod
+    def _snapshot_row(snapshot: Dict[str, Any], source_file: Optional[str]) -> tuple:
+        return (
+            snapshot["forecast_id"],
+            snapshot.get("symbol"),
+            snapshot.get("timestamp"),
+            _epoch(snapshot.get("timestamp")),
+            source_file,
+            json.dumps(snapshot, default=str),
+        )
+
+    def _insert(self, entries: List[tuple]) -> int:
+        """
+        Insert (row, snapshot) pairs in one transaction, then notify listeners.
+
+        Returns:
+            Number of rows actually inserted
+        """
+        inserted = []
+        with self._lock:
+            for row, snapshot in entries:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO snapshots (forecast_id, symbol, timestamp, ts, source_file, snapshot) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    row
+                )
+                if cursor.rowcount > 0:
+                    inserted.append(snapshot)
+            self._conn.commit()
+        if inserted and self._listeners:
+            self._notify(inserted)
+        return len(inserted)
+
+    def save_snapshot(self, snapshot: Dict[str, Any], source_file: Optional[str] = None) -> None:
+        """Insert a snapshot dict (must contain forecast_id)."""
+        self.save_snapshots([snapshot], [source_file])
+
+    def save_snapshots(
+        self,
+        snapshots: List[Dict[str, Any]],
+        source_files: Optional[List[Optional[str]]] = None
+    ) -> int:
+        """
+        Insert many snapshots in one transaction (or buffer them inside `batch()`).
+
+        Returns:
+            Number of snapshots inserted (or buffered, inside `batch()`)
+        """
+        source_files = source_files or [None] * len(snapshots)
+        entries = [(self._snapshot_row(s, f), s) for s, f in zip(snapshots, source_files)]
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.extend(entries)
+            return len(entries)
+        return self._insert(entries)
+
+    def save_evaluation(self, forecast_id: str, evaluation: Dict[str, Any]) -> None:
+        """Store (or replace) the evaluation for a forecast."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations (forecast_id, evaluated_at, evaluation) VALUES (?, ?, ?)",
+                (forecast_id, evaluation.get("evaluation_date") or datetime.now().isoformat(),
+                 json.dumps(evaluation, default=str))
+            )
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_snapshot(self, forecast_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot by forecast ID (earliest stored if the ID was saved more than once)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot FROM snapshots WHERE forecast_id = ? ORDER BY rowid LIMIT 1",
+                (forecast_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_snapshots(
+        self,
+        limit: int = 100,
+        symbol: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Most recent snapshots first, optionally filtered by symbol and time."""
+        query = "SELECT snapshot FROM snapshots WHERE 1=1"
+        params: List[Any] = []
+        if symbol:
+            query += " AND symbol = ?"
+            params.append(symbol)
+        if since is not None:
+            query += " AND ts >= ?"
+            params.append(since.timestamp())
+        query += " ORDER BY ts DESC, rowid DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def recent_evaluations(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Evaluations of forecasts made since `since`, most recent forecast first."""
+        query = (
+            "SELECT e.evaluation FROM evaluations e "
+            "JOIN snapshots s ON s.forecast_id = e.forecast_id WHERE 1=1"
+        )
+        params: List[Any] = []
+        if symbol:
+            query += " AND s.symbol = ?"
+            params.append(symbol)
+        if since is not None:
+            query += " AND (s.ts IS NULL OR s.ts >= ?)"
+            params.append(since.timestamp())
+        query += " GROUP BY e.forecast_id ORDER BY MAX(s.ts) DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def migrate_legacy(self) -> int:
+        """
+        Import legacy JSON snapshot files (and eval_ siblings) not yet imported.
+
+        Returns:
+            Number of snapshot files imported
+        """
+        files = {p.name: p for p in self.storage_dir.glob("*.json")}
+        if not files:
+            return 0
+
+        with self._lock:
+            imported = {r[0] for r in self._conn.execute("SELECT filename FROM legacy_imports")}
+        pending = [files[name] for name in sorted(files) if name not in imported]
+        if not pending:
+            return 0
+
+        snapshot_rows, evaluation_rows = [], []
+        for path in pending:
+            try:
+                with open(path, "r") as f:
+                    snapshot = json.load(f)
+                if not (isinstance(snapshot, dict) and snapshot.get("forecast_id")):
+                    continue
+                snapshot_rows.append(self._snapshot_row(snapshot, path.name))
+                eval_file = path.parent / f"eval_{path.stem}"
+                if eval_file.exists():
+                    with open(eval_file, "r") as ef:
+                        evaluation = json.load(ef)
+                    evaluation_rows.append((
+                        snapshot["forecast_id"],
+                        evaluation.get("evaluation_date"),
+                        json.dumps(evaluation, default=str)
+                    ))
+            except Exception as e:
+                logger.warning(f"Skipping legacy forecast snapshot {path}: {e}")
+
+        # One transaction for the whole import
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO snapshots (forecast_id, symbol, timestamp, ts, source_file, snapshot) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                snapshot_rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO evaluations (forecast_id, evaluated_at, evaluation) VALUES (?, ?, ?)",
+                evaluation_rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO legacy_imports VALUES (?)", [(p.name,) for p in pending]
+            )
+            self._conn.commit()
+        count = len(snapshot_rows)
+
+        logger.info(f"Imported {count} legacy forecast snapshots into {self.db_path}")
+        return count
+
+
+# Shared store per directory (one connection per process and path)
+_stores: Dict[Path, ForecastSnapshotStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_snapshot_store(storage_dir: Path) -> ForecastSnapshotStore:
+    """Get or create the snapshot store for a directory."""
+    key = Path(storage_dir).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = ForecastSnapshotStore(key)
+        return store
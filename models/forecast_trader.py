@@ -12,7 +12,7 @@ from datetime import datetime
 import numpy as np
 
 from .tsfm.inference import ChronosInferenceEngine
-from .tsfm.schemas import ForecastInput, ForecastOutput
+from .tsfm.schemas import ForecastInput, ForecastOutput, BatchForecastInput
 from .trust.filter import TrustFilter
 from .trust.schemas import TrustEvaluation, TrustFilterConfig
 
@@ -90,14 +90,35 @@ class ForecastTrader:
                 "recommendation": None
             }
         
-        # Evaluate trust
-        trust_eval = self.trust_filter.evaluate(
-            forecast=forecast,
-            input_data=forecast_input,
+        return self._evaluate_forecast(
             symbol=symbol,
+            forecast=forecast,
+            forecast_input=forecast_input,
             current_volatility=current_volatility,
             historical_volatility=historical_volatility
         )
+    
+    def _evaluate_forecast(
+        self,
+        symbol: str,
+        forecast: ForecastOutput,
+        forecast_input: ForecastInput,
+        current_volatility: Optional[float] = None,
+        historical_volatility: Optional[float] = None,
+        trust_eval: Optional[TrustEvaluation] = None
+    ) -> Dict[str, Any]:
+        """Evaluate trust for a generated forecast (unless already evaluated) and build the analysis result."""
+        historical_prices = forecast_input.series
+        
+        # Evaluate trust
+        if trust_eval is None:
+            trust_eval = self.trust_filter.evaluate(
+                forecast=forecast,
+                input_data=forecast_input,
+                symbol=symbol,
+                current_volatility=current_volatility,
+                historical_volatility=historical_volatility
+            )
         
         # Generate trading recommendation
         recommendation = self._generate_recommendation(
@@ -219,6 +240,11 @@ class ForecastTrader:
         """
         Analyze multiple symbols in batch.
         
+        All forecasts are generated with a single batched inference call and
+        trust-evaluated in one vectorized pass; recommendations then run per
+        symbol. If the batch call fails, symbols are analyzed one by one so a
+        single bad series only fails its own result.
+        
         Args:
             symbol_data: Dict mapping symbols to historical price lists
             forecast_horizon: Number of periods to forecast
@@ -227,15 +253,69 @@ class ForecastTrader:
         Returns:
             Dict mapping symbols to analysis results
         """
-        results = {}
+        if not symbol_data:
+            return {}
         
-        for symbol, prices in symbol_data.items():
-            results[symbol] = self.analyze_symbol(
-                symbol=symbol,
-                historical_prices=prices,
-                forecast_horizon=forecast_horizon,
-                context_length=context_length
+        symbols = list(symbol_data.keys())
+        timestamp = datetime.now().isoformat()
+        
+        try:
+            inputs = [
+                ForecastInput(
+                    series=symbol_data[symbol],
+                    forecast_horizon=forecast_horizon,
+                    context_length=context_length,
+                    metadata={"symbol": symbol, "timestamp": timestamp}
+                )
+                for symbol in symbols
+            ]
+            batch = self.forecast_engine.forecast_batch(
+                BatchForecastInput(
+                    series_list=[i.series for i in inputs],
+                    forecast_horizon=forecast_horizon,
+                    context_length=context_length,
+                    metadata_list=[i.metadata for i in inputs]
+                )
             )
+            logger.info(f"Batch forecast for {len(symbols)} symbols in {batch.total_inference_time_ms:.1f}ms")
+        except Exception as e:
+            logger.warning(f"Batch forecast failed ({e}); analyzing symbols individually")
+            return {
+                symbol: self.analyze_symbol(
+                    symbol=symbol,
+                    historical_prices=symbol_data[symbol],
+                    forecast_horizon=forecast_horizon,
+                    context_length=context_length
+                )
+                for symbol in symbols
+            }
+        
+        try:
+            trust_evals = self.trust_filter.evaluate_batch(
+                forecasts=batch.forecasts,
+                input_data_list=inputs,
+                symbols=symbols
+            ).evaluations
+        except Exception as e:
+            logger.warning(f"Batch trust evaluation failed ({e}); evaluating symbols individually")
+            trust_evals = [None] * len(symbols)
+        
+        results = {}
+        for symbol, forecast_input, forecast, trust_eval in zip(symbols, inputs, batch.forecasts, trust_evals):
+            try:
+                results[symbol] = self._evaluate_forecast(
+                    symbol, forecast, forecast_input, trust_eval=trust_eval
+                )
+            except Exception as e:
+                logger.error(f"Trust evaluation failed for {symbol}: {e}", exc_info=True)
+                results[symbol] = {
+                    "symbol": symbol,
+                    "success": False,
+                    "error": str(e),
+                    "forecast": forecast,
+                    "trust_evaluation": None,
+                    "recommendation": None
+                }
         
         return results
     
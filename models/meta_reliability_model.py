@@ -2,15 +2,102 @@
 Meta Reliability Model.
 
 Learns when FuggerBot is trustworthy using FRS history and outcomes.
+
+Labelled records live in an array-backed sliding window (FeatureStore), so
+training reads the feature matrix directly instead of rebuilding it from
+Python dicts. Retraining warm-starts from the previous coefficients and can
+weight recent outcomes more heavily, which keeps it cheap enough to run after
+every labelled outcome. Model state (window + coefficients) persists to a
+versioned JSON file.
 """
-from typing import Dict, Any, List, Optional
-from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+import json
 import numpy as np
 from sklearn.linear_model import LogisticRegression
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bump when the on-disk layout changes; load() rejects unknown versions
+FORMAT_VERSION = 1
+
+REGIMES = [
+    "normal",
+    "high_volatility",
+    "low_predictability",
+    "overconfidence",
+    "data_quality_degradation"
+]
+
+N_FEATURES = 4 + len(REGIMES)
+
+
+class FeatureStore:
+    """Growable ring buffer of feature rows and outcomes."""
+
+    def __init__(self, n_features: int, max_rows: int, initial_capacity: int = 64):
+        """
+        Initialize feature store.
+
+        Args:
+            n_features: Number of features per row
+            max_rows: Window size; once full, the oldest row is overwritten
+            initial_capacity: Rows allocated up front (doubles until max_rows)
+        """
+        self.n_features = n_features
+        self.max_rows = max_rows
+        capacity = max(1, min(initial_capacity, max_rows))
+        self._X = np.empty((capacity, n_features), dtype=float)
+        self._y = np.empty(capacity, dtype=int)
+        self._seq = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+        self._head = 0  # Oldest slot, overwritten next once the window is full
+        self.total_added = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        capacity = min(self.max_rows, 2 * len(self._X))
+        for name in ("_X", "_y", "_seq"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def append(self, features: List[float], outcome: int) -> None:
+        """Add one labelled row, evicting the oldest if the window is full."""
+        if self._size == len(self._X) and self._size < self.max_rows:
+            self._grow()
+        if self._size < len(self._X):
+            slot = self._size
+            self._size += 1
+        else:
+            slot = self._head
+            self._head = (self._head + 1) % self.max_rows
+        self._X[slot] = features
+        self._y[slot] = outcome
+        self._seq[slot] = self.total_added
+        self.total_added += 1
+
+    def window(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Current window as views (row order is storage order, not insertion order).
+
+        Returns:
+            Tuple of (features (n, n_features), outcomes (n,), age in records (n,), 0 = newest)
+        """
+        n = self._size
+        return self._X[:n], self._y[:n], (self.total_added - 1) - self._seq[:n]
+
+    def chronological(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Features and outcomes, oldest first (copies)."""
+        X, y, age = self.window()
+        order = np.argsort(-age, kind="stable")
+        return X[order], y[order]
+
 
 class MetaReliabilityModel:
     """Predicts FuggerBot reliability."""
@@ -19,22 +106,37 @@ class MetaReliabilityModel:
         self,
         max_history: int = 500,
         reliability_threshold: float = 0.6,
-        min_training_samples: int = 50
+        min_training_samples: int = 50,
+        decay_half_life: Optional[float] = None,
+        retrain_every: Optional[int] = None
     ):
         """
         Initialize meta reliability model.
 
         Args:
-            max_history: Maximum records to keep
+            max_history: Maximum records to keep (sliding training window)
             reliability_threshold: Threshold for reliable predictions
             min_training_samples: Minimum samples before training
+            decay_half_life: If set, records are weighted 0.5 ** (age / half_life)
+                so recent outcomes dominate (age counted in records)
+            retrain_every: If set, retrain inline after this many new records
         """
         self.max_history = max_history
         self.reliability_threshold = reliability_threshold
         self.min_training_samples = min_training_samples
-        self.history = deque(maxlen=max_history)
-        self.model = LogisticRegression(max_iter=1000)
+        self.decay_half_life = decay_half_life
+        self.retrain_every = retrain_every
+        self.store = FeatureStore(N_FEATURES, max_history)
+        self.model = LogisticRegression(max_iter=1000, warm_start=True)
         self.is_trained = False
+        self.records_since_train = 0
+        self.trained_at: Optional[str] = None
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Records in the window, oldest first (built on demand)."""
+        X, y = self.store.chronological()
+        return [{"features": row.tolist(), "outcome": int(o)} for row, o in zip(X, y)]
 
     def add_record(
         self,
@@ -56,32 +158,49 @@ class MetaReliabilityModel:
             regime: Regime type
             outcome: 1 if forecast was accurate, 0 otherwise
         """
-        regime_features = self._encode_regime(regime)
-        record = {
-            "features": [
-                frs_score,
-                trust_score,
-                volatility,
-                drift_score,
-                *regime_features
-            ],
-            "outcome": outcome
-        }
-        self.history.append(record)
+        self.store.append(
+            [frs_score, trust_score, volatility, drift_score, *self._encode_regime(regime)],
+            outcome
+        )
+        self.records_since_train += 1
 
-    def train(self) -> bool:
-        """Train meta model if enough data."""
-        if len(self.history) < self.min_training_samples:
+        if (
+            self.retrain_every
+            and self.records_since_train >= self.retrain_every
+            and len(self.store) >= self.min_training_samples
+        ):
+            self.train()
+
+    def sample_weights(self, ages: np.ndarray) -> Optional[np.ndarray]:
+        """Decay weights for the given record ages (None if decay is disabled)."""
+        if not self.decay_half_life:
+            return None
+        return np.power(0.5, ages / self.decay_half_life)
+
+    def train(self, warm_start: bool = True) -> bool:
+        """
+        Train meta model on the current window if enough data.
+
+        Args:
+            warm_start: Start from the previous coefficients (fast incremental
+                refit); False refits from scratch
+
+        Returns:
+            True if the model was trained
+        """
+        if len(self.store) < self.min_training_samples:
             logger.info("Not enough data to train meta reliability model")
             return False
 
-        X = np.array([rec["features"] for rec in self.history])
-        y = np.array([rec["outcome"] for rec in self.history])
+        X, y, ages = self.store.window()
 
         try:
-            self.model.fit(X, y)
+            self.model.warm_start = warm_start and self.is_trained
+            self.model.fit(X, y, sample_weight=self.sample_weights(ages))
             self.is_trained = True
-            logger.info("Meta reliability model trained successfully")
+            self.records_since_train = 0
+            self.trained_at = datetime.now().isoformat()
+            logger.debug(f"Meta reliability model trained on {len(y)} records")
             return True
         except Exception as e:
             logger.error(f"Failed to train meta reliability model: {e}", exc_info=True)
@@ -137,34 +256,109 @@ class MetaReliabilityModel:
             "model_trained": self.is_trained
         }
 
-    def _encode_regime(self, regime: str) -> List[int]:
-        """One-hot encode regime."""
-        regimes = [
-            "normal",
-            "high_volatility",
-            "low_predictability",
-            "overconfidence",
-            "data_quality_degradation"
-        ]
-        return [1 if regime == r else 0 for r in regimes]
+    def save(self, path: Path) -> Path:
+        """
+        Persist configuration, training window and fitted coefficients.
 
-    @staticmethod
-    def _classify_reliability(prob: float) -> str:
-        """Classify reliability probability."""
-        if prob >= 0.8:
-            return "high"
-        elif prob >= 0.65:
-            return "medium"
-        else:
-            return "low"
+        Args:
+            path: Destination JSON file
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        X, y = self.store.chronological()
+
+        state = {
+            "format_version": FORMAT_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            "config": {
+                "max_history": self.max_history,
+                "reliability_threshold": self.reliability_threshold,
+                "min_training_samples": self.min_training_samples,
+                "decay_half_life": self.decay_half_life,
+                "retrain_every": self.retrain_every
+            },
+            "regimes": REGIMES,
+            "window": {
+                "features": X.tolist(),
+                "outcomes": y.tolist(),
+                "total_added": self.store.total_added
+            },
+            "model": {
+                "is_trained": self.is_trained,
+                "trained_at": self.trained_at,
+                "records_since_train": self.records_since_train,
+                "coef": self.model.coef_.tolist() if self.is_trained else None,
+                "intercept": self.model.intercept_.tolist() if self.is_trained else None,
+                "classes": self.model.classes_.tolist() if self.is_trained else None
+            }
+        }
 
+        # Write-then-rename so a crash never leaves a truncated state file
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        tmp_path.replace(path)
+        return path
 
+    @classmethod
+    def load(cls, path: Path) -> "MetaReliabilityModel":
+        """
+        Restore a model saved with save().
 
+        Args:
+            path: JSON state file
 
+        Returns:
+            MetaReliabilityModel ready to predict and continue training
 
+        Raises:
+            ValueError: If the file uses an unsupported format version or regime encoding
+        """
+        with open(path, "r") as f:
+            state = json.load(f)
 
+        version = state.get("format_version")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported meta reliability model format version: {version}")
+        if state.get("regimes") != REGIMES:
+            raise ValueError("Saved meta reliability model uses a different regime encoding")
 
+        model = cls(**state["config"])
 
+        window = state["window"]
+        for features, outcome in zip(window["features"], window["outcomes"]):
+            model.store.append(features, outcome)
+        # Keep record ages (used for decay weights) consistent with the saved window
+        offset = window["total_added"] - model.store.total_added
+        model.store._seq[:len(model.store)] += offset
+        model.store.total_added = window["total_added"]
 
+        saved_model = state["model"]
+        if saved_model["is_trained"]:
+            model.model.coef_ = np.array(saved_model["coef"], dtype=float)
+            model.model.intercept_ = np.array(saved_model["intercept"], dtype=float)
+            model.model.classes_ = np.array(saved_model["classes"])
+            model.model.n_features_in_ = N_FEATURES
+            model.is_trained = True
+        model.trained_at = saved_model["trained_at"]
+        model.records_since_train = saved_model["records_since_train"]
 
+        logger.info(f"Loaded meta reliability model from {path} ({len(model.store)} records)")
+        return model
 
+    def _encode_regime(self, regime: str) -> List[int]:
+        """One-hot encode regime."""
+        return [1 if regime == r else 0 for r in REGIMES]
+
+    @staticmethod
+    def _classify_reliability(prob: float) -> str:
+        """Classify reliability probability."""
+        if prob >= 0.8:
+            return "high"
+        elif prob >= 0.65:
+            return "medium"
+        else:
+            return "low"
@@ -3,9 +3,11 @@ Multi-Symbol Comparative Analysis.
 
 Ranks and compares forecasts across multiple symbols.
 """
+import time
 import numpy as np
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from models.forecast_trader import ForecastTrader
 from models.forecast_quality import ForecastQualityScorer
 from models.regime_classifier import RegimeClassifier
@@ -43,33 +45,78 @@ class MultiSymbolAnalyzer:
         symbols: List[str],
         forecast_horizon: int = 30,
         historical_period: str = "1y",
-        context_length: Optional[int] = None
+        context_length: Optional[int] = None,
+        pipelined: bool = True
     ) -> Dict[str, Any]:
         """
         Analyze multiple symbols and rank opportunities.
         
+        Pipelined mode prefetches all price histories concurrently, runs every
+        forecast through one batched inference call and scores FQS/regimes in a
+        single vectorized pass. Sequential mode processes one symbol at a time.
+        
         Args:
             symbols: List of symbols to analyze
             forecast_horizon: Forecast horizon
             historical_period: Historical data period
             context_length: Context window size
+            pipelined: Use the batched pipeline (default) instead of per-symbol processing
             
         Returns:
-            Dict with ranked opportunities and analysis
+            Dict with ranked opportunities, per-symbol failures and per-stage timings (seconds)
         """
-        from dash.utils.forecast_helper import get_historical_prices
-        
         # Freeze date ranges for reproducibility
         if self.date_anchoring:
             frozen_ranges = self.date_anchoring.freeze_for_analysis(symbols, historical_period)
             logger.info(f"Date anchoring enabled - using frozen date ranges")
         
+        if pipelined:
+            results, failures, timings = self._analyze_pipelined(
+                symbols, forecast_horizon, historical_period, context_length
+            )
+        else:
+            results, failures, timings = self._analyze_sequential(
+                symbols, forecast_horizon, historical_period, context_length
+            )
+        
+        # Rank opportunities
+        stage_start = time.perf_counter()
+        ranked = self._rank_opportunities(results)
+        by_regime = self._group_by_regime(results)
+        timings["rank"] = time.perf_counter() - stage_start
+        timings["total"] = sum(timings.values())
+        
+        if failures:
+            logger.warning(f"{len(failures)}/{len(symbols)} symbols failed analysis: {failures}")
+        
+        return {
+            "total_analyzed": len(symbols),
+            "successful": len(results),
+            "ranked_opportunities": ranked,
+            "by_regime": by_regime,
+            "failures": failures,
+            "timings": {stage: round(seconds, 4) for stage, seconds in timings.items()}
+        }
+    
+    def _analyze_sequential(
+        self,
+        symbols: List[str],
+        forecast_horizon: int,
+        historical_period: str,
+        context_length: Optional[int]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str], Dict[str, float]]:
+        """Fetch, forecast and score one symbol at a time."""
+        from dash.utils.forecast_helper import get_historical_prices
+        
         results = {}
+        failures = {}
+        stage_start = time.perf_counter()
         
         for symbol in symbols:
             try:
                 prices = get_historical_prices(symbol, period=historical_period)
                 if not prices or len(prices) < 20:
+                    failures[symbol] = f"Insufficient data ({len(prices) if prices else 0} points)"
                     continue
                 
                 result = self.forecast_trader.analyze_symbol(
@@ -79,7 +126,9 @@ class MultiSymbolAnalyzer:
                     context_length=context_length
                 )
                 
-                if result.get("success") and result["trust_evaluation"].is_trusted:
+                if not result.get("success"):
+                    failures[symbol] = f"Forecast failed: {result.get('error')}"
+                elif result["trust_evaluation"].is_trusted:
                     # Calculate FQS
                     fqs = self.quality_scorer.calculate_fqs(
                         result["forecast"],
@@ -94,44 +143,120 @@ class MultiSymbolAnalyzer:
                         prices
                     )
                     
-                    # Apply stability smoothing if enabled
-                    if self.stability_smoother:
-                        # Smooth FQS
-                        smoothed_fqs_score, smoothed_category = self.stability_smoother.smooth_fqs(
-                            symbol, fqs["fqs_score"], fqs["interpretation"].split(" - ")[0]
-                        )
-                        fqs["fqs_score"] = smoothed_fqs_score
-                        fqs["interpretation"] = f"{smoothed_category} - {fqs['interpretation'].split(' - ')[1] if ' - ' in fqs['interpretation'] else 'Forecast quality'}"
-                        
-                        # Smooth regime
-                        smoothed_regime_type = self.stability_smoother.smooth_regime(
-                            symbol, regime["regime"]
-                        )
-                        regime["regime"] = smoothed_regime_type
-                        regime["regime_label"] = self.regime_classifier._get_regime_label(smoothed_regime_type)
-                        
-                        # Smooth uncertainty
-                        risk_pct = result.get("recommendation", {}).get("risk_pct", 0)
-                        smoothed_risk = self.stability_smoother.smooth_uncertainty(symbol, risk_pct)
-                        if "recommendation" in result:
-                            result["recommendation"]["risk_pct"] = smoothed_risk
-                    
-                    results[symbol] = {
-                        **result,
-                        "fqs": fqs,
-                        "regime": regime
-                    }
+                    results[symbol] = self._finalize_result(symbol, result, fqs, regime)
             except Exception as e:
-                continue
+                logger.error(f"Analysis failed for {symbol}: {e}", exc_info=True)
+                failures[symbol] = str(e)
         
-        # Rank opportunities
-        ranked = self._rank_opportunities(results)
+        return results, failures, {"sequential": time.perf_counter() - stage_start}
+    
+    def _analyze_pipelined(
+        self,
+        symbols: List[str],
+        forecast_horizon: int,
+        historical_period: str,
+        context_length: Optional[int]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str], Dict[str, float]]:
+        """Concurrent fetch -> batched forecast -> vectorized scoring -> smoothing."""
+        from services.market_data_gateway import get_market_data_gateway
+        
+        failures: Dict[str, str] = {}
+        timings: Dict[str, float] = {}
+        symbols = list(dict.fromkeys(symbols))
+        
+        # Stage 1: prefetch price histories concurrently
+        stage_start = time.perf_counter()
+        gateway = get_market_data_gateway()
+        price_data: Dict[str, List[float]] = {}
+        if symbols:
+            with ThreadPoolExecutor(max_workers=min(gateway.max_workers, len(symbols))) as pool:
+                futures = {
+                    symbol: pool.submit(gateway.get_bars, symbol, period=historical_period, interval="1d")
+                    for symbol in symbols
+                }
+                for symbol, future in futures.items():
+                    try:
+                        prices = future.result()["Close"].tolist()
+                    except Exception as e:
+                        failures[symbol] = f"Fetch failed: {e}"
+                        continue
+                    if len(prices) < 20:
+                        failures[symbol] = f"Insufficient data ({len(prices)} points)"
+                        continue
+                    price_data[symbol] = prices
+        timings["fetch"] = time.perf_counter() - stage_start
+        
+        # Stage 2: one batched inference call + trust evaluation
+        stage_start = time.perf_counter()
+        analyses = self.forecast_trader.analyze_multiple_symbols(
+            price_data,
+            forecast_horizon=forecast_horizon,
+            context_length=context_length
+        )
+        timings["forecast"] = time.perf_counter() - stage_start
+        
+        trusted = []
+        for symbol, result in analyses.items():
+            if not result.get("success"):
+                failures[symbol] = f"Forecast failed: {result.get('error')}"
+            elif result["trust_evaluation"].is_trusted:
+                trusted.append(symbol)
+        
+        # Stage 3: vectorized FQS + regime scoring
+        stage_start = time.perf_counter()
+        forecasts = [analyses[s]["forecast"] for s in trusted]
+        trust_evals = [analyses[s]["trust_evaluation"] for s in trusted]
+        histories = [price_data[s] for s in trusted]
+        fqs_list = self.quality_scorer.calculate_fqs_batch(forecasts, histories)
+        regimes = self.regime_classifier.classify_regime_batch(forecasts, trust_evals, histories)
+        timings["score"] = time.perf_counter() - stage_start
+        
+        # Stage 4: stability smoothing (stateful per symbol)
+        stage_start = time.perf_counter()
+        results = {}
+        for symbol, fqs, regime in zip(trusted, fqs_list, regimes):
+            try:
+                results[symbol] = self._finalize_result(symbol, analyses[symbol], fqs, regime)
+            except Exception as e:
+                logger.error(f"Scoring failed for {symbol}: {e}", exc_info=True)
+                failures[symbol] = f"Scoring failed: {e}"
+        timings["smooth"] = time.perf_counter() - stage_start
+        
+        return results, failures, timings
+    
+    def _finalize_result(
+        self,
+        symbol: str,
+        result: Dict[str, Any],
+        fqs: Dict[str, Any],
+        regime: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Apply stability smoothing (if enabled) and attach FQS/regime to a result."""
+        if self.stability_smoother:
+            # Smooth FQS
+            smoothed_fqs_score, smoothed_category = self.stability_smoother.smooth_fqs(
+                symbol, fqs["fqs_score"], fqs["interpretation"].split(" - ")[0]
+            )
+            fqs["fqs_score"] = smoothed_fqs_score
+            fqs["interpretation"] = f"{smoothed_category} - {fqs['interpretation'].split(' - ')[1] if ' - ' in fqs['interpretation'] else 'Forecast quality'}"
+            
+            # Smooth regime
+            smoothed_regime_type = self.stability_smoother.smooth_regime(
+                symbol, regime["regime"]
+            )
+            regime["regime"] = smoothed_regime_type
+            regime["regime_label"] = self.regime_classifier._get_regime_label(smoothed_regime_type)
+            
+            # Smooth uncertainty
+            risk_pct = result.get("recommendation", {}).get("risk_pct", 0)
+            smoothed_risk = self.stability_smoother.smooth_uncertainty(symbol, risk_pct)
+            if "recommendation" in result:
+                result["recommendation"]["risk_pct"] = smoothed_risk
         
         return {
-            "total_analyzed": len(symbols),
-            "successful": len(results),
-            "ranked_opportunities": ranked,
-            "by_regime": self._group_by_regime(results)
+            **result,
+            "fqs": fqs,
+            "regime": regime
         }
     
     def _rank_opportunities(self, results: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -4,9 +4,12 @@ Portfolio Construction Layer.
 Multi-symbol allocation with MCR, correlation awareness, volatility scaling, and capital constraints.
 """
 import numpy as np
-from typing import Dict, Any, List, Optional
+import pandas as pd
+from typing import Dict, Any, List, Optional, Union
 import logging
 
+from models.risk_engine import RiskEngine, risk_contributions
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +20,8 @@ class PortfolioConstructor:
         self,
         max_position_size: float = 0.10,  # 10% max per position
         max_portfolio_risk: float = 0.20,  # 20% max portfolio risk
-        correlation_threshold: float = 0.7  # High correlation threshold
+        correlation_threshold: float = 0.7,  # High correlation threshold
+        correlation_service=None
     ):
         """
         Initialize portfolio constructor.
@@ -26,10 +30,13 @@ class PortfolioConstructor:
             max_position_size: Maximum position size as fraction
             max_portfolio_risk: Maximum portfolio risk
             correlation_threshold: Correlation threshold for diversification
+            correlation_service: Optional CorrelationService used when no
+                correlation matrix is passed in
         """
         self.max_position_size = max_position_size
         self.max_portfolio_risk = max_portfolio_risk
         self.correlation_threshold = correlation_threshold
+        self.correlation_service = correlation_service
     
     def calculate_marginal_contribution_to_risk(
         self,
@@ -53,32 +60,29 @@ class PortfolioConstructor:
         if symbol not in portfolio_weights or portfolio_weights[symbol] == 0:
             return 0.0
         
-        # Calculate portfolio variance
-        portfolio_variance = 0.0
-        for sym1, w1 in portfolio_weights.items():
-            for sym2, w2 in portfolio_weights.items():
-                if sym1 in covariance_matrix and sym2 in covariance_matrix[sym1]:
-                    portfolio_variance += w1 * w2 * covariance_matrix[sym1][sym2]
-        
-        if portfolio_variance <= 0:
-            return 0.0
-        
-        portfolio_volatility = np.sqrt(portfolio_variance)
-        
-        # Calculate MCR: partial derivative of portfolio risk w.r.t. symbol weight
-        mcr_numerator = 0.0
-        for sym, w in portfolio_weights.items():
-            if sym in covariance_matrix and symbol in covariance_matrix[sym]:
-                mcr_numerator += w * covariance_matrix[sym][symbol]
-        
-        mcr = (mcr_numerator / portfolio_volatility) if portfolio_volatility > 0 else 0.0
+        return risk_contributions(portfolio_weights, covariance_matrix)[symbol]["mcr"]
+    
+    def calculate_risk_contributions(
+        self,
+        portfolio_weights: Dict[str, float],
+        covariance_matrix: Dict[str, Dict[str, float]]
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate MCR and component risk for every position in one pass.
         
-        return float(mcr)
+        Args:
+            portfolio_weights: Current portfolio weights
+            covariance_matrix: Symbol covariance matrix
+            
+        Returns:
+            Dict of symbol -> {"mcr", "component_risk", "pct_contribution"}
+        """
+        return risk_contributions(portfolio_weights, covariance_matrix)
     
     def build_correlation_aware_portfolio(
         self,
         forecasts: Dict[str, Dict[str, Any]],
-        correlation_matrix: Optional[Dict[str, Dict[str, float]]] = None,
+        correlation_matrix: Optional[Union[Dict[str, Dict[str, float]], pd.DataFrame]] = None,
         portfolio_value: float = 100000.0
     ) -> Dict[str, float]:
         """
@@ -86,7 +90,7 @@ class PortfolioConstructor:
         
         Args:
             forecasts: Dict of symbol -> forecast data
-            correlation_matrix: Optional correlation matrix
+            correlation_matrix: Optional correlation matrix (dict-of-dicts or DataFrame)
             portfolio_value: Total portfolio value
             
         Returns:
@@ -108,49 +112,47 @@ class PortfolioConstructor:
         if not candidate_symbols:
             return {}
         
+        # Fall back to the shared rolling correlations if available
+        if correlation_matrix is None and self.correlation_service is not None and len(candidate_symbols) > 1:
+            try:
+                correlation_matrix = self.correlation_service.correlation_matrix(candidate_symbols)
+            except Exception as e:
+                logger.warning(f"Correlation service unavailable: {e}")
+        
         # If no correlation matrix, use simple diversification
-        if not correlation_matrix:
+        if correlation_matrix is None or len(correlation_matrix) == 0:
             return self._simple_equal_weight(candidate_symbols, forecasts, portfolio_value)
         
-        # Build portfolio avoiding high correlations
-        selected_symbols = []
-        allocations = {}
+        # Aligned correlations (row = selected symbol, column = candidate); missing = NaN
+        if isinstance(correlation_matrix, pd.DataFrame):
+            correlation = correlation_matrix.reindex(
+                index=candidate_symbols, columns=candidate_symbols
+            ).to_numpy(dtype=float, copy=True)
+        else:
+            correlation = RiskEngine.align_matrix(candidate_symbols, correlation_matrix, fill_value=np.nan)
+        np.fill_diagonal(correlation, np.nan)
         
-        for symbol in candidate_symbols:
-            # Check correlation with already selected symbols
-            is_diversified = True
-            
-            for selected_symbol in selected_symbols:
-                if (selected_symbol in correlation_matrix and 
-                    symbol in correlation_matrix[selected_symbol]):
-                    correlation = correlation_matrix[selected_symbol][symbol]
-                    if abs(correlation) > self.correlation_threshold:
-                        is_diversified = False
-                        break
-            
-            if is_diversified:
-                selected_symbols.append(symbol)
-                # Allocate based on expected return and risk
-                rec = forecasts[symbol].get("recommendation", {})
-                expected_return = rec.get("expected_return_pct", 0)
-                risk = rec.get("risk_pct", 1.0)
-                
-                # Weight by Sharpe-like ratio
-                sharpe_ratio = expected_return / risk if risk > 0 else 0
-                allocations[symbol] = sharpe_ratio
+        # Build portfolio avoiding high correlations (greedy, in candidate order)
+        selected = RiskEngine.greedy_select(correlation, self.correlation_threshold)
+        
+        # Allocate based on expected return and risk (Sharpe-like ratio)
+        recs = [forecasts[symbol].get("recommendation", {}) for symbol in candidate_symbols]
+        expected_returns = np.array([rec.get("expected_return_pct", 0) for rec in recs], dtype=float)
+        risks = np.array([rec.get("risk_pct", 1.0) for rec in recs], dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe_ratios = np.where(risks > 0, expected_returns / risks, 0.0)
+        scores = np.where(selected, sharpe_ratios, 0.0)
         
         # Normalize and apply position size limits
-        total_weight = sum(allocations.values())
-        if total_weight > 0:
-            final_allocations = {}
-            for symbol, weight in allocations.items():
-                normalized_weight = weight / total_weight
-                # Apply max position size constraint
-                normalized_weight = min(normalized_weight, self.max_position_size)
-                final_allocations[symbol] = portfolio_value * normalized_weight
-            return final_allocations
-        
-        return {}
+        if scores.sum() <= 0:
+            return {}
+        weights = RiskEngine.capped_weights(scores, self.max_position_size)
+        
+        return {
+            symbol: float(portfolio_value * weights[i])
+            for i, symbol in enumerate(candidate_symbols)
+            if selected[i]
+        }
     
     def volatility_scaled_allocation(
         self,
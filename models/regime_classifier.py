@@ -110,6 +110,93 @@ class RegimeClassifier:
             }
         }
     
+    @staticmethod
+    def classify_regime_batch(
+        forecasts: List[ForecastOutput],
+        trust_evals: List[TrustEvaluation],
+        historical_series_list: Optional[List[Optional[List[float]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify regimes for many forecasts in one vectorized pass.
+        
+        Equivalent to calling `classify_regime` per forecast. All forecasts
+        must share one horizon.
+        
+        Args:
+            forecasts: ForecastOutputs with equal horizons
+            trust_evals: TrustEvaluation per forecast
+            historical_series_list: Optional historical data per forecast
+            
+        Returns:
+            List of regime dicts, in input order
+        """
+        if not forecasts:
+            return []
+        
+        n = len(forecasts)
+        histories = historical_series_list or [None] * n
+        point = np.array([f.point_forecast for f in forecasts], dtype=float)
+        lower = np.array([f.lower_bound for f in forecasts], dtype=float)
+        upper = np.array([f.upper_bound for f in forecasts], dtype=float)
+        
+        trust_score = np.array([t.metrics.overall_trust_score for t in trust_evals], dtype=float)
+        consistency = np.array([t.metrics.consistency_score for t in trust_evals], dtype=float)
+        data_quality = np.array([t.metrics.data_quality_score for t in trust_evals], dtype=float)
+        
+        recent_vol = np.array([
+            np.std(np.asarray(h[-min(30, len(h)):], dtype=float)) if h and len(h) > 1 else np.nan
+            for h in histories
+        ])
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            uncertainty_ratio = np.mean((upper - lower) / np.abs(point), axis=1)
+            vol_ratio = np.where(
+                np.isnan(recent_vol), 1.0, np.std(point, axis=1) / (recent_vol + 1e-10)
+            )
+        
+        # Same precedence as classify_regime
+        conditions = [
+            vol_ratio > 1.5,
+            (trust_score < 0.55) | (consistency < 0.5),
+            (uncertainty_ratio < 0.05) & (trust_score > 0.8),
+            data_quality < 0.6,
+        ]
+        regimes = np.select(
+            conditions,
+            ["high_volatility", "low_predictability", "overconfidence", "data_quality_degradation"],
+            default="normal"
+        )
+        confidences = np.select(
+            conditions + [trust_score > 0.75, trust_score > 0.6],
+            ["medium", "low", "medium", "low", "high", "medium"],
+            default="low"
+        )
+        warning_text = {
+            "high_volatility": "Forecast volatility significantly exceeds historical",
+            "low_predictability": "Low trust or consistency score - reduced predictability",
+            "overconfidence": "Very tight uncertainty bounds with high trust - possible overconfidence",
+            "data_quality_degradation": "Data quality concerns detected",
+        }
+        
+        results = []
+        for i in range(n):
+            regime = str(regimes[i])
+            confidence = str(confidences[i])
+            results.append({
+                "regime": regime,
+                "regime_label": RegimeClassifier._get_regime_label(regime),
+                "confidence": confidence,
+                "warnings": [warning_text[regime]] if regime in warning_text else [],
+                "trading_action": RegimeClassifier._get_trading_action(regime, confidence),
+                "indicators": {
+                    "uncertainty_ratio": float(uncertainty_ratio[i]),
+                    "volatility_ratio": float(vol_ratio[i]),
+                    "data_quality": float(data_quality[i]),
+                    "trust_score": float(trust_score[i])
+                }
+            })
+        return results
+    
     @staticmethod
     def _get_regime_label(regime: str) -> str:
         """Get human-readable regime label."""
@@ -0,0 +1,133 @@
+"""
+Matrix-based portfolio risk engine.
+
+Works on aligned NumPy arrays (weight vector + covariance/correlation matrix
+in the same symbol order) so risk decomposition and diversification checks run
+in a handful of vectorized operations instead of nested dict lookups.
+"""
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class RiskEngine:
+    """Vectorized risk decomposition and correlation-aware selection."""
+
+    @staticmethod
+    def align_matrix(
+        symbols: Sequence[str],
+        matrix: Dict[str, Dict[str, float]],
+        fill_value: float = 0.0
+    ) -> np.ndarray:
+        """
+        Convert a dict-of-dicts matrix to an aligned array.
+
+        Element [i, j] is matrix[symbols[i]][symbols[j]]; missing entries get fill_value.
+        """
+        n = len(symbols)
+        out = np.full((n, n), fill_value, dtype=float)
+        position = {symbol: i for i, symbol in enumerate(symbols)}
+        for row_symbol, row in matrix.items():
+            i = position.get(row_symbol)
+            if i is None:
+                continue
+            for col_symbol, value in row.items():
+                j = position.get(col_symbol)
+                if j is not None and value is not None:
+                    out[i, j] = value
+        return out
+
+    @staticmethod
+    def portfolio_volatility(weights: np.ndarray, covariance: np.ndarray) -> float:
+        """Portfolio volatility sqrt(w' C w) (0 if variance is not positive)."""
+        variance = float(weights @ covariance @ weights)
+        return float(np.sqrt(variance)) if variance > 0 else 0.0
+
+    @staticmethod
+    def risk_decomposition(
+        weights: np.ndarray,
+        covariance: np.ndarray
+    ) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Decompose portfolio risk for all assets in one pass.
+
+        Args:
+            weights: Weight vector (n,)
+            covariance: Covariance matrix (n, n), same order as weights
+
+        Returns:
+            Tuple of (portfolio volatility, marginal contribution to risk (n,),
+            component risk w_i * MCR_i (n,), summing to the portfolio volatility)
+        """
+        weights = np.asarray(weights, dtype=float)
+        covariance = np.asarray(covariance, dtype=float)
+        volatility = RiskEngine.portfolio_volatility(weights, covariance)
+        if volatility <= 0:
+            zeros = np.zeros_like(weights)
+            return 0.0, zeros, zeros
+
+        # dSigma/dw_k = sum_i w_i C[i, k] / sigma
+        mcr = (covariance.T @ weights) / volatility
+        mcr = np.where(weights != 0, mcr, 0.0)
+        return volatility, mcr, weights * mcr
+
+    @staticmethod
+    def greedy_select(
+        correlation: np.ndarray,
+        threshold: float,
+        order: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Greedy diversified selection.
+
+        Walks candidates in `order`; a candidate is kept unless the absolute
+        correlation (row = already selected, column = candidate) exceeds the
+        threshold for any selected asset. NaN correlations never block.
+
+        Returns:
+            Boolean mask (n,) of selected candidates
+        """
+        n = correlation.shape[0]
+        order = range(n) if order is None else order
+        with np.errstate(invalid="ignore"):
+            too_close = np.abs(correlation) > threshold  # NaN -> False
+        blocked = np.zeros(n, dtype=bool)
+        selected = np.zeros(n, dtype=bool)
+        for i in order:
+            if blocked[i]:
+                continue
+            selected[i] = True
+            blocked |= too_close[i]
+        return selected
+
+    @staticmethod
+    def capped_weights(scores: np.ndarray, max_weight: float) -> np.ndarray:
+        """Normalize scores to weights and cap each at max_weight (0s if total <= 0)."""
+        total = scores.sum()
+        if total <= 0:
+            return np.zeros_like(scores, dtype=float)
+        return np.minimum(scores / total, max_weight)
+
+
+def risk_contributions(
+    portfolio_weights: Dict[str, float],
+    covariance_matrix: Dict[str, Dict[str, float]]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Dict adapter: MCR and component risk for every symbol in the portfolio.
+
+    Returns:
+        Dict of symbol -> {"mcr", "component_risk", "pct_contribution"}
+    """
+    symbols: List[str] = list(portfolio_weights.keys())
+    weights = np.array([portfolio_weights[s] for s in symbols], dtype=float)
+    covariance = RiskEngine.align_matrix(symbols, covariance_matrix)
+    volatility, mcr, component = RiskEngine.risk_decomposition(weights, covariance)
+    pct = component / volatility if volatility > 0 else np.zeros_like(component)
+    return {
+        symbol: {
+            "mcr": float(mcr[i]),
+            "component_risk": float(component[i]),
+            "pct_contribution": float(pct[i])
+        }
+        for i, symbol in enumerate(symbols)
+    }
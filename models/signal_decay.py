@@ -2,35 +2,429 @@
 Signal Decay Modeling and Visualization.
 
 Estimates forecast half-life and signal persistence.
+
+Forecast history is kept in a per-symbol time-indexed store of
+(timestamp, expected_return, action, trust) arrays, fed from forecast
+snapshots as they are saved. Rolling statistics are maintained
+incrementally, so half-life/persistence lookups are O(1) and the decay
+heatmap for the whole universe is one vectorized binning pass.
 """
 import numpy as np
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
 import logging
 
 from models.forecast_metadata import ForecastMetadata
+from models.forecast_snapshot_store import ForecastSnapshotStore
 
 logger = logging.getLogger(__name__)
 
+BASE_HALF_LIFE_HOURS = 24.0
+
+# Action strings are stored as small integer codes (only equality matters)
+_ACTION_CODES: Dict[str, int] = {"HOLD": 0, "BUY": 1, "SELL": 2, "PASS": 3}
+
+
+def _action_code(action: Optional[str]) -> int:
+    action = action or "HOLD"
+    code = _ACTION_CODES.get(action)
+    if code is None:
+        code = _ACTION_CODES.setdefault(action, len(_ACTION_CODES))
+    return code
+
+
+def _parse_timestamp(timestamp_str: Optional[str]) -> Optional[float]:
+    if not timestamp_str:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _extract_point(forecast: Dict[str, Any]) -> Optional[Tuple[float, float, int, float, float]]:
+    """(timestamp, expected_return, action_code, trust, fqs) from a forecast dict/snapshot."""
+    ts = _parse_timestamp(forecast.get("timestamp"))
+    if ts is None:
+        return None
+    rec = forecast.get("recommendation") or {}
+    trust = (forecast.get("trust_evaluation") or {}).get("overall_trust_score")
+    fqs = forecast.get("fqs_score", rec.get("fqs_score"))
+    return (
+        ts,
+        float(rec.get("expected_return_pct") or 0.0),
+        _action_code(rec.get("action")),
+        np.nan if trust is None else float(trust),
+        np.nan if fqs is None else float(fqs),
+    )
+
+
+def _stability(std: np.ndarray, mean_abs: np.ndarray) -> np.ndarray:
+    return 1.0 - np.minimum(1.0, std / (mean_abs + 1e-10))
+
+
+def half_life_hours(std: np.ndarray, mean_abs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Half-life from return dispersion (vectorized).
+    
+    More stable forecasts (lower std relative to mean |return|) have longer
+    half-life: very stable 48-72h, moderate 24-48h, unstable 6-24h.
+    
+    Returns:
+        Tuple of (half-life hours, stability ratio)
+    """
+    std = np.asarray(std, dtype=float)
+    mean_abs = np.asarray(mean_abs, dtype=float)
+    stability_ratio = np.where(mean_abs > 0, _stability(std, mean_abs), 0.5)
+    half_life = BASE_HALF_LIFE_HOURS * (1.0 + stability_ratio * 2.0)
+    return np.clip(half_life, 6.0, 72.0), stability_ratio
+
+
+def persistence_scores(
+    same_action_pairs: np.ndarray,
+    counts: np.ndarray,
+    std: np.ndarray,
+    mean_abs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Persistence from action consistency and return stability (vectorized).
+    
+    Returns:
+        Tuple of (persistence score, action consistency, return stability)
+    """
+    action_consistency = same_action_pairs / np.maximum(1, np.asarray(counts) - 1)
+    return_stability = _stability(np.asarray(std, dtype=float), np.asarray(mean_abs, dtype=float))
+    return action_consistency * 0.6 + return_stability * 0.4, action_consistency, return_stability
+
+
+class _SymbolHistory:
+    """Time-sorted arrays for one symbol plus running window sums."""
+    
+    def __init__(self, capacity: int = 64):
+        self.ts = np.empty(capacity)
+        self.returns = np.empty(capacity)
+        self.actions = np.empty(capacity, dtype=np.int16)
+        self.trust = np.empty(capacity)
+        self.fqs = np.empty(capacity)
+        self.start = 0
+        self.end = 0
+        self._reset_stats()
+    
+    def _reset_stats(self) -> None:
+        self.sum = 0.0
+        self.sumsq = 0.0
+        self.sum_abs = 0.0
+        self.same_action_pairs = 0
+    
+    def __len__(self) -> int:
+        return self.end - self.start
+    
+    def _arrays(self) -> Tuple[str, ...]:
+        return ("ts", "returns", "actions", "trust", "fqs")
+    
+    def _make_room(self) -> None:
+        n = len(self)
+        capacity = len(self.ts)
+        if self.start > 0 and n <= capacity // 2:
+            new_capacity = capacity  # compact in place
+        else:
+            new_capacity = capacity * 2
+        for name in self._arrays():
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:n] = old[self.start:self.end]
+            setattr(self, name, new)
+        self.start, self.end = 0, n
+        self.recompute()  # also clears float drift from incremental updates
+    
+    def recompute(self) -> None:
+        """Rebuild running sums from the arrays."""
+        r = self.returns[self.start:self.end]
+        a = self.actions[self.start:self.end]
+        self.sum = float(r.sum())
+        self.sumsq = float((r * r).sum())
+        self.sum_abs = float(np.abs(r).sum())
+        self.same_action_pairs = int(np.count_nonzero(a[1:] == a[:-1]))
+    
+    def add(self, ts: float, ret: float, action: int, trust: float, fqs: float) -> None:
+        if self.end == len(self.ts):
+            self._make_room()
+        
+        if len(self) and ts < self.ts[self.end - 1]:
+            # Out-of-order point: insert in place and rebuild the (order-dependent) stats
+            pos = self.start + int(np.searchsorted(self.ts[self.start:self.end], ts, side="right"))
+            for name, value in zip(self._arrays(), (ts, ret, action, trust, fqs)):
+                arr = getattr(self, name)
+                arr[pos + 1:self.end + 1] = arr[pos:self.end].copy()
+                arr[pos] = value
+            self.end += 1
+            self.recompute()
+            return
+        
+        if len(self) and self.actions[self.end - 1] == action:
+            self.same_action_pairs += 1
+        for name, value in zip(self._arrays(), (ts, ret, action, trust, fqs)):
+            getattr(self, name)[self.end] = value
+        self.end += 1
+        self.sum += ret
+        self.sumsq += ret * ret
+        self.sum_abs += abs(ret)
+    
+    def evict(self, cutoff_ts: Optional[float], max_points: Optional[int]) -> None:
+        """Drop points older than cutoff_ts and beyond the newest max_points."""
+        k = 0
+        if cutoff_ts is not None:
+            k = int(np.searchsorted(self.ts[self.start:self.end], cutoff_ts, side="left"))
+        if max_points is not None:
+            k = max(k, len(self) - max_points)
+        if k <= 0:
+            return
+        
+        s = self.start
+        r = self.returns[s:s + k]
+        self.sum -= float(r.sum())
+        self.sumsq -= float((r * r).sum())
+        self.sum_abs -= float(np.abs(r).sum())
+        # Pairs (i, i+1) whose left element is evicted
+        right = min(s + k + 1, self.end)
+        self.same_action_pairs -= int(np.count_nonzero(self.actions[s:right - 1] == self.actions[s + 1:right]))
+        self.start += k
+        if len(self) == 0:
+            self.start = self.end = 0
+            self._reset_stats()
+    
+    def stats(self) -> Tuple[int, float, float, int]:
+        """(count, std, mean |return|, same-action pairs) for the window."""
+        n = len(self)
+        if n == 0:
+            return 0, 0.0, 0.0, 0
+        mean = self.sum / n
+        std = float(np.sqrt(max(0.0, self.sumsq / n - mean * mean)))
+        return n, std, self.sum_abs / n, self.same_action_pairs
+
+
+class ForecastHistoryIndex:
+    """Per-symbol time-indexed forecast history with rolling statistics."""
+    
+    def __init__(self, window_days: Optional[float] = 30, max_points_per_symbol: int = 2000):
+        """
+        Initialize forecast history index.
+        
+        Args:
+            window_days: Rolling window; older forecasts are evicted (None = keep all)
+            max_points_per_symbol: Cap on stored forecasts per symbol
+        """
+        self.window_days = window_days
+        self.max_points_per_symbol = max_points_per_symbol
+        self._symbols: Dict[str, _SymbolHistory] = {}
+        self._lock = threading.RLock()
+    
+    def _cutoff(self) -> Optional[float]:
+        if self.window_days is None:
+            return None
+        return (datetime.now() - timedelta(days=self.window_days)).timestamp()
+    
+    def add_forecasts(self, forecasts: List[Dict[str, Any]]) -> int:
+        """
+        Add forecast snapshots/results (need symbol, timestamp and recommendation).
+        
+        Returns:
+            Number of forecasts indexed
+        """
+        added = 0
+        touched = set()
+        with self._lock:
+            for forecast in forecasts:
+                symbol = forecast.get("symbol")
+                point = _extract_point(forecast) if symbol else None
+                if point is None:
+                    continue
+                history = self._symbols.get(symbol)
+                if history is None:
+                    history = self._symbols[symbol] = _SymbolHistory()
+                history.add(*point)
+                touched.add(symbol)
+                added += 1
+            
+            cutoff = self._cutoff()
+            for symbol in touched:
+                self._symbols[symbol].evict(cutoff, self.max_points_per_symbol)
+        return added
+    
+    def add_forecast(self, forecast: Dict[str, Any]) -> bool:
+        """Add one forecast snapshot/result."""
+        return self.add_forecasts([forecast]) == 1
+    
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return [s for s, h in self._symbols.items() if len(h)]
+    
+    def series(self, symbol: str) -> Dict[str, np.ndarray]:
+        """Copies of a symbol's arrays (timestamps are epoch seconds)."""
+        with self._lock:
+            history = self._symbols.get(symbol)
+            if history is None:
+                return {name: np.empty(0) for name in ("timestamps", "expected_returns", "trust_scores", "fqs_scores")}
+            window = slice(history.start, history.end)
+            return {
+                "timestamps": history.ts[window].copy(),
+                "expected_returns": history.returns[window].copy(),
+                "trust_scores": history.trust[window].copy(),
+                "fqs_scores": history.fqs[window].copy(),
+            }
+    
+    def stats(self, symbols: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Rolling statistics for many symbols as aligned arrays.
+        
+        Returns:
+            Dict of count, std, mean_abs and same_action_pairs arrays (len(symbols),)
+        """
+        cutoff = self._cutoff()
+        rows = []
+        with self._lock:
+            for symbol in symbols:
+                history = self._symbols.get(symbol)
+                if history is None:
+                    rows.append((0, 0.0, 0.0, 0))
+                    continue
+                history.evict(cutoff, None)
+                rows.append(history.stats())
+        arr = np.array(rows, dtype=float).reshape(len(symbols), 4)
+        return {
+            "count": arr[:, 0].astype(int),
+            "std": arr[:, 1],
+            "mean_abs": arr[:, 2],
+            "same_action_pairs": arr[:, 3],
+        }
+    
+    def binned(
+        self,
+        symbols: List[str],
+        start_ts: float,
+        end_ts: float,
+        bucket_seconds: float
+    ) -> Dict[str, np.ndarray]:
+        """
+        Mean expected return / trust / FQS per (symbol, time bucket) in one pass.
+        
+        Returns:
+            Dict of (len(symbols), n_buckets) matrices (NaN where no forecasts)
+            plus "bucket_starts" (n_buckets,) epoch seconds
+        """
+        n_buckets = max(1, int(np.ceil((end_ts - start_ts) / bucket_seconds)))
+        n = len(symbols)
+        
+        with self._lock:
+            parts = []
+            for row, symbol in enumerate(symbols):
+                history = self._symbols.get(symbol)
+                if history is None or not len(history):
+                    continue
+                window = slice(history.start, history.end)
+                parts.append((
+                    np.full(len(history), row),
+                    history.ts[window], history.returns[window],
+                    history.trust[window], history.fqs[window]
+                ))
+        
+        result = {"bucket_starts": start_ts + bucket_seconds * np.arange(n_buckets)}
+        if not parts:
+            empty = np.full((n, n_buckets), np.nan)
+            result.update(expected_return=empty, trust=empty.copy(), fqs=empty.copy())
+            return result
+        
+        rows, ts, returns, trust, fqs = (np.concatenate(col) for col in zip(*parts))
+        buckets = np.floor((ts - start_ts) / bucket_seconds).astype(int)
+        in_range = (buckets >= 0) & (buckets < n_buckets)
+        rows, buckets = rows[in_range], buckets[in_range]
+        
+        for name, values in (("expected_return", returns), ("trust", trust), ("fqs", fqs)):
+            values = values[in_range]
+            valid = ~np.isnan(values)
+            sums = np.zeros((n, n_buckets))
+            counts = np.zeros((n, n_buckets))
+            np.add.at(sums, (rows[valid], buckets[valid]), values[valid])
+            np.add.at(counts, (rows[valid], buckets[valid]), 1)
+            with np.errstate(invalid="ignore"):
+                result[name] = np.where(counts > 0, sums / np.where(counts > 0, counts, 1), np.nan)
+        return result
+
+
+_indexes: Dict[Path, ForecastHistoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_forecast_history_index(store: ForecastSnapshotStore, window_days: Optional[float] = 30) -> ForecastHistoryIndex:
+    """
+    Shared history index for a snapshot store.
+    
+    Seeded from the store's recent snapshots on first use, then kept current
+    by a store listener as new snapshots are saved.
+    """
+    with _indexes_lock:
+        index = _indexes.get(store.db_path)
+        if index is None:
+            index = ForecastHistoryIndex(window_days=window_days)
+            since = None if window_days is None else datetime.now() - timedelta(days=window_days)
+            snapshots = store.list_snapshots(limit=1_000_000, since=since)
+            index.add_forecasts(list(reversed(snapshots)))  # oldest first
+            store.add_listener(index.add_forecasts)
+            _indexes[store.db_path] = index
+            logger.info(f"Forecast history index seeded with {len(snapshots)} snapshots")
+        return index
+
 
 class SignalDecayModel:
     """Models signal decay and persistence."""
     
-    def __init__(self, storage_dir: Optional[Path] = None):
+    def __init__(self, storage_dir: Optional[Path] = None, window_days: Optional[float] = 30):
         """
         Initialize signal decay model.
         
         Args:
             storage_dir: Directory with forecast snapshots
+            window_days: Rolling window for forecast history statistics
         """
         self.metadata = ForecastMetadata(storage_dir)
+        self.history = get_forecast_history_index(self.metadata.store, window_days=window_days)
+    
+    def record_forecast(self, forecast: Dict[str, Any]) -> bool:
+        """
+        Index a forecast result that was not saved through the snapshot store.
+        
+        Args:
+            forecast: Dict with symbol, timestamp and recommendation
+            
+        Returns:
+            True if the forecast was indexed
+        """
+        return self.history.add_forecast(forecast)
+    
+    @staticmethod
+    def _list_stats(forecast_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Window statistics for an explicit forecast list (same fields as the index)."""
+        points = [p for p in (_extract_point(f) for f in forecast_history) if p is not None]
+        returns = np.array([p[1] for p in points])
+        actions = [_action_code((f.get("recommendation") or {}).get("action")) for f in forecast_history]
+        all_returns = np.array([(f.get("recommendation") or {}).get("expected_return_pct") or 0.0 for f in forecast_history])
+        return {
+            "count": len(points),
+            "std": float(np.std(returns)) if len(points) else 0.0,
+            "mean_abs": float(np.mean(np.abs(returns))) if len(points) else 0.0,
+            "all_count": len(forecast_history),
+            "all_std": float(np.std(all_returns)) if len(all_returns) else 0.0,
+            "all_mean_abs": float(np.mean(np.abs(all_returns))) if len(all_returns) else 0.0,
+            "same_action_pairs": sum(1 for i in range(len(actions) - 1) if actions[i] == actions[i + 1]),
+        }
     
     def calculate_half_life(
         self,
         symbol: str,
-        forecast_history: List[Dict[str, Any]],
+        forecast_history: Optional[List[Dict[str, Any]]] = None,
         stability_threshold: float = 0.1
     ) -> Dict[str, Any]:
         """
@@ -38,155 +432,135 @@ class SignalDecayModel:
         
         Args:
             symbol: Trading symbol
-            forecast_history: List of historical forecasts with timestamps
+            forecast_history: Optional explicit forecasts with timestamps; if None,
+                uses the indexed rolling history for the symbol
             stability_threshold: Threshold for considering forecast stable
             
         Returns:
             Dict with half-life estimate
         """
-        if len(forecast_history) < 2:
-            return {
-                "half_life_hours": None,
-                "reason": "Insufficient forecast history"
-            }
-        
-        # Extract expected returns over time
-        expected_returns = []
-        timestamps = []
-        
-        for forecast in forecast_history:
-            rec = forecast.get("recommendation", {})
-            expected_return = rec.get("expected_return_pct", 0)
-            timestamp_str = forecast.get("timestamp", "")
-            
-            if timestamp_str:
-                try:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    expected_returns.append(expected_return)
-                    timestamps.append(timestamp)
-                except:
-                    continue
-        
-        if len(expected_returns) < 2:
-            return {
-                "half_life_hours": None,
-                "reason": "Insufficient valid timestamps"
-            }
-        
-        # Calculate variance in expected returns
-        return_variance = np.var(expected_returns)
-        return_std = np.std(expected_returns)
-        mean_return = np.mean(np.abs(expected_returns))
-        
-        # Estimate half-life based on stability
-        # More stable forecasts (lower variance) have longer half-life
-        if mean_return > 0:
-            stability_ratio = 1.0 - min(1.0, return_std / (mean_return + 1e-10))
+        if forecast_history is not None:
+            if len(forecast_history) < 2:
+                return {
+                    "half_life_hours": None,
+                    "reason": "Insufficient forecast history"
+                }
+            stats = self._list_stats(forecast_history)
+            count, std, mean_abs = stats["count"], stats["std"], stats["mean_abs"]
+            if count < 2:
+                return {
+                    "half_life_hours": None,
+                    "reason": "Insufficient valid timestamps"
+                }
         else:
-            stability_ratio = 0.5
+            stats = self.history.stats([symbol])
+            count, std, mean_abs = int(stats["count"][0]), stats["std"][0], stats["mean_abs"][0]
+            if count < 2:
+                return {
+                    "half_life_hours": None,
+                    "reason": "Insufficient forecast history"
+                }
         
-        # Half-life in hours (base 24 hours, adjusted by stability)
-        # Very stable: 48-72 hours
-        # Moderate: 24-48 hours
-        # Unstable: 6-24 hours
-        base_half_life = 24.0
-        half_life_hours = base_half_life * (1.0 + stability_ratio * 2.0)
-        
-        # Clamp to reasonable range
-        half_life_hours = max(6.0, min(72.0, half_life_hours))
+        half_life, stability_ratio = half_life_hours(std, mean_abs)
         
         return {
-            "half_life_hours": float(half_life_hours),
+            "half_life_hours": float(half_life),
             "stability_ratio": float(stability_ratio),
-            "return_variance": float(return_variance),
-            "mean_return": float(mean_return),
-            "forecast_count": len(expected_returns)
+            "return_variance": float(std ** 2),
+            "mean_return": float(mean_abs),
+            "forecast_count": count
         }
     
     def calculate_signal_persistence(
         self,
         symbol: str,
-        forecast_history: List[Dict[str, Any]]
+        forecast_history: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Calculate signal persistence score.
         
         Args:
             symbol: Trading symbol
-            forecast_history: List of historical forecasts
+            forecast_history: Optional explicit forecasts; if None, uses the
+                indexed rolling history for the symbol
             
         Returns:
             Dict with persistence metrics
         """
-        if len(forecast_history) < 2:
+        if forecast_history is not None:
+            stats = self._list_stats(forecast_history)
+            count, std, mean_abs = stats["all_count"], stats["all_std"], stats["all_mean_abs"]
+            same_pairs = stats["same_action_pairs"]
+        else:
+            stats = self.history.stats([symbol])
+            count, std, mean_abs = int(stats["count"][0]), stats["std"][0], stats["mean_abs"][0]
+            same_pairs = stats["same_action_pairs"][0]
+        
+        if count < 2:
             return {
                 "persistence_score": 0.5,
                 "reason": "Insufficient history"
             }
         
-        # Extract actions and expected returns
-        actions = []
-        expected_returns = []
-        
-        for forecast in forecast_history:
-            rec = forecast.get("recommendation", {})
-            actions.append(rec.get("action", "HOLD"))
-            expected_returns.append(rec.get("expected_return_pct", 0))
-        
-        # Action consistency
-        action_consistency = sum(1 for i in range(len(actions)-1) if actions[i] == actions[i+1]) / max(1, len(actions)-1)
-        
-        # Return stability
-        return_stability = 1.0 - min(1.0, np.std(expected_returns) / (np.mean(np.abs(expected_returns)) + 1e-10))
-        
-        # Combined persistence score
-        persistence_score = (action_consistency * 0.6 + return_stability * 0.4)
+        persistence_score, action_consistency, return_stability = persistence_scores(
+            same_pairs, count, std, mean_abs
+        )
         
         return {
             "persistence_score": float(persistence_score),
             "action_consistency": float(action_consistency),
             "return_stability": float(return_stability),
-            "signal_stable": persistence_score > 0.7
+            "signal_stable": bool(persistence_score > 0.7)
         }
     
     def generate_decay_heatmap_data(
         self,
         symbols: List[str],
-        days_back: int = 7
+        days_back: int = 7,
+        bucket_hours: float = 24.0
     ) -> Dict[str, Any]:
         """
         Generate data for signal decay heatmap.
         
+        All symbols are binned and scored in one vectorized pass over the
+        indexed history.
+        
         Args:
             symbols: List of symbols to analyze
             days_back: Number of days to look back
+            bucket_hours: Width of each heatmap time bucket
             
         Returns:
-            Dict with heatmap data
+            Dict with heatmap data per symbol (trends are per-bucket means, None where empty)
         """
-        heatmap_data = {}
+        if not symbols:
+            return {}
         
-        for symbol in symbols:
-            # Load recent forecasts for this symbol
-            # In production, would query forecast snapshots
-            # For now, return structure
+        end = datetime.now().timestamp()
+        start = end - days_back * 86400
+        binned = self.history.binned(symbols, start, end, bucket_hours * 3600)
+        stats = self.history.stats(symbols)
+        
+        counts = stats["count"]
+        half_lives, _ = half_life_hours(stats["std"], stats["mean_abs"])
+        persistence, _, _ = persistence_scores(
+            stats["same_action_pairs"], counts, stats["std"], stats["mean_abs"]
+        )
+        bucket_starts = [datetime.fromtimestamp(t).isoformat() for t in binned["bucket_starts"]]
+        
+        def _trend(row: np.ndarray) -> List[Optional[float]]:
+            return [None if np.isnan(v) else float(v) for v in row]
+        
+        heatmap_data = {}
+        for i, symbol in enumerate(symbols):
+            enough = counts[i] >= 2
             heatmap_data[symbol] = {
-                "expected_return_trend": [],  # Would populate from actual data
-                "confidence_trend": [],
-                "fqs_trend": [],
-                "half_life_hours": None,
-                "persistence_score": None
+                "bucket_starts": bucket_starts,
+                "expected_return_trend": _trend(binned["expected_return"][i]),
+                "confidence_trend": _trend(binned["trust"][i]),
+                "fqs_trend": _trend(binned["fqs"][i]),
+                "half_life_hours": float(half_lives[i]) if enough else None,
+                "persistence_score": float(persistence[i]) if enough else None
             }
         
         return heatmap_data
-
-
-
-
-
-
-
-
-
-
-
@@ -4,6 +4,8 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
+import numpy as np
+
 from .schemas import (
     TrustEvaluation,
     TrustMetrics,
@@ -116,6 +118,50 @@ class TrustFilter:
             overall_trust_score
         )
         
+        # Check uncertainty ratio
+        point_forecast = np.array(forecast.point_forecast)
+        uncertainty_ranges = np.array(forecast.upper_bound) - np.array(forecast.lower_bound)
+        point_abs = np.abs(point_forecast)
+        point_abs = np.where(point_abs < 1e-10, 1.0, point_abs)
+        max_ratio = np.max(uncertainty_ranges / point_abs)
+        
+        evaluation = self._build_evaluation(
+            forecast=forecast,
+            uncertainty_score=uncertainty_score,
+            consistency_score=consistency_score,
+            data_quality_score=data_quality_score,
+            historical_accuracy=historical_accuracy,
+            market_regime_score=market_regime_score,
+            overall_trust_score=overall_trust_score,
+            confidence_level=confidence_level,
+            max_ratio=max_ratio
+        )
+        is_trusted = evaluation.is_trusted
+        
+        logger.info(
+            f"Trust evaluation: score={overall_trust_score:.3f}, "
+            f"trusted={is_trusted}, confidence={confidence_level}"
+        )
+        
+        return evaluation
+    
+    def _build_evaluation(
+        self,
+        forecast: ForecastOutput,
+        uncertainty_score: float,
+        consistency_score: float,
+        data_quality_score: float,
+        historical_accuracy: Optional[float],
+        market_regime_score: Optional[float],
+        overall_trust_score: float,
+        confidence_level: str,
+        max_ratio: float
+    ) -> TrustEvaluation:
+        """
+        Apply thresholds to computed scores and build the TrustEvaluation.
+        
+        Shared by evaluate() and evaluate_batch() so both paths make the same decisions.
+        """
         # Collect rejection reasons
         rejection_reasons = []
         
@@ -153,14 +199,6 @@ class TrustFilter:
                     f"({self.config.min_historical_accuracy:.3f})"
                 )
         
-        # Check uncertainty ratio
-        import numpy as np
-        point_forecast = np.array(forecast.point_forecast)
-        uncertainty_ranges = np.array(forecast.upper_bound) - np.array(forecast.lower_bound)
-        point_abs = np.abs(point_forecast)
-        point_abs = np.where(point_abs < 1e-10, 1.0, point_abs)
-        max_ratio = np.max(uncertainty_ranges / point_abs)
-        
         if max_ratio > self.config.max_uncertainty_ratio:
             rejection_reasons.append(
                 f"Uncertainty ratio ({max_ratio:.3f}) exceeds maximum "
@@ -192,20 +230,13 @@ class TrustFilter:
         )
         
         # Build evaluation
-        evaluation = TrustEvaluation(
+        return TrustEvaluation(
             forecast=forecast,
             metrics=metrics,
             is_trusted=is_trusted,
             evaluation_timestamp=datetime.now(),
             evaluation_id=str(uuid.uuid4())[:8]
         )
-        
-        logger.info(
-            f"Trust evaluation: score={overall_trust_score:.3f}, "
-            f"trusted={is_trusted}, confidence={confidence_level}"
-        )
-        
-        return evaluation
     
     def evaluate_batch(
         self,
@@ -218,6 +249,9 @@ class TrustFilter:
         """
         Evaluate trustworthiness of multiple forecasts in batch.
         
+        Forecasts are stacked into (n, horizon) arrays (grouped by horizon) and
+        scored in one vectorized pass; results match calling evaluate() per item.
+        
         Args:
             forecasts: List of ForecastOutputs to evaluate
             input_data_list: Optional list of original ForecastInputs
@@ -228,22 +262,72 @@ class TrustFilter:
         Returns:
             BatchTrustEvaluation with results for all forecasts
         """
-        evaluations = []
+        n = len(forecasts)
+        
+        def _item(values: Optional[List[Any]], i: int) -> Any:
+            return values[i] if values and i < len(values) else None
+        
+        input_data = [_item(input_data_list, i) for i in range(n)]
+        histories = [d.series if d else None for d in input_data]
+        
+        # Data quality and optional components over the whole batch
+        data_quality_scores = self.metrics_calculator.calculate_data_quality_scores(histories)
+        historical_accuracies = np.array([
+            self.metrics_calculator.calculate_historical_accuracy(_item(symbols, i), self.accuracy_history)
+            for i in range(n)
+        ], dtype=float)
+        market_regime_scores = self.metrics_calculator.calculate_market_regime_scores(
+            np.array([_item(current_volatilities, i) for i in range(n)], dtype=float),
+            np.array([_item(historical_volatilities, i) for i in range(n)], dtype=float)
+        )
         
+        # Forecast-shape metrics over stacked (n, horizon) arrays, one stack per horizon
+        uncertainty_scores = np.zeros(n)
+        max_ratios = np.zeros(n)
+        consistency_scores = np.zeros(n)
+        by_horizon: Dict[int, List[int]] = {}
         for i, forecast in enumerate(forecasts):
-            input_data = input_data_list[i] if input_data_list and i < len(input_data_list) else None
-            symbol = symbols[i] if symbols and i < len(symbols) else None
-            current_vol = current_volatilities[i] if current_volatilities and i < len(current_volatilities) else None
-            hist_vol = historical_volatilities[i] if historical_volatilities and i < len(historical_volatilities) else None
+            by_horizon.setdefault(len(forecast.point_forecast), []).append(i)
+        
+        for indices in by_horizon.values():
+            point = np.array([forecasts[i].point_forecast for i in indices], dtype=float)
+            lower = np.array([forecasts[i].lower_bound for i in indices], dtype=float)
+            upper = np.array([forecasts[i].upper_bound for i in indices], dtype=float)
             
-            evaluation = self.evaluate(
+            uncertainty_scores[indices], max_ratios[indices] = (
+                self.metrics_calculator.calculate_uncertainty_scores(point, lower, upper)
+            )
+            consistency_scores[indices] = self.metrics_calculator.calculate_consistency_scores(
+                point, lower, upper, [histories[i] for i in indices]
+            )
+        
+        overall_trust_scores = self.metrics_calculator.calculate_overall_trust_scores(
+            uncertainty_scores=uncertainty_scores,
+            consistency_scores=consistency_scores,
+            data_quality_scores=data_quality_scores,
+            historical_accuracies=historical_accuracies,
+            market_regime_scores=market_regime_scores,
+            weights=self.config.weights
+        )
+        confidence_levels = self.metrics_calculator.classify_confidence_levels(overall_trust_scores)
+        
+        def _optional(value: float) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+        
+        evaluations = [
+            self._build_evaluation(
                 forecast=forecast,
-                input_data=input_data,
-                symbol=symbol,
-                current_volatility=current_vol,
-                historical_volatility=hist_vol
+                uncertainty_score=float(uncertainty_scores[i]),
+                consistency_score=float(consistency_scores[i]),
+                data_quality_score=float(data_quality_scores[i]),
+                historical_accuracy=_optional(historical_accuracies[i]),
+                market_regime_score=_optional(market_regime_scores[i]),
+                overall_trust_score=float(overall_trust_scores[i]),
+                confidence_level=str(confidence_levels[i]),
+                max_ratio=max_ratios[i]
             )
-            evaluations.append(evaluation)
+            for i, forecast in enumerate(forecasts)
+        ]
         
         # Calculate batch statistics
         trusted_count = sum(1 for e in evaluations if e.is_trusted)
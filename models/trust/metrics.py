@@ -333,3 +333,238 @@ class TrustMetricsCalculator:
 
 
 
+    
+    # ------------------------------------------------------------------
+    # Batched variants
+    #
+    # Each takes stacked (n_forecasts, horizon) arrays and applies the same
+    # per-row operations as the single-forecast methods above, so results
+    # are identical to calling those methods one forecast at a time.
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def calculate_uncertainty_scores(
+        point: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray
+    ) -> tuple:
+        """
+        Uncertainty scores for stacked forecasts.
+        
+        Args:
+            point: Point forecasts (n, horizon)
+            lower: Lower bounds (n, horizon)
+            upper: Upper bounds (n, horizon)
+            
+        Returns:
+            Tuple of (scores (n,), max uncertainty ratio per forecast (n,))
+        """
+        point_abs = np.abs(point)
+        point_abs = np.where(point_abs < 1e-10, 1.0, point_abs)
+        uncertainty_ratios = (upper - lower) / point_abs
+        
+        threshold = 0.3
+        avg_scores = np.mean(np.exp(-uncertainty_ratios / threshold), axis=1)
+        scores = 1.0 / (1.0 + np.exp(-5 * (avg_scores - 0.5)))
+        
+        return np.clip(scores, 0.0, 1.0), np.max(uncertainty_ratios, axis=1)
+    
+    @staticmethod
+    def calculate_consistency_scores(
+        point: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        historical_series_list: Optional[List[Optional[List[float]]]] = None
+    ) -> np.ndarray:
+        """
+        Consistency scores for stacked forecasts.
+        
+        Args:
+            point: Point forecasts (n, horizon)
+            lower: Lower bounds (n, horizon)
+            upper: Upper bounds (n, horizon)
+            historical_series_list: Optional historical data per forecast
+            
+        Returns:
+            Consistency scores (n,)
+        """
+        n, horizon = point.shape
+        if horizon < 2:
+            return np.full(n, 0.5)
+        
+        changes = np.diff(point, axis=1)
+        change_ratios = changes / (np.abs(point[:, :-1]) + 1e-10)
+        extreme_change_penalty = np.sum(np.abs(change_ratios) > 0.5, axis=1) / change_ratios.shape[1]
+        
+        # Trend statistics per history (lengths differ, so computed per series)
+        histories = historical_series_list or [None] * n
+        recent_trend = np.full(n, np.nan)
+        hist_mean = np.full(n, np.nan)
+        for i, history in enumerate(histories):
+            if history and len(history) > 1:
+                hist_array = np.array(history)
+                recent_trend[i] = np.mean(np.diff(hist_array[-min(10, len(hist_array)):]))
+                hist_mean[i] = np.mean(hist_array)
+        
+        forecast_trend = np.mean(changes, axis=1)
+        with np.errstate(invalid="ignore"):
+            has_trend = ~np.isnan(recent_trend) & (np.abs(recent_trend) > 0.01 * np.abs(hist_mean))
+            trend_consistency = np.where(
+                has_trend,
+                1.0 - np.minimum(1.0, np.abs(forecast_trend - recent_trend) / (np.abs(recent_trend) + 1e-10)),
+                0.7
+            )
+        
+        bounds_consistency = np.mean((point >= lower) & (point <= upper), axis=1)
+        
+        consistency_scores = (
+            0.4 * (1.0 - extreme_change_penalty) +
+            0.3 * trend_consistency +
+            0.3 * bounds_consistency
+        )
+        
+        return np.clip(consistency_scores, 0.0, 1.0)
+    
+    @staticmethod
+    def calculate_data_quality_scores(
+        series_list: List[Optional[List[float]]]
+    ) -> np.ndarray:
+        """
+        Data quality scores for many input series.
+        
+        Series are grouped by length and each group is scored as one 2-D array.
+        
+        Args:
+            series_list: Historical series per forecast (None = no data)
+            
+        Returns:
+            Data quality scores (n,)
+        """
+        scores = np.full(len(series_list), 0.5)  # Neutral if no data available
+        
+        groups: Dict[int, List[int]] = {}
+        for i, series in enumerate(series_list):
+            if series is not None:
+                groups.setdefault(len(series), []).append(i)
+        
+        for length, indices in groups.items():
+            series = np.array([series_list[i] for i in indices], dtype=float)
+            
+            length_score = min(1.0, length / 50.0)
+            completeness_score = 1.0 - np.sum(np.isnan(series), axis=1) / length
+            
+            if length > 4:
+                q1, q3 = np.percentile(series, [25, 75], axis=1)
+                iqr = q3 - q1
+                outliers = np.sum(
+                    (series < (q1 - 3 * iqr)[:, None]) | (series > (q3 + 3 * iqr)[:, None]),
+                    axis=1
+                )
+                outlier_score = np.where(
+                    iqr > 0,
+                    1.0 - np.minimum(1.0, (outliers / length) * 2),
+                    0.5
+                )
+            else:
+                outlier_score = np.full(len(indices), 0.7)
+            
+            if length > 1:
+                variance = np.var(series, axis=1)
+                mean_abs = np.abs(np.mean(series, axis=1))
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    variance_score = np.where(
+                        mean_abs > 0,
+                        np.minimum(1.0, np.sqrt(variance) / mean_abs * 10),
+                        0.5
+                    )
+            else:
+                variance_score = np.full(len(indices), 0.5)
+            
+            quality_score = (
+                0.3 * length_score +
+                0.3 * completeness_score +
+                0.2 * outlier_score +
+                0.2 * variance_score
+            )
+            scores[indices] = np.clip(quality_score, 0.0, 1.0)
+        
+        return scores
+    
+    @staticmethod
+    def calculate_market_regime_scores(
+        current_volatilities: np.ndarray,
+        historical_volatilities: np.ndarray
+    ) -> np.ndarray:
+        """
+        Market regime scores; NaN inputs (unavailable data) give NaN scores.
+        
+        Args:
+            current_volatilities: Current volatility per forecast (NaN = unknown)
+            historical_volatilities: Historical volatility per forecast (NaN = unknown)
+            
+        Returns:
+            Market regime scores (n,) with NaN where unavailable
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = current_volatilities / historical_volatilities
+            scores = np.select(
+                [
+                    np.isnan(current_volatilities) | np.isnan(historical_volatilities),
+                    historical_volatilities == 0,
+                    (ratio >= 0.5) & (ratio <= 2.0),
+                    (ratio > 2.0) & (ratio <= 3.0),
+                    (ratio >= 0.3) & (ratio < 0.5),
+                ],
+                [np.nan, 0.5, 1.0, 0.7, 0.8],
+                default=0.4
+            )
+        return scores
+    
+    @staticmethod
+    def calculate_overall_trust_scores(
+        uncertainty_scores: np.ndarray,
+        consistency_scores: np.ndarray,
+        data_quality_scores: np.ndarray,
+        historical_accuracies: np.ndarray,
+        market_regime_scores: np.ndarray,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Weighted overall trust scores; NaN optional components are redistributed
+        exactly as in calculate_overall_trust_score.
+        """
+        if weights is None:
+            weights = {
+                "uncertainty": 0.3,
+                "consistency": 0.25,
+                "data_quality": 0.25,
+                "historical_accuracy": 0.15,
+                "market_regime": 0.05
+            }
+        
+        total_weight = sum(weights.values())
+        if total_weight > 0:
+            weights = {k: v / total_weight for k, v in weights.items()}
+        
+        overall_scores = (
+            weights.get("uncertainty", 0.0) * uncertainty_scores +
+            weights.get("consistency", 0.0) * consistency_scores +
+            weights.get("data_quality", 0.0) * data_quality_scores
+        )
+        
+        for key, component in (("historical_accuracy", historical_accuracies), ("market_regime", market_regime_scores)):
+            remaining = weights.get(key, 0.0)
+            missing = np.isnan(component)
+            scaled = overall_scores * (1.0 + remaining / (1.0 - remaining)) if remaining > 0 else overall_scores
+            overall_scores = np.where(missing, scaled, overall_scores + remaining * np.nan_to_num(component))
+        
+        return np.clip(overall_scores, 0.0, 1.0)
+    
+    @staticmethod
+    def classify_confidence_levels(trust_scores: np.ndarray) -> np.ndarray:
+        """Vectorized classify_confidence_level."""
+        return np.select(
+            [trust_scores >= 0.75, trust_scores >= 0.55],
+            ["high", "medium"],
+            default="low"
+        )
@@ -11,6 +11,46 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _chronos_context(
+    series: List[float],
+    context_length: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select the context window passed to Chronos.
+    
+    Returns:
+        Tuple of (context, context as fed to the model)
+    """
+    series_array = np.array(series, dtype=np.float32)
+    
+    # Select context window
+    if context_length is not None:
+        context = series_array[-context_length:]
+    else:
+        context = series_array
+    
+    # Ensure minimum length
+    if len(context) < 10:
+        logger.warning(f"Context length ({len(context)}) is very short")
+    
+    # Ensure deterministic ordering (sort if needed)
+    # In practice, context should already be time-ordered
+    context_sorted = np.sort(context) if len(context) > 1 and not np.all(np.diff(context) >= -1e-10) else context
+    
+    return context, context_sorted
+
+
+def _clamp_bounds(
+    point_forecast: np.ndarray,
+    lower_bound: np.ndarray,
+    upper_bound: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Ensure bounds are valid (within 50%-150% of the point forecast)."""
+    lower_bound = np.maximum(lower_bound, point_forecast * 0.5)
+    upper_bound = np.minimum(upper_bound, point_forecast * 1.5)
+    return lower_bound, upper_bound
+
+
 def forecast_series(
     model,
     series: List[float],
@@ -30,27 +70,12 @@ def forecast_series(
         Tuple of (point_forecast, lower_bound, upper_bound) as numpy arrays
     """
     try:
-        # Convert to numpy array
-        series_array = np.array(series, dtype=np.float32)
-        
-        # Select context window
-        if context_length is not None:
-            context = series_array[-context_length:]
-        else:
-            context = series_array
-        
-        # Ensure minimum length
-        if len(context) < 10:
-            logger.warning(f"Context length ({len(context)}) is very short")
+        context, context_sorted = _chronos_context(series, context_length)
         
         # Prepare context for Chronos (needs to be 2D: [batch, time])
         # Chronos expects shape (batch_size, context_length) as torch.Tensor
         import torch
         
-        # Ensure deterministic ordering (sort if needed)
-        # In practice, context should already be time-ordered
-        context_sorted = np.sort(context) if len(context) > 1 and not np.all(np.diff(context) >= -1e-10) else context
-        
         context_2d = context_sorted.reshape(1, -1)
         
         # Use float64 for deterministic mode if available
@@ -130,9 +155,7 @@ def forecast_series(
             lower_bound = point_forecast - 1.96 * uncertainty
             upper_bound = point_forecast + 1.96 * uncertainty
         
-        # Ensure bounds are valid
-        lower_bound = np.maximum(lower_bound, point_forecast * 0.5)
-        upper_bound = np.minimum(upper_bound, point_forecast * 1.5)
+        lower_bound, upper_bound = _clamp_bounds(point_forecast, lower_bound, upper_bound)
         
         logger.info(f"Generated forecast: horizon={forecast_horizon}, "
                    f"point_range=[{np.min(point_forecast):.2f}, {np.max(point_forecast):.2f}]")
@@ -145,6 +168,68 @@ def forecast_series(
         raise RuntimeError(f"Forecast generation failed: {e}")
 
 
+def forecast_series_batch(
+    model,
+    series_list: List[List[float]],
+    forecast_horizon: int = 30,
+    context_length: Optional[int] = None,
+    num_samples: int = 100
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Generate forecasts for many series with a single Chronos pipeline call.
+    
+    Contexts of different lengths are passed as a list of 1-D tensors, which
+    the pipeline left-pads into one batch. Deterministic pipelines fall back
+    to per-series `forecast_series` calls so their outputs stay reproducible.
+    
+    Args:
+        model: ChronosPipeline instance from chronos-forecasting
+        series_list: Historical time series, one per forecast
+        forecast_horizon: Number of future periods to forecast
+        context_length: Number of historical points to use (None = use all)
+        num_samples: Monte Carlo samples per series
+        
+    Returns:
+        List of (point_forecast, lower_bound, upper_bound) tuples, in input order
+    """
+    if getattr(model, '_deterministic_mode', False):
+        return [forecast_series(model, s, forecast_horizon, context_length) for s in series_list]
+    
+    try:
+        import torch
+        
+        contexts = [
+            torch.tensor(_chronos_context(series, context_length)[1], dtype=torch.float32)
+            for series in series_list
+        ]
+        
+        # Returns: (batch_size, num_samples, prediction_length)
+        samples = model.predict(
+            contexts,
+            prediction_length=forecast_horizon,
+            num_samples=num_samples
+        ).cpu().numpy()
+        
+        if samples.ndim != 3 or samples.shape[0] != len(series_list):
+            raise RuntimeError(f"Unexpected batch forecast shape {samples.shape}")
+        
+        point_forecasts = np.median(samples, axis=1)
+        lower_bounds = np.percentile(samples, 5, axis=1)
+        upper_bounds = np.percentile(samples, 95, axis=1)
+        lower_bounds, upper_bounds = _clamp_bounds(point_forecasts, lower_bounds, upper_bounds)
+        
+        logger.info(f"Generated {len(series_list)} forecasts in one batch: horizon={forecast_horizon}")
+        
+        return [
+            (point_forecasts[i], lower_bounds[i], upper_bounds[i])
+            for i in range(len(series_list))
+        ]
+    
+    except Exception as e:
+        logger.error(f"Error in forecast_series_batch: {e}", exc_info=True)
+        raise RuntimeError(f"Batch forecast generation failed: {e}")
+
+
 def prepare_context(
     series: List[float],
     context_length: Optional[int] = None
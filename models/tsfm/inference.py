@@ -1,11 +1,13 @@
 """Chronos-based time series forecasting inference engine."""
+import threading
 import time
 import numpy as np
 from typing import Optional, Dict, Any, List
 import logging
 
+from core.metrics import metrics
 from .schemas import ForecastInput, ForecastOutput, BatchForecastInput, BatchForecastOutput
-from .forecast_utils import forecast_series
+from .forecast_utils import forecast_series, forecast_series_batch
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,7 @@ class ChronosInferenceEngine:
         self.tokenizer = None
         self.pipeline = None
         self._initialized = False
+        self._init_lock = threading.Lock()
         
         if deterministic_mode:
             from models.deterministic_mode import DeterministicForecastMode
@@ -49,11 +52,20 @@ class ChronosInferenceEngine:
         else:
             self.dfm = None
         
+    def load(self) -> None:
+        """Load the model now instead of on the first forecast (e.g. during warm-up)."""
+        self._initialize_model()
+    
     def _initialize_model(self) -> None:
-        """Lazy initialization of the Chronos model."""
+        """Lazy initialization of the Chronos model (safe to call from several threads)."""
         if self._initialized:
             return
-            
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._load_model()
+    
+    def _load_model(self) -> None:
         logger.info(f"Initializing Chronos model: {self.model_name}")
         start_time = time.time()
         
@@ -209,6 +221,7 @@ class ChronosInferenceEngine:
         )
         
         forecast_horizon = input_data.forecast_horizon
+        mode = "chronos"
         
         # Generate forecast
         if self.pipeline is not None:
@@ -223,6 +236,8 @@ class ChronosInferenceEngine:
                 logger.info("Using real Chronos model for inference")
             except Exception as e:
                 logger.warning(f"Chronos inference failed, falling back to mock: {e}")
+                metrics.incr("tsfm.fallbacks")
+                mode = "mock"
                 # Fallback to mock if Chronos fails
                 point_forecast, lower_bound, upper_bound = self._generate_realistic_mock_forecast(
                     input_data.series,
@@ -230,12 +245,14 @@ class ChronosInferenceEngine:
                 )
         else:
             # REALISTIC MOCK MODE (when library not installed)
+            mode = "mock"
             point_forecast, lower_bound, upper_bound = self._generate_realistic_mock_forecast(
                 input_data.series,
                 forecast_horizon
             )
         
         inference_time_ms = (time.time() - start_time) * 1000
+        metrics.observe("tsfm.inference", inference_time_ms, mode=mode)
         
         # Build output
         output = ForecastOutput(
@@ -277,27 +294,67 @@ class ChronosInferenceEngine:
         
         start_time = time.time()
         
-        forecasts = []
-        for i, series in enumerate(input_data.series_list):
-            metadata = None
-            if input_data.metadata_list and i < len(input_data.metadata_list):
-                metadata = input_data.metadata_list[i]
-            
-            forecast_input = ForecastInput(
-                series=series,
-                forecast_horizon=input_data.forecast_horizon,
-                context_length=input_data.context_length,
-                metadata=metadata
-            )
+        series_list = input_data.series_list
+        metadata_list = [
+            input_data.metadata_list[i] if input_data.metadata_list and i < len(input_data.metadata_list) else None
+            for i in range(len(series_list))
+        ]
+        
+        if self.pipeline is None:
+            # REALISTIC MOCK MODE: per-series, identical to forecast()
+            forecasts = [
+                self.forecast(
+                    ForecastInput(
+                        series=series,
+                        forecast_horizon=input_data.forecast_horizon,
+                        context_length=input_data.context_length,
+                        metadata=metadata
+                    ),
+                    num_samples=num_samples,
+                    temperature=temperature
+                )
+                for series, metadata in zip(series_list, metadata_list)
+            ]
+        else:
+            # REAL CHRONOS INFERENCE: one pipeline call for the whole batch
+            try:
+                bounds = forecast_series_batch(
+                    model=self.pipeline,
+                    series_list=series_list,
+                    forecast_horizon=input_data.forecast_horizon,
+                    context_length=input_data.context_length,
+                    num_samples=num_samples
+                )
+            except Exception as e:
+                logger.warning(f"Batched Chronos inference failed, falling back to mock: {e}")
+                metrics.incr("tsfm.fallbacks")
+                bounds = [
+                    self._generate_realistic_mock_forecast(series, input_data.forecast_horizon)
+                    for series in series_list
+                ]
             
-            forecast = self.forecast(
-                forecast_input,
-                num_samples=num_samples,
-                temperature=temperature
-            )
-            forecasts.append(forecast)
+            per_series_ms = (time.time() - start_time) * 1000 / len(series_list)
+            forecasts = [
+                ForecastOutput(
+                    point_forecast=point_forecast.tolist(),
+                    lower_bound=lower_bound.tolist(),
+                    upper_bound=upper_bound.tolist(),
+                    forecast_horizon=input_data.forecast_horizon,
+                    model_name=self.model_name,
+                    inference_time_ms=per_series_ms,
+                    metadata=metadata
+                )
+                for (point_forecast, lower_bound, upper_bound), metadata in zip(bounds, metadata_list)
+            ]
         
         total_time_ms = (time.time() - start_time) * 1000
+        metrics.observe("tsfm.batch_inference", total_time_ms)
+        metrics.incr("tsfm.batch_series", len(forecasts))
+        
+        logger.info(
+            f"Generated {len(forecasts)} forecasts in batch: "
+            f"horizon={input_data.forecast_horizon}, time={total_time_ms:.1f}ms"
+        )
         
         return BatchForecastOutput(
             forecasts=forecasts,
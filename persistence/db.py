@@ -1,18 +1,97 @@
-"""Database connection and session management."""
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+"""Database connection and session management.
+
+The API, trigger evaluator, portfolio sync and heartbeat workers all write to
+the same SQLite file, so every connection is tuned for concurrent access:
+
+- WAL journaling (readers never block the writer and vice versa)
+- busy timeout (writers wait for the lock instead of failing with
+  "database is locked")
+- synchronous=NORMAL, in-memory temp store and a larger page cache
+
+Use session_scope() for a unit of work (one transaction, committed or rolled
+back as a whole); write units take the write lock up front with
+BEGIN IMMEDIATE so they never fail half-way on a lock upgrade.
+"""
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 from pathlib import Path
 
-# SQLite database path
-db_path = Path(__file__).parent.parent / "data" / "fuggerbot.db"
+# SQLite database path (FUGGERBOT_DB_PATH overrides, e.g. for benchmarks)
+db_path = Path(os.getenv("FUGGERBOT_DB_PATH") or Path(__file__).parent.parent / "data" / "fuggerbot.db")
 db_path.parent.mkdir(parents=True, exist_ok=True)
 
-# Create engine
-engine = create_engine(f"sqlite:///{db_path}", echo=False)
+# Seconds a connection waits for a lock held by another process
+BUSY_TIMEOUT_SECONDS = 30
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": BUSY_TIMEOUT_SECONDS * 1000,
+    "temp_store": "MEMORY",
+    "cache_size": -20000,  # KiB (~20 MB)
+    "mmap_size": 128 * 1024 * 1024,
+}
+
+# Create engine (pooled connections, shareable across worker threads)
+engine = create_engine(
+    f"sqlite:///{db_path}",
+    echo=False,
+    connect_args={"timeout": BUSY_TIMEOUT_SECONDS, "check_same_thread": False},
+    pool_size=10,
+    max_overflow=10,
+)
+
+
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    """Apply pragmas and let SQLAlchemy (not pysqlite) emit BEGIN."""
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+@event.listens_for(engine, "begin")
+def _begin_transaction(conn):
+    conn.exec_driver_sql(conn.get_execution_options().get("sqlite_begin", "BEGIN"))
+
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+@contextmanager
+def session_scope(write: bool = True) -> Iterator[Session]:
+    """
+    Session for one unit of work.
+
+    Commits when the block succeeds, rolls back if it raises, always closes.
+
+    Args:
+        write: Take the database write lock at the start (BEGIN IMMEDIATE);
+            False for read-only units
+
+    Yields:
+        Session
+    """
+    session = SessionLocal()
+    try:
+        if write:
+            session.connection(execution_options={"sqlite_begin": "BEGIN IMMEDIATE"})
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 # Import models to ensure they're registered
 from persistence.models_paper import Base as PaperBase
 from persistence.models_triggers import Base as TriggerBase
@@ -29,3 +108,7 @@ TradesBase.metadata.create_all(bind=engine)
 PortfolioBase.metadata.create_all(bind=engine)
 BacktestBase.metadata.create_all(bind=engine)
 
+# Bring indexes on existing databases up to date
+from persistence.migrations import apply_migrations
+
+apply_migrations(engine)
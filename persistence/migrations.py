@@ -0,0 +1,70 @@
+"""Idempotent schema migrations for the SQLite database.
+
+`create_all` only creates indexes together with a new table, so databases
+created by older versions miss indexes added to the models later, and some
+hot list queries (filter + ORDER BY time) need composite indexes the models
+don't declare. Each migration here is safe to re-run.
+"""
+import logging
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# (index name, table, columns) for the hot query columns
+INDEXES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    # Trigger evaluator / trigger API
+    ("ix_trigger_events_symbol_timestamp", "trigger_events", ("symbol", "timestamp")),
+    ("ix_trigger_events_trigger_id_timestamp", "trigger_events", ("trigger_id", "timestamp")),
+    ("ix_trigger_results_trigger_id_fired_at", "trigger_results", ("trigger_id", "fired_at")),
+    ("ix_trade_candidates_trigger_id_created_at", "trade_candidates", ("trigger_id", "created_at")),
+    ("ix_trade_candidates_symbol_created_at", "trade_candidates", ("symbol", "created_at")),
+    ("ix_trade_candidates_action_created_at", "trade_candidates", ("action", "created_at")),
+    # Trade approval / history endpoints
+    ("ix_trade_requests_status_paper_requested_at", "trade_requests", ("status", "paper_trading", "requested_at")),
+    ("ix_trade_requests_symbol_requested_at", "trade_requests", ("symbol", "requested_at")),
+    ("ix_trade_executions_status", "trade_executions", ("status",)),
+    ("ix_trade_executions_paper_execution_time", "trade_executions", ("paper_trading", "execution_time")),
+    ("ix_trade_executions_symbol_execution_time", "trade_executions", ("symbol", "execution_time")),
+    # Portfolio sync / heartbeat
+    ("ix_account_state_timestamp", "account_state", ("timestamp",)),
+    ("ix_portfolio_positions_symbol", "portfolio_positions", ("symbol",)),
+    ("ix_ibkr_status_paper_last_checked", "ibkr_status", ("paper_trading", "last_checked")),
+    # Paper trading
+    ("ix_paper_trades_symbol_timestamp", "paper_trades", ("symbol", "timestamp")),
+    ("ix_paper_trades_timestamp", "paper_trades", ("timestamp",)),
+    # Backtests
+    ("ix_backtests_symbol_created_at", "backtests", ("symbol", "created_at")),
+    ("ix_backtests_forecast_id_created_at", "backtests", ("forecast_id", "created_at")),
+]
+
+
+def apply_migrations(engine: Engine) -> int:
+    """
+    Create missing indexes and refresh the query planner statistics.
+
+    Args:
+        engine: SQLAlchemy engine for the database
+
+    Returns:
+        Number of indexes created
+    """
+    tables = set(inspect(engine).get_table_names())
+    created = 0
+    with engine.begin() as conn:
+        existing = {
+            row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+        }
+        for name, table, columns in INDEXES:
+            if table not in tables or name in existing:
+                continue
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+            created += 1
+
+    if created:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA optimize")
+        logger.info(f"Created {created} database indexes")
+    return created
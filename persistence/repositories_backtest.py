@@ -1,4 +1,8 @@
-"""Repository classes for backtest results."""
+"""Repository classes for backtest results.
+
+upsert_backtests writes many rows in one statement and does not commit; call
+it inside a persistence.db.session_scope() unit of work.
+"""
 from __future__ import annotations
 
 from typing import List, Optional, Dict, Any
@@ -7,6 +11,7 @@ import json
 
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from persistence.models_backtest import Backtest
 
@@ -57,6 +62,42 @@ class BacktestRepository:
         self.session.refresh(backtest)
         return backtest
 
+    def upsert_backtests(self, backtests: List[Dict[str, Any]]) -> List[int]:
+        """
+        Bulk insert-or-replace backtest results keyed by backtest_id.
+        
+        Args:
+            backtests: Dicts with the add_backtest arguments
+        
+        Returns:
+            Row IDs of the written backtests, in input order
+        """
+        if not backtests:
+            return []
+        now = datetime.utcnow()
+        rows = [
+            {
+                "backtest_id": b["backtest_id"],
+                "forecast_id": b["forecast_id"],
+                "symbol": b["symbol"],
+                "horizon": b["horizon"],
+                "realised_series": json.dumps(b["realised_series"]),
+                "metrics": json.dumps(b["metrics"]),
+                "backtest_metadata": json.dumps(b["metadata"]) if b.get("metadata") else None,
+                "created_at": now,
+            }
+            for b in backtests
+        ]
+        stmt = sqlite_insert(Backtest)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Backtest.backtest_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in ("forecast_id", "symbol", "horizon", "realised_series", "metrics", "backtest_metadata")
+            },
+        ).returning(Backtest.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+
     def get_by_id(self, backtest_id: str) -> Optional[Backtest]:
         """Get backtest by backtest_id."""
         return (
@@ -1,6 +1,12 @@
-"""Repositories for paper trading data."""
+"""Repositories for paper trading data.
+
+add_positions / add_trades flush many rows at once and do not commit; call
+them inside a persistence.db.session_scope() unit of work.
+"""
 from __future__ import annotations
 
+from typing import Iterable, List
+
 from sqlalchemy.orm import Session
 
 from persistence.models_paper import PaperTrade, Position
@@ -19,6 +25,12 @@ class PositionRepository:
         self.session.add(position)
         self.session.commit()
 
+    def add_positions(self, positions: Iterable[Position]) -> List[int]:
+        positions = list(positions)
+        self.session.add_all(positions)
+        self.session.flush()
+        return [p.id for p in positions]
+
 
 class PaperTradeRepository:
     """Repository for managing paper trades."""
@@ -37,6 +49,12 @@ class PaperTradeRepository:
         self.session.add(trade)
         self.session.commit()
 
+    def add_trades(self, trades: Iterable[PaperTrade]) -> List[int]:
+        trades = list(trades)
+        self.session.add_all(trades)
+        self.session.flush()
+        return [t.id for t in trades]
+
 
 
 
@@ -1,13 +1,28 @@
-"""Repository classes for account state and portfolio positions."""
+"""Repository classes for account state and portfolio positions.
+
+The bulk methods (add_states, add_state_if_changed, upsert_positions) do not
+commit; call them inside a persistence.db.session_scope() unit of work.
+"""
 from __future__ import annotations
 
-from typing import List, Optional
+import math
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from persistence.models_portfolio import AccountState, Position
 
+ACCOUNT_FIELDS = ("cash", "buying_power", "realized_pnl", "unrealized_pnl", "equity")
+POSITION_FIELDS = ("quantity", "avg_cost", "market_value", "unrealized_pnl")
+
+
+def _same(a: Optional[float], b: Optional[float]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
 
 class AccountStateRepository:
     """Repository for managing account state snapshots."""
@@ -38,6 +53,53 @@ class AccountStateRepository:
         self.session.refresh(state)
         return state
 
+    def add_states(self, states: List[Dict]) -> List[int]:
+        """
+        Bulk-insert account state snapshots in one statement.
+
+        Args:
+            states: Dicts with cash, buying_power, realized_pnl, unrealized_pnl,
+                equity and optional timestamp
+
+        Returns:
+            IDs of the inserted snapshots, in input order
+        """
+        if not states:
+            return []
+        now = datetime.utcnow()
+        rows = [
+            {**{f: s[f] for f in ACCOUNT_FIELDS}, "timestamp": s.get("timestamp") or now}
+            for s in states
+        ]
+        stmt = insert(AccountState).returning(AccountState.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+
+    def add_state_if_changed(
+        self,
+        cash: float,
+        buying_power: float,
+        realized_pnl: float,
+        unrealized_pnl: float,
+        equity: float,
+    ) -> Optional[int]:
+        """
+        Insert a snapshot only if it differs from the latest one.
+
+        Returns:
+            ID of the new snapshot, or None if the values were unchanged
+        """
+        values = dict(
+            cash=cash,
+            buying_power=buying_power,
+            realized_pnl=realized_pnl,
+            unrealized_pnl=unrealized_pnl,
+            equity=equity,
+        )
+        latest = self.get_latest()
+        if latest is not None and all(_same(getattr(latest, f), values[f]) for f in ACCOUNT_FIELDS):
+            return None
+        return self.add_states([values])[0]
+
     def get_latest(self) -> Optional[AccountState]:
         """Get the most recent account state snapshot."""
         return (
@@ -116,3 +178,69 @@ class PositionRepository:
         self.session.delete(position)
         self.session.commit()
         return True
+
+    def sync_positions(self, positions: Iterable[Dict], commit: bool = True) -> Dict[str, int]:
+        """
+        Make the stored positions match `positions` in one transaction.
+
+        The diff is computed in memory against a single read of the table:
+        new symbols are inserted, changed rows updated, missing symbols
+        deleted, and unchanged rows left alone. Nothing is committed when
+        nothing changed.
+
+        Args:
+            positions: Dicts with symbol, quantity, avg_cost, market_value,
+                unrealized_pnl (later entries win for duplicate symbols)
+            commit: Commit if anything changed (False when the caller's
+                session_scope owns the transaction)
+
+        Returns:
+            Counts of inserted, updated, deleted and unchanged positions
+        """
+        return self._apply_positions(positions, delete_missing=True, commit=commit)
+
+    def upsert_positions(self, positions: Iterable[Dict]) -> Dict[str, int]:
+        """
+        Bulk upsert_position: insert or update many positions at once.
+
+        Positions not in `positions` are kept; unchanged rows are not rewritten.
+
+        Returns:
+            Counts of inserted, updated, deleted (duplicate rows) and unchanged positions
+        """
+        return self._apply_positions(positions, delete_missing=False, commit=False)
+
+    def _apply_positions(self, positions: Iterable[Dict], delete_missing: bool, commit: bool) -> Dict[str, int]:
+        incoming = {p["symbol"].upper(): p for p in positions}
+        stored: Dict[str, Position] = {}
+        counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        now = datetime.utcnow()
+
+        for position in self.list_positions():
+            if position.symbol not in stored and (position.symbol in incoming or not delete_missing):
+                stored[position.symbol] = position
+            else:
+                # No longer held (or a duplicate row for the symbol)
+                self.session.delete(position)
+                counts["deleted"] += 1
+
+        for symbol, data in incoming.items():
+            position = stored.get(symbol)
+            if position is None:
+                self.session.add(Position(
+                    symbol=symbol,
+                    updated_at=now,
+                    **{f: data[f] for f in POSITION_FIELDS},
+                ))
+                counts["inserted"] += 1
+            elif all(_same(getattr(position, f), data[f]) for f in POSITION_FIELDS):
+                counts["unchanged"] += 1
+            else:
+                for f in POSITION_FIELDS:
+                    setattr(position, f, data[f])
+                position.updated_at = now
+                counts["updated"] += 1
+
+        if commit and (counts["inserted"] or counts["updated"] or counts["deleted"]):
+            self.session.commit()
+        return counts
@@ -1,6 +1,11 @@
-"""Repository classes for trade requests and executions."""
+"""Repository classes for trade requests and executions.
+
+The bulk methods (add_trade_requests, update_statuses, record_executions)
+write many rows in one statement and do not commit; call them inside a
+persistence.db.session_scope() unit of work.
+"""
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, insert, update
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
@@ -66,6 +71,40 @@ class TradeRequestRepository:
         self.session.refresh(trade_request)
         return trade_request
     
+    def add_trade_requests(self, requests: List[Dict[str, Any]]) -> List[int]:
+        """
+        Bulk add_trade_request.
+        
+        Args:
+            requests: Dicts with the add_trade_request arguments
+        
+        Returns:
+            IDs of the inserted requests, in input order
+        """
+        if not requests:
+            return []
+        now = datetime.utcnow()
+        rows = [
+            {
+                "trade_id": r["trade_id"],
+                "approval_code": r["approval_code"],
+                "symbol": r["symbol"],
+                "action": r["action"],
+                "quantity": r["quantity"],
+                "order_type": r["order_type"],
+                "price": r.get("price"),
+                "expires_at": r.get("expires_at"),
+                "forecast_id": r.get("forecast_id"),
+                "trade_details": json.dumps(r["trade_details"]) if r.get("trade_details") else None,
+                "paper_trading": r.get("paper_trading", False),
+                "status": "pending",
+                "requested_at": now,
+            }
+            for r in requests
+        ]
+        stmt = insert(TradeRequest).returning(TradeRequest.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+    
     def list_pending_requests(
         self,
         paper_trading: Optional[bool] = None,
@@ -144,6 +183,33 @@ class TradeRequestRepository:
         self.session.refresh(trade_request)
         return trade_request
     
+    def update_statuses(self, trade_ids: List[str], status: str) -> List[int]:
+        """
+        Set the status of many trade requests in one UPDATE.
+        
+        Args:
+            trade_ids: Trade IDs to update
+            status: New status (submitted, approved, rejected, expired)
+        
+        Returns:
+            IDs of the updated requests
+        """
+        if not trade_ids:
+            return []
+        values: Dict[str, Any] = {"status": status}
+        if status == "approved":
+            values["approved_at"] = datetime.utcnow()
+        elif status == "rejected":
+            values["rejected_at"] = datetime.utcnow()
+        stmt = (
+            update(TradeRequest)
+            .where(TradeRequest.trade_id.in_(trade_ids))
+            .values(**values)
+            .returning(TradeRequest.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(self.session.scalars(stmt))
+    
     def list_all(
         self,
         paper_trading: Optional[bool] = None,
@@ -224,6 +290,39 @@ class TradeExecutionRepository:
         self.session.refresh(execution)
         return execution
     
+    def record_executions(self, executions: List[Dict[str, Any]]) -> List[int]:
+        """
+        Bulk record_execution.
+        
+        Args:
+            executions: Dicts with the record_execution arguments
+        
+        Returns:
+            IDs of the inserted executions, in input order
+        """
+        if not executions:
+            return []
+        now = datetime.utcnow()
+        rows = [
+            {
+                "trade_request_id": e["trade_request_id"],
+                "symbol": e["symbol"],
+                "action": e["action"],
+                "quantity": e["quantity"],
+                "execution_price": e["execution_price"],
+                "execution_time": e.get("execution_time") or now,
+                "status": e["status"],
+                "order_id": e.get("order_id"),
+                "broker_response": json.dumps(e["broker_response"]) if e.get("broker_response") else None,
+                "forecast_id": e.get("forecast_id"),
+                "paper_trading": e.get("paper_trading", False),
+                "error_message": e.get("error_message"),
+            }
+            for e in executions
+        ]
+        stmt = insert(TradeExecution).returning(TradeExecution.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+    
     def get_by_trade_request_id(self, trade_request_id: int) -> List[TradeExecution]:
         """Get all executions for a trade request."""
         return (
@@ -6,7 +6,7 @@ from datetime import datetime
 import json
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, insert
 
 from persistence.models_triggers import TriggerResult, TradeCandidate
 
@@ -45,6 +45,32 @@ class TriggerResultRepository:
         self.session.refresh(result)
         return result
 
+    def add_results(self, results: List[Dict[str, Any]]) -> List[int]:
+        """
+        Bulk-insert trigger results in one statement (not committed; use
+        inside a session_scope unit of work).
+        
+        Args:
+            results: Dicts with trigger_id, data_snapshot and optional fired_at
+        
+        Returns:
+            IDs of the inserted results, in input order
+        """
+        if not results:
+            return []
+        now = datetime.utcnow()
+        rows = [
+            {
+                "trigger_id": r["trigger_id"],
+                "fired_at": r.get("fired_at") or now,
+                "data_snapshot": json.dumps(r["data_snapshot"]),
+                "created_at": now,
+            }
+            for r in results
+        ]
+        stmt = insert(TriggerResult).returning(TriggerResult.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+
     def get_by_id(self, result_id: int) -> Optional[TriggerResult]:
         """Get trigger result by ID."""
         return self.session.query(TriggerResult).filter(TriggerResult.id == result_id).first()
@@ -146,6 +172,36 @@ class TradeCandidateRepository:
         self.session.refresh(candidate)
         return candidate
 
+    def add_candidates(self, candidates: List[Dict[str, Any]]) -> List[int]:
+        """
+        Bulk-insert trade candidates in one statement (not committed; use
+        inside a session_scope unit of work).
+        
+        Args:
+            candidates: Dicts with trigger_result_id, trigger_id, symbol, action,
+                confidence and optional metadata
+        
+        Returns:
+            IDs of the inserted candidates, in input order
+        """
+        if not candidates:
+            return []
+        now = datetime.utcnow()
+        rows = [
+            {
+                "trigger_result_id": c["trigger_result_id"],
+                "trigger_id": c["trigger_id"],
+                "symbol": c["symbol"],
+                "action": c["action"],
+                "confidence": c["confidence"],
+                "candidate_metadata": json.dumps(c["metadata"]) if c.get("metadata") else None,
+                "created_at": now,
+            }
+            for c in candidates
+        ]
+        stmt = insert(TradeCandidate).returning(TradeCandidate.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+
     def get_by_id(self, candidate_id: int) -> Optional[TradeCandidate]:
         """Get trade candidate by ID."""
         return self.session.query(TradeCandidate).filter(TradeCandidate.id == candidate_id).first()
@@ -4,9 +4,9 @@ import logging
 import re
 from typing import Optional, Dict, Any
 from pydantic import ValidationError
-from openai import OpenAI
 
 from reasoning.schemas import TradeContext, DeepSeekResponse, ReasoningDecision
+from core.metrics import metrics
 
 # Setup Logging
 logging.basicConfig(level=logging.INFO)
@@ -19,9 +19,19 @@ class MetaCriticAgent:
     Orchestrates Proposer -> Critic -> Verdict reasoning chains.
     """
     def __init__(self, api_key: str, base_url: str = "https://api.deepseek.com/v1", model: str = "deepseek-reasoner"):
+        from openai import OpenAI  # ~1s import, paid when the engine is first built
         self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
 
+    def _complete(self, step: str, **kwargs):
+        """Chat completion for one reasoning step, timed and token-counted in core.metrics."""
+        with metrics.timer("llm.request", step=step, model=self.model):
+            response = self.client.chat.completions.create(model=self.model, **kwargs)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            metrics.incr("llm.tokens", getattr(usage, "prompt_tokens", 0) or 0, kind="prompt", model=self.model)
+            metrics.incr("llm.tokens", getattr(usage, "completion_tokens", 0) or 0, kind="completion", model=self.model)
+        return response
 
 
     def _get_system_prompt(self, red_team_mode: bool) -> str:
@@ -150,20 +160,26 @@ class MetaCriticAgent:
                 
         return data
 
-    def analyze_trade(self, context: TradeContext, mode: str = "standard") -> Optional[DeepSeekResponse]:
+    def analyze_trade(
+        self,
+        context: TradeContext,
+        mode: str = "standard",
+        red_team_mode: bool = False
+    ) -> Optional[DeepSeekResponse]:
         """
         Analyze trade with MetaCritic flow.
         
         Modes:
         - "standard": Balanced analysis.
-        - "adversarial": Trigger separate Proposer/Critic agents.
+        - "adversarial": Trigger separate Proposer/Critic agents
+          (also selected by red_team_mode=True, as the orchestrator passes it).
         
         Flow:
         1. ProposerAgent: Generates thesis (even if weak).
         2. CriticAgent (Adversarial only): Attacks thesis.
         3. VerdictAgent: Synthesizes final decision.
         """
-        red_team_mode = (mode == "adversarial")
+        red_team_mode = red_team_mode or (mode == "adversarial")
         
         # Step A: Proposer Agent (The "Bull")
         # In adversarial mode, the Proposer tries to sell it, the Critic tries to kill it.
@@ -191,8 +207,8 @@ class MetaCriticAgent:
         
         try:
             # Step A: Get initial proposal
-            proposer_response = self.client.chat.completions.create(
-                model=self.model,
+            proposer_response = self._complete(
+                "proposer",
                 messages=[
                     {"role": "system", "content": self._get_system_prompt(False)},  # Standard mode for initial thesis
                     {"role": "user", "content": proposer_prompt}
@@ -220,8 +236,8 @@ class MetaCriticAgent:
                 try:
                     adversarial_prompt = self._get_adversarial_prompt(initial_thesis)
                     
-                    critique_response = self.client.chat.completions.create(
-                        model=self.model,
+                    critique_response = self._complete(
+                        "critic",
                         messages=[
                             {"role": "system", "content": "You are a CRITIC AGENT. Your job is to DEBUNK the Proposer."},
                             {"role": "user", "content": adversarial_prompt}
@@ -269,8 +285,8 @@ class MetaCriticAgent:
                 "The confidence should reflect the critique if provided."
             )
             
-            final_response = self.client.chat.completions.create(
-                model=self.model,
+            final_response = self._complete(
+                "verdict",
                 messages=[
                     {"role": "system", "content": self._get_system_prompt(red_team_mode)},
                     {"role": "user", "content": synthesis_prompt}
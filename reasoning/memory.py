@@ -15,6 +15,16 @@ from reasoning.schemas import ReasoningDecision, TradeContext, DeepSeekResponse
 logger = logging.getLogger(__name__)
 
 
+def closed_trades_log_path(memory_file: Path) -> Path:
+    """
+    Append-only log of trades as they close (one JSON record per line).
+    
+    Lets consumers such as the reviewer daemon pick up newly closed trades
+    without re-reading the whole memory file.
+    """
+    return memory_file.with_name(f"{memory_file.stem}_closed.jsonl")
+
+
 class TradeMemory:
     """Manages trade history and performance tracking for reasoning system."""
     
@@ -217,12 +227,22 @@ class TradeMemory:
                     trade["regret"] = None
                 
                 self._save_memory()
+                self._log_closed_trade(trade)
                 logger.info(f"Trade outcome updated: {trade_id} - {trade['outcome']} (PnL: {pnl:.2f})")
                 return True
         
         logger.warning(f"Trade ID {trade_id} not found in memory")
         return False
     
+    def _log_closed_trade(self, trade: Dict[str, Any]) -> None:
+        """Append a closed trade snapshot to the closed-trades log."""
+        record = {"closed_at": datetime.now().isoformat(), "trade": trade}
+        try:
+            with open(closed_trades_log_path(self.memory_file), "a") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+        except Exception as e:
+            logger.warning(f"Could not append to closed-trades log: {e}")
+    
     def get_summary(self, symbol: Optional[str] = None) -> str:
         """
         Get performance summary for symbol (or all trades if symbol is None).
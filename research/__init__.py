@@ -3,10 +3,8 @@ Research module for FuggerBot.
 
 Contains tools for mining historical data and building learning datasets.
 """
-from research.miner import HistoryMiner, main
+from research.miner import LearningBookMiner
 
 __all__ = [
-    "mine_asset",
-    "main",
+    "LearningBookMiner",
 ]
-
@@ -21,14 +21,20 @@ import pandas as pd
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Import technical analysis library (Phase 3)
 from models.technical_analysis import add_indicators, is_quality_setup
+from services.lake_snapshot import LakeSnapshot, open_lake_snapshot
+from core.metrics import metrics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Assets and window mined by run() (also fingerprinted by the optimization scheduler)
+MINING_SYMBOLS = ["BTC-USD", "ETH-USD", "NVDA", "MSFT", "AAPL", "GOOGL"]
+MINING_LOOKBACK_DAYS = 730  # 2 years
+
 
 class LearningBookMiner:
     """
@@ -38,10 +44,20 @@ class LearningBookMiner:
     def __init__(
         self,
         db_path: Path = PROJECT_ROOT / "data" / "market_history.duckdb",
-        output_path: Path = PROJECT_ROOT / "data" / "learning_book.json"
+        output_path: Path = PROJECT_ROOT / "data" / "learning_book.json",
+        preloaded_data: Optional[Dict[str, pd.DataFrame]] = None
     ):
+        """
+        Args:
+            db_path: Path to the DuckDB Data Lake
+            output_path: Where to write learning_book.json
+            preloaded_data: Optional full OHLCV history per symbol already held
+                in memory, or a LakeSnapshot; symbols found here are not
+                queried from DuckDB
+        """
         self.db_path = db_path
         self.output_path = output_path
+        self.preloaded_data = preloaded_data or {}
         self.conn = None
     
     def connect(self):
@@ -64,14 +80,15 @@ class LearningBookMiner:
         Returns:
             List of pattern records
         """
-        if not self.conn:
+        if not self.conn and not (symbols and all(s in self.preloaded_data for s in symbols)):
             self.connect()
         
         # Get available symbols if not specified
         if not symbols:
-            symbols_df = self.conn.execute(
-                "SELECT DISTINCT symbol FROM ohlcv_history WHERE asset_class IN ('CRYPTO', 'STOCKS') ORDER BY symbol"
-            ).fetchdf()
+            with metrics.timer("duckdb.query", query="miner_symbols"):
+                symbols_df = self.conn.execute(
+                    "SELECT DISTINCT symbol FROM ohlcv_history WHERE asset_class IN ('CRYPTO', 'STOCKS') ORDER BY symbol"
+                ).fetchdf()
             symbols = symbols_df['symbol'].tolist()
         
         logger.info(f"🔍 Mining patterns for {len(symbols)} symbols over {lookback_days} days...")
@@ -81,15 +98,10 @@ class LearningBookMiner:
         for symbol in symbols:
             try:
                 # Fetch data for symbol
-                query = f"""
-                    SELECT date, open, high, low, close, volume
-                    FROM ohlcv_history
-                    WHERE symbol = '{symbol}'
-                    AND date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
-                    ORDER BY date
-                """
-                
-                df = self.conn.execute(query).fetchdf()
+                if symbol in self.preloaded_data:
+                    df = self._slice_preloaded(symbol, lookback_days)
+                else:
+                    df = self._query_symbol(symbol, lookback_days)
                 
                 if len(df) < 60:  # Need more data for technical indicators
                     logger.warning(f"⚠️  Insufficient data for {symbol} ({len(df)} rows, need 60+)")
@@ -173,6 +185,27 @@ class LearningBookMiner:
         
         return all_patterns
     
+    def _query_symbol(self, symbol: str, lookback_days: int) -> pd.DataFrame:
+        """Fetch the lookback window for a symbol from DuckDB."""
+        query = f"""
+            SELECT date, open, high, low, close, volume
+            FROM ohlcv_history
+            WHERE symbol = '{symbol}'
+            AND date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
+            ORDER BY date
+        """
+        with metrics.timer("duckdb.query", query="miner_window"):
+            return self.conn.execute(query).fetchdf()
+    
+    def _slice_preloaded(self, symbol: str, lookback_days: int) -> pd.DataFrame:
+        """Take the lookback window for a symbol from preloaded history."""
+        cutoff = pd.Timestamp(datetime.now().date() - timedelta(days=lookback_days))
+        if isinstance(self.preloaded_data, LakeSnapshot):
+            return self.preloaded_data.window(symbol, start=cutoff)
+        full = self.preloaded_data[symbol]
+        mask = pd.to_datetime(full['date']) >= cutoff
+        return full.loc[mask, ['date', 'open', 'high', 'low', 'close', 'volume']].reset_index(drop=True)
+    
     def save_learning_book(self, patterns: List[Dict[str, Any]]):
         """Save patterns to learning book JSON."""
         # Calculate quality metrics
@@ -216,8 +249,7 @@ class LearningBookMiner:
         self.connect()
         
         # Mine patterns for key assets
-        symbols = ["BTC-USD", "ETH-USD", "NVDA", "MSFT", "AAPL", "GOOGL"]
-        patterns = self.mine_patterns(symbols=symbols, lookback_days=730)  # 2 years
+        patterns = self.mine_patterns(symbols=MINING_SYMBOLS, lookback_days=MINING_LOOKBACK_DAYS)
         
         # Save to learning book
         self.save_learning_book(patterns)
@@ -234,7 +266,9 @@ class LearningBookMiner:
 
 
 if __name__ == "__main__":
-    miner = LearningBookMiner()
+    # Map the shared lake snapshot when current (see services/lake_snapshot.py)
+    miner = LearningBookMiner(preloaded_data=open_lake_snapshot())
+    metrics.start_snapshot_writer("miner")
     patterns = miner.run()
     
     # Calculate metrics
@@ -145,11 +145,10 @@ class StressTester:
         logger.info(f"🔍 Running stress test for {symbol} from {start_date}...")
         
         try:
-            import yfinance as yf
+            from services.market_data_gateway import get_market_data_gateway
             
-            # Fetch hourly data
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(start=start_date, interval="1h", progress=False)
+            # Fetch hourly data (local cache first; upstream only for missing bars)
+            df = get_market_data_gateway().get_bars(symbol, period=None, interval="1h", start=start_date)
             
             if df.empty:
                 logger.warning(f"⚠️ No data for {symbol}")
@@ -165,17 +164,6 @@ class StressTester:
                     "error": "No data"
                 }
             
-            # Clean data
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            
-            if 'Close' not in df.columns:
-                if 'Adj Close' in df.columns:
-                    df['Close'] = df['Adj Close']
-                else:
-                    logger.error(f"❌ No Close column for {symbol}")
-                    return {"symbol": symbol, "error": "No Close column"}
-            
             df = df[['Close']].dropna()
             
             if len(df) < MIN_DATA_POINTS + HORIZON:
@@ -17,7 +17,8 @@ sys.path.insert(0, str(project_root))
 
 from engine import TradeOrchestrator
 from config import get_settings
-from core.logger import logger
+from core.logger import logger, enable_queue_logging
+from core.metrics import get_metrics
 
 # Configure logging for CLI
 logging.basicConfig(
@@ -29,6 +30,9 @@ logging.basicConfig(
 # Target assets to process
 TARGET_ASSETS = ['BTC-USD', 'ETH-USD', 'NVDA']
 
+# Re-run an asset before the interval elapses if its live price moves this much
+EARLY_RUN_MOVE_PCT = 2.0
+
 
 def print_summary(decision, elapsed_time: float = 0.0):
     """
@@ -142,8 +146,9 @@ def run_once():
     # Initialize orchestrator
     orchestrator = None
     try:
-        orchestrator = TradeOrchestrator(env="dev")
+        orchestrator = TradeOrchestrator(env="dev", background_warm_up=True)
         print("✅ TradeOrchestrator initialized")
+        get_metrics().start_snapshot_writer("run_bot")
         print()
     except Exception as e:
         print(f"❌ ERROR: Failed to initialize TradeOrchestrator: {e}")
@@ -193,6 +198,7 @@ def run_once():
         
         print(f"\n📅 Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
+        orchestrator.log_startup_report()
     finally:
         # Graceful shutdown: disconnect from IBKR
         if orchestrator is not None:
@@ -231,15 +237,23 @@ def run_continuous(interval_seconds: int = 300):
     # Initialize orchestrator
     orchestrator = None
     try:
-        orchestrator = TradeOrchestrator(env="dev")
+        orchestrator = TradeOrchestrator(env="dev", background_warm_up=True)
         print("✅ TradeOrchestrator initialized")
+        get_metrics().start_snapshot_writer("run_bot")
         print()
     except Exception as e:
         print(f"❌ ERROR: Failed to initialize TradeOrchestrator: {e}")
         logger.error(f"Orchestrator initialization failed: {e}", exc_info=True)
         return
     
+    # Shared live quote feed: wake early on large moves instead of sleeping blind
+    from services.market_data_bus import start_market_data_feed
+    bus = start_market_data_feed()
+    bus.watch(TARGET_ASSETS)
+    
     run_count = 0
+    assets = TARGET_ASSETS
+    next_full_run = time.monotonic() + interval_seconds
     
     try:
         while True:
@@ -250,7 +264,7 @@ def run_continuous(interval_seconds: int = 300):
             print()
             
             # Process each asset
-            for asset in TARGET_ASSETS:
+            for asset in assets:
                 print(f"🔄 Processing {asset}...")
                 start_time = time.time()
                 
@@ -265,6 +279,9 @@ def run_continuous(interval_seconds: int = 300):
                     print()
                     logger.error(f"Error processing {asset}: {e}", exc_info=True)
             
+            if run_count == 1:
+                orchestrator.log_startup_report()
+            
             # Update outcomes for recent trades (every run)
             try:
                 from tools.update_outcomes import update_trade_outcomes
@@ -274,10 +291,18 @@ def run_continuous(interval_seconds: int = 300):
             except Exception as e:
                 logger.debug(f"Could not update outcomes: {e}")
             
-            # Wait before next run
-            print(f"⏸️  Waiting {interval_seconds}s before next run...")
+            # Wait until the next full run is due (or a target asset moves sharply).
+            # Early runs only cover the movers, so they never push back the full run.
+            wait_seconds = max(0.0, next_full_run - time.monotonic())
+            print(f"⏸️  Waiting {wait_seconds:.0f}s before next run...")
             print()
-            time.sleep(interval_seconds)
+            moved = bus.wait_for_move(TARGET_ASSETS, EARLY_RUN_MOVE_PCT, timeout=wait_seconds)
+            if not moved or time.monotonic() >= next_full_run:
+                assets = TARGET_ASSETS
+                next_full_run = time.monotonic() + interval_seconds
+            else:
+                print(f"⚡ Price move ≥{EARLY_RUN_MOVE_PCT}% on {', '.join(moved)} - running early")
+                assets = [a for a in TARGET_ASSETS if a.upper() in moved]
             
     except KeyboardInterrupt:
         print()
@@ -317,6 +342,8 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    enable_queue_logging()  # Format/write log records off the trading loop
+    
     if args.continuous:
         run_continuous(interval_seconds=args.interval)
     else:
@@ -0,0 +1,238 @@
+"""
+Trade Approval Registry
+
+Pending trade approvals are parked here instead of being polled for by the
+thread that requested them. Waiters (asyncio futures, blocking waits and
+callbacks) are woken the moment an approval is decided:
+
+- In-process API/dashboard approvals resolve immediately via
+  RiskControlService._mark_approved / TradeService.reject_trade
+- SMS replies and decisions made by other processes are picked up by one
+  shared poller thread that checks every pending approval in a single pass
+  and exits when nothing is pending
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ApprovalCallback = Callable[[str, bool], None]
+
+# Decisions remembered so late waiters return immediately
+MAX_DECIDED = 1000
+
+
+@dataclass
+class PendingApproval:
+    """An approval awaiting a decision."""
+    trade_id: str
+    expires_at: float
+    event: threading.Event = field(default_factory=threading.Event)
+    futures: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = field(default_factory=list)
+    callbacks: List[ApprovalCallback] = field(default_factory=list)
+
+
+class ApprovalRegistry:
+    """Registry of pending trade approvals with async/blocking waiters and callbacks."""
+
+    def __init__(self, poll_interval: float = 5.0):
+        """
+        Initialize approval registry.
+
+        Args:
+            poll_interval: Seconds between poller passes (SMS / cross-process decisions)
+        """
+        self.poll_interval = poll_interval
+        self._pending: Dict[str, PendingApproval] = {}
+        self._decided: "OrderedDict[str, Tuple[bool, Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._poller: Optional[Callable[[List[str]], None]] = None
+        self._poll_thread: Optional[threading.Thread] = None
+
+    def set_poller(self, poller: Callable[[List[str]], None]) -> None:
+        """
+        Set the function that checks pending approvals out-of-band.
+
+        Args:
+            poller: Called with the pending trade IDs; resolves decided ones via resolve()
+        """
+        self._poller = poller
+
+    def register(self, trade_id: str, timeout: float = 900) -> PendingApproval:
+        """
+        Park a trade awaiting approval.
+
+        Args:
+            trade_id: Confirmation trade ID
+            timeout: Seconds until the approval expires (resolved as not approved)
+
+        Returns:
+            PendingApproval entry
+        """
+        with self._lock:
+            return self._register_locked(trade_id, timeout)
+
+    def pending_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._pending)
+
+    def decision(self, trade_id: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """(approved, reason) if the trade was decided, else None."""
+        with self._lock:
+            return self._decided.get(trade_id)
+
+    def add_callback(self, trade_id: str, callback: ApprovalCallback) -> None:
+        """
+        Call callback(trade_id, approved) once the trade is decided.
+
+        Runs immediately if it already was; otherwise on the resolving thread.
+        """
+        with self._lock:
+            decided = self._decided.get(trade_id)
+            if decided is None:
+                self._register_locked(trade_id).callbacks.append(callback)
+                return
+        self._run_callback(callback, trade_id, decided[0])
+
+    async def wait(self, trade_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Await the approval decision without holding a thread.
+
+        Args:
+            trade_id: Confirmation trade ID
+            timeout: Seconds to wait; on timeout the trade is resolved as not approved
+
+        Returns:
+            True if approved
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            decided = self._decided.get(trade_id)
+            if decided is not None:
+                return decided[0]
+            future = loop.create_future()
+            self._register_locked(trade_id).futures.append((loop, future))
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.resolve(trade_id, False, "Approval Timeout")
+            return False
+
+    def wait_blocking(self, trade_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block the calling thread until the trade is decided (no polling latency).
+
+        Args:
+            trade_id: Confirmation trade ID
+            timeout: Seconds to wait; on timeout the trade is resolved as not approved
+
+        Returns:
+            True if approved
+        """
+        with self._lock:
+            decided = self._decided.get(trade_id)
+            if decided is not None:
+                return decided[0]
+            event = self._register_locked(trade_id).event
+
+        if not event.wait(timeout):
+            self.resolve(trade_id, False, "Approval Timeout")
+        decided = self.decision(trade_id)
+        return bool(decided and decided[0])
+
+    def resolve(self, trade_id: str, approved: bool, reason: Optional[str] = None) -> bool:
+        """
+        Record a decision and wake every waiter.
+
+        Args:
+            trade_id: Confirmation trade ID
+            approved: Whether the trade may execute
+            reason: Why it was not approved (timeout, rejection, ...)
+
+        Returns:
+            True if the trade was pending (first decision wins)
+        """
+        with self._lock:
+            if trade_id in self._decided:
+                return False
+            self._decided[trade_id] = (approved, reason)
+            while len(self._decided) > MAX_DECIDED:
+                self._decided.popitem(last=False)
+            pending = self._pending.pop(trade_id, None)
+
+        if pending is None:
+            return False
+
+        logger.info(
+            f"{'✅' if approved else '❌'} Approval {trade_id} resolved: "
+            f"{'approved' if approved else reason or 'not approved'}"
+        )
+        pending.event.set()
+        for loop, future in pending.futures:
+            loop.call_soon_threadsafe(self._set_future, future, approved)
+        for callback in pending.callbacks:
+            self._run_callback(callback, trade_id, approved)
+        return True
+
+    def _register_locked(self, trade_id: str, timeout: float = 900) -> PendingApproval:
+        """Get or create the pending entry and make sure the poller runs (lock held)."""
+        pending = self._pending.get(trade_id)
+        if pending is None:
+            pending = PendingApproval(trade_id=trade_id, expires_at=time.time() + timeout)
+            self._pending[trade_id] = pending
+        if self._poll_thread is None:
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop, name="ApprovalPoller", daemon=True
+            )
+            self._poll_thread.start()
+        return pending
+
+    @staticmethod
+    def _set_future(future: asyncio.Future, approved: bool) -> None:
+        if not future.done():
+            future.set_result(approved)
+
+    @staticmethod
+    def _run_callback(callback: ApprovalCallback, trade_id: str, approved: bool) -> None:
+        try:
+            callback(trade_id, approved)
+        except Exception as e:
+            logger.error(f"Approval callback for {trade_id} failed: {e}", exc_info=True)
+
+    def _poll_loop(self) -> None:
+        """Expire stale approvals and run the poller until nothing is pending."""
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                if not self._pending:
+                    self._poll_thread = None
+                    return
+                now = time.time()
+                expired = [tid for tid, p in self._pending.items() if p.expires_at <= now]
+                trade_ids = [tid for tid in self._pending if tid not in expired]
+
+            for trade_id in expired:
+                self.resolve(trade_id, False, "Approval Timeout")
+
+            if trade_ids and self._poller is not None:
+                try:
+                    self._poller(trade_ids)
+                except Exception as e:
+                    logger.error(f"Approval poller failed: {e}", exc_info=True)
+
+
+_approval_registry: Optional[ApprovalRegistry] = None
+
+
+def get_approval_registry() -> ApprovalRegistry:
+    """Get or create the shared approval registry."""
+    global _approval_registry
+    if _approval_registry is None:
+        _approval_registry = ApprovalRegistry()
+    return _approval_registry
@@ -17,7 +17,7 @@ from models.backtesting import ForecastBacktester
 from domain.forecast import Forecast
 from domain.backtest import BacktestResult, BacktestMetrics
 from services.forecast_service import get_forecast
-from persistence.db import SessionLocal
+from persistence.db import SessionLocal, session_scope
 from persistence.repositories_backtest import BacktestRepository
 from core.logger import logger
 from core.logger import log_backtest_result
@@ -138,7 +138,7 @@ class BacktestService:
             result: BacktestResult domain object to save
         """
         try:
-            with SessionLocal() as session:
+            with session_scope() as session:
                 repo = BacktestRepository(session)
                 
                 # Convert metrics to dict
@@ -155,15 +155,15 @@ class BacktestService:
                     "calibration_error": result.metrics.calibration_error,
                 }
                 
-                repo.add_backtest(
-                    backtest_id=result.id,
-                    forecast_id=result.forecast_id,
-                    symbol=result.symbol,
-                    horizon=result.horizon,
-                    realised_series=result.realised_series,
-                    metrics=metrics_dict,
-                    metadata=result.metadata
-                )
+                repo.upsert_backtests([{
+                    "backtest_id": result.id,
+                    "forecast_id": result.forecast_id,
+                    "symbol": result.symbol,
+                    "horizon": result.horizon,
+                    "realised_series": result.realised_series,
+                    "metrics": metrics_dict,
+                    "metadata": result.metadata,
+                }])
                 
                 logger.info(f"Saved backtest {result.id} to database")
         except Exception as e:
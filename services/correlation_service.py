@@ -0,0 +1,345 @@
+"""
+Rolling correlation service.
+
+Maintains a rolling window of daily returns for the held universe together
+with pairwise sufficient statistics (count, sums, sums of squares and cross
+products over rows where both symbols have a return). Correlation and
+covariance for any pair are read from those statistics, so "how correlated is
+X with the portfolio" costs O(k) for k positions instead of a full `df.corr()`.
+
+Updates are incremental:
+- a new bar appends one row (and drops the oldest) with O(n^2) outer products
+- a new symbol is added with a single column fetch, O(window * n)
+- the newest row is provisional and is recomputed on each refresh, so a
+  partial intraday bar or a late-arriving symbol is corrected in place
+
+Returns are computed per symbol on its own calendar before alignment, so a
+stock's Monday return spans Friday -> Monday even when crypto trades at weekends.
+
+Bars come from the shared market data gateway.
+"""
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.logger import logger
+
+DEFAULT_WINDOW = 60  # Daily returns kept in the rolling window
+MIN_OBSERVATIONS = 10  # Pairwise observations required for a correlation
+
+
+class CorrelationService:
+    """Incrementally maintained return matrix and pairwise correlation/covariance."""
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        refresh_seconds: float = 300.0,
+        gateway=None
+    ):
+        """
+        Initialize correlation service.
+
+        Args:
+            window: Number of return rows kept per symbol
+            refresh_seconds: Minimum seconds between pulls of new bars from the gateway
+            gateway: Market data gateway (default: shared gateway)
+        """
+        self.window = window
+        self.refresh_seconds = refresh_seconds
+        self._gateway = gateway
+
+        self.symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.dates: List[pd.Timestamp] = []
+        self._returns = np.empty((0, 0))  # rows = dates, cols = symbols (NaN = no bar)
+
+        # Pairwise statistics over rows where both symbols have a return.
+        # _sum[i, j] / _sumsq[i, j] are sums of symbol i's returns / squared returns.
+        self._count = np.zeros((0, 0))
+        self._sum = np.zeros((0, 0))
+        self._sumsq = np.zeros((0, 0))
+        self._cross = np.zeros((0, 0))
+
+        self._lock = threading.RLock()
+        self._last_refresh = 0.0
+        self._updates_since_rebuild = 0
+
+    @property
+    def gateway(self):
+        if self._gateway is None:
+            from services.market_data_gateway import get_market_data_gateway
+            self._gateway = get_market_data_gateway()
+        return self._gateway
+
+    # ------------------------------------------------------------------
+    # Statistics maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _row_terms(row: np.ndarray):
+        mask = (~np.isnan(row)).astype(float)
+        values = np.where(mask > 0, row, 0.0)
+        return (
+            np.outer(mask, mask),
+            np.outer(values, mask),
+            np.outer(values ** 2, mask),
+            np.outer(values, values),
+        )
+
+    def _apply_row(self, row: np.ndarray, sign: float) -> None:
+        count, total, sumsq, cross = self._row_terms(row)
+        self._count += sign * count
+        self._sum += sign * total
+        self._sumsq += sign * sumsq
+        self._cross += sign * cross
+
+    def _rebuild_stats(self) -> None:
+        """Recompute statistics from the window (bounds floating-point drift)."""
+        n = len(self.symbols)
+        mask = (~np.isnan(self._returns)).astype(float)
+        values = np.where(mask > 0, self._returns, 0.0)
+        self._count = mask.T @ mask if n else np.zeros((0, 0))
+        self._sum = values.T @ mask if n else np.zeros((0, 0))
+        self._sumsq = (values ** 2).T @ mask if n else np.zeros((0, 0))
+        self._cross = values.T @ values if n else np.zeros((0, 0))
+        self._updates_since_rebuild = 0
+
+    def _append_row(self, date: pd.Timestamp, row: np.ndarray) -> None:
+        self.dates.append(date)
+        self._returns = np.vstack([self._returns, row[None, :]])
+        self._apply_row(row, 1.0)
+
+        while len(self.dates) > self.window:
+            self._apply_row(self._returns[0], -1.0)
+            self._returns = self._returns[1:]
+            self.dates.pop(0)
+
+        self._updates_since_rebuild += 1
+        if self._updates_since_rebuild >= self.window:
+            self._rebuild_stats()
+
+    def _pop_last_row(self) -> None:
+        self._apply_row(self._returns[-1], -1.0)
+        self._returns = self._returns[:-1]
+        self.dates.pop()
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+
+    def _fetch_returns(self, symbol: str, start=None) -> pd.Series:
+        """Daily returns for a symbol on its own calendar."""
+        if start is None:
+            # Enough calendar days for `window` trading-day returns
+            start = pd.Timestamp.now().normalize() - timedelta(days=int(self.window * 1.6) + 10)
+        bars = self.gateway.get_bars(symbol, period=None, interval="1d", start=start.to_pydatetime())
+        if bars.empty:
+            return pd.Series(dtype=float)
+        return bars["Close"].pct_change().dropna()
+
+    def ensure_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Add any symbols not yet tracked (one column fetch each).
+
+        Returns:
+            Symbols that were added
+        """
+        with self._lock:
+            missing = [s for s in dict.fromkeys(symbols) if s not in self._index]
+            if not missing:
+                return []
+
+            columns = {symbol: self._fetch_returns(symbol) for symbol in missing}
+
+            if not self.dates:
+                # First symbols define the window
+                available = {s: r for s, r in columns.items() if not r.empty}
+                if available:
+                    frame = pd.DataFrame(available).sort_index().iloc[-self.window:]
+                else:
+                    frame = pd.DataFrame(index=pd.DatetimeIndex([]), dtype=float)
+                self.dates = list(frame.index)
+                for symbol in missing:
+                    self._index[symbol] = len(self.symbols)
+                    self.symbols.append(symbol)
+                self._returns = frame.reindex(columns=self.symbols).to_numpy(dtype=float)
+                self._rebuild_stats()
+            else:
+                for symbol in missing:
+                    self._add_column(symbol, columns[symbol])
+
+            self._last_refresh = time.time()
+            return missing
+
+    def _add_column(self, symbol: str, returns: pd.Series) -> None:
+        column = returns.reindex(pd.DatetimeIndex(self.dates)).to_numpy(dtype=float)
+        values_r = np.where(np.isnan(self._returns), 0.0, self._returns)
+        mask_r = (~np.isnan(self._returns)).astype(float)
+        mask_c = (~np.isnan(column)).astype(float)
+        values_c = np.where(mask_c > 0, column, 0.0)
+
+        def grow(matrix, col, row, corner):
+            n = matrix.shape[0]
+            out = np.zeros((n + 1, n + 1))
+            out[:n, :n] = matrix
+            out[:n, n] = col
+            out[n, :n] = row
+            out[n, n] = corner
+            return out
+
+        self._count = grow(self._count, mask_r.T @ mask_c, mask_c @ mask_r, mask_c @ mask_c)
+        self._sum = grow(self._sum, values_r.T @ mask_c, values_c @ mask_r, values_c @ mask_c)
+        self._sumsq = grow(self._sumsq, (values_r ** 2).T @ mask_c, (values_c ** 2) @ mask_r, (values_c ** 2) @ mask_c)
+        self._cross = grow(self._cross, values_r.T @ values_c, values_c @ values_r, values_c @ values_c)
+
+        self._returns = np.hstack([self._returns, column[:, None]])
+        self._index[symbol] = len(self.symbols)
+        self.symbols.append(symbol)
+
+    def remove_symbols(self, symbols: List[str]) -> None:
+        """Stop tracking symbols (e.g. after positions are closed)."""
+        with self._lock:
+            drop = set(symbols)
+            if not drop.intersection(self._index):
+                return
+            keep = [i for i, s in enumerate(self.symbols) if s not in drop]
+            self.symbols = [self.symbols[i] for i in keep]
+            self._index = {s: i for i, s in enumerate(self.symbols)}
+            self._returns = self._returns[:, keep]
+            for name in ("_count", "_sum", "_sumsq", "_cross"):
+                matrix = getattr(self, name)
+                setattr(self, name, matrix[np.ix_(keep, keep)])
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Pull bars newer than the window from the gateway and append them.
+
+        The newest existing row is treated as provisional and recomputed.
+
+        Returns:
+            Number of rows appended (excluding the recomputed provisional row)
+        """
+        with self._lock:
+            if not self.symbols or not self.dates:
+                return 0
+            if not force and time.time() - self._last_refresh < self.refresh_seconds:
+                return 0
+
+            last_date = self.dates[-1]
+            # Start a few days back so each symbol's previous close is available
+            start = last_date - timedelta(days=10)
+            columns = {s: self._fetch_returns(s, start) for s in self.symbols}
+            self._last_refresh = time.time()
+
+            columns = {s: r for s, r in columns.items() if not r.empty}
+            if not columns:
+                return 0
+            fresh = pd.DataFrame(columns).sort_index()
+            fresh = fresh[fresh.index >= last_date].reindex(columns=self.symbols)
+            if fresh.empty:
+                return 0
+
+            self._pop_last_row()
+            for date, row in fresh.iterrows():
+                self._append_row(date, row.to_numpy(dtype=float))
+            return len(fresh) - 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _pair_stats(self, i: int, cols: np.ndarray):
+        n = self._count[i, cols]
+        sx = self._sum[i, cols]
+        sy = self._sum[cols, i]
+        sxx = self._sumsq[i, cols]
+        syy = self._sumsq[cols, i]
+        sxy = self._cross[i, cols]
+        return n, sx, sy, sxx, syy, sxy
+
+    def correlations(self, symbol: str, others: List[str], min_observations: int = MIN_OBSERVATIONS) -> pd.Series:
+        """
+        Pearson correlation of symbol's returns with each of `others` (O(k)).
+
+        Pairs with fewer than min_observations shared returns are NaN.
+        """
+        with self._lock:
+            self.ensure_symbols([symbol] + list(others))
+            self.refresh()
+            i = self._index[symbol]
+            cols = np.array([self._index[o] for o in others], dtype=int)
+            n, sx, sy, sxx, syy, sxy = self._pair_stats(i, cols)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            numerator = n * sxy - sx * sy
+            denominator = np.sqrt((n * sxx - sx ** 2) * (n * syy - sy ** 2))
+            corr = np.where((n >= min_observations) & (denominator > 0), numerator / denominator, np.nan)
+        return pd.Series(np.clip(corr, -1.0, 1.0), index=list(others))
+
+    def covariance_matrix(self, symbols: List[str]) -> pd.DataFrame:
+        """Pairwise sample covariance of daily returns."""
+        with self._lock:
+            self.ensure_symbols(symbols)
+            self.refresh()
+            idx = np.array([self._index[s] for s in symbols], dtype=int)
+            n = self._count[np.ix_(idx, idx)]
+            sx = self._sum[np.ix_(idx, idx)]
+            sy = sx.T
+            sxy = self._cross[np.ix_(idx, idx)]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = np.where(n > 1, (sxy - sx * sy / n) / (n - 1), np.nan)
+        return pd.DataFrame(cov, index=symbols, columns=symbols)
+
+    def correlation_matrix(self, symbols: List[str], min_observations: int = MIN_OBSERVATIONS) -> pd.DataFrame:
+        """Pairwise correlation of daily returns (NaN where too few shared observations)."""
+        with self._lock:
+            self.ensure_symbols(symbols)
+            self.refresh()
+            idx = np.array([self._index[s] for s in symbols], dtype=int)
+            n = self._count[np.ix_(idx, idx)]
+            sx = self._sum[np.ix_(idx, idx)]
+            sxx = self._sumsq[np.ix_(idx, idx)]
+            sxy = self._cross[np.ix_(idx, idx)]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            numerator = n * sxy - sx * sx.T
+            denominator = np.sqrt((n * sxx - sx ** 2) * (n * sxx.T - sx.T ** 2))
+            corr = np.where((n >= min_observations) & (denominator > 0), numerator / denominator, np.nan)
+        return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=symbols, columns=symbols)
+
+    def portfolio_correlation(self, symbol: str, positions: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Average and maximum correlation of a candidate with current positions.
+
+        Returns:
+            Dict with avg, max and the number of positions with enough data
+        """
+        others = [p for p in dict.fromkeys(positions) if p != symbol]
+        if not others:
+            return {"avg": None, "max": None, "observed": 0}
+        corr = self.correlations(symbol, others).dropna()
+        if corr.empty:
+            return {"avg": None, "max": None, "observed": 0}
+        return {"avg": float(corr.mean()), "max": float(corr.max()), "observed": int(len(corr))}
+
+
+# Singleton instance
+_correlation_service: Optional[CorrelationService] = None
+_service_lock = threading.Lock()
+
+
+def get_correlation_service() -> CorrelationService:
+    """Get or create the shared correlation service."""
+    global _correlation_service
+    if _correlation_service is None:
+        with _service_lock:
+            if _correlation_service is None:
+                _correlation_service = CorrelationService()
+                logger.info("CorrelationService initialized")
+    return _correlation_service
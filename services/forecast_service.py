@@ -190,11 +190,11 @@ class ForecastService:
             technicals = {"error": str(e)}
         
         # Save snapshot
-        snapshot_path = self.metadata_manager.save_forecast_snapshot(
+        snapshot_id = self.metadata_manager.save_forecast_snapshot(
             forecast_id, symbol, parameters, result
         )
         
-        logger.info(f"Forecast {forecast_id} created and saved to {snapshot_path}")
+        logger.info(f"Forecast {forecast_id} created and saved to {self.metadata_manager.store.db_path}")
         
         # Create domain model
         forecast = Forecast(
@@ -213,7 +213,7 @@ class ForecastService:
             coherence=coherence,
             recommendation=recommendation,
             metadata={
-                "snapshot_path": str(snapshot_path),
+                "snapshot_id": snapshot_id,
                 "inference_time_ms": forecast_output.inference_time_ms,
                 "fqs_interpretation": fqs.get('interpretation'),
                 "frs_reliability_level": frs.get('reliability_level'),
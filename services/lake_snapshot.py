@@ -0,0 +1,303 @@
+"""
+Memory-mapped columnar snapshot of the Data Lake.
+
+export_lake_snapshot() writes the DuckDB ohlcv_history table to a directory of
+.npy column files sorted by (symbol, date), so each symbol's bars are one
+contiguous slice of every column, plus index.json with each symbol's row
+offset, length and date range:
+
+    data/lake_snapshot/
+        index.json        symbol -> {offset, length, start, end, asset_class}
+        date.npy          datetime64[D]
+        open.npy ... volume.npy   float64
+
+LakeSnapshot maps the column files read-only (np.load(mmap_mode="r")), so
+opening it is O(1) and every process reading the same snapshot shares the
+page cache instead of holding its own copy. It is a Mapping of symbol to full
+OHLCV history and can be passed wherever `preloaded_data` is accepted
+(WarGamesRunner, LearningBookMiner); window() slices a date range without
+touching the rest of the history.
+
+Usage:
+    python -m services.lake_snapshot            # export data/market_history.duckdb
+"""
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_LAKE_PATH = PROJECT_ROOT / "data" / "market_history.duckdb"
+DEFAULT_SNAPSHOT_DIR = PROJECT_ROOT / "data" / "lake_snapshot"
+
+SNAPSHOT_VERSION = 1
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+INDEX_FILE = "index.json"
+
+
+def _source_fingerprint(db_path: Path) -> Dict[str, Any]:
+    """Identity of the lake file a snapshot was exported from."""
+    stat = Path(db_path).stat()
+    return {"path": str(Path(db_path).resolve()), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def export_lake_snapshot(
+    db_path: Path = DEFAULT_LAKE_PATH,
+    snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR
+) -> Dict[str, Any]:
+    """
+    Export ohlcv_history to a memory-mappable snapshot.
+
+    The snapshot is written to a temporary directory and swapped in, so
+    readers never see a partial export; processes that already mapped the
+    previous snapshot keep their (unlinked) mappings until they close.
+
+    Args:
+        db_path: DuckDB Data Lake
+        snapshot_dir: Output directory (replaced)
+
+    Returns:
+        The snapshot index
+    """
+    import duckdb
+
+    start = time.time()
+    snapshot_dir = Path(snapshot_dir)
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        df = conn.execute("""
+            SELECT symbol, date, open, high, low, close, volume, asset_class
+            FROM ohlcv_history
+            ORDER BY symbol, date
+        """).fetchdf()
+    finally:
+        conn.close()
+
+    symbols: Dict[str, Dict[str, Any]] = {}
+    if not df.empty:
+        codes, uniques = pd.factorize(df["symbol"], sort=False)
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        offsets = np.concatenate(([0], boundaries))
+        lengths = np.diff(np.concatenate((offsets, [len(df)])))
+        dates = pd.to_datetime(df["date"]).values.astype("datetime64[D]")
+        for symbol, offset, length in zip(uniques, offsets, lengths):
+            symbols[symbol] = {
+                "offset": int(offset),
+                "length": int(length),
+                "start": str(dates[offset]),
+                "end": str(dates[offset + length - 1]),
+                "asset_class": df["asset_class"].iat[offset],
+            }
+    else:
+        dates = np.array([], dtype="datetime64[D]")
+
+    tmp_dir = snapshot_dir.with_name(f"{snapshot_dir.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    np.save(tmp_dir / "date.npy", dates)
+    for column in PRICE_COLUMNS:
+        np.save(tmp_dir / f"{column}.npy", df[column].to_numpy(dtype="float64"))
+
+    index = {
+        "version": SNAPSHOT_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "source": _source_fingerprint(db_path),
+        "rows": len(df),
+        "columns": ["date", *PRICE_COLUMNS],
+        "symbols": symbols,
+    }
+    with open(tmp_dir / INDEX_FILE, "w") as f:
+        json.dump(index, f, indent=2)
+
+    old_dir = snapshot_dir.with_name(f"{snapshot_dir.name}.old-{os.getpid()}")
+    if snapshot_dir.exists():
+        os.replace(snapshot_dir, old_dir)
+    os.replace(tmp_dir, snapshot_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    logger.info(
+        f"🗜️ Exported lake snapshot: {len(df):,} bars, {len(symbols)} symbols -> "
+        f"{snapshot_dir} ({time.time() - start:.1f}s)"
+    )
+    return index
+
+
+class LakeSnapshot(Mapping):
+    """
+    Read-only, memory-mapped view of an exported snapshot.
+
+    snapshot[symbol] builds a DataFrame (date, open, high, low, close,
+    volume) of the symbol's full history; window() builds only a date range;
+    arrays() returns the mapped column slices without copying.
+    """
+
+    def __init__(self, snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR):
+        """
+        Open (map) a snapshot.
+
+        Args:
+            snapshot_dir: Directory written by export_lake_snapshot()
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist
+            ValueError: If the snapshot version is unsupported
+        """
+        self.snapshot_dir = Path(snapshot_dir)
+        with open(self.snapshot_dir / INDEX_FILE, "r") as f:
+            self.index = json.load(f)
+        if self.index.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported lake snapshot version: {self.index.get('version')}")
+        self._symbols: Dict[str, Dict[str, Any]] = self.index["symbols"]
+        self._columns: Dict[str, np.ndarray] = {
+            column: np.load(self.snapshot_dir / f"{column}.npy", mmap_mode="r")
+            for column in self.index["columns"]
+        }
+
+    def __getitem__(self, symbol: str) -> pd.DataFrame:
+        if symbol not in self._symbols:
+            raise KeyError(symbol)
+        return self.window(symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._symbols
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def asset_class(self, symbol: str) -> Optional[str]:
+        entry = self._symbols.get(symbol)
+        return entry["asset_class"] if entry else None
+
+    def symbols(self, asset_classes: Optional[List[str]] = None) -> List[str]:
+        """Symbols in the snapshot, optionally filtered by asset class."""
+        return [
+            symbol for symbol, entry in self._symbols.items()
+            if asset_classes is None or entry["asset_class"] in asset_classes
+        ]
+
+    def arrays(self, symbol: str) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy column slices for a symbol.
+
+        Args:
+            symbol: Symbol
+
+        Returns:
+            Dict of column name -> read-only array view into the mapped files
+        """
+        entry = self._symbols[symbol]
+        lo, hi = entry["offset"], entry["offset"] + entry["length"]
+        return {column: values[lo:hi] for column, values in self._columns.items()}
+
+    def window(
+        self,
+        symbol: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None
+    ) -> pd.DataFrame:
+        """
+        Bars for a symbol between start and end (inclusive).
+
+        Only the selected rows are copied out of the mapped files.
+
+        Args:
+            symbol: Symbol
+            start: First date (anything np.datetime64 accepts), or None
+            end: Last date, or None
+
+        Returns:
+            DataFrame with a datetime 'date' column and float64 OHLCV columns
+        """
+        views = self.arrays(symbol)
+        dates = views["date"]
+        lo = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start).date(), "D"), "left")) if start is not None else 0
+        hi = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end).date(), "D"), "right")) if end is not None else len(dates)
+        frame = {"date": pd.to_datetime(np.asarray(dates[lo:hi]).astype("datetime64[ns]"))}
+        for column in PRICE_COLUMNS:
+            frame[column] = np.array(views[column][lo:hi])
+        return pd.DataFrame(frame)
+
+    def is_current(self, db_path: Path = DEFAULT_LAKE_PATH) -> bool:
+        """Whether the snapshot was exported from db_path as it is now."""
+        try:
+            return self.index.get("source") == _source_fingerprint(db_path)
+        except OSError:
+            return False
+
+
+def open_lake_snapshot(
+    snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR,
+    db_path: Optional[Path] = DEFAULT_LAKE_PATH
+) -> Optional[LakeSnapshot]:
+    """
+    Open a snapshot if it exists and is current.
+
+    Args:
+        snapshot_dir: Snapshot directory
+        db_path: Lake the snapshot must match (None skips the check)
+
+    Returns:
+        LakeSnapshot, or None if missing, unreadable or stale
+    """
+    try:
+        snapshot = LakeSnapshot(snapshot_dir)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not open lake snapshot {snapshot_dir}: {e}")
+        return None
+    if db_path is not None and not snapshot.is_current(db_path):
+        logger.info(f"Lake snapshot {snapshot_dir} is stale (lake changed since export)")
+        return None
+    return snapshot
+
+
+def ensure_lake_snapshot(
+    db_path: Path = DEFAULT_LAKE_PATH,
+    snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR
+) -> Optional[LakeSnapshot]:
+    """
+    Open the snapshot, exporting it first if missing or stale.
+
+    Args:
+        db_path: DuckDB Data Lake
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        LakeSnapshot, or None if the export failed
+    """
+    snapshot = open_lake_snapshot(snapshot_dir, db_path)
+    if snapshot is not None:
+        return snapshot
+    try:
+        export_lake_snapshot(db_path, snapshot_dir)
+    except Exception as e:
+        logger.error(f"❌ Lake snapshot export failed: {e}")
+        return None
+    return open_lake_snapshot(snapshot_dir, db_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Export the Data Lake to a memory-mapped snapshot")
+    parser.add_argument("--db", type=Path, default=DEFAULT_LAKE_PATH, help="DuckDB Data Lake")
+    parser.add_argument("--out", type=Path, default=DEFAULT_SNAPSHOT_DIR, help="Snapshot directory")
+    args = parser.parse_args()
+
+    index = export_lake_snapshot(args.db, args.out)
+    print(f"✅ {index['rows']:,} bars, {len(index['symbols'])} symbols -> {args.out}")
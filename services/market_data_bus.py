@@ -0,0 +1,766 @@
+"""
+Market data bus.
+
+In-process publish/subscribe bus for live quotes and bars. One feed (the
+`QuotePoller` over the shared market data gateway, or an IBKR streaming
+subscription) publishes into the bus; the trigger evaluator, orchestrator
+loop, macro watcher and portfolio sync subscribe to the symbols they care
+about and react to new data instead of each re-polling upstream on its own
+timer.
+
+Each symbol keeps fixed-size NumPy ring buffers of recent quotes and bars.
+Quotes are rolled up into bars of `bar_seconds`; a bar is published when the
+first quote of the next bar arrives.
+
+Separate processes can share one feed: the process running the feed calls
+`bus.serve(port)`, and other processes set FUGGERBOT_MARKET_BUS=tcp://host:port
+so `start_market_data_feed()` connects to it instead of polling (reconnecting
+with backoff if it drops, then falling back to a local poller). Messages are
+newline-delimited JSON over a local TCP socket.
+"""
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from core.logger import logger
+
+QUOTE = "quote"
+BAR = "bar"
+
+
+@dataclass
+class Quote:
+    """Last-trade price update."""
+    symbol: str
+    price: float
+    timestamp: float
+    source: str = "poller"
+
+
+@dataclass
+class Bar:
+    """OHLCV bar (timestamp is the bar open time, epoch seconds)."""
+    symbol: str
+    timestamp: float
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+    interval_seconds: float = 60.0
+
+
+class _Ring:
+    """Fixed-capacity ring of float rows (oldest overwritten first)."""
+
+    def __init__(self, capacity: int, width: int):
+        self._data = np.full((capacity, width), np.nan)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row) -> None:
+        self._data[self._next] = row
+        self._next = (self._next + 1) % len(self._data)
+        self._size = min(self._size + 1, len(self._data))
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """Most recent n rows, oldest first (copy)."""
+        n = self._size if n is None else min(n, self._size)
+        if n <= 0:
+            return self._data[:0].copy()
+        idx = (self._next - n + np.arange(n)) % len(self._data)
+        return self._data[idx]
+
+
+class _SymbolState:
+    def __init__(self, quote_capacity: int, bar_capacity: int):
+        self.quotes = _Ring(quote_capacity, 2)      # timestamp, price
+        self.bars = _Ring(bar_capacity, 6)          # timestamp, open, high, low, close, volume
+        self.building: Optional[Bar] = None
+
+
+class Subscription:
+    """Handle returned by MarketDataBus.subscribe()."""
+
+    def __init__(self, bus: "MarketDataBus", symbols: Optional[Set[str]], kinds: Set[str], callback: Callable):
+        self.bus = bus
+        self.symbols = symbols
+        self.kinds = kinds
+        self.callback = callback
+
+    def matches(self, kind: str, symbol: str) -> bool:
+        return kind in self.kinds and (self.symbols is None or symbol in self.symbols)
+
+    def unsubscribe(self) -> None:
+        self.bus.unsubscribe(self)
+
+
+class MarketDataBus:
+    """Publish/subscribe hub with per-symbol ring buffers."""
+
+    def __init__(self, bar_seconds: float = 60.0, quote_capacity: int = 1024, bar_capacity: int = 512):
+        """
+        Initialize the bus.
+
+        Args:
+            bar_seconds: Length of bars aggregated from quotes
+            quote_capacity: Quotes kept per symbol
+            bar_capacity: Bars kept per symbol
+        """
+        self.bar_seconds = bar_seconds
+        self.quote_capacity = quote_capacity
+        self.bar_capacity = bar_capacity
+
+        self._state: Dict[str, _SymbolState] = {}
+        self._subscriptions: List[Subscription] = []
+        self._watched: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        self._sequence = 0
+
+        self._server: Optional[socket.socket] = None
+        self._clients: List[socket.socket] = []
+        self._client_symbols: Dict[socket.socket, Set[str]] = {}
+        self._clients_lock = threading.Lock()
+        self._remote: Optional[socket.socket] = None
+        self._remote_address: Optional[tuple] = None
+        self._on_remote_lost: Optional[Callable[[], None]] = None
+        self._max_reconnect_attempts = 5
+        self._closed = threading.Event()
+
+        self.stats = {"quotes": 0, "bars": 0, "callback_errors": 0}
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        symbols: Optional[Iterable[str]],
+        callback: Callable,
+        kinds: Iterable[str] = (QUOTE, BAR)
+    ) -> Subscription:
+        """
+        Call `callback(event)` for each Quote/Bar on the given symbols.
+
+        Callbacks run on the publishing thread and must be quick; hand work off
+        (e.g. with subscribe_queue) if it can block.
+
+        Args:
+            symbols: Symbols to receive (None = all symbols, not added to the watch list)
+            callback: Function taking a Quote or Bar
+            kinds: Event kinds to receive ("quote", "bar")
+
+        Returns:
+            Subscription handle (call unsubscribe() when done)
+        """
+        symbol_set = {s.upper() for s in symbols} if symbols is not None else None
+        subscription = Subscription(self, symbol_set, set(kinds), callback)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            for symbol in symbol_set or ():
+                self._watched[symbol] = self._watched.get(symbol, 0) + 1
+        if symbol_set:
+            self._send_remote({"type": "watch", "symbols": sorted(symbol_set)})
+        return subscription
+
+    def subscribe_queue(
+        self,
+        symbols: Optional[Iterable[str]],
+        kinds: Iterable[str] = (QUOTE, BAR),
+        maxsize: int = 10000
+    ) -> "queue.Queue":
+        """Subscribe and receive events on a queue (oldest dropped when full)."""
+        events: queue.Queue = queue.Queue(maxsize=maxsize)
+
+        def _put(event):
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                try:
+                    events.get_nowait()
+                except queue.Empty:
+                    pass
+                events.put_nowait(event)
+
+        self.subscribe(symbols, _put, kinds)
+        return events
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+                for symbol in subscription.symbols or ():
+                    self._watched[symbol] -= 1
+                    if self._watched[symbol] <= 0:
+                        del self._watched[symbol]
+
+    def watch(self, symbols: Iterable[str]) -> None:
+        """Ask the feed to cover symbols without subscribing a callback."""
+        with self._lock:
+            for symbol in symbols:
+                symbol = symbol.upper()
+                self._watched[symbol] = self._watched.get(symbol, 0) + 1
+
+    def unwatch(self, symbols: Iterable[str]) -> None:
+        """Release symbols previously passed to watch()."""
+        with self._lock:
+            for symbol in symbols:
+                symbol = symbol.upper()
+                if symbol in self._watched:
+                    self._watched[symbol] -= 1
+                    if self._watched[symbol] <= 0:
+                        del self._watched[symbol]
+
+    def watched_symbols(self) -> List[str]:
+        """Symbols some consumer has subscribed to (what feeds should cover)."""
+        with self._lock:
+            return sorted(self._watched)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def _state_for(self, symbol: str) -> _SymbolState:
+        state = self._state.get(symbol)
+        if state is None:
+            state = self._state[symbol] = _SymbolState(self.quote_capacity, self.bar_capacity)
+        return state
+
+    def publish_quote(self, symbol: str, price: float, timestamp: Optional[float] = None, source: str = "poller") -> None:
+        """Publish a price update (also rolls it into the current bar)."""
+        if price is None:
+            return
+        quote = Quote(symbol.upper(), float(price), timestamp or time.time(), source)
+        completed = None
+        with self._lock:
+            state = self._state_for(quote.symbol)
+            state.quotes.append((quote.timestamp, quote.price))
+            completed = self._roll_bar(state, quote)
+        self._dispatch(QUOTE, quote)
+        if completed is not None:
+            self._dispatch(BAR, completed)
+
+    def _roll_bar(self, state: _SymbolState, quote: Quote) -> Optional[Bar]:
+        bar_open = quote.timestamp - (quote.timestamp % self.bar_seconds)
+        building = state.building
+        if building is not None and building.timestamp == bar_open:
+            building.high = max(building.high, quote.price)
+            building.low = min(building.low, quote.price)
+            building.close = quote.price
+            return None
+        state.building = Bar(
+            quote.symbol, bar_open, quote.price, quote.price, quote.price, quote.price,
+            interval_seconds=self.bar_seconds
+        )
+        if building is not None and building.timestamp < bar_open:
+            state.bars.append((building.timestamp, building.open, building.high,
+                               building.low, building.close, building.volume))
+            return building
+        return None
+
+    def publish_bar(self, bar: Bar) -> None:
+        """Publish a completed bar from an upstream feed."""
+        bar.symbol = bar.symbol.upper()
+        with self._lock:
+            self._state_for(bar.symbol).bars.append(
+                (bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+            )
+        self._dispatch(BAR, bar)
+
+    def _dispatch(self, kind: str, event) -> None:
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.matches(kind, event.symbol)]
+            self._sequence += 1
+            self.stats["quotes" if kind == QUOTE else "bars"] += 1
+            self._condition.notify_all()
+
+        for subscription in targets:
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                self.stats["callback_errors"] += 1
+                logger.error(f"Market data subscriber failed on {event.symbol}: {e}", exc_info=True)
+
+        if self._clients:
+            self._broadcast({"type": kind, **asdict(event)})
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def last_price(self, symbol: str, max_age_seconds: Optional[float] = None) -> Optional[float]:
+        """Most recent quote (None if none, or older than max_age_seconds)."""
+        with self._lock:
+            state = self._state.get(symbol.upper())
+            if state is None or not len(state.quotes):
+                return None
+            ts, price = state.quotes.last(1)[0]
+        if max_age_seconds is not None and time.time() - ts > max_age_seconds:
+            return None
+        return float(price)
+
+    def previous_price(self, symbol: str) -> Optional[float]:
+        """Quote before the most recent one (for move-based conditions)."""
+        with self._lock:
+            state = self._state.get(symbol.upper())
+            if state is None or len(state.quotes) < 2:
+                return None
+            return float(state.quotes.last(2)[0, 1])
+
+    def recent_quotes(self, symbol: str, n: Optional[int] = None) -> np.ndarray:
+        """(n, 2) array of [timestamp, price], oldest first."""
+        with self._lock:
+            state = self._state.get(symbol.upper())
+            return state.quotes.last(n) if state else np.empty((0, 2))
+
+    def recent_bars(self, symbol: str, n: Optional[int] = None) -> np.ndarray:
+        """(n, 6) array of [timestamp, open, high, low, close, volume], oldest first."""
+        with self._lock:
+            state = self._state.get(symbol.upper())
+            return state.bars.last(n) if state else np.empty((0, 6))
+
+    def wait(self, timeout: float, predicate: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Block until any event is published (or predicate() turns true), or timeout.
+
+        Returns:
+            True if woken by an event/predicate, False on timeout
+        """
+        deadline = time.time() + timeout
+        with self._condition:
+            start = self._sequence
+            while True:
+                if predicate is not None:
+                    if predicate():
+                        return True
+                elif self._sequence != start:
+                    return True
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+
+    def last_prices(self, symbols: Iterable[str]) -> Dict[str, Optional[float]]:
+        """Latest price of each symbol (None if no quote yet)."""
+        return {s.upper(): self.last_price(s) for s in symbols}
+
+    def wait_for_move(
+        self,
+        symbols: Iterable[str],
+        min_move_pct: float,
+        timeout: float,
+        reference: Optional[Dict[str, Optional[float]]] = None
+    ) -> List[str]:
+        """
+        Sleep up to `timeout`, waking early once any symbol moves at least
+        min_move_pct from its reference price.
+
+        Args:
+            symbols: Symbols to watch for a move
+            min_move_pct: Move (percent) that ends the wait
+            timeout: Maximum wait in seconds
+            reference: Prices to measure moves from, e.g. from last_prices()
+                taken earlier (default: prices when the wait starts)
+
+        Returns:
+            Symbols that moved past the threshold (empty on timeout)
+        """
+        symbols = [s.upper() for s in symbols]
+        reference = dict(reference) if reference is not None else self.last_prices(symbols)
+        moved: List[str] = []
+
+        def _moved() -> bool:
+            for symbol in symbols:
+                ref = reference.get(symbol)
+                state = self._state.get(symbol)
+                if state is None or not len(state.quotes):
+                    continue
+                price = state.quotes.last(1)[0, 1]
+                if ref is None:
+                    reference[symbol] = price
+                elif ref and abs(price - ref) / abs(ref) * 100 >= min_move_pct:
+                    moved.append(symbol)
+            return bool(moved)
+
+        self.wait(timeout, predicate=_moved)
+        return moved
+
+    # ------------------------------------------------------------------
+    # Cross-process bridge
+    # ------------------------------------------------------------------
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """
+        Stream this bus's events to other processes over a local TCP socket.
+
+        Returns:
+            Port actually bound (pass 0 to pick a free one)
+        """
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host, port))
+        server.listen()
+        self._server = server
+        threading.Thread(target=self._accept_loop, name="market-bus-server", daemon=True).start()
+        bound = server.getsockname()[1]
+        logger.info(f"📡 Market data bus serving on {host}:{bound}")
+        return bound
+
+    def _accept_loop(self) -> None:
+        while self._server is not None:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._clients_lock:
+                self._clients.append(client)
+                self._client_symbols[client] = set()
+            threading.Thread(target=self._client_reader, args=(client,), daemon=True).start()
+
+    def _client_reader(self, client: socket.socket) -> None:
+        """Read watch requests from a remote subscriber."""
+        try:
+            for line in client.makefile("r"):
+                message = json.loads(line)
+                if message.get("type") == "watch":
+                    # Watch each symbol once per client so _drop_client can release it
+                    with self._clients_lock:
+                        symbols = self._client_symbols.get(client)
+                        if symbols is None:
+                            break
+                        new = {s.upper() for s in message.get("symbols", [])} - symbols
+                        symbols.update(new)
+                    if new:
+                        self.watch(new)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._drop_client(client)
+
+    def _drop_client(self, client: socket.socket) -> None:
+        with self._clients_lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            symbols = self._client_symbols.pop(client, set())
+        if symbols:
+            self.unwatch(symbols)
+        _shutdown(client)
+
+    def _broadcast(self, message: Dict) -> None:
+        payload = (json.dumps(message) + "\n").encode()
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                client.sendall(payload)
+            except OSError:
+                self._drop_client(client)
+
+    def connect(
+        self,
+        host: str,
+        port: int,
+        on_lost: Optional[Callable[[], None]] = None,
+        max_reconnect_attempts: int = 5
+    ) -> None:
+        """
+        Receive events from a bus served by another process and republish them locally.
+
+        If the connection drops, reconnects with exponential backoff; after
+        `max_reconnect_attempts` failures `on_lost` is called (e.g. to start
+        polling locally instead).
+
+        Args:
+            host: Host of the serving bus
+            port: Port of the serving bus
+            on_lost: Called once when reconnecting gives up
+            max_reconnect_attempts: Reconnect attempts before giving up
+
+        Raises:
+            OSError: If the initial connection fails
+        """
+        self._closed.clear()
+        self._remote_address = (host, port)
+        self._on_remote_lost = on_lost
+        self._max_reconnect_attempts = max_reconnect_attempts
+        try:
+            self._open_remote(host, port)
+        except OSError:
+            self._remote_address = None
+            raise
+        logger.info(f"📡 Connected to market data bus at {host}:{port}")
+
+    def _open_remote(self, host: str, port: int) -> None:
+        remote = socket.create_connection((host, port))
+        self._remote = remote
+        watched = self.watched_symbols()
+        if watched:
+            self._send_remote({"type": "watch", "symbols": watched})
+        threading.Thread(target=self._remote_reader, args=(remote,), name="market-bus-client", daemon=True).start()
+
+    def _send_remote(self, message: Dict) -> None:
+        if self._remote is None:
+            return
+        try:
+            self._remote.sendall((json.dumps(message) + "\n").encode())
+        except OSError as e:
+            logger.warning(f"Market data bus connection lost: {e}")
+            self._remote = None
+
+    def _remote_reader(self, remote: socket.socket) -> None:
+        try:
+            for line in remote.makefile("r"):
+                message = json.loads(line)
+                kind = message.pop("type", None)
+                if kind == QUOTE:
+                    self.publish_quote(message["symbol"], message["price"], message["timestamp"], message.get("source", "remote"))
+                elif kind == BAR:
+                    self.publish_bar(Bar(**message))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Market data bus connection closed: {e}")
+        finally:
+            if self._remote is remote:
+                self._remote = None
+            if not self._closed.is_set() and self._remote_address is not None:
+                self._reconnect()
+
+    def _reconnect(self) -> None:
+        """Reconnect to the remote bus with exponential backoff, then give up."""
+        host, port = self._remote_address
+        delay = 1.0
+        for attempt in range(1, self._max_reconnect_attempts + 1):
+            if self._closed.wait(delay):
+                return
+            try:
+                self._open_remote(host, port)
+                logger.info(f"📡 Reconnected to market data bus at {host}:{port}")
+                return
+            except OSError as e:
+                logger.warning(f"Market data bus reconnect {attempt}/{self._max_reconnect_attempts} failed: {e}")
+                delay = min(delay * 2, 30.0)
+
+        logger.error(f"❌ Gave up reconnecting to market data bus at {host}:{port}")
+        self._remote_address = None
+        if self._on_remote_lost is not None:
+            self._on_remote_lost()
+
+    def close(self) -> None:
+        """Stop serving and disconnect from any remote bus."""
+        self._closed.set()
+        self._remote_address = None
+        server, self._server = self._server, None
+        if server is not None:
+            _shutdown(server)
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            self._drop_client(client)
+        remote, self._remote = self._remote, None
+        if remote is not None:
+            _shutdown(remote)
+
+
+def _shutdown(sock: socket.socket) -> None:
+    """Close a socket so threads blocked reading or accepting on it wake up."""
+    try:
+        # close() alone leaves the socket open while a makefile() or accept() holds it
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    sock.close()
+
+
+class QuotePoller:
+    """
+    Single poller feeding the bus from the market data gateway.
+
+    Each cycle fetches quotes for every watched symbol in parallel and
+    publishes them, so N consumers cost one upstream call per symbol.
+    """
+
+    def __init__(
+        self,
+        bus: MarketDataBus,
+        interval_seconds: float = 15.0,
+        gateway=None,
+        max_workers: int = 8
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            bus: Bus to publish into
+            interval_seconds: Seconds between polling cycles
+            gateway: MarketDataGateway (default: shared gateway)
+            max_workers: Parallel quote requests per cycle
+        """
+        if gateway is None:
+            from services.market_data_gateway import get_market_data_gateway
+            gateway = get_market_data_gateway()
+        self.bus = bus
+        self.gateway = gateway
+        self.interval_seconds = interval_seconds
+        self.max_workers = max_workers
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll_once(self) -> int:
+        """Poll all watched symbols once; returns number of quotes published."""
+        symbols = self.bus.watched_symbols()
+        if not symbols:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols))) as pool:
+            prices = list(pool.map(self.gateway.get_quote, symbols))
+        published = 0
+        for symbol, price in zip(symbols, prices):
+            if price is not None:
+                self.bus.publish_quote(symbol, price, source="poller")
+                published += 1
+        return published
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Quote poller cycle failed: {e}", exc_info=True)
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> "QuotePoller":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="quote-poller", daemon=True)
+            self._thread.start()
+            logger.info(f"📈 Quote poller started (interval: {self.interval_seconds}s)")
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class IBKRMarketDataFeed:
+    """
+    Streams IBKR market data into the bus (ib_insync `reqMktData`).
+
+    Ticks arrive through `pendingTickersEvent` on the IB event loop, so
+    consumers see prices as they print rather than on the next poll.
+    """
+
+    def __init__(self, bus: MarketDataBus, bridge):
+        """
+        Args:
+            bus: Bus to publish into
+            bridge: Connected IBKRBridge (provides .ib and get_contract)
+        """
+        self.bus = bus
+        self.bridge = bridge
+        self._tickers: Dict[str, object] = {}
+
+    def subscribe(self, symbols: Optional[Iterable[str]] = None) -> int:
+        """Request streaming data for symbols (default: the bus watch list)."""
+        ib = self.bridge.ib
+        if not self._tickers:
+            ib.pendingTickersEvent += self._on_tickers
+        count = 0
+        for symbol in symbols or self.bus.watched_symbols():
+            if symbol in self._tickers:
+                continue
+            contract = self.bridge.get_contract(symbol)
+            if contract is None:
+                continue
+            self._tickers[symbol] = ib.reqMktData(contract, "", False, False)
+            count += 1
+        return count
+
+    def _on_tickers(self, tickers) -> None:
+        by_contract = {id(t): s for s, t in self._tickers.items()}
+        for ticker in tickers:
+            symbol = by_contract.get(id(ticker))
+            if symbol is None:
+                continue
+            price = ticker.last if ticker.last == ticker.last else ticker.marketPrice()
+            if price is not None and price == price and price > 0:
+                self.bus.publish_quote(symbol, price, source="ibkr")
+
+    def unsubscribe_all(self) -> None:
+        ib = self.bridge.ib
+        for ticker in self._tickers.values():
+            ib.cancelMktData(ticker.contract)
+        if self._tickers:
+            ib.pendingTickersEvent -= self._on_tickers
+        self._tickers.clear()
+
+
+# Singleton instances
+_market_data_bus: Optional[MarketDataBus] = None
+_quote_poller: Optional[QuotePoller] = None
+_bus_lock = threading.Lock()
+
+
+def get_market_data_bus() -> MarketDataBus:
+    """Get or create the shared market data bus."""
+    global _market_data_bus
+    if _market_data_bus is None:
+        with _bus_lock:
+            if _market_data_bus is None:
+                _market_data_bus = MarketDataBus()
+    return _market_data_bus
+
+
+def start_market_data_feed(interval_seconds: float = 15.0) -> MarketDataBus:
+    """
+    Make sure the shared bus is being fed (idempotent).
+
+    FUGGERBOT_MARKET_BUS=tcp://host:port connects to a bus served by another
+    process; otherwise a local QuotePoller is started, and
+    FUGGERBOT_MARKET_BUS_SERVE=<port> additionally serves it to other processes.
+
+    Returns:
+        The shared bus
+    """
+    global _quote_poller
+    bus = get_market_data_bus()
+    with _bus_lock:
+        if _quote_poller is not None or bus._remote_address is not None:
+            return bus
+
+        remote = os.getenv("FUGGERBOT_MARKET_BUS", "")
+        if remote.startswith("tcp://"):
+            host, _, port = remote[len("tcp://"):].rpartition(":")
+            try:
+                bus.connect(
+                    host or "127.0.0.1",
+                    int(port),
+                    on_lost=lambda: _start_local_poller(bus, interval_seconds)
+                )
+                return bus
+            except OSError as e:
+                logger.warning(f"Could not reach market data bus at {remote} ({e}); polling locally")
+
+        _quote_poller = QuotePoller(bus, interval_seconds=interval_seconds).start()
+        serve_port = os.getenv("FUGGERBOT_MARKET_BUS_SERVE")
+        if serve_port:
+            bus.serve(int(serve_port))
+    return bus
+
+
+def _start_local_poller(bus: MarketDataBus, interval_seconds: float) -> None:
+    """Fall back to polling locally once the remote bus is gone for good."""
+    global _quote_poller
+    with _bus_lock:
+        if _quote_poller is None:
+            logger.warning("Remote market data bus lost; polling locally")
+            _quote_poller = QuotePoller(bus, interval_seconds=interval_seconds).start()
@@ -0,0 +1,440 @@
+"""
+Market data gateway.
+
+Single entry point for historical bars and quotes used by the orchestrator,
+forecast helpers, portfolio manager, stress tester and market data API.
+
+Lookup order for bars:
+1. In-process bar cache (per symbol + interval, least recently used
+   series evicted past max_cached_series)
+2. DuckDB Data Lake (`ohlcv_history`, daily bars only)
+3. Upstream provider - only for the range not already covered (usually
+   just the tail since the last cached bar)
+
+The last cached bar may still be forming, so it is provisional: once
+refresh_seconds have passed, the tail is refetched starting at that bar
+(inclusive) and the refetched bar replaces it.
+
+Concurrent requests for the same symbol/interval are coalesced: one caller
+fetches while the others wait and then read the refreshed cache.
+
+Frames use the yfinance layout (DatetimeIndex, Open/High/Low/Close/Volume)
+with float64 NumPy columns and tz-naive exchange wall-clock timestamps.
+
+The upstream provider is pluggable. `FileBarProvider` serves CSV files from a
+directory and stands in for yfinance in tests and benchmarks; select it with
+FUGGERBOT_MARKET_DATA_PROVIDER=file:/path/to/dir.
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.logger import logger
+from core.metrics import metrics
+
+BAR_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+DEFAULT_LAKE_PATH = Path(__file__).parent.parent / "data" / "market_history.duckdb"
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|y)$")
+_PERIOD_UNITS = {"d": 1, "wk": 7, "mo": 30, "y": 365}
+
+
+def period_start(period: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Convert a yfinance period string (e.g. "60d", "1y", "ytd", "max") to a start time.
+
+    Returns:
+        Start datetime, or None for "max"
+    """
+    now = now or datetime.now()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return datetime(now.year, 1, 1)
+    match = _PERIOD_RE.match(period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    return now - timedelta(days=int(match.group(1)) * _PERIOD_UNITS[match.group(2)])
+
+
+def normalize_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize a provider frame to the gateway layout.
+
+    Flattens yfinance MultiIndex columns, fills Close from Adj Close, drops
+    timezone (keeping wall-clock time), sorts, de-duplicates and casts to float64.
+    """
+    if df is None or df.empty:
+        return pd.DataFrame(columns=BAR_COLUMNS, index=pd.DatetimeIndex([]), dtype="float64")
+
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    if "Close" not in df.columns and "Adj Close" in df.columns:
+        df["Close"] = df["Adj Close"]
+    for col in BAR_COLUMNS:
+        if col not in df.columns:
+            df[col] = np.nan
+
+    index = pd.DatetimeIndex(pd.to_datetime(df.index))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    df.index = index
+    df.index.name = "Date"
+
+    df = df[BAR_COLUMNS].astype("float64")
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    return df.dropna(subset=["Close"])
+
+
+class YFinanceProvider:
+    """Upstream provider backed by yfinance (and CoinGecko for BTC/ETH quotes)."""
+
+    name = "yfinance"
+
+    def fetch_bars(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        import yfinance as yf
+
+        ticker = yf.Ticker(symbol)
+        if start is None:
+            df = ticker.history(period="max", interval=interval)
+        else:
+            df = ticker.history(start=start, end=end, interval=interval)
+        return normalize_bars(df)
+
+    def fetch_quote(self, symbol: str) -> Optional[float]:
+        from dash.utils.price_feed import get_crypto_price, get_stock_price
+
+        if symbol.upper() in ["BTC", "ETH"]:
+            return get_crypto_price(symbol)
+        return get_stock_price(symbol)
+
+
+class FileBarProvider:
+    """
+    File-backed stand-in provider.
+
+    Reads `<SYMBOL>_<interval>.csv` (falling back to `<SYMBOL>.csv`) from a
+    directory; the first column is the timestamp. Quotes are the last close.
+    """
+
+    name = "file"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, symbol: str, interval: str) -> Optional[Path]:
+        for name in (f"{symbol}_{interval}.csv", f"{symbol}.csv"):
+            path = self.root / name
+            if path.exists():
+                return path
+        return None
+
+    def fetch_bars(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        path = self._path(symbol, interval)
+        if path is None:
+            return normalize_bars(None)
+        df = normalize_bars(pd.read_csv(path, index_col=0, parse_dates=True))
+        if start is not None:
+            df = df[df.index >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df.index <= pd.Timestamp(end)]
+        return df
+
+    def fetch_quote(self, symbol: str) -> Optional[float]:
+        df = self.fetch_bars(symbol, "1d")
+        return float(df["Close"].iloc[-1]) if not df.empty else None
+
+
+class _CacheEntry:
+    __slots__ = ("bars", "covered_from", "refreshed_at")
+
+    def __init__(self, bars: pd.DataFrame, covered_from: Optional[datetime], refreshed_at: float):
+        self.bars = bars
+        self.covered_from = covered_from  # None = full history
+        self.refreshed_at = refreshed_at
+
+
+class MarketDataGateway:
+    """Local-first, coalescing source of bars and quotes."""
+
+    def __init__(
+        self,
+        provider=None,
+        lake_path: Optional[Path] = DEFAULT_LAKE_PATH,
+        refresh_seconds: float = 60.0,
+        quote_ttl_seconds: float = 15.0,
+        max_workers: int = 8,
+        max_cached_series: int = 512
+    ):
+        """
+        Initialize the gateway.
+
+        Args:
+            provider: Upstream provider (default: from FUGGERBOT_MARKET_DATA_PROVIDER, else yfinance)
+            lake_path: DuckDB Data Lake path (None to disable)
+            refresh_seconds: Minimum seconds between upstream tail refreshes per key
+                (0 refetches the provisional last bar on every request)
+            quote_ttl_seconds: Seconds a quote is served from cache
+            max_workers: Threads used by batch requests
+            max_cached_series: Bar series (symbol + interval) kept in memory
+        """
+        self.provider = provider or _provider_from_env()
+        self.lake_path = Path(lake_path) if lake_path else None
+        self.refresh_seconds = refresh_seconds
+        self.quote_ttl_seconds = quote_ttl_seconds
+        self.max_workers = max_workers
+        self.max_cached_series = max_cached_series
+
+        self._bars: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
+        self._quotes: Dict[str, Tuple[Optional[float], float]] = {}
+        self._key_locks: Dict[object, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._lake_conn = None
+        self._lake_lock = threading.Lock()
+        self._lake_available = self.lake_path is not None and self.lake_path.exists()
+
+        self.stats = {
+            "cache_hits": 0, "lake_loads": 0, "upstream_calls": 0,
+            "quote_hits": 0, "quote_calls": 0, "evictions": 0,
+        }
+
+    def _lock_for(self, key) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    # ------------------------------------------------------------------
+    # Data Lake
+    # ------------------------------------------------------------------
+
+    def _load_from_lake(self, symbol: str, start: Optional[datetime]) -> pd.DataFrame:
+        """Daily bars for symbol from the Data Lake (empty frame if unavailable)."""
+        if not self._lake_available:
+            return normalize_bars(None)
+        try:
+            with self._lake_lock:
+                if self._lake_conn is None:
+                    import duckdb
+                    self._lake_conn = duckdb.connect(str(self.lake_path), read_only=True)
+                query = (
+                    "SELECT date, open, high, low, close, volume FROM ohlcv_history "
+                    "WHERE symbol = ?" + (" AND date >= ?" if start is not None else "") + " ORDER BY date"
+                )
+                params = [symbol] + ([start.date()] if start is not None else [])
+                with metrics.timer("duckdb.query", query="gateway_bars"):
+                    df = self._lake_conn.execute(query, params).fetchdf()
+        except Exception as e:
+            logger.warning(f"Data Lake unavailable ({e}); falling back to upstream provider")
+            self._lake_available = False
+            return normalize_bars(None)
+
+        if df.empty:
+            return normalize_bars(None)
+        self.stats["lake_loads"] += 1
+        df = df.set_index("date").rename(columns=str.capitalize)
+        return normalize_bars(df)
+
+    # ------------------------------------------------------------------
+    # Bars
+    # ------------------------------------------------------------------
+
+    def _fetch_upstream(self, symbol: str, interval: str, start: Optional[datetime]) -> pd.DataFrame:
+        self.stats["upstream_calls"] += 1
+        try:
+            return self.provider.fetch_bars(symbol, interval, start=start)
+        except Exception as e:
+            logger.error(f"Upstream fetch failed for {symbol} ({interval}): {e}")
+            return normalize_bars(None)
+
+    def _is_stale(self, entry: _CacheEntry) -> bool:
+        # The last bar may still be forming, so any entry older than
+        # refresh_seconds is refreshed (not only once a full bar has elapsed)
+        return time.time() - entry.refreshed_at >= self.refresh_seconds
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[_CacheEntry]:
+        with self._locks_guard:
+            entry = self._bars.get(key)
+            if entry is not None:
+                self._bars.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key: Tuple[str, str], entry: _CacheEntry) -> None:
+        with self._locks_guard:
+            self._bars[key] = entry
+            self._bars.move_to_end(key)
+            while len(self._bars) > self.max_cached_series:
+                self._bars.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_bars(
+        self,
+        symbol: str,
+        period: Optional[str] = "1y",
+        interval: str = "1d",
+        start: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Historical bars for a symbol.
+
+        Args:
+            symbol: Ticker symbol
+            period: yfinance-style period ("60d", "1y", "max", ...); ignored if start is given
+            interval: yfinance-style interval ("1d", "90m", "1h", ...)
+            start: Explicit start datetime
+
+        Returns:
+            DataFrame (DatetimeIndex, Open/High/Low/Close/Volume float64); empty if unavailable
+        """
+        now = datetime.now()
+        if start is None and period is not None:
+            start = period_start(period, now)
+        if isinstance(start, str):
+            start = pd.Timestamp(start).to_pydatetime()
+
+        key = (symbol, interval)
+        with self._lock_for(key):
+            entry = self._cache_get(key)
+            covers_start = entry is not None and (
+                entry.covered_from is None or (start is not None and entry.covered_from <= start)
+            )
+
+            if not covers_start:
+                bars = self._load_from_lake(symbol, start) if interval == "1d" else normalize_bars(None)
+                lake_covers = not bars.empty and (start is None or bars.index[0] <= pd.Timestamp(start) + timedelta(days=7))
+                if lake_covers:
+                    # Lake covers the head; only the tail after its last bar is fetched
+                    tail = self._fetch_upstream(symbol, interval, bars.index[-1].to_pydatetime())
+                    bars = normalize_bars(pd.concat([bars, tail])) if not tail.empty else bars
+                else:
+                    bars = self._fetch_upstream(symbol, interval, start)
+                entry = _CacheEntry(bars, start, time.time())
+                self._cache_put(key, entry)
+            elif self._is_stale(entry):
+                # Refetch from the provisional last bar (inclusive); the
+                # refetched copy replaces it (normalize_bars keeps the last duplicate)
+                last = entry.bars.index[-1].to_pydatetime() if not entry.bars.empty else start
+                tail = self._fetch_upstream(symbol, interval, last)
+                if not tail.empty:
+                    entry.bars = normalize_bars(pd.concat([entry.bars, tail]))
+                entry.refreshed_at = time.time()
+            else:
+                self.stats["cache_hits"] += 1
+
+            bars = entry.bars
+
+        if start is not None:
+            bars = bars[bars.index >= pd.Timestamp(start)]
+        return bars.copy()
+
+    def get_bars_batch(
+        self,
+        symbols: List[str],
+        period: Optional[str] = "1y",
+        interval: str = "1d",
+        start: Optional[datetime] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Bars for several symbols, fetched concurrently."""
+        unique = list(dict.fromkeys(symbols))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(unique)))) as pool:
+            frames = pool.map(lambda s: self.get_bars(s, period=period, interval=interval, start=start), unique)
+            return dict(zip(unique, frames))
+
+    def get_close_matrix(
+        self,
+        symbols: List[str],
+        period: Optional[str] = "60d",
+        interval: str = "1d"
+    ) -> pd.DataFrame:
+        """
+        Aligned close prices (columns = symbols, outer-joined on timestamp).
+        """
+        frames = self.get_bars_batch(symbols, period=period, interval=interval)
+        closes = {symbol: df["Close"] for symbol, df in frames.items() if not df.empty}
+        if not closes:
+            return pd.DataFrame()
+        return pd.DataFrame(closes).sort_index()
+
+    # ------------------------------------------------------------------
+    # Quotes
+    # ------------------------------------------------------------------
+
+    def get_quote(self, symbol: str) -> Optional[float]:
+        """Latest price for a symbol, cached for quote_ttl_seconds."""
+        key = ("quote", symbol.upper())
+        with self._lock_for(key):
+            cached = self._quotes.get(symbol.upper())
+            if cached and cached[0] is not None and time.time() - cached[1] < self.quote_ttl_seconds:
+                self.stats["quote_hits"] += 1
+                return cached[0]
+
+            self.stats["quote_calls"] += 1
+            try:
+                price = self.provider.fetch_quote(symbol)
+            except Exception as e:
+                logger.error(f"Quote fetch failed for {symbol}: {e}")
+                price = None
+            self._quotes[symbol.upper()] = (price, time.time())
+            return price
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop cached bars and quotes (for one symbol, or everything)."""
+        with self._locks_guard:
+            if symbol is None:
+                self._bars.clear()
+                self._quotes.clear()
+            else:
+                for key in [k for k in self._bars if k[0] == symbol]:
+                    del self._bars[key]
+                self._quotes.pop(symbol.upper(), None)
+
+
+def _provider_from_env():
+    spec = os.getenv("FUGGERBOT_MARKET_DATA_PROVIDER", "yfinance")
+    if spec.startswith("file:"):
+        return FileBarProvider(Path(spec[len("file:"):]))
+    return YFinanceProvider()
+
+
+# Singleton instance
+_market_data_gateway: Optional[MarketDataGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_market_data_gateway() -> MarketDataGateway:
+    """Get or create the shared market data gateway."""
+    global _market_data_gateway
+    if _market_data_gateway is None:
+        with _gateway_lock:
+            if _market_data_gateway is None:
+                _market_data_gateway = MarketDataGateway()
+    return _market_data_gateway
+
+
+def set_market_data_gateway(gateway: Optional[MarketDataGateway]) -> None:
+    """Replace the shared gateway (e.g. with a file-backed one in tests)."""
+    global _market_data_gateway
+    _market_data_gateway = gateway
@@ -5,7 +5,6 @@ Fetches relevant financial news from RSS feeds to provide market context for tra
 """
 import logging
 from typing import Dict, List, Optional
-import feedparser
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -78,6 +77,7 @@ class NewsFetcher:
             List of headline dictionaries with 'title' and 'published' keys
         """
         try:
+            import feedparser  # deferred: services/__init__ imports this module
             feed = feedparser.parse(url)
             
             headlines = []
@@ -25,7 +25,7 @@ class PortfolioServiceDB:
             return repo.list_trades()
 
     def record_paper_trade(self, symbol: str, side: str, qty: float, price: float):
-        with self.sessionmaker() as session:
+        with self.sessionmaker() as session, session.begin():
             repo = PaperTradeRepository(session)
             trade = PaperTrade(
                 symbol=symbol,
@@ -34,7 +34,7 @@ class PortfolioServiceDB:
                 price=price,
                 timestamp=datetime.utcnow(),
             )
-            repo.add_trade(trade)
+            repo.add_trades([trade])
 
 
 
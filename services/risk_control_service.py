@@ -10,12 +10,13 @@ import random
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import uuid
 
 # Import SMS notifier from core (assuming it stays there for now, or we could move it too)
 # The plan said "Ensure it relies on core.sms_notifier"
 from core.sms_notifier import get_sms_notifier
+from services.approval_registry import get_approval_registry
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,8 @@ class RiskControlService:
         self.confirmation_file = confirmation_file
         self.confirmation_file.parent.mkdir(parents=True, exist_ok=True)
         self.sms_notifier = get_sms_notifier()
+        # SMS replies / other processes' decisions are checked by the registry's shared poller
+        get_approval_registry().set_poller(self.poll_approvals)
         
         logger.info(f"RiskControlService initialized (Store: {self.confirmation_file})")
 
@@ -105,6 +108,7 @@ class RiskControlService:
                 "status": "pending"
             }
             self._save_confirmation(trade_id, confirmation)
+            get_approval_registry().register(trade_id, timeout=15 * 60)
             logger.info(f"Confirmation requested for {trade_id}: {symbol} {action}")
             return trade_id
         else:
@@ -141,6 +145,44 @@ class RiskControlService:
             
         # Check for new SMS replies
         messages = self.sms_notifier.get_recent_messages(limit=10)
+        return self._match_sms_approval(trade_id, confirmation, messages)
+
+    def poll_approvals(self, trade_ids: List[str]) -> None:
+        """
+        Resolve decided approvals in the approval registry.
+        
+        One confirmation-file read and at most one SMS fetch cover every
+        pending trade ID (status changes made by other processes included).
+        
+        Args:
+            trade_ids: Pending trade IDs to check
+        """
+        registry = get_approval_registry()
+        confirmations = self._load_confirmations()
+        undecided = []
+        for trade_id in trade_ids:
+            confirmation = confirmations.get(trade_id)
+            if confirmation is None:
+                continue
+            status = confirmation.get("status")
+            if status == "approved":
+                registry.resolve(trade_id, True)
+            elif status == "rejected":
+                registry.resolve(trade_id, False, "Rejected")
+            elif datetime.now() > datetime.fromisoformat(confirmation["expires_at"]):
+                registry.resolve(trade_id, False, "Expired")
+            else:
+                undecided.append(trade_id)
+        
+        if not undecided or not self.sms_notifier.is_available():
+            return
+        
+        messages = self.sms_notifier.get_recent_messages(limit=10)
+        for trade_id in undecided:
+            self._match_sms_approval(trade_id, confirmations[trade_id], messages)
+
+    def _match_sms_approval(self, trade_id: str, confirmation: Dict, messages) -> bool:
+        """Mark the trade approved if an SMS reply approves it."""
         if not messages:
             return False
             
@@ -186,6 +228,7 @@ class RiskControlService:
         confirmation["approved_at"] = datetime.now().isoformat()
         self._save_confirmation(trade_id, confirmation)
         logger.info(f"✅ Trade {trade_id} APPROVED via SMS/API.")
+        get_approval_registry().resolve(trade_id, True)
 
     def _verify_timing(self, msg_date, request_time) -> bool:
         """
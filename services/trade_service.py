@@ -9,9 +9,10 @@ from typing import Optional, Dict, List
 from datetime import datetime
 
 from services.risk_control_service import RiskControlService as TradeConfirmation
+from services.approval_registry import get_approval_registry
 from execution.ibkr import get_ibkr_trader as get_live_trading_trader, get_paper_trading_trader
 from services.ibkr_client import get_ibkr_client
-from persistence.db import SessionLocal
+from persistence.db import session_scope
 from persistence.repositories_trades import TradeRequestRepository, TradeExecutionRepository
 from persistence.models_trades import TradeRequest
 from core.logger import logger
@@ -161,6 +162,7 @@ class TradeService:
                         conf["status"] = "rejected"
                         conf["rejected_at"] = datetime.now().isoformat()
                         self.confirmation._save_confirmation(code, conf)
+                        get_approval_registry().resolve(code, False, "Rejected")
                         found = True
                         trade_details = conf.get("trade_details", {})
                         log_trade_event(
@@ -269,78 +271,58 @@ class TradeService:
                 limit_price=trade_request.price
             )
             
-            # Update database
-            with SessionLocal() as session:
-                request_repo = TradeRequestRepository(session)
-                exec_repo = TradeExecutionRepository(session)
-                
-                # Record execution (success or failure)
-                execution_id = None
-                if order_result.get("success"):
+            # Update database (status and execution in one transaction)
+            success = bool(order_result.get("success"))
+            order_id = order_result.get("order_id") if success else None
+            if success:
+                status = order_result.get("status", "Submitted")
+                # Get execution price if available
+                execution_price = order_result.get("execution_price", trade_request.price or 0.0)
+                error_msg = None
+            else:
+                # Order failed - record execution with error but keep status as pending
+                status = "Rejected"
+                execution_price = 0.0
+                error_msg = order_result.get("message", "Unknown error")
+            
+            with session_scope() as session:
+                if success:
                     # Order was successfully placed - update status to "submitted"
-                    updated_request = request_repo.update_request_status(
-                        trade_request.trade_id,
-                        "submitted"
-                    )
-                    
-                    if not updated_request:
+                    updated = TradeRequestRepository(session).update_statuses([trade_request.trade_id], "submitted")
+                    if not updated:
                         logger.warning(f"Could not update trade request {trade_request.trade_id} status")
-                    order_id = order_result.get("order_id")
-                    status = order_result.get("status", "Submitted")
-                    
-                    # Get execution price if available
-                    execution_price = trade_request.price if trade_request.price else 0.0
-                    if "execution_price" in order_result:
-                        execution_price = order_result["execution_price"]
-                    
-                    # Create execution record
-                    execution = exec_repo.record_execution(
-                        trade_request_id=trade_request.id,
-                        symbol=trade_request.symbol,
-                        action=trade_request.action,
-                        quantity=trade_request.quantity,
-                        execution_price=execution_price,
-                        status=status,
-                        order_id=str(order_id) if order_id else None,
-                        broker_response=order_result,
-                        forecast_id=trade_request.forecast_id,
-                        paper_trading=trade_request.paper_trading,
-                        error_message=None if order_result.get("success") else order_result.get("message")
-                    )
-                    execution_id = execution.id
-                    logger.info(f"Trade execution recorded: execution_id={execution_id}, order_id={order_id}")
-                    
-                    log_trade_event(
-                        event_type="executed",
-                        symbol=trade_request.symbol,
-                        action=trade_request.action,
-                        quantity=trade_request.quantity,
-                        price=execution_price,
-                        trade_id=trade_request.trade_id,
-                        status=status,
-                        order_id=str(order_id) if order_id else None,
-                        execution_id=execution_id,
-                        paper_trading=trade_request.paper_trading
-                    )
-                else:
-                    # Order failed - record execution with error but keep status as pending
-                    error_msg = order_result.get("message", "Unknown error")
-                    execution = exec_repo.record_execution(
-                        trade_request_id=trade_request.id,
-                        symbol=trade_request.symbol,
-                        action=trade_request.action,
-                        quantity=trade_request.quantity,
-                        execution_price=0.0,
-                        status="Rejected",
-                        order_id=None,
-                        broker_response=order_result,
-                        forecast_id=trade_request.forecast_id,
-                        paper_trading=trade_request.paper_trading,
-                        error_message=error_msg
-                    )
-                    execution_id = execution.id
-                    logger.warning(f"Order submission failed, execution recorded with error: {error_msg}")
-                    # Status remains "pending" - can retry later
+                
+                execution_id = TradeExecutionRepository(session).record_executions([{
+                    "trade_request_id": trade_request.id,
+                    "symbol": trade_request.symbol,
+                    "action": trade_request.action,
+                    "quantity": trade_request.quantity,
+                    "execution_price": execution_price,
+                    "status": status,
+                    "order_id": str(order_id) if order_id else None,
+                    "broker_response": order_result,
+                    "forecast_id": trade_request.forecast_id,
+                    "paper_trading": trade_request.paper_trading,
+                    "error_message": error_msg,
+                }])[0]
+            
+            if success:
+                logger.info(f"Trade execution recorded: execution_id={execution_id}, order_id={order_id}")
+                log_trade_event(
+                    event_type="executed",
+                    symbol=trade_request.symbol,
+                    action=trade_request.action,
+                    quantity=trade_request.quantity,
+                    price=execution_price,
+                    trade_id=trade_request.trade_id,
+                    status=status,
+                    order_id=str(order_id) if order_id else None,
+                    execution_id=execution_id,
+                    paper_trading=trade_request.paper_trading
+                )
+            else:
+                logger.warning(f"Order submission failed, execution recorded with error: {error_msg}")
+                # Status remains "pending" - can retry later
             
             # Return result with execution_id
             result = {
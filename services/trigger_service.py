@@ -50,6 +50,19 @@ class TriggerService:
                 return []
         return []
     
+    def version(self) -> Optional[tuple]:
+        """
+        Cheap change token for the trigger file (mtime + size, no parsing).
+        
+        Returns:
+            Token that changes whenever the file is rewritten, or None if it does not exist
+        """
+        try:
+            stat = self.trigger_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
     def save_triggers(self, triggers: List[Dict[str, Any]]) -> bool:
         """
         Save triggers to file.
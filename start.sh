@@ -10,6 +10,9 @@ mkdir -p data/logs data/forecasts data/paper_trades
 # Set default port if not provided
 PORT=${PORT:-8080}
 
+# Start the job worker pool (runs War Games / optimizer jobs outside the API process)
+python -m workers.job_worker --workers ${JOB_WORKERS:-2} &
+
 # Start the application
 exec uvicorn main:app --host 0.0.0.0 --port ${PORT} --loop asyncio
 
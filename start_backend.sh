@@ -11,6 +11,11 @@ echo ""
 
 # Kill any existing instances
 pkill -9 -f "uvicorn main:app" 2>/dev/null
+pkill -f "workers.job_worker" 2>/dev/null
+
+# Start the job worker pool (runs War Games / optimizer jobs outside the API process)
+nohup python -m workers.job_worker --workers ${JOB_WORKERS:-2} \
+    > /tmp/fuggerbot_jobs.log 2>&1 &
 
 # Start with asyncio loop (required for nest_asyncio + ib_insync)
 nohup python -m uvicorn main:app \
@@ -27,6 +32,7 @@ if curl -s http://localhost:8000/health > /dev/null 2>&1; then
     echo "   API: http://localhost:8000"
     echo "   Docs: http://localhost:8000/docs"
     echo "   Logs: tail -f /tmp/fuggerbot_backend.log"
+    echo "   Job worker logs: tail -f /tmp/fuggerbot_jobs.log"
 else
     echo "❌ Backend failed to start. Check logs:"
     echo "   tail -f /tmp/fuggerbot_backend.log"
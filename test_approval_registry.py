@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Test script for the trade approval registry."""
+import asyncio
+import threading
+import time
+
+from services import approval_registry
+from services.approval_registry import ApprovalRegistry
+
+
+def resolve_later(registry, trade_id, approved, delay=0.05, reason=None):
+    threading.Timer(delay, registry.resolve, args=(trade_id, approved, reason)).start()
+
+
+def test_blocking_wait_wakes_on_resolve():
+    registry = ApprovalRegistry(poll_interval=60)
+    resolve_later(registry, "T1", True)
+    start = time.monotonic()
+    assert registry.wait_blocking("T1", timeout=5) is True
+    assert time.monotonic() - start < 1, "waiter should wake on resolve, not on a poll"
+    assert registry.pending_ids() == []
+
+
+def test_async_waiters_and_callbacks():
+    registry = ApprovalRegistry(poll_interval=60)
+    calls = []
+    registry.add_callback("T2", lambda trade_id, approved: calls.append((trade_id, approved)))
+
+    async def main():
+        resolve_later(registry, "T2", False, reason="Rejected")
+        return await asyncio.gather(registry.wait("T2", timeout=5), registry.wait("T2", timeout=5))
+
+    assert asyncio.run(main()) == [False, False]
+    assert calls == [("T2", False)]
+    assert registry.decision("T2") == (False, "Rejected")
+
+
+def test_first_decision_wins_and_late_waiters_return():
+    registry = ApprovalRegistry(poll_interval=60)
+    registry.register("T3")
+    assert registry.resolve("T3", True) is True
+    assert registry.resolve("T3", False, "Rejected") is False
+    assert registry.wait_blocking("T3", timeout=0) is True
+    assert asyncio.run(registry.wait("T3", timeout=0)) is True
+
+    calls = []
+    registry.add_callback("T3", lambda trade_id, approved: calls.append(approved))
+    assert calls == [True], "callbacks added after the decision run immediately"
+
+
+def test_timeout_resolves_not_approved():
+    registry = ApprovalRegistry(poll_interval=60)
+    assert registry.wait_blocking("T4", timeout=0.05) is False
+    assert registry.decision("T4") == (False, "Approval Timeout")
+    assert asyncio.run(registry.wait("T5", timeout=0.05)) is False
+    assert registry.decision("T5") == (False, "Approval Timeout")
+
+
+def test_poller_checks_all_pending_in_one_pass():
+    registry = ApprovalRegistry(poll_interval=0.02)
+    passes = []
+
+    def poller(trade_ids):
+        passes.append(sorted(trade_ids))
+        for trade_id in trade_ids:
+            registry.resolve(trade_id, trade_id == "A")
+
+    registry.set_poller(poller)
+    registry.register("A")
+    registry.register("B")
+    assert registry.wait_blocking("A", timeout=5) is True
+    assert registry.wait_blocking("B", timeout=5) is False
+    assert passes[0] == ["A", "B"]
+
+    # The poller thread exits once nothing is pending
+    time.sleep(0.1)
+    assert registry._poll_thread is None
+
+
+def test_poller_expires_stale_approvals():
+    registry = ApprovalRegistry(poll_interval=0.02)
+    registry.register("T6", timeout=0.01)
+    assert registry.wait_blocking("T6", timeout=5) is False
+    assert registry.decision("T6") == (False, "Approval Timeout")
+
+
+def test_decisions_are_bounded():
+    registry = ApprovalRegistry(poll_interval=60)
+    for i in range(approval_registry.MAX_DECIDED + 10):
+        registry.resolve(f"D{i}", True)
+    assert registry.decision("D0") is None
+    assert registry.decision(f"D{approval_registry.MAX_DECIDED + 9}") == (True, None)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            print(f"Running {name}...")
+            test()
+    print("\n✅ Approval registry OK")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Randomized check of the indexed trigger engine against
+TriggerEvaluator.evaluate_condition (the one-trigger-at-a-time reference).
+"""
+import random
+import tempfile
+from pathlib import Path
+
+from core.trigger_engine import TriggerEngine, TriggerIndex, LEVEL_CONDITIONS
+from services.trigger_service import TriggerService
+from workers.trigger_evaluator import TriggerEvaluator
+
+SYMBOLS = ["AAPL", "MSFT", "BTC-USD"]
+CONDITIONS = [">", "<", "rise_pct", "drop_pct"]
+
+evaluator = TriggerEvaluator()
+
+
+def random_threshold(rng, condition):
+    """Thresholds on a coarse grid so prices often land exactly on them."""
+    if condition in LEVEL_CONDITIONS:
+        return rng.randint(180, 220) / 2
+    return rng.randint(0, 10) / 2
+
+
+def random_trigger(rng, trigger_id):
+    condition = rng.choice(CONDITIONS)
+    threshold = random_threshold(rng, condition)
+    trigger = {
+        "id": trigger_id,
+        "symbol": rng.choice(SYMBOLS + ["aapl"]),
+        "condition": condition,
+        "enabled": rng.random() > 0.2,
+    }
+    trigger["value" if rng.random() > 0.3 else "price"] = threshold
+    return trigger
+
+
+def threshold_of(trigger):
+    return float(trigger.get("value", trigger.get("price", 0)))
+
+
+def level_key(trigger):
+    return (trigger["symbol"].upper(), trigger["condition"], threshold_of(trigger), trigger["id"])
+
+
+def fired_ids(triggers):
+    return sorted(t["id"] for t in triggers)
+
+
+def test_index_level_mode(rounds=2000, seed=1):
+    """Level mode fires exactly the triggers evaluate_condition accepts."""
+    rng = random.Random(seed)
+    triggers = [random_trigger(rng, i) for i in range(60)]
+    index = TriggerIndex(triggers)
+    for _ in range(rounds):
+        symbol = rng.choice(SYMBOLS)
+        price = rng.randint(170, 230) / 2
+        previous = rng.choice([None, 0, rng.randint(170, 230) / 2])
+        expected = [
+            t for t in triggers
+            if t["enabled"] and t["symbol"].upper() == symbol
+            and evaluator.evaluate_condition(t["condition"], price, threshold_of(t), previous)
+        ]
+        actual = index.fired(symbol, price, previous_price=previous)
+        assert fired_ids(actual) == fired_ids(expected), (symbol, price, previous)
+
+
+def test_engine_crossing_with_rebuilds(rounds=5000, seed=2):
+    """
+    Crossing mode fires ">"/"<" triggers whose condition became true since the
+    last price; the first price per symbol, and thresholds added or changed by
+    a rebuild, get one level check instead.
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = TriggerEngine(TriggerService(Path(tmp) / "triggers.json"))
+        next_id = 40
+        triggers = [random_trigger(rng, i) for i in range(next_id)]
+        engine.load(triggers)
+
+        last = {}
+        level_check = set()
+        prices = {s: 100.0 for s in SYMBOLS}
+        for _ in range(rounds):
+            if rng.random() < 0.02:
+                # Rebuild: change thresholds, toggle, add and remove triggers
+                old_keys = {level_key(t) for t in triggers if t["enabled"] and t["condition"] in LEVEL_CONDITIONS}
+                triggers = [dict(t) for t in triggers if rng.random() > 0.1]
+                for t in triggers:
+                    roll = rng.random()
+                    if roll < 0.1:
+                        t.pop("price", None)
+                        t["value"] = random_threshold(rng, t["condition"])
+                    elif roll < 0.2:
+                        t["enabled"] = not t["enabled"]
+                for _ in range(rng.randint(0, 5)):
+                    triggers.append(random_trigger(rng, next_id))
+                    next_id += 1
+                engine.load(triggers)
+                new_keys = {level_key(t) for t in triggers if t["enabled"] and t["condition"] in LEVEL_CONDITIONS}
+                level_check = {
+                    k for k in new_keys
+                    if (k in level_check or k not in old_keys) and k[0] in last
+                }
+                continue
+
+            symbol = rng.choice(SYMBOLS)
+            previous = prices[symbol]
+            price = max(85.0, min(115.0, previous + rng.randint(-6, 6) / 2))
+            prices[symbol] = price
+
+            expected = []
+            for t in triggers:
+                if not t["enabled"] or t["symbol"].upper() != symbol:
+                    continue
+                holds = evaluator.evaluate_condition(t["condition"], price, threshold_of(t), previous)
+                if t["condition"] in LEVEL_CONDITIONS and symbol in last and level_key(t) not in level_check:
+                    holds = holds and not evaluator.evaluate_condition(t["condition"], last[symbol], threshold_of(t))
+                if holds:
+                    expected.append(t)
+            level_check = {k for k in level_check if k[0] != symbol}
+            last[symbol] = price
+
+            actual = engine.on_price(symbol, price, previous_price=previous)
+            assert fired_ids(actual) == fired_ids(expected), (symbol, previous, price)
+
+
+if __name__ == "__main__":
+    print("Checking TriggerIndex level mode...")
+    test_index_level_mode()
+    print("Checking TriggerEngine crossing mode with rebuilds...")
+    test_engine_crossing_with_rebuilds()
+    print("\n✅ Trigger engine matches evaluate_condition")
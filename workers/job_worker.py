@@ -0,0 +1,250 @@
+"""
+Job worker pool.
+
+Runs jobs from the persistent job queue (daemon/job_queue.py) in separate
+worker processes, so War Games and optimizer runs never execute inside the
+API process and survive API restarts.
+
+Usage:
+    python -m workers.job_worker --workers 2 --limit simulation=1 --limit optimizer=1
+"""
+import time
+import os
+import multiprocessing
+from typing import Dict, Any, Callable, Optional, List
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from daemon.job_queue import JobQueue, JobStatus, Job
+from core.logger import logger
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when its job has been cancelled."""
+
+
+ProgressReporter = Callable[[int, str], None]
+
+
+def run_simulation(payload: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """Run the War Games campaign suite."""
+    from daemon.simulator.war_games_runner import WarGamesRunner
+
+    report(10, "Initializing War Games...")
+    runner = WarGamesRunner()
+    output = runner.run_all_scenarios(progress_callback=report)
+    return {"scenarios_run": output.get("total_campaigns", 0)}
+
+
+def run_optimizer(payload: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """Run the Strategy Optimizer over the latest War Games results."""
+    from agents.trm.strategy_optimizer_agent import StrategyOptimizerAgent
+
+    report(10, "Initializing Optimizer...")
+    optimizer = StrategyOptimizerAgent()
+    report(50, "Optimizing Parameters...")
+    results = optimizer.optimize()
+    return {"configurations": len(results)}
+
+
+# Job type -> handler(payload, report) -> result dict
+JOB_HANDLERS: Dict[str, Callable[[Dict[str, Any], ProgressReporter], Dict[str, Any]]] = {
+    "simulation": run_simulation,
+    "optimizer": run_optimizer,
+}
+
+# Max concurrently RUNNING jobs per type across all workers
+DEFAULT_CONCURRENCY_LIMITS: Dict[str, int] = {
+    "simulation": 1,
+    "optimizer": 1,
+}
+
+COMPLETION_MESSAGES = {
+    "simulation": "Simulations Complete",
+    "optimizer": "Optimization Complete",
+}
+
+
+class JobWorker:
+    """Claims and executes jobs from the queue, one at a time."""
+
+    def __init__(
+        self,
+        queue: Optional[JobQueue] = None,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        poll_interval: float = 1.0
+    ):
+        """
+        Initialize job worker.
+
+        Args:
+            queue: Job queue (default: data/job_queue.db)
+            concurrency_limits: Max RUNNING jobs per type across all workers
+            poll_interval: Seconds to wait when no job is available
+        """
+        self.queue = queue or JobQueue()
+        self.concurrency_limits = concurrency_limits or dict(DEFAULT_CONCURRENCY_LIMITS)
+        self.poll_interval = poll_interval
+        self.running = False
+
+    def _reporter(self, job: Job) -> ProgressReporter:
+        def report(progress: int, message: str):
+            if self.queue.is_cancel_requested(job.id):
+                raise JobCancelled(job.id)
+            self.queue.update_job(job.id, progress=progress, message=message)
+        return report
+
+    def execute(self, job: Job) -> None:
+        """Run a claimed job and record its outcome."""
+        handler = JOB_HANDLERS.get(job.type)
+        if handler is None:
+            self.queue.update_job(job.id, status=JobStatus.FAILED, message=f"Unknown job type: {job.type}")
+            return
+
+        started = time.time()
+        logger.info(f"Job {job.id} ({job.type}) started")
+        try:
+            result = handler(job.payload or {}, self._reporter(job))
+            self.queue.update_job(
+                job.id,
+                status=JobStatus.COMPLETED,
+                progress=100,
+                message=COMPLETION_MESSAGES.get(job.type, "Complete"),
+                result=result
+            )
+            logger.info(f"Job {job.id} ({job.type}) completed in {time.time() - started:.1f}s")
+        except JobCancelled:
+            self.queue.update_job(job.id, status=JobStatus.CANCELLED, message="Cancelled")
+            logger.info(f"Job {job.id} ({job.type}) cancelled")
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.type}) failed: {e}", exc_info=True)
+            self.queue.update_job(job.id, status=JobStatus.FAILED, message=str(e))
+
+    def run_once(self) -> bool:
+        """
+        Claim and execute at most one job.
+
+        Returns:
+            True if a job was executed
+        """
+        job = self.queue.claim_next_job(
+            JOB_HANDLERS.keys(),
+            concurrency_limits=self.concurrency_limits,
+            worker_pid=os.getpid()
+        )
+        if job is None:
+            return False
+        self.execute(job)
+        return True
+
+    def start(self):
+        """Run the claim/execute loop until stopped."""
+        self.running = True
+        logger.info(f"JobWorker {os.getpid()} started (limits: {self.concurrency_limits})")
+        while self.running:
+            try:
+                if not self.run_once():
+                    time.sleep(self.poll_interval)
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                logger.error(f"JobWorker loop error: {e}", exc_info=True)
+                time.sleep(self.poll_interval)
+        self.running = False
+
+    def stop(self):
+        """Stop after the current job."""
+        self.running = False
+
+
+def _worker_main(db_path: str, concurrency_limits: Dict[str, int], poll_interval: float):
+    JobWorker(JobQueue(Path(db_path)), concurrency_limits, poll_interval).start()
+
+
+class JobWorkerPool:
+    """Supervises a fixed number of JobWorker processes."""
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        poll_interval: float = 1.0,
+        db_path: Optional[Path] = None
+    ):
+        self.num_workers = num_workers
+        self.concurrency_limits = concurrency_limits or dict(DEFAULT_CONCURRENCY_LIMITS)
+        self.poll_interval = poll_interval
+        self.queue = JobQueue(db_path)
+        self.processes: List[multiprocessing.Process] = []
+
+    def _spawn(self) -> multiprocessing.Process:
+        process = multiprocessing.Process(
+            target=_worker_main,
+            args=(str(self.queue.db_path), self.concurrency_limits, self.poll_interval),
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def start(self):
+        """Start workers and restart any that exit, until interrupted."""
+        requeued = self.queue.requeue_orphaned_jobs()
+        if requeued:
+            logger.info(f"Requeued {requeued} orphaned job(s)")
+
+        self.processes = [self._spawn() for _ in range(self.num_workers)]
+        logger.info(f"JobWorkerPool started with {self.num_workers} worker(s)")
+
+        try:
+            while True:
+                time.sleep(5)
+                for i, process in enumerate(self.processes):
+                    if not process.is_alive():
+                        logger.warning(f"Worker {process.pid} exited ({process.exitcode}); restarting")
+                        self.queue.requeue_orphaned_jobs()
+                        self.processes[i] = self._spawn()
+        except KeyboardInterrupt:
+            logger.info("JobWorkerPool stopped by user")
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Terminate all worker processes."""
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            process.join(timeout=10)
+        self.queue.requeue_orphaned_jobs()
+
+
+def main():
+    """Main entry point for the job worker pool."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="FuggerBot Job Worker Pool")
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes (default: 2)")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Idle poll interval in seconds")
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="TYPE=N",
+        help="Concurrency limit per job type (e.g. simulation=1); repeatable"
+    )
+    args = parser.parse_args()
+
+    limits = dict(DEFAULT_CONCURRENCY_LIMITS)
+    for item in args.limit:
+        job_type, _, value = item.partition("=")
+        limits[job_type] = int(value)
+
+    JobWorkerPool(args.workers, limits, args.poll_interval).start()
+
+
+if __name__ == "__main__":
+    main()
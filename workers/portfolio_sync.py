@@ -5,7 +5,7 @@ Continuously syncs IBKR account summary and positions to the database.
 """
 import time
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 from pathlib import Path
 import sys
 
@@ -14,24 +14,29 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from services.ibkr_client import get_ibkr_client
-from persistence.db import SessionLocal
+from persistence.db import session_scope
 from persistence.repositories_portfolio import AccountStateRepository, PositionRepository
+from services.market_data_bus import start_market_data_feed
 from core.logger import logger
+from core.metrics import metrics
 
 
 class PortfolioSync:
     """Syncs IBKR portfolio data to database."""
     
-    def __init__(self, interval_seconds: int = 60, paper_trading: bool = False):
+    def __init__(self, interval_seconds: int = 60, paper_trading: bool = False, resync_move_pct: float = 1.0):
         """
         Initialize portfolio sync worker.
         
         Args:
             interval_seconds: How often to sync (default: 60 seconds)
             paper_trading: Whether to sync paper trading account
+            resync_move_pct: Held-position price move (%) that triggers an early sync
         """
         self.interval_seconds = interval_seconds
         self.paper_trading = paper_trading
+        self.resync_move_pct = resync_move_pct
+        self.held_symbols: List[str] = []
         self.ibkr_client = get_ibkr_client(paper_trading=paper_trading)
         self.running = False
         logger.info(f"PortfolioSync initialized (interval: {interval_seconds}s, paper_trading={paper_trading})")
@@ -74,6 +79,7 @@ class PortfolioSync:
                     logger.warning(f"Error processing position {pos.contract.symbol if hasattr(pos, 'contract') else 'UNKNOWN'}: {e}")
                     continue
             
+            self.held_symbols = [p["symbol"] for p in result]
             return result
         except Exception as e:
             logger.error(f"Error getting IBKR positions: {e}", exc_info=True)
@@ -103,17 +109,20 @@ class PortfolioSync:
             realized_pnl = 0.0  # Would need to track from trade history
             unrealized_pnl = 0.0  # Will be calculated from positions
             
-            # Save to database
-            with SessionLocal() as session:
+            # Save to database (skipped when nothing changed since the last snapshot)
+            with session_scope() as session:
                 repo = AccountStateRepository(session)
-                state = repo.add_state(
+                state_id = repo.add_state_if_changed(
                     cash=cash,
                     buying_power=buying_power,
                     realized_pnl=realized_pnl,
                     unrealized_pnl=unrealized_pnl,
                     equity=equity
                 )
-                logger.info(f"Synced account state: equity=${equity:,.2f}, cash=${cash:,.2f}, buying_power=${buying_power:,.2f}")
+                if state_id is None:
+                    logger.debug("Account state unchanged, skipping write")
+                else:
+                    logger.info(f"Synced account state: equity=${equity:,.2f}, cash=${cash:,.2f}, buying_power=${buying_power:,.2f}")
                 return True
         except Exception as e:
             logger.error(f"Error syncing account state: {e}", exc_info=True)
@@ -129,40 +138,23 @@ class PortfolioSync:
         try:
             positions = self.get_ibkr_positions()
             
-            # Save to database
-            with SessionLocal() as session:
-                repo = PositionRepository(session)
-                
-                # Get existing positions to track which ones to delete
-                existing_positions = repo.list_positions()
-                existing_symbols = {pos.symbol for pos in existing_positions}
-                synced_symbols = set()
-                
-                if positions:
-                    for pos_data in positions:
-                        repo.upsert_position(
-                            symbol=pos_data["symbol"],
-                            quantity=pos_data["quantity"],
-                            avg_cost=pos_data["avg_cost"],
-                            market_value=pos_data["market_value"],
-                            unrealized_pnl=pos_data["unrealized_pnl"]
-                        )
-                        synced_symbols.add(pos_data["symbol"].upper())
-                    
-                    logger.info(f"Synced {len(positions)} positions to database")
-                else:
-                    logger.debug("No positions found in IBKR account")
-                
-                # Delete positions that no longer exist in IBKR
-                for symbol in existing_symbols - synced_symbols:
-                    repo.delete_position(symbol)
-                    logger.info(f"Deleted position for {symbol} (no longer in IBKR account)")
-                
-                return True
+            # Apply the diff against stored positions in one transaction
+            with session_scope() as session:
+                counts = PositionRepository(session).sync_positions(positions, commit=False)
+            
+            if not positions:
+                logger.debug("No positions found in IBKR account")
+            changed = counts["inserted"] + counts["updated"] + counts["deleted"]
+            (logger.info if changed else logger.debug)(
+                f"Synced {len(positions)} positions to database "
+                f"(+{counts['inserted']} ~{counts['updated']} -{counts['deleted']}, {counts['unchanged']} unchanged)"
+            )
+            return True
         except Exception as e:
             logger.error(f"Error syncing positions: {e}", exc_info=True)
             return False
     
+    @metrics.timed("daemon.cycle", daemon="portfolio_sync")
     def sync_once(self) -> Dict:
         """
         Run a single sync cycle.
@@ -201,20 +193,38 @@ class PortfolioSync:
         }
     
     def run_forever(self):
-        """Run the sync continuously."""
+        """
+        Run the sync continuously.
+        
+        Syncs every interval, or early when a held position's price moves by
+        resync_move_pct on the market data bus.
+        """
         self.running = True
         logger.info(f"Portfolio sync started (interval: {self.interval_seconds}s, paper_trading={self.paper_trading})")
+        bus = start_market_data_feed()
+        metrics.start_snapshot_writer("portfolio_sync")
+        
+        watched: Set[str] = set()
         
         try:
             while self.running:
                 self.sync_once()
-                time.sleep(self.interval_seconds)
+                held = {s.upper() for s in self.held_symbols}
+                if held != watched:
+                    bus.watch(held - watched)
+                    bus.unwatch(watched - held)
+                    watched = held
+                moved = bus.wait_for_move(self.held_symbols, self.resync_move_pct, timeout=self.interval_seconds)
+                if moved:
+                    logger.info(f"Held positions moved ({', '.join(moved)}), syncing early")
         except KeyboardInterrupt:
             logger.info("Portfolio sync stopped by user")
             self.running = False
         except Exception as e:
             logger.error(f"Error in portfolio sync: {e}", exc_info=True)
             self.running = False
+        finally:
+            bus.unwatch(watched)
     
     def stop(self):
         """Stop the sync."""
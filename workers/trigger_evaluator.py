@@ -1,12 +1,14 @@
 """
 Trigger evaluator worker.
 
-Runs periodically to evaluate enabled triggers and emit events.
+Evaluates enabled triggers as live quotes arrive on the market data bus
+and emits events.
 """
 import time
 import json
+import queue
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import sys
 
@@ -16,12 +18,15 @@ sys.path.insert(0, str(project_root))
 
 from services.trigger_service import get_trigger_service
 from dash.utils.price_feed import get_price
-from persistence.db import SessionLocal
+from services.market_data_bus import get_market_data_bus, start_market_data_feed, QUOTE
+from persistence.db import session_scope
 from persistence.models_triggers import TriggerEvent
 from persistence.repositories_triggers import TriggerResultRepository, TradeCandidateRepository
 from core.logger import logger
 from core.logger import log_trigger_fire
 from core.alert_router import get_alert_router
+from core.trigger_engine import TriggerEngine
+from core.metrics import metrics
 
 
 class TriggerEvaluator:
@@ -37,6 +42,8 @@ class TriggerEvaluator:
         self.interval_seconds = interval_seconds
         self.trigger_service = get_trigger_service()
         self.alert_router = get_alert_router()
+        self.bus = get_market_data_bus()
+        self.engine = TriggerEngine(self.trigger_service)
         self.running = False
         logger.info(f"TriggerEvaluator initialized with {interval_seconds}s interval")
     
@@ -77,160 +84,176 @@ class TriggerEvaluator:
             logger.warning(f"Unknown condition type: {condition}")
             return False
     
-    def get_previous_price(self, symbol: str) -> Optional[float]:
+    def get_current_price(self, symbol: str) -> Optional[float]:
         """
-        Get previous price for a symbol (from last evaluation or cache).
+        Current price for a symbol.
         
-        For now, this is a simple implementation. In production, you might
-        want to cache prices or fetch historical data.
+        Uses the market data bus if it has a fresh quote; otherwise fetches one
+        and publishes it so the bus keeps the price history.
         
         Args:
             symbol: Trading symbol
         
         Returns:
-            Previous price or None if not available
+            Current price or None if not available
         """
-        # TODO: Implement price caching/history
-        # For now, return None (percentage-based triggers won't work on first run)
-        return None
+        price = self.bus.last_price(symbol, max_age_seconds=self.interval_seconds)
+        if price is None:
+            price = get_price(symbol)
+            if price is not None:
+                self.bus.publish_quote(symbol, price, source="trigger_evaluator")
+        return price
     
-    def record_trigger_event(
-        self,
-        trigger: Dict[str, Any],
-        current_price: float,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> TriggerEvent:
+    def get_previous_price(self, symbol: str) -> Optional[float]:
         """
-        Record a trigger event in the database.
+        Get previous price for a symbol (the quote before the latest one on the bus).
         
         Args:
-            trigger: Trigger dictionary
-            current_price: Current price when trigger fired
-            metadata: Additional metadata
+            symbol: Trading symbol
         
         Returns:
-            Created TriggerEvent
+            Previous price or None if not available (first observation)
         """
-        with SessionLocal() as session:
-            event = TriggerEvent(
-                trigger_id=trigger.get("id", "UNKNOWN"),
-                symbol=trigger["symbol"],
-                condition=trigger["condition"],
-                threshold_value=trigger.get("value", trigger.get("price", 0)),
-                action=trigger["action"],
-                current_price=current_price,
-                timestamp=datetime.utcnow(),
-                event_metadata=json.dumps(metadata) if metadata else None
-            )
-            session.add(event)
-            session.commit()
-            session.refresh(event)
-            logger.info(f"Recorded trigger event: {trigger['symbol']} {trigger['condition']} {current_price}")
-            return event
+        return self.bus.previous_price(symbol)
     
-    def save_trigger_result(
+    def build_candidate(
         self,
         trigger: Dict[str, Any],
         current_price: float,
-        previous_price: Optional[float] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> tuple:
+        previous_price: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
-        Save a TriggerResult and generate TradeCandidate rows.
+        Map a fired trigger to a TradeCandidate row (without trigger_result_id).
         
         Args:
             trigger: Trigger dictionary
             current_price: Current price when trigger fired
             previous_price: Previous price (if available)
-            metadata: Additional metadata
         
         Returns:
-            Tuple of (TriggerResult, List[TradeCandidate])
+            Dict with trigger_id, symbol, action, confidence and metadata
         """
-        trigger_id = trigger.get("id", f"trigger_{trigger['symbol']}_{trigger['condition']}")
+        action = trigger.get("action", "").upper()
+        
+        # Map trigger actions to trade actions
+        if action == "BUY":
+            trade_action = "BUY"
+            confidence = 0.75  # Default confidence for buy triggers
+        elif action == "SELL":
+            trade_action = "SELL"
+            confidence = 0.75  # Default confidence for sell triggers
+        elif action == "LAYER_IN":
+            trade_action = "BUY"
+            confidence = 0.60  # Lower confidence for layer-in
+        else:
+            # For "notify" or other actions, generate a HOLD candidate
+            trade_action = "HOLD"
+            confidence = 0.50
+        
+        # Adjust confidence based on price movement
+        if previous_price and previous_price > 0:
+            price_change_pct = abs((current_price - previous_price) / previous_price) * 100
+            # Higher price movement = higher confidence
+            if price_change_pct > 5:
+                confidence = min(confidence + 0.15, 0.95)
+            elif price_change_pct > 2:
+                confidence = min(confidence + 0.10, 0.90)
         
-        # Create data snapshot
-        data_snapshot = {
+        return {
+            "trigger_id": trigger.get("id", f"trigger_{trigger['symbol']}_{trigger['condition']}"),
             "symbol": trigger["symbol"],
-            "condition": trigger["condition"],
-            "threshold_value": trigger.get("value", trigger.get("price", 0)),
-            "action": trigger["action"],
-            "current_price": current_price,
-            "previous_price": previous_price,
-            "trigger_id": trigger_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "action": trade_action,
+            "confidence": confidence,
+            "metadata": {
+                "trigger_action": trigger.get("action"),
+                "condition": trigger["condition"],
+                "threshold_value": trigger.get("value", trigger.get("price", 0)),
+                "current_price": current_price,
+                "previous_price": previous_price,
+                "price_change_pct": ((current_price - previous_price) / previous_price * 100) if previous_price else None
+            }
         }
-        if metadata:
-            data_snapshot.update(metadata)
+    
+    def save_fires(self, fires: List[Tuple[Dict[str, Any], float, Optional[float]]]) -> List[Dict[str, Any]]:
+        """
+        Persist fired triggers in one unit of work.
         
-        with SessionLocal() as session:
-            result_repo = TriggerResultRepository(session)
-            candidate_repo = TradeCandidateRepository(session)
-            
-            # Save TriggerResult
-            trigger_result = result_repo.add_result(
-                trigger_id=trigger_id,
-                data_snapshot=data_snapshot
-            )
-            logger.info(f"Saved TriggerResult id={trigger_result.id} for trigger_id={trigger_id}")
+        Each fire writes a TriggerEvent, a TriggerResult and a TradeCandidate;
+        results and candidates are bulk-inserted, and the whole batch is one
+        transaction.
+        
+        Args:
+            fires: (trigger, current_price, previous_price) tuples
+        
+        Returns:
+            Per fire, a dict with event_id, trigger_result_id and candidate
+        """
+        if not fires:
+            return []
+        fired_at = datetime.utcnow()
+        
+        with session_scope() as session:
+            events = []
+            for trigger, current_price, previous_price in fires:
+                threshold_value = trigger.get("value", trigger.get("price", 0))
+                events.append(TriggerEvent(
+                    trigger_id=trigger.get("id", "UNKNOWN"),
+                    symbol=trigger["symbol"],
+                    condition=trigger["condition"],
+                    threshold_value=threshold_value,
+                    action=trigger["action"],
+                    current_price=current_price,
+                    timestamp=fired_at,
+                    event_metadata=json.dumps({"previous_price": previous_price, "threshold_value": threshold_value})
+                ))
+            session.add_all(events)
+            session.flush()
+            event_ids = [event.id for event in events]
             
-            # Generate TradeCandidate based on trigger action
+            results = []
             candidates = []
-            action = trigger.get("action", "").upper()
-            
-            # Map trigger actions to trade actions
-            if action in ["BUY", "buy"]:
-                trade_action = "BUY"
-                confidence = 0.75  # Default confidence for buy triggers
-            elif action in ["SELL", "sell"]:
-                trade_action = "SELL"
-                confidence = 0.75  # Default confidence for sell triggers
-            elif action in ["LAYER_IN", "layer_in"]:
-                trade_action = "BUY"
-                confidence = 0.60  # Lower confidence for layer-in
-            else:
-                # For "notify" or other actions, generate a HOLD candidate
-                trade_action = "HOLD"
-                confidence = 0.50
+            for (trigger, current_price, previous_price), event_id in zip(fires, event_ids):
+                candidate = self.build_candidate(trigger, current_price, previous_price)
+                results.append({
+                    "trigger_id": candidate["trigger_id"],
+                    "fired_at": fired_at,
+                    "data_snapshot": {
+                        "symbol": trigger["symbol"],
+                        "condition": trigger["condition"],
+                        "threshold_value": trigger.get("value", trigger.get("price", 0)),
+                        "action": trigger["action"],
+                        "current_price": current_price,
+                        "previous_price": previous_price,
+                        "trigger_id": candidate["trigger_id"],
+                        "timestamp": fired_at.isoformat(),
+                        "event_id": event_id,
+                    },
+                })
+                candidates.append(candidate)
             
-            # Adjust confidence based on price movement
-            if previous_price and previous_price > 0:
-                price_change_pct = abs((current_price - previous_price) / previous_price) * 100
-                # Higher price movement = higher confidence
-                if price_change_pct > 5:
-                    confidence = min(confidence + 0.15, 0.95)
-                elif price_change_pct > 2:
-                    confidence = min(confidence + 0.10, 0.90)
-            
-            # Create trade candidate
-            candidate = candidate_repo.add_candidate(
-                trigger_result_id=trigger_result.id,
-                trigger_id=trigger_id,
-                symbol=trigger["symbol"],
-                action=trade_action,
-                confidence=confidence,
-                metadata={
-                    "trigger_action": trigger.get("action"),
-                    "condition": trigger["condition"],
-                    "threshold_value": trigger.get("value", trigger.get("price", 0)),
-                    "current_price": current_price,
-                    "previous_price": previous_price,
-                    "price_change_pct": ((current_price - previous_price) / previous_price * 100) if previous_price else None
-                }
+            result_ids = TriggerResultRepository(session).add_results(results)
+            for candidate, result_id in zip(candidates, result_ids):
+                candidate["trigger_result_id"] = result_id
+            candidate_ids = TradeCandidateRepository(session).add_candidates(candidates)
+        
+        saved = []
+        for event_id, result_id, candidate, candidate_id in zip(event_ids, result_ids, candidates, candidate_ids):
+            candidate["id"] = candidate_id
+            saved.append({"event_id": event_id, "trigger_result_id": result_id, "candidate": candidate, "fired_at": fired_at})
+            logger.info(
+                f"Saved TriggerEvent id={event_id}, TriggerResult id={result_id}, TradeCandidate id={candidate_id}: "
+                f"{candidate['symbol']} {candidate['action']} (confidence={candidate['confidence']:.2f})"
             )
-            candidates.append(candidate)
-            logger.info(f"Generated TradeCandidate id={candidate.id}: {candidate.symbol} {candidate.action} (confidence={candidate.confidence:.2f})")
-            
-            return trigger_result, candidates
+        return saved
     
-    def send_alert(self, trigger: Dict[str, Any], current_price: float, event: TriggerEvent):
+    def send_alert(self, trigger: Dict[str, Any], current_price: float, fired_at: datetime):
         """
         Send alert for triggered event.
         
         Args:
             trigger: Trigger dictionary
             current_price: Current price
-            event: TriggerEvent that was created
+            fired_at: When the trigger fired (UTC)
         """
         try:
             message = (
@@ -238,7 +261,7 @@ class TriggerEvaluator:
                 f"Condition: {trigger['condition']} {trigger.get('value', trigger.get('price', 0))}\n"
                 f"Current Price: ${current_price:.2f}\n"
                 f"Action: {trigger['action']}\n"
-                f"Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                f"Time: {fired_at.strftime('%Y-%m-%d %H:%M:%S UTC')}"
             )
             
             # Send via alert router (SMS/Slack/etc.)
@@ -251,100 +274,109 @@ class TriggerEvaluator:
         except Exception as e:
             logger.error(f"Error sending alert: {e}", exc_info=True)
     
-    def evaluate_triggers(self) -> List[Dict[str, Any]]:
+    def fire_triggers(self, fires: List[Tuple[Dict[str, Any], float, Optional[float]]]) -> List[Dict[str, Any]]:
         """
-        Evaluate all enabled triggers.
+        Log, persist (one transaction) and alert for a batch of fired triggers.
+        
+        Args:
+            fires: (trigger, current_price, previous_price) tuples; previous_price
+                is the reference price for percentage conditions, else None
+        
+        Returns:
+            Per fire, a dict with trigger, current_price, event_id,
+            trigger_result_id and candidate (IDs are None if saving failed)
+        """
+        for trigger, current_price, previous_price in fires:
+            symbol = trigger["symbol"]
+            condition = trigger["condition"]
+            threshold_value = trigger.get("value", trigger.get("price", 0))
+            
+            logger.info(
+                f"✅ Trigger fired: {symbol} {condition} {threshold_value} "
+                f"(current: ${current_price:.2f})"
+            )
+            
+            # Log trigger fire event
+            log_trigger_fire(
+                trigger_id=trigger.get("id", f"trigger_{symbol}_{condition}"),
+                symbol=symbol,
+                condition=condition,
+                threshold=threshold_value,
+                current_price=current_price,
+                action=trigger.get("action", "notify"),
+                previous_price=previous_price
+            )
+        
+        try:
+            saved = self.save_fires(fires)
+        except Exception as e:
+            logger.error(f"Error saving fired triggers: {e}", exc_info=True)
+            fired_at = datetime.utcnow()
+            saved = [
+                {"event_id": None, "trigger_result_id": None, "candidate": None, "fired_at": fired_at}
+                for _ in fires
+            ]
+        
+        fired = []
+        for (trigger, current_price, previous_price), record in zip(fires, saved):
+            # Send alert
+            if trigger["action"] == "notify" or trigger.get("send_alert", True):
+                self.send_alert(trigger, current_price, record["fired_at"])
+            fired.append({"trigger": trigger, "current_price": current_price, **record})
+        return fired
+    
+    @metrics.timed("daemon.cycle", daemon="trigger_evaluator")
+    def evaluate_triggers(
+        self,
+        symbols: Optional[set] = None,
+        crossing: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate enabled triggers against current prices.
+        
+        Fired triggers are looked up in the trigger engine's per-symbol sorted
+        threshold index (one price fetch per symbol, binary search per condition).
+        
+        Args:
+            symbols: Only evaluate triggers on these symbols (default: all)
+            crossing: Fire price-level triggers only when their threshold is
+                crossed since the last evaluated price (streaming mode)
         
         Returns:
             List of triggers that fired
         """
-        triggers = self.trigger_service.load_triggers()
-        enabled_triggers = [t for t in triggers if t.get("enabled", True)]
+        self.engine.refresh()
         
-        fired_triggers = []
+        fires = []
         
-        for trigger in enabled_triggers:
+        for symbol in self.engine.symbols():
+            if symbols is not None and symbol not in symbols:
+                continue
             try:
-                symbol = trigger["symbol"]
-                condition = trigger["condition"]
-                threshold_value = trigger.get("value", trigger.get("price", 0))
-                
                 # Fetch current price
-                current_price = get_price(symbol)
+                current_price = self.get_current_price(symbol)
                 if current_price is None:
                     logger.warning(f"Could not fetch price for {symbol}")
                     continue
                 
-                # Get previous price for percentage-based conditions
-                previous_price = None
-                if condition in ["drop_pct", "rise_pct"]:
-                    previous_price = self.get_previous_price(symbol)
-                
-                # Evaluate condition
-                if self.evaluate_condition(condition, current_price, threshold_value, previous_price):
-                    logger.info(
-                        f"✅ Trigger fired: {symbol} {condition} {threshold_value} "
-                        f"(current: ${current_price:.2f})"
-                    )
-                    
-                    # Log trigger fire event
-                    log_trigger_fire(
-                        trigger_id=trigger.get("id", f"trigger_{symbol}_{condition}"),
-                        symbol=symbol,
-                        condition=condition,
-                        threshold=threshold_value,
-                        current_price=current_price,
-                        action=trigger.get("action", "notify"),
-                        previous_price=previous_price
-                    )
-                    
-                    # Record event (legacy TriggerEvent)
-                    event = self.record_trigger_event(
-                        trigger=trigger,
-                        current_price=current_price,
-                        metadata={
-                            "previous_price": previous_price,
-                            "threshold_value": threshold_value
-                        }
-                    )
-                    
-                    # Save TriggerResult and generate TradeCandidate
-                    try:
-                        trigger_result, candidates = self.save_trigger_result(
-                            trigger=trigger,
-                            current_price=current_price,
-                            previous_price=previous_price,
-                            metadata={
-                                "previous_price": previous_price,
-                                "threshold_value": threshold_value,
-                                "event_id": event.id
-                            }
-                        )
-                        logger.info(f"Saved TriggerResult and {len(candidates)} TradeCandidate(s)")
-                    except Exception as e:
-                        logger.error(f"Error saving TriggerResult/TradeCandidate: {e}", exc_info=True)
-                        trigger_result = None
-                        candidates = []
-                    
-                    # Send alert
-                    if trigger["action"] == "notify" or trigger.get("send_alert", True):
-                        self.send_alert(trigger, current_price, event)
-                    
-                    fired_triggers.append({
-                        "trigger": trigger,
-                        "event": event,
-                        "trigger_result": trigger_result,
-                        "candidates": candidates,
-                        "current_price": current_price
-                    })
-                else:
-                    logger.debug(
-                        f"Trigger not met: {symbol} {condition} {threshold_value} "
-                        f"(current: ${current_price:.2f})"
-                    )
-            
+                # Previous price for percentage-based conditions
+                previous_price = self.get_previous_price(symbol)
+                fired = self.engine.on_price(symbol, current_price, previous_price, crossing=crossing)
+                if not fired:
+                    logger.debug(f"No triggers met for {symbol} (current: ${current_price:.2f})")
             except Exception as e:
-                logger.error(f"Error evaluating trigger {trigger.get('symbol', 'UNKNOWN')}: {e}", exc_info=True)
+                logger.error(f"Error evaluating triggers for {symbol}: {e}", exc_info=True)
+                continue
+            
+            for trigger in fired:
+                fires.append((
+                    trigger,
+                    current_price,
+                    previous_price if trigger["condition"] in ("drop_pct", "rise_pct") else None
+                ))
+        
+        # One transaction for everything that fired this cycle
+        fired_triggers = self.fire_triggers(fires) if fires else []
         
         return fired_triggers
     
@@ -361,20 +393,54 @@ class TriggerEvaluator:
         return fired
     
     def run_forever(self):
-        """Run the evaluator continuously."""
+        """
+        Run the evaluator continuously.
+        
+        Subscribes to the market data bus for the triggered symbols and
+        evaluates a symbol's triggers as soon as a new quote arrives, firing
+        price-level triggers when their threshold is crossed. The trigger index
+        is checked for changes every interval and rebuilt only if the trigger
+        file was modified.
+        """
         self.running = True
-        logger.info(f"Trigger evaluator started (interval: {self.interval_seconds}s)")
+        logger.info(f"Trigger evaluator started (interval: {self.interval_seconds}s, streaming)")
+        
+        start_market_data_feed()
+        metrics.start_snapshot_writer("trigger_evaluator")
+        subscription = None
+        events = queue.Queue()
         
         try:
             while self.running:
-                self.run_once()
-                time.sleep(self.interval_seconds)
+                self.engine.refresh()
+                symbols = set(self.engine.symbols())
+                if subscription is None or subscription.symbols != symbols:
+                    if subscription is not None:
+                        subscription.unsubscribe()
+                    subscription = self.bus.subscribe(symbols, lambda q: events.put(q.symbol), kinds=(QUOTE,))
+                
+                reload_at = time.time() + self.interval_seconds
+                while self.running and time.time() < reload_at:
+                    try:
+                        changed = {events.get(timeout=max(0.0, reload_at - time.time()))}
+                    except queue.Empty:
+                        break
+                    # Coalesce a burst of quotes into one evaluation per symbol
+                    while True:
+                        try:
+                            changed.add(events.get_nowait())
+                        except queue.Empty:
+                            break
+                    self.evaluate_triggers(symbols=changed, crossing=True)
         except KeyboardInterrupt:
             logger.info("Trigger evaluator stopped by user")
             self.running = False
         except Exception as e:
             logger.error(f"Error in trigger evaluator: {e}", exc_info=True)
             self.running = False
+        finally:
+            if subscription is not None:
+                subscription.unsubscribe()
     
     def stop(self):
         """Stop the evaluator."""